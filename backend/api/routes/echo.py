@@ -2,13 +2,32 @@
 Echo 시뮬레이션 관련 API 라우트
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.orm import Session
 import numpy as np
 import base64
+from pathlib import Path
+from typing import List, Optional
 from api.schemas.request import EchoSimulateRequest, EchoSimulateMultipleRequest
+from api.schemas.target import TargetRequest
 from api.schemas.response import EchoResponse, EchoMultipleResponse
+from api.database import get_db
+from api.services.tle_service import get_tle_propagator
 from sar_simulator.echo.echo_simulator import SarEchoSimulator
-from sar_simulator.common.target_model import Target, TargetList
+from sar_simulator.echo.clutter_generator import ClutterGenerator
+from sar_simulator.common.target_model import TargetList
+from sar_simulator.common.target_aggregation import aggregate_targets, AggregationReport
+from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.common.cint16_echo import CInt16Echo
+
+# Scene 파일 로드 시 빔 원뿔 반각 (고도 빔폭 대비 배수)
+SCENE_BEAM_MARGIN = 1.5
+
+# 여러 펄스 Echo 시뮬레이션 최대 펄스 개수
+MAX_ECHO_PULSES = 100000
+
+# 여러 펄스 Echo 행렬 (complex64, 펄스 × 샘플) 최대 크기 (단위: byte)
+MAX_ECHO_BYTES = 1024 ** 3
 
 router = APIRouter()
 
@@ -24,21 +43,22 @@ async def simulate_echo(request: EchoSimulateRequest):
         # 시스템 설정 생성
         config = request.config.to_sar_system_config()
         
-        # 타겟 리스트 생성
-        target_list = TargetList([
-            Target(
-                position=np.array(t.position),
-                reflectivity=t.reflectivity,
-                phase=t.phase
-            )
-            for t in request.targets
-        ])
-        
         # 위성 상태
         satellite_position = np.array(request.satellite_state.position)
         satellite_velocity = np.array(request.satellite_state.velocity)
         beam_direction = np.array(request.satellite_state.beam_direction) if request.satellite_state.beam_direction else None
         
+        # 타겟 리스트 생성
+        target_list = _build_target_list(request.targets, request.scene_file, config, satellite_position, beam_direction)
+        
+        # 해상도 셀 단위 타겟 집계 (선택)
+        report: Optional[AggregationReport] = None
+        if request.aggregate_cell_fraction is not None:
+            target_list, report = aggregate_targets(
+                target_list, config, satellite_position, satellite_velocity,
+                cell_fraction=request.aggregate_cell_fraction
+            )
+        
         # Echo Simulator 생성 및 시뮬레이션
         echo_sim = SarEchoSimulator(config)
         echo_signal = echo_sim.simulate_echo(
@@ -62,7 +82,9 @@ async def simulate_echo(request: EchoSimulateRequest):
             data=echo_base64,
             num_samples=len(echo_signal),
             max_amplitude=float(np.max(np.abs(echo_signal))),
-            mean_amplitude=float(np.mean(np.abs(echo_signal)))
+            mean_amplitude=float(np.mean(np.abs(echo_signal))),
+            num_targets_eliminated=report.num_eliminated if report else None,
+            aggregation_error=report.relative_error if report else None
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
@@ -71,59 +93,171 @@ async def simulate_echo(request: EchoSimulateRequest):
 
 
 @router.post("/simulate-multiple", response_model=EchoMultipleResponse)
-async def simulate_multiple_echoes(request: EchoSimulateMultipleRequest):
+async def simulate_multiple_echoes(
+    request: EchoSimulateMultipleRequest,
+    db: Session = Depends(get_db)
+):
     """
     여러 펄스 Echo 시뮬레이션
     
     여러 위성 상태에 대해 Echo 신호를 생성합니다.
+    tle_trajectory가 지정되면 저장된 TLE를 PRF 간격으로 전파한 궤적을 사용합니다.
+    ephemeris가 지정되면 희소 상태 벡터를 PRF 간격으로 보간한 궤적을 사용합니다.
+    config에 버스 자세(bus_*)가 있으면 모든 펄스의 빔 방향에 자세를 적용합니다.
+    add_noise가 True이면 수신기 열잡음을 더하고, adc_full_scale이 있으면 I, Q를 포화시킵니다.
+    adc_quantize가 True이면 int16 I/Q 코드(dtype: cint16)와 scale_factor를 반환합니다.
     """
     try:
         # 시스템 설정 생성
         config = request.config.to_sar_system_config()
         
-        # 타겟 리스트 생성
-        target_list = TargetList([
-            Target(
-                position=np.array(t.position),
-                reflectivity=t.reflectivity,
-                phase=t.phase
-            )
-            for t in request.targets
-        ])
-        
         # 위성 상태 배열 준비
-        num_pulses = len(request.satellite_states)
-        satellite_positions = np.array([s.position for s in request.satellite_states])
-        satellite_velocities = np.array([s.velocity for s in request.satellite_states])
         beam_directions = None
-        if request.satellite_states and request.satellite_states[0].beam_direction:
-            beam_directions = np.array([s.beam_direction for s in request.satellite_states])
+        num_sources = sum([bool(request.satellite_states), request.tle_trajectory is not None, request.ephemeris is not None])
+        if num_sources > 1:
+            raise ValueError("satellite_states, tle_trajectory, ephemeris 중 하나만 지정할 수 있습니다.")
+        if request.tle_trajectory is not None:
+            _check_echo_size(request.tle_trajectory.num_pulses, config)
+            propagator = get_tle_propagator(db, request.tle_trajectory.tle_id)
+            satellite_positions, satellite_velocities = propagator.propagate_pulses(
+                request.tle_trajectory.num_pulses, config.prf, request.tle_trajectory.start_time
+            )
+        elif request.ephemeris is not None:
+            if request.ephemeris.num_pulses is None:
+                raise ValueError("ephemeris 사용 시 num_pulses가 필요합니다.")
+            _check_echo_size(request.ephemeris.num_pulses, config)
+            satellite_positions, satellite_velocities = request.ephemeris.to_ephemeris().propagate_pulses(
+                request.ephemeris.num_pulses, config.prf, request.ephemeris.start_time
+            )
+        elif request.satellite_states:
+            satellite_positions = np.array([s.position for s in request.satellite_states])
+            satellite_velocities = np.array([s.velocity for s in request.satellite_states])
+            if request.satellite_states[0].beam_direction:
+                beam_directions = np.array([s.beam_direction for s in request.satellite_states])
+        else:
+            raise ValueError("satellite_states, tle_trajectory, ephemeris 중 하나가 필요합니다.")
+        num_pulses = len(satellite_positions)
+        _check_echo_size(num_pulses, config)
         
-        # Echo Simulator 생성 및 시뮬레이션
+        # 버스 자세 (config의 bus_* 필드, 첫 펄스 기준 시각), 빔 방향에는 시뮬레이터가 적용
+        attitude = request.config.to_attitude_profile()
         echo_sim = SarEchoSimulator(config)
+        
+        # 타겟 리스트 생성 (Scene 파일 타일은 자세를 적용한 빔 footprint로 선택)
+        footprint_directions = None
+        if request.scene_file:
+            footprint_directions = echo_sim.pulse_beam_directions(
+                satellite_positions, satellite_velocities, beam_directions, attitude
+            )
+        target_list = _build_target_list(request.targets, request.scene_file, config, satellite_positions, footprint_directions)
+        
+        # 해상도 셀 단위 타겟 집계 (선택, 관측 구간 중앙 펄스 기준)
+        report: Optional[AggregationReport] = None
+        if request.aggregate_cell_fraction is not None and num_pulses > 0:
+            target_list, report = aggregate_targets(
+                target_list, config, satellite_positions[num_pulses // 2], satellite_velocities[num_pulses // 2],
+                cell_fraction=request.aggregate_cell_fraction
+            )
+        
+        # 분포 클러터 생성기 (선택, 지리 좌표 [경도, 위도] → (위도, 경도))
+        clutter_generator = None
+        if request.clutter is not None:
+            clutter_generator = ClutterGenerator(
+                config,
+                sigma0_db=request.clutter.sigma0_db,
+                upper_left=(request.clutter.upper_left[1], request.clutter.upper_left[0]),
+                lower_right=(request.clutter.lower_right[1], request.clutter.lower_right[0]),
+                height=request.clutter.height,
+                seed=request.clutter.seed
+            )
+        
+        # Echo 시뮬레이션
         echo_signals = echo_sim.simulate_multiple_pulses(
             target_list=target_list,
             satellite_positions=satellite_positions,
             satellite_velocities=satellite_velocities,
-            beam_directions=beam_directions
+            beam_directions=beam_directions,
+            range_compressed=request.range_compressed,
+            clutter_generator=clutter_generator,
+            attitude=attitude,
+            add_noise=request.add_noise,
+            noise_seed=request.noise_seed,
+            adc_quantize=request.adc_quantize,
+            adc_full_scale=request.adc_full_scale
         )
         
         # NumPy 배열을 Base64로 인코딩
-        # 복소수를 실수/허수로 분리하여 저장
-        echo_data = np.stack([echo_signals.real, echo_signals.imag], axis=-1)
-        echo_bytes = echo_data.astype(np.float32).tobytes()
+        scale_factor = None
+        if isinstance(echo_signals, CInt16Echo):
+            # int16 [I, Q, I, Q, ...] 코드를 그대로 전송 (complex64 대비 절반 크기)
+            echo_bytes = echo_signals.tobytes()
+            dtype = "cint16"
+            scale_factor = echo_signals.scale
+        else:
+            # 복소수를 실수/허수로 분리하여 저장
+            echo_data = np.stack([echo_signals.real, echo_signals.imag], axis=-1)
+            echo_bytes = echo_data.astype(np.float32).tobytes()
+            dtype = str(echo_signals.dtype)
         echo_base64 = base64.b64encode(echo_bytes).decode('utf-8')
         
         return EchoMultipleResponse(
             success=True,
             message="여러 펄스 Echo 시뮬레이션 완료",
             shape=list(echo_signals.shape),
-            dtype=str(echo_signals.dtype),
+            dtype=dtype,
             data=echo_base64,
             num_pulses=num_pulses,
-            num_samples=echo_signals.shape[1]
+            num_samples=echo_signals.shape[1],
+            scale_factor=scale_factor,
+            num_targets_eliminated=report.num_eliminated if report else None,
+            aggregation_error=report.relative_error if report else None
         )
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+def _check_echo_size(num_pulses: int, config: SarSystemConfig) -> None:
+    """여러 펄스 Echo 행렬이 펄스 개수 및 메모리 한도 안인지 확인 (초과 시 ValueError)"""
+    if num_pulses > MAX_ECHO_PULSES:
+        raise ValueError(f"펄스 개수가 한도를 초과합니다: {num_pulses} > {MAX_ECHO_PULSES}")
+    echo_bytes = num_pulses * config.num_samples * np.dtype(np.complex64).itemsize
+    if echo_bytes > MAX_ECHO_BYTES:
+        raise ValueError(
+            f"Echo 행렬 크기가 한도를 초과합니다: {echo_bytes} bytes > {MAX_ECHO_BYTES} bytes "
+            f"(펄스 {num_pulses} × 샘플 {config.num_samples})"
+        )
+
+
+def _build_target_list(
+    targets: List[TargetRequest],
+    scene_file: Optional[str],
+    config: SarSystemConfig,
+    satellite_positions: np.ndarray,
+    beam_directions: Optional[np.ndarray]
+) -> TargetList:
+    """요청 타겟과 Scene 파일(빔 footprint 내 타일)로 TargetList 생성"""
+    target_list = TargetList.from_columns(
+        positions=np.array([t.position for t in targets], dtype=np.float64).reshape(-1, 3),
+        reflectivity=np.array([t.reflectivity for t in targets], dtype=np.float64),
+        phase=np.array([t.phase for t in targets], dtype=np.float64)
+    )
+    
+    if scene_file:
+        if not Path(scene_file).exists():
+            raise ValueError(f"Scene 파일을 찾을 수 없습니다: {scene_file}")
+        
+        scene_targets = TargetList.from_scene_file(
+            scene_file,
+            satellite_positions=satellite_positions,
+            beam_directions=beam_directions,
+            half_angle=SCENE_BEAM_MARGIN * np.deg2rad(config.beamwidth_el)
+        )
+        if len(target_list) == 0:
+            return scene_targets
+        target_list.append(scene_targets.positions, scene_targets.reflectivity, scene_targets.phase)
+    
+    return target_list
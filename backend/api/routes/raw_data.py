@@ -8,6 +8,7 @@ import base64
 from pathlib import Path
 from api.schemas.request import RawDataSaveRequest
 from api.schemas.response import RawDataSaveResponse
+from sar_simulator.common.cint16_echo import CInt16Echo
 from sar_simulator.io.raw_data_writer import RawDataWriter
 
 router = APIRouter()
@@ -19,6 +20,11 @@ async def save_raw_data(request: RawDataSaveRequest):
     Raw Data 저장
     
     Echo 신호 데이터를 HDF5 파일로 저장합니다.
+    ephemeris가 지정되면 펄스별 위성 상태를 궤도력에서 보간하여 기록합니다.
+    config_request에 버스 자세(bus_*)가 있으면 ADX 자세 쿼터니언/각속도 열을 채웁니다.
+    compression이 지정되면 Echo 데이터셋을 자동 청크 크기로 압축 저장합니다.
+    baq_bits가 지정되면 Echo를 BAQ 인코딩하여 저장합니다.
+    sample_format이 cint16이면 int16 I/Q 코드를 complex64로 변환하지 않고 그대로 저장합니다.
     """
     try:
         # 시스템 설정 생성
@@ -26,19 +32,49 @@ async def save_raw_data(request: RawDataSaveRequest):
         
         # Base64 디코딩
         echo_bytes = base64.b64decode(request.echo_data_base64)
-        # 실수/허수로 분리된 float32 데이터를 복원
-        echo_float32 = np.frombuffer(echo_bytes, dtype=np.float32)
-        # [real, imag, real, imag, ...] 형태를 복소수로 변환
-        echo_data = echo_float32[::2] + 1j * echo_float32[1::2]
-        
-        # Echo 데이터 shape 복원
-        num_pulses = len(request.satellite_states)
-        num_samples = len(echo_data) // num_pulses if num_pulses > 0 else len(echo_data)
-        echo_data = echo_data.reshape(num_pulses, num_samples).astype(np.complex64)
+        if request.sample_format == "cint16":
+            # [I, Q, I, Q, ...] int16 코드 (shape 확인 후 CInt16Echo로 변환)
+            if request.scale_factor is None:
+                raise ValueError("cint16 형식에는 scale_factor가 필요합니다.")
+            num_values = len(echo_bytes) // 4
+        elif request.sample_format == "complex64":
+            # 실수/허수로 분리된 float32 데이터를 복원
+            echo_float32 = np.frombuffer(echo_bytes, dtype=np.float32)
+            # [real, imag, real, imag, ...] 형태를 복소수로 변환
+            echo_data = echo_float32[::2] + 1j * echo_float32[1::2]
+            num_values = len(echo_data)
+        else:
+            raise ValueError(f"지원하지 않는 sample_format입니다: {request.sample_format}")
         
         # 위성 상태 배열 준비
-        satellite_positions = np.array([s.position for s in request.satellite_states])
-        satellite_velocities = np.array([s.velocity for s in request.satellite_states])
+        ephemeris = None
+        timestamps = None
+        satellite_positions = None
+        satellite_velocities = None
+        if request.ephemeris is not None:
+            if request.satellite_states:
+                raise ValueError("satellite_states와 ephemeris는 동시에 지정할 수 없습니다.")
+            ephemeris = request.ephemeris.to_ephemeris()
+            num_pulses = request.ephemeris.num_pulses or num_values // config.num_samples
+            if num_pulses <= 0 or num_pulses > num_values:
+                # 펄스마다 샘플이 하나 이상이어야 하므로 Echo 데이터 크기가 펄스 개수의 상한
+                raise ValueError("Echo 데이터 크기가 펄스 개수와 맞지 않습니다.")
+            timestamps = ephemeris.pulse_times(num_pulses, config.prf, request.ephemeris.start_time)
+        elif request.satellite_states:
+            num_pulses = len(request.satellite_states)
+            satellite_positions = np.array([s.position for s in request.satellite_states])
+            satellite_velocities = np.array([s.velocity for s in request.satellite_states])
+        else:
+            raise ValueError("satellite_states 또는 ephemeris가 필요합니다.")
+        
+        # Echo 데이터 shape 복원
+        if num_pulses <= 0 or num_values % num_pulses != 0:
+            raise ValueError("Echo 데이터 크기가 펄스 개수와 맞지 않습니다.")
+        num_samples = num_values // num_pulses
+        if request.sample_format == "cint16":
+            echo_data = CInt16Echo.frombuffer(echo_bytes, (num_pulses, num_samples), request.scale_factor, config.adc_bits)
+        else:
+            echo_data = echo_data.reshape(num_pulses, num_samples).astype(np.complex64)
         
         # 파일 경로 검증
         output_path = Path(request.filepath)
@@ -46,12 +82,21 @@ async def save_raw_data(request: RawDataSaveRequest):
             output_path.parent.mkdir(parents=True, exist_ok=True)
         
         # Raw Data 저장
-        with RawDataWriter(str(output_path), config) as writer:
+        with RawDataWriter(
+            str(output_path),
+            config,
+            compression=request.compression,
+            compression_level=request.compression_level,
+            baq_bits=request.baq_bits
+        ) as writer:
             writer.write_burst(
                 group_name=request.group_name,
                 echo_data=echo_data,
                 satellite_positions=satellite_positions,
-                satellite_velocities=satellite_velocities
+                satellite_velocities=satellite_velocities,
+                timestamps=timestamps,
+                ephemeris=ephemeris,
+                attitude=request.config_request.to_attitude_profile()
             )
         
         return RawDataSaveResponse(
@@ -2,15 +2,30 @@
 SAR 이미지 처리 관련 API 라우트
 """
 
-from fastapi import APIRouter, HTTPException
+from collections import OrderedDict
+from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Request, Response
 import numpy as np
 import base64
 from api.schemas.request import SarImageProcessRequest
 from api.schemas.response import SarImageResponse, SarImageBothResponse
+from sar_simulator.common.cint16_echo import CInt16Echo
+from sar_simulator.io.image_tiles import ImagePyramid, build_image_pyramid
 from sar_simulator.processing.rda_processor import RDAProcessor
 
 router = APIRouter()
 
+# 최근 생성한 타일 피라미드 (pyramid_id -> ImagePyramid)
+# 전체 level 영상 크기가 한도를 넘으면 오래된 순으로 제거 (가장 최근 피라미드는 항상 유지)
+_pyramids: "OrderedDict[str, ImagePyramid]" = OrderedDict()
+MAX_CACHED_PYRAMID_BYTES = 512 * 1024 * 1024
+
+# 타일 URL 경로 (main.py의 /api/sar-image 접두사 기준)
+TILE_URL_PREFIX = "/api/sar-image/tiles"
+
+# 타일 URL은 피라미드 내용 해시를 포함하므로 변경되지 않음
+TILE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
 
 def _encode_sar_image(sar_image_db: np.ndarray) -> str:
     """SAR 이미지를 Base64로 인코딩"""
@@ -19,21 +34,50 @@ def _encode_sar_image(sar_image_db: np.ndarray) -> str:
     return base64.b64encode(sar_bytes).decode('utf-8')
 
 
+def _create_tiles(
+    sar_image_db: np.ndarray,
+    range_extent: np.ndarray,
+    azimuth_extent: np.ndarray,
+    image_bounds: Optional[List[float]] = None
+) -> dict:
+    """타일 피라미드 생성 후 캐시에 등록하고 메타데이터 반환"""
+    pyramid = build_image_pyramid(sar_image_db, range_extent, azimuth_extent, bounds=image_bounds)
+    pyramid_id = pyramid.pyramid_id
+    
+    _pyramids[pyramid_id] = pyramid
+    _pyramids.move_to_end(pyramid_id)
+    cached_bytes = sum(cached.nbytes for cached in _pyramids.values())
+    while len(_pyramids) > 1 and cached_bytes > MAX_CACHED_PYRAMID_BYTES:
+        _, evicted = _pyramids.popitem(last=False)
+        cached_bytes -= evicted.nbytes
+    
+    return _tile_metadata(pyramid_id, pyramid)
+
+
+def _tile_metadata(pyramid_id: str, pyramid: ImagePyramid) -> dict:
+    """타일 피라미드 메타데이터에 타일 URL 템플릿 추가"""
+    metadata = pyramid.metadata()
+    metadata["url_template"] = f"{TILE_URL_PREFIX}/{pyramid_id}/{{z}}/{{x}}/{{y}}.png"
+    return metadata
+
+
 def _create_sar_image_dict(
     sar_image_db: np.ndarray,
     range_extent: np.ndarray,
     azimuth_extent: np.ndarray,
-    is_full_swath: bool = False
+    is_full_swath: bool = False,
+    tiles: Optional[dict] = None
 ) -> dict:
-    """SAR 이미지 딕셔너리 생성"""
+    """SAR 이미지 딕셔너리 생성 (타일 피라미드가 있으면 전체 영상 데이터 생략)"""
     return {
         "shape": list(sar_image_db.shape),
-        "data": _encode_sar_image(sar_image_db),
+        "data": _encode_sar_image(sar_image_db) if tiles is None else None,
         "range_extent": range_extent.tolist(),
         "azimuth_extent": azimuth_extent.tolist(),
         "max_value": float(np.max(sar_image_db)),
         "min_value": float(np.min(sar_image_db)),
-        "is_full_swath": is_full_swath
+        "is_full_swath": is_full_swath,
+        "tiles": tiles
     }
 
 
@@ -44,6 +88,8 @@ async def process_sar_image(request: SarImageProcessRequest):
     
     Echo 신호 배열을 RDA 알고리즘으로 처리하여 SAR 이미지를 생성합니다.
     process_both=True인 경우 타겟 영역과 전체 영역 모두 반환합니다.
+    tiled=True인 경우 타일 피라미드를 생성하고 응답의 tiles에 메타데이터를 포함하며,
+    전체 영상 data는 생략합니다 (process_both인 경우 image_bounds는 전체 영역 이미지에 적용).
     """
     try:
         # 시스템 설정 생성
@@ -51,14 +97,23 @@ async def process_sar_image(request: SarImageProcessRequest):
         
         # Base64 디코딩
         echo_bytes = base64.b64decode(request.echo_data_base64)
-        echo_float32 = np.frombuffer(echo_bytes, dtype=np.float32)
-        
-        # 복소수로 복원 [real, imag, real, imag, ...] 형태
-        echo_data = echo_float32[::2] + 1j * echo_float32[1::2]
-        
-        # Shape 복원
         num_pulses, num_samples = request.shape
-        echo_signals = echo_data.reshape(num_pulses, num_samples).astype(np.complex64)
+        
+        if request.sample_format == "cint16":
+            # int16 I/Q 코드 그대로 처리 (Pulse Compression에서 블록 단위로 복원)
+            if request.scale_factor is None:
+                raise ValueError("cint16 형식에는 scale_factor가 필요합니다.")
+            echo_signals = CInt16Echo.frombuffer(echo_bytes, (num_pulses, num_samples), request.scale_factor, config.adc_bits)
+        elif request.sample_format == "complex64":
+            echo_float32 = np.frombuffer(echo_bytes, dtype=np.float32)
+            
+            # 복소수로 복원 [real, imag, real, imag, ...] 형태
+            echo_data = echo_float32[::2] + 1j * echo_float32[1::2]
+            
+            # Shape 복원
+            echo_signals = echo_data.reshape(num_pulses, num_samples).astype(np.complex64)
+        else:
+            raise ValueError(f"지원하지 않는 sample_format입니다: {request.sample_format}")
         
         # 위성 속도 벡터
         satellite_velocity = np.array(request.satellite_velocity)
@@ -70,11 +125,18 @@ async def process_sar_image(request: SarImageProcessRequest):
         if request.process_both:
             target_result, full_result = rda_processor.process_both(
                 echo_signals,
-                dynamic_range=request.dynamic_range
+                dynamic_range=request.dynamic_range,
+                range_compressed=request.range_compressed
             )
             
-            target_dict = _create_sar_image_dict(*target_result, is_full_swath=False)
-            full_dict = _create_sar_image_dict(*full_result, is_full_swath=True)
+            target_tiles = None
+            full_tiles = None
+            if request.tiled:
+                target_tiles = _create_tiles(*target_result)
+                full_tiles = _create_tiles(*full_result, image_bounds=request.image_bounds)
+            
+            target_dict = _create_sar_image_dict(*target_result, is_full_swath=False, tiles=target_tiles)
+            full_dict = _create_sar_image_dict(*full_result, is_full_swath=True, tiles=full_tiles)
             
             return SarImageBothResponse(
                 success=True,
@@ -87,21 +149,66 @@ async def process_sar_image(request: SarImageProcessRequest):
         sar_image_db, range_extent, azimuth_extent = rda_processor.process(
             echo_signals,
             dynamic_range=request.dynamic_range,
-            process_full_swath=request.process_full_swath
+            process_full_swath=request.process_full_swath,
+            range_compressed=request.range_compressed
         )
         
+        tiles = None
+        if request.tiled:
+            tiles = _create_tiles(sar_image_db, range_extent, azimuth_extent, request.image_bounds)
+        
         return SarImageResponse(
             success=True,
             message="SAR 이미지 처리 완료",
             shape=list(sar_image_db.shape),
-            data=_encode_sar_image(sar_image_db),
+            data=_encode_sar_image(sar_image_db) if tiles is None else None,
             range_extent=range_extent.tolist(),
             azimuth_extent=azimuth_extent.tolist(),
             max_value=float(np.max(sar_image_db)),
             min_value=float(np.min(sar_image_db)),
-            is_full_swath=request.process_full_swath
+            is_full_swath=request.process_full_swath,
+            tiles=tiles
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+def _get_pyramid(pyramid_id: str) -> ImagePyramid:
+    """캐시된 타일 피라미드 조회"""
+    pyramid = _pyramids.get(pyramid_id)
+    if pyramid is None:
+        raise HTTPException(status_code=404, detail=f"타일 피라미드를 찾을 수 없습니다: {pyramid_id}")
+    return pyramid
+
+
+@router.get("/tiles/{pyramid_id}/metadata")
+async def get_tile_metadata(pyramid_id: str):
+    """
+    타일 피라미드 메타데이터 조회
+    
+    타일 크기, level 수, level 0 타일 개수, 경위도 사각형 등을 반환합니다.
+    """
+    return _tile_metadata(pyramid_id, _get_pyramid(pyramid_id))
+
+
+@router.get("/tiles/{pyramid_id}/{z}/{x}/{y}.png")
+async def get_tile(pyramid_id: str, z: int, x: int, y: int, request: Request):
+    """
+    SAR 이미지 타일 (그레이스케일+알파 PNG)
+    
+    z는 피라미드 level(0이 가장 낮은 해상도), x는 서쪽, y는 북쪽에서부터의 타일 인덱스입니다.
+    타일 URL은 피라미드 내용 해시를 포함하므로 장기 캐시 헤더와 ETag를 함께 반환합니다.
+    """
+    pyramid = _get_pyramid(pyramid_id)
+    etag = f'"{pyramid_id}-{z}-{x}-{y}"'
+    headers = {"Cache-Control": TILE_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    try:
+        content = pyramid.tile_png(z, x, y)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=f"타일을 찾을 수 없습니다: {str(e)}")
+    return Response(content=content, media_type="image/png", headers=headers)
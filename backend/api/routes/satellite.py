@@ -2,16 +2,30 @@
 위성 생성 및 미션 방향 계산 API 라우트
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.orm import Session
 import numpy as np
-from api.schemas.request import SatelliteCreateRequest, MissionDirectionRequest
-from api.schemas.response import SatelliteCreateResponse, MissionDirectionResponse
+from api.database import get_db
+from api.schemas.request import (
+    SatelliteCreateRequest,
+    MissionDirectionRequest,
+    MissionDirectionBatchRequest,
+    SwathFootprintRequest
+)
+from api.schemas.response import (
+    SatelliteCreateResponse,
+    MissionDirectionResponse,
+    MissionDirectionBatchResponse,
+    SwathFootprintResponse
+)
 from api.schemas.target import SatelliteState
+from api.services.tle_service import get_tle_propagator
 from sar_simulator.common.satellite_orbit_service import (
     llh_to_ecef,
-    ecef_to_llh,
-    calculate_mission_direction
+    calculate_mission_direction,
+    calculate_mission_direction_batch
 )
+from sar_simulator.orbit.ground_track import decimate_indices, calculate_swath_footprint
 
 router = APIRouter()
 
@@ -88,3 +102,118 @@ async def calculate_direction(request: MissionDirectionRequest):
         raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@router.post("/calculate-direction-batch", response_model=MissionDirectionBatchResponse)
+async def calculate_direction_batch(request: MissionDirectionBatchRequest):
+    """
+    미션 방향 일괄 계산
+    
+    궤적 전체(여러 위성 상태)에 대해 빔 방향, Heading, 교차점을 한 번에 계산합니다.
+    """
+    try:
+        # 위성 상태 배열 구성
+        positions = np.array(request.positions, dtype=np.float64)
+        velocities = np.array(request.velocities, dtype=np.float64)
+        
+        # 미션 방향 일괄 계산
+        mission_direction = calculate_mission_direction_batch(
+            positions,
+            velocities,
+            request.mission_location
+        )
+        
+        crossing_points = [
+            point if valid else None
+            for point, valid in zip(
+                mission_direction["crossing_points"].tolist(),
+                mission_direction["crossing_valid"].tolist()
+            )
+        ]
+        
+        # 응답 생성
+        return MissionDirectionBatchResponse(
+            success=True,
+            message="미션 방향 일괄 계산 완료",
+            num_states=len(positions),
+            beam_directions=mission_direction["beam_directions"].tolist(),
+            headings=mission_direction["headings"].tolist(),
+            crossing_points=crossing_points
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@router.post("/swath-footprint", response_model=SwathFootprintResponse)
+async def calculate_swath(request: SwathFootprintRequest, db: Session = Depends(get_db)):
+    """
+    지상 궤적 및 Swath Footprint 계산
+    
+    펄스별 위성 상태, 저장된 TLE 또는 궤도력으로 지정한 궤적 전체에 대해
+    위성 직하점과 Swath near/far 가장자리 폴리라인을 계산합니다.
+    궤적은 max_points개 이하로 균등 간격 추출한 펄스에서만 전파/계산합니다.
+    """
+    try:
+        # 시스템 설정 생성
+        config = request.config.to_sar_system_config()
+        
+        # 추출한 펄스의 위성 상태 준비
+        num_sources = sum([bool(request.satellite_states), request.tle_trajectory is not None, request.ephemeris is not None])
+        if num_sources > 1:
+            raise ValueError("satellite_states, tle_trajectory, ephemeris 중 하나만 지정할 수 있습니다.")
+        if request.tle_trajectory is not None:
+            indices = decimate_indices(request.tle_trajectory.num_pulses, request.max_points)
+            times = indices / config.prf
+            propagator = get_tle_propagator(db, request.tle_trajectory.tle_id)
+            positions, velocities = propagator.propagate(times, request.tle_trajectory.start_time)
+        elif request.ephemeris is not None:
+            if request.ephemeris.num_pulses is None:
+                raise ValueError("ephemeris 사용 시 num_pulses가 필요합니다.")
+            ephemeris = request.ephemeris.to_ephemeris()
+            indices = decimate_indices(request.ephemeris.num_pulses, request.max_points)
+            start_time = ephemeris.start_time if request.ephemeris.start_time is None else request.ephemeris.start_time
+            times = start_time + indices / config.prf
+            positions, velocities = ephemeris.evaluate(times)
+        elif request.satellite_states:
+            indices = decimate_indices(len(request.satellite_states), request.max_points)
+            times = indices / config.prf
+            positions = np.array([request.satellite_states[i].position for i in indices], dtype=np.float64)
+            velocities = np.array([request.satellite_states[i].velocity for i in indices], dtype=np.float64)
+        else:
+            raise ValueError("satellite_states, tle_trajectory, ephemeris 중 하나가 필요합니다.")
+        
+        # 지상 궤적 및 Swath 계산
+        footprint = calculate_swath_footprint(
+            positions,
+            velocities,
+            request.look_angle,
+            config.beamwidth_el,
+            look_side=request.look_side
+        )
+        
+        swath_valid = footprint["near_valid"] & footprint["far_valid"]
+        
+        # 응답 생성
+        return SwathFootprintResponse(
+            success=True,
+            message="지상 궤적 및 Swath 계산 완료",
+            num_points=len(times),
+            times=np.asarray(times, dtype=np.float64).tolist(),
+            ground_track=footprint["ground_track"].tolist(),
+            near_edge=_to_optional_list(footprint["near_edge"], footprint["near_valid"]),
+            far_edge=_to_optional_list(footprint["far_edge"], footprint["far_valid"]),
+            swath_widths=_to_optional_list(footprint["swath_widths"], swath_valid)
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+def _to_optional_list(values: np.ndarray, valid: np.ndarray) -> list:
+    """유효하지 않은 항목을 None으로 바꾼 리스트"""
+    return [value if is_valid else None for value, is_valid in zip(values.tolist(), valid.tolist())]
@@ -1,27 +1,37 @@
 """
 TLE 관련 API 라우트
 
-TLE 데이터의 CRUD 작업을 처리합니다.
+TLE 데이터의 CRUD 작업, 궤도 전파, 관측 기회 탐색을 처리합니다.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List
+from datetime import timedelta
+from functools import partial
+import numpy as np
 
 from api.database import get_db
 from api.schemas.tle import (
     TleCreateRequest,
     TleUpdateRequest,
     TleResponse,
-    TleListResponse
+    TleListResponse,
+    TlePropagateRequest,
+    TlePropagateResponse,
+    AccessWindowRequest,
+    AccessWindowResponse,
+    AccessWindowItem
 )
 from api.services.tle_service import (
     create_tle,
     get_tle,
     get_all_tles,
     update_tle,
-    delete_tle
+    delete_tle,
+    get_tle_propagator
 )
+from sar_simulator.orbit.access_window import calc_off_nadir_limits, find_access_windows
 
 router = APIRouter()
 
@@ -109,3 +119,102 @@ async def delete_tle_endpoint(
     """
     delete_tle(db, tle_id)
     return None
+
+
+@router.post("/{tle_id}/propagate", response_model=TlePropagateResponse)
+async def propagate_tle_endpoint(
+    tle_id: str,
+    request: TlePropagateRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    TLE 궤도 전파
+    
+    저장된 TLE를 SGP4로 전파하여 시간 격자의 ECEF 상태 벡터를 반환합니다.
+    """
+    try:
+        propagator = get_tle_propagator(db, tle_id)
+        
+        times = np.arange(request.num_points) * request.step
+        positions, velocities = propagator.propagate(times, request.start_time)
+        
+        return TlePropagateResponse(
+            success=True,
+            message="TLE 궤도 전파 완료",
+            tle_id=tle_id,
+            epoch=propagator.epoch,
+            start_time=request.start_time if request.start_time is not None else propagator.epoch,
+            times=times.tolist(),
+            positions=positions.tolist(),
+            velocities=velocities.tolist()
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@router.post("/{tle_id}/access-windows", response_model=AccessWindowResponse)
+async def find_access_windows_endpoint(
+    tle_id: str,
+    request: AccessWindowRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    관측 기회(Access Window) 탐색
+    
+    저장된 TLE로 여러 관심 지역을 관측할 수 있는 시간 구간을 한 번에 찾습니다.
+    off_nadir_range를 지정하지 않으면 설정의 swst/swl(el_angle 또는 30°로 rank 추정)로 계산합니다.
+    """
+    try:
+        propagator = get_tle_propagator(db, tle_id)
+        
+        # 관측 가능 off-nadir 각도 범위
+        if request.off_nadir_range is not None:
+            off_nadir_range = tuple(request.off_nadir_range)
+        else:
+            nominal_look_angle = request.config.el_angle if request.config.el_angle else 30.0
+            off_nadir_range = calc_off_nadir_limits(request.config.to_sar_system_config(), nominal_look_angle)
+        
+        # 관심 지역 [경도, 위도(, 고도)] → [위도, 경도(, 고도)]
+        aoi_locations = np.array(request.aoi_locations, dtype=np.float64)
+        if aoi_locations.ndim != 2 or aoi_locations.shape[1] not in (2, 3):
+            raise ValueError("aoi_locations는 [경도, 위도] 또는 [경도, 위도, 고도] 목록이어야 합니다.")
+        aoi_locations[:, [0, 1]] = aoi_locations[:, [1, 0]]
+        
+        windows = find_access_windows(
+            partial(propagator.propagate, start_time=request.start_time),
+            aoi_locations,
+            request.duration,
+            off_nadir_range,
+            look_side=request.look_side,
+            step=request.step,
+            min_elevation=request.min_elevation
+        )
+        
+        start_time = request.start_time if request.start_time is not None else propagator.epoch
+        return AccessWindowResponse(
+            success=True,
+            message="관측 기회 탐색 완료",
+            tle_id=tle_id,
+            start_time=start_time,
+            off_nadir_range=[float(angle) for angle in off_nadir_range],
+            num_windows=len(windows),
+            windows=[
+                AccessWindowItem(
+                    aoi_index=window.aoi_index,
+                    start_time=start_time + timedelta(seconds=window.start_time),
+                    end_time=start_time + timedelta(seconds=window.end_time),
+                    duration=window.duration
+                )
+                for window in windows
+            ]
+        )
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"잘못된 요청: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
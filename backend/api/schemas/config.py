@@ -8,6 +8,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, List
 from datetime import datetime
 from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.orbit.attitude import AttitudeProfile
 
 
 class SarSystemConfigRequest(BaseModel):
@@ -95,6 +96,16 @@ class SarSystemConfigRequest(BaseModel):
             beam_id=self.beam_id
         )
     
+    def to_attitude_profile(self) -> Optional[AttitudeProfile]:
+        """버스 자세 프로파일로 변환 (버스 자세 필드가 모두 없으면 None)"""
+        values = [
+            self.bus_roll_angle, self.bus_pitch_angle, self.bus_yaw_angle,
+            self.bus_roll_rate, self.bus_pitch_rate, self.bus_yaw_rate
+        ]
+        if all(value is None for value in values):
+            return None
+        return AttitudeProfile(*[value or 0.0 for value in values])
+    
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
@@ -7,7 +7,8 @@ API 요청을 위한 Pydantic 스키마입니다.
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
 from api.schemas.config import SarSystemConfigRequest
-from api.schemas.target import TargetRequest, SatelliteState
+from api.schemas.target import TargetRequest, SatelliteState, ClutterRequest, EphemerisRequest
+from api.schemas.tle import TleTrajectoryRequest
 
 
 class EchoSimulateRequest(BaseModel):
@@ -15,8 +16,10 @@ class EchoSimulateRequest(BaseModel):
     
     # 시스템 설정 (인라인 또는 참조)
     config: SarSystemConfigRequest = Field(..., description="SAR 시스템 설정")
-    targets: List[TargetRequest] = Field(..., description="타겟 리스트")
+    targets: List[TargetRequest] = Field(default_factory=list, description="타겟 리스트")
+    scene_file: Optional[str] = Field(None, description="Scene 파일 경로 (지정 시 빔 footprint와 겹치는 타겟을 targets에 추가)")
     satellite_state: SatelliteState = Field(..., description="위성 상태")
+    aggregate_cell_fraction: Optional[float] = Field(None, description="해상도 셀 단위 타겟 집계 셀 크기 비율 (None이면 집계하지 않음, 작을수록 정확)", gt=0)
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -52,8 +55,18 @@ class EchoSimulateMultipleRequest(BaseModel):
     """여러 펄스 Echo 시뮬레이션 요청 스키마"""
     
     config: SarSystemConfigRequest = Field(..., description="SAR 시스템 설정")
-    targets: List[TargetRequest] = Field(..., description="타겟 리스트")
-    satellite_states: List[SatelliteState] = Field(..., description="위성 상태 배열")
+    targets: List[TargetRequest] = Field(default_factory=list, description="타겟 리스트")
+    scene_file: Optional[str] = Field(None, description="Scene 파일 경로 (지정 시 빔 footprint와 겹치는 타겟을 targets에 추가)")
+    satellite_states: List[SatelliteState] = Field(default_factory=list, description="위성 상태 배열")
+    tle_trajectory: Optional[TleTrajectoryRequest] = Field(None, description="TLE 기반 궤적 (satellite_states 대신 저장된 TLE를 PRF 간격으로 전파)")
+    ephemeris: Optional[EphemerisRequest] = Field(None, description="궤도력 (satellite_states 대신 듬성한 상태 벡터를 PRF 간격으로 보간, num_pulses 필수)")
+    aggregate_cell_fraction: Optional[float] = Field(None, description="해상도 셀 단위 타겟 집계 셀 크기 비율 (None이면 집계하지 않음, 작을수록 정확)", gt=0)
+    range_compressed: bool = Field(False, description="Range 압축된 Echo 생성 여부 (Chirp 합성 및 정합 필터링 생략)")
+    clutter: Optional[ClutterRequest] = Field(None, description="분포 클러터 영역 (지정 시 점 타겟 Echo에 클러터 Echo를 더함)")
+    add_noise: bool = Field(False, description="수신기 열잡음(k·Tsys·bw) 추가 여부")
+    noise_seed: Optional[int] = Field(None, description="잡음 seed (같은 seed는 같은 잡음, None이면 임의 seed)", ge=0)
+    adc_quantize: bool = Field(False, description="config의 adc_bits로 ADC 양자화 여부 (True인 경우 cint16 형식과 scale_factor로 응답)")
+    adc_full_scale: Optional[float] = Field(None, description="ADC 최대 입력 진폭 (지정 시 I, Q 초과 값은 포화, None이면 양자화는 Echo I, Q 최대 절댓값 기준)", gt=0)
 
 
 class RawDataSaveRequest(BaseModel):
@@ -61,9 +74,15 @@ class RawDataSaveRequest(BaseModel):
     
     config_request: SarSystemConfigRequest = Field(..., description="SAR 시스템 설정")
     echo_data_base64: str = Field(..., description="Base64 인코딩된 Echo 데이터")
-    satellite_states: List[SatelliteState] = Field(..., description="위성 상태 배열")
+    sample_format: str = Field("complex64", description="Echo 샘플 형식 (complex64: float32 실수/허수, cint16: int16 I/Q 코드 그대로 저장)")
+    scale_factor: Optional[float] = Field(None, description="cint16 스케일 팩터 (복소 샘플 = (I + jQ) * scale_factor, cint16 형식에서 필수)", gt=0)
+    satellite_states: List[SatelliteState] = Field(default_factory=list, description="위성 상태 배열")
+    ephemeris: Optional[EphemerisRequest] = Field(None, description="궤도력 (satellite_states 대신 듬성한 상태 벡터를 PRF 간격으로 보간)")
     filepath: str = Field(..., description="저장할 파일 경로")
     group_name: str = Field("SSG00", description="그룹 이름")
+    compression: Optional[str] = Field(None, description="Echo 데이터 압축 코덱 (None: 압축 없음, gzip, lzf, blosc-zstd는 hdf5plugin 필요)")
+    compression_level: Optional[int] = Field(None, description="압축 레벨 (None이면 코덱 기본값, gzip/blosc-zstd: 0-9)")
+    baq_bits: Optional[int] = Field(None, description="BAQ 인코딩 비트 수 (None이면 float32 저장, config의 adc_bits 이하)", ge=1, le=8)
 
 
 class SarImageProcessRequest(BaseModel):
@@ -72,10 +91,15 @@ class SarImageProcessRequest(BaseModel):
     config: SarSystemConfigRequest = Field(..., description="SAR 시스템 설정")
     echo_data_base64: str = Field(..., description="Base64 인코딩된 Echo 신호 데이터")
     shape: List[int] = Field(..., description="Echo 신호 shape [num_pulses, num_samples]")
+    sample_format: str = Field("complex64", description="Echo 샘플 형식 (complex64: float32 실수/허수, cint16: int16 I/Q 코드)")
+    scale_factor: Optional[float] = Field(None, description="cint16 스케일 팩터 (복소 샘플 = (I + jQ) * scale_factor, cint16 형식에서 필수)", gt=0)
     satellite_velocity: List[float] = Field(..., description="위성 속도 벡터 [vx, vy, vz] (m/s)")
     dynamic_range: float = Field(50.0, description="SAR 이미지 동적 범위 (dB)")
     process_full_swath: bool = Field(False, description="전체 swath 처리 여부 (False: 타겟 영역만, True: 전체 영역)")
     process_both: bool = Field(False, description="타겟 영역과 전체 영역 모두 처리 여부")
+    range_compressed: bool = Field(False, description="입력 Echo가 이미 Range 압축된 신호인지 여부 (True인 경우 Pulse Compression 생략)")
+    tiled: bool = Field(False, description="타일 피라미드 생성 여부 (True인 경우 응답에 타일 메타데이터 포함, 타일은 /tiles 엔드포인트로 제공)")
+    image_bounds: Optional[List[float]] = Field(None, description="SAR 이미지를 감싸는 경위도 사각형 [west, south, east, north] (단위: deg, 타일 오버레이 위치)", min_length=4, max_length=4)
     
     model_config = ConfigDict(
         json_schema_extra={
@@ -137,3 +161,66 @@ class MissionDirectionRequest(BaseModel):
             }
         }
     )
+
+
+class MissionDirectionBatchRequest(BaseModel):
+    """미션 방향 일괄 계산 요청 스키마"""
+    
+    positions: List[List[float]] = Field(..., description="위성 위치 목록 (ECEF 좌표, [[x, y, z], ...], 단위: m)", min_length=1)
+    velocities: List[List[float]] = Field(..., description="위성 속도 목록 (ECEF 좌표, [[vx, vy, vz], ...], 단위: m/s)", min_length=1)
+    mission_location: List[float] = Field(..., description="미션 위치 (지리 좌표: [경도, 위도], 단위: [deg, deg])", min_length=2, max_length=2)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "positions": [
+                    [6378137.0 + 517000.0, 0.0, 0.0],
+                    [6378137.0 + 517000.0, 7266.0, 0.0]
+                ],
+                "velocities": [
+                    [0.0, 7266.0, 0.0],
+                    [0.0, 7266.0, 0.0]
+                ],
+                "mission_location": [128.1, 37.1]
+            }
+        }
+    )
+
+
+class SwathFootprintRequest(BaseModel):
+    """지상 궤적 및 Swath Footprint 계산 요청 스키마"""
+    
+    config: SarSystemConfigRequest = Field(..., description="SAR 시스템 설정 (PRF와 고각 빔폭 사용)")
+    satellite_states: List[SatelliteState] = Field(default_factory=list, description="펄스별 위성 상태 배열")
+    tle_trajectory: Optional[TleTrajectoryRequest] = Field(None, description="TLE 기반 궤적 (satellite_states 대신 저장된 TLE를 PRF 간격으로 전파)")
+    ephemeris: Optional[EphemerisRequest] = Field(None, description="궤도력 (satellite_states 대신 듬성한 상태 벡터를 PRF 간격으로 보간, num_pulses 필수)")
+    look_angle: float = Field(30.0, description="빔 중심 off-nadir 각도 (단위: deg)", ge=0.0, lt=90.0)
+    look_side: str = Field("right", description="관측 방향 (right: 진행 방향 오른쪽, left: 왼쪽)")
+    max_points: int = Field(500, description="최대 출력 점 개수 (궤적을 균등 간격으로 추출, 최대 100,000)", ge=2, le=100000)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "config": {
+                    "fc": 5.4e9,
+                    "bw": 150e6,
+                    "fs": 250e6,
+                    "taup": 10e-6,
+                    "prf": 5000,
+                    "swst": 10e-6,
+                    "swl": 50e-6,
+                    "orbit_height": 517e3,
+                    "antenna_width": 4.0,
+                    "antenna_height": 0.5
+                },
+                "tle_trajectory": {
+                    "tle_id": "123e4567-e89b-12d3-a456-426614174000",
+                    "start_time": None,
+                    "num_pulses": 3000000
+                },
+                "look_angle": 30.0,
+                "look_side": "right",
+                "max_points": 500
+            }
+        }
+    )
@@ -30,6 +30,8 @@ class EchoResponse(BaseModel):
     num_samples: int = Field(..., description="샘플 수")
     max_amplitude: float = Field(..., description="최대 진폭")
     mean_amplitude: float = Field(..., description="평균 진폭")
+    num_targets_eliminated: Optional[int] = Field(None, description="타겟 집계로 제거된 타겟 수")
+    aggregation_error: Optional[float] = Field(None, description="타겟 집계 근사 오차 (오차 에너지 비율)")
 
 
 class EchoMultipleResponse(BaseModel):
@@ -38,10 +40,13 @@ class EchoMultipleResponse(BaseModel):
     success: bool = Field(..., description="성공 여부")
     message: str = Field(..., description="응답 메시지")
     shape: List[int] = Field(..., description="신호 shape [num_pulses, num_samples]")
-    dtype: str = Field(..., description="데이터 타입")
+    dtype: str = Field(..., description="데이터 타입 (complex64 또는 cint16)")
     data: str = Field(..., description="Base64 인코딩된 신호 데이터")
     num_pulses: int = Field(..., description="펄스 개수")
     num_samples: int = Field(..., description="샘플 수")
+    scale_factor: Optional[float] = Field(None, description="cint16 스케일 팩터 (복소 샘플 = (I + jQ) * scale_factor)")
+    num_targets_eliminated: Optional[int] = Field(None, description="타겟 집계로 제거된 타겟 수")
+    aggregation_error: Optional[float] = Field(None, description="타겟 집계 근사 오차 (오차 에너지 비율)")
 
 
 class RawDataSaveResponse(BaseModel):
@@ -61,12 +66,13 @@ class SarImageResponse(BaseModel):
     success: bool = Field(..., description="성공 여부")
     message: str = Field(..., description="응답 메시지")
     shape: List[int] = Field(..., description="SAR 이미지 shape [azimuth_samples, range_samples]")
-    data: str = Field(..., description="Base64 인코딩된 SAR 이미지 데이터 (dB 스케일, float32)")
+    data: Optional[str] = Field(None, description="Base64 인코딩된 SAR 이미지 데이터 (dB 스케일, float32, tiled=True인 경우 생략)")
     range_extent: List[float] = Field(..., description="Range 범위 [min, max] (m)")
     azimuth_extent: List[float] = Field(..., description="Azimuth 범위 [min, max] (m)")
     max_value: float = Field(..., description="최대 값 (dB)")
     min_value: float = Field(..., description="최소 값 (dB)")
     is_full_swath: bool = Field(False, description="전체 swath 여부")
+    tiles: Optional[dict] = Field(None, description="타일 피라미드 메타데이터 (tiled=True인 경우)")
 
 
 class SarImageBothResponse(BaseModel):
@@ -124,3 +130,55 @@ class MissionDirectionResponse(BaseModel):
             }
         }
     )
+
+
+class MissionDirectionBatchResponse(BaseModel):
+    """미션 방향 일괄 계산 응답 스키마"""
+    
+    success: bool = Field(..., description="성공 여부")
+    message: str = Field(..., description="응답 메시지")
+    num_states: int = Field(..., description="위성 상태 수")
+    beam_directions: List[List[float]] = Field(..., description="빔 방향 벡터 목록 (ECEF 좌표, 정규화된 벡터)")
+    headings: List[float] = Field(..., description="Heading 각도 목록 (단위: deg, 0-360)")
+    crossing_points: List[Optional[List[float]]] = Field(..., description="빔과 지구 교차점 목록 (지리 좌표: [경도, 위도, 고도]), 교차점이 없으면 null")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "success": True,
+                "message": "미션 방향 일괄 계산 완료",
+                "num_states": 2,
+                "beam_directions": [[0.0, 0.0, -1.0], [0.0, 0.0, -1.0]],
+                "headings": [0.0, 0.0],
+                "crossing_points": [[128.1, 37.1, 0.0], None]
+            }
+        }
+    )
+
+
+class SwathFootprintResponse(BaseModel):
+    """지상 궤적 및 Swath Footprint 계산 응답 스키마"""
+    
+    success: bool = Field(..., description="성공 여부")
+    message: str = Field(..., description="응답 메시지")
+    num_points: int = Field(..., description="출력 점 개수")
+    times: List[float] = Field(..., description="점별 펄스 시각 (단위: s, 첫 펄스 기준 또는 궤도력 시각)")
+    ground_track: List[List[float]] = Field(..., description="위성 직하점 목록 (지리 좌표: [경도, 위도, 고도])")
+    near_edge: List[Optional[List[float]]] = Field(..., description="Swath near 가장자리 목록 (지리 좌표: [경도, 위도, 고도]), 교차점이 없으면 null")
+    far_edge: List[Optional[List[float]]] = Field(..., description="Swath far 가장자리 목록 (지리 좌표: [경도, 위도, 고도]), 교차점이 없으면 null")
+    swath_widths: List[Optional[float]] = Field(..., description="near/far 가장자리 간 거리 목록 (단위: m), 교차점이 없으면 null")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "success": True,
+                "message": "지상 궤적 및 Swath 계산 완료",
+                "num_points": 2,
+                "times": [0.0, 600.0],
+                "ground_track": [[128.0, 36.0, 0.0], [125.9, 72.1, 0.0]],
+                "near_edge": [[130.8, 36.4, 0.0], [135.1, 72.9, 0.0]],
+                "far_edge": [[131.5, 36.5, 0.0], [137.5, 73.1, 0.0]],
+                "swath_widths": [63120.5, 63118.9]
+            }
+        }
+    )
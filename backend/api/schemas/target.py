@@ -7,6 +7,8 @@
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
 
+from sar_simulator.orbit.ephemeris import Ephemeris
+
 
 class TargetRequest(BaseModel):
     """타겟 요청 스키마"""
@@ -42,3 +44,59 @@ class SatelliteState(BaseModel):
             }
         }
     )
+
+
+class ClutterRequest(BaseModel):
+    """분포 클러터 요청 스키마"""
+    
+    sigma0_db: float = Field(..., description="후방산란계수 σ⁰ (단위: dB)")
+    upper_left: List[float] = Field(..., description="영역 좌상단 (지리 좌표: [경도, 위도], 단위: [deg, deg])", min_length=2, max_length=2)
+    lower_right: List[float] = Field(..., description="영역 우하단 (지리 좌표: [경도, 위도], 단위: [deg, deg])", min_length=2, max_length=2)
+    height: float = Field(0.0, description="영역 고도 (단위: m)")
+    seed: Optional[int] = Field(None, description="난수 시드")
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "sigma0_db": -15.0,
+                "upper_left": [127.0, 37.1],
+                "lower_right": [127.1, 37.0],
+                "height": 0.0,
+                "seed": None
+            }
+        }
+    )
+
+
+class EphemerisRequest(BaseModel):
+    """궤도력 (듬성한 상태 벡터) 스키마"""
+    
+    times: List[float] = Field(..., description="노드 시각 (단위: s, 엄격히 증가)", min_length=2)
+    positions: List[List[float]] = Field(..., description="노드 위치 (ECEF 좌표, [[x, y, z], ...], 단위: m)", min_length=2)
+    velocities: List[List[float]] = Field(..., description="노드 속도 (ECEF 좌표, [[vx, vy, vz], ...], 단위: m/s)", min_length=2)
+    start_time: Optional[float] = Field(None, description="첫 펄스 시각 (단위: s, None이면 첫 노드 시각)")
+    num_pulses: Optional[int] = Field(None, description="펄스 개수 (PRF 간격으로 보간, 최대 100,000,000, Raw Data 저장 시 생략하면 Echo 데이터에서 계산, Echo 시뮬레이션은 별도의 펄스 개수 및 Echo 행렬 크기 한도 적용)", ge=1, le=100000000)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "times": [0.0, 10.0, 20.0],
+                "positions": [
+                    [6895137.0, 0.0, 0.0],
+                    [6894754.2, 72650.6, 0.0],
+                    [6893605.9, 145293.1, 0.0]
+                ],
+                "velocities": [
+                    [0.0, 7603.0, 0.0],
+                    [-80.1, 7602.6, 0.0],
+                    [-160.2, 7601.3, 0.0]
+                ],
+                "start_time": 0.0,
+                "num_pulses": 1000
+            }
+        }
+    )
+    
+    def to_ephemeris(self) -> Ephemeris:
+        """Ephemeris 객체로 변환"""
+        return Ephemeris(self.times, self.positions, self.velocities)
@@ -7,6 +7,7 @@ TLE API 요청 및 응답을 위한 Pydantic 스키마입니다.
 from pydantic import BaseModel, Field, ConfigDict, field_validator
 from typing import List, Optional
 from datetime import datetime
+from api.schemas.config import SarSystemConfigRequest
 
 
 class TleCreateRequest(BaseModel):
@@ -108,3 +109,99 @@ class TleListResponse(BaseModel):
             }
         }
     )
+
+
+class TlePropagateRequest(BaseModel):
+    """TLE 궤도 전파 요청 스키마"""
+    
+    start_time: Optional[datetime] = Field(None, description="전파 시작 시각 (UTC, None이면 TLE 기준 시각)")
+    step: float = Field(..., description="시간 간격 (단위: s)", gt=0)
+    num_points: int = Field(..., description="시간 격자 점 개수 (최대 100,000)", ge=1, le=100000)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "start_time": "2024-01-01T03:00:00",
+                "step": 1.0,
+                "num_points": 600
+            }
+        }
+    )
+
+
+class TlePropagateResponse(BaseModel):
+    """TLE 궤도 전파 응답 스키마"""
+    
+    success: bool = Field(..., description="성공 여부")
+    message: str = Field(..., description="응답 메시지")
+    tle_id: str = Field(..., description="TLE ID")
+    epoch: datetime = Field(..., description="TLE 기준 시각 (UTC)")
+    start_time: datetime = Field(..., description="전파 시작 시각 (UTC)")
+    times: List[float] = Field(..., description="시작 시각으로부터의 경과 시간 (단위: s)")
+    positions: List[List[float]] = Field(..., description="위성 위치 (ECEF 좌표, [[x, y, z], ...], 단위: m)")
+    velocities: List[List[float]] = Field(..., description="위성 속도 (ECEF 좌표, [[vx, vy, vz], ...], 단위: m/s)")
+
+
+class TleTrajectoryRequest(BaseModel):
+    """TLE 기반 위성 궤적 요청 스키마"""
+    
+    tle_id: str = Field(..., description="TLE ID")
+    start_time: Optional[datetime] = Field(None, description="첫 펄스 시각 (UTC, None이면 TLE 기준 시각)")
+    num_pulses: int = Field(..., description="펄스 개수 (PRF 간격으로 전파, 최대 100,000,000, Echo 시뮬레이션은 별도의 펄스 개수 및 Echo 행렬 크기 한도 적용)", ge=1, le=100000000)
+
+
+class AccessWindowRequest(BaseModel):
+    """관측 기회(Access Window) 탐색 요청 스키마"""
+    
+    config: SarSystemConfigRequest = Field(..., description="SAR 시스템 설정 (swst/swl로 관측 가능 off-nadir 각도 범위 계산)")
+    aoi_locations: List[List[float]] = Field(..., description="관심 지역 목록 (지리 좌표: [[경도, 위도], ...] 또는 [[경도, 위도, 고도], ...], 최대 1,000개)", min_length=1, max_length=1000)
+    start_time: Optional[datetime] = Field(None, description="탐색 시작 시각 (UTC, None이면 TLE 기준 시각)")
+    duration: float = Field(..., description="탐색 기간 (단위: s, 최대 30일)", gt=0, le=30 * 86400)
+    off_nadir_range: Optional[List[float]] = Field(None, description="관측 가능 off-nadir 각도 범위 [최소, 최대] (단위: deg, None이면 swst/swl에서 계산)", min_length=2, max_length=2)
+    look_side: str = Field("right", description="관측 방향 (right, left, both)")
+    min_elevation: float = Field(0.0, description="관심 지역에서 본 최소 위성 고도각 (단위: deg)", ge=0.0, lt=90.0)
+    step: float = Field(20.0, description="거친 탐색 격자 시간 간격 (단위: s, 최소 1, 격자 시각 수 × AOI 개수는 최대 20,000,000)", ge=1.0)
+    
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "config": {
+                    "fc": 5.4e9,
+                    "bw": 150e6,
+                    "fs": 250e6,
+                    "taup": 11e-6,
+                    "prf": 5930,
+                    "swst": 47.8e-6,
+                    "swl": 45.5e-6,
+                    "orbit_height": 561e3,
+                    "antenna_width": 4.0,
+                    "antenna_height": 0.5
+                },
+                "aoi_locations": [[127.0, 37.5], [129.0, 35.1]],
+                "start_time": "2024-01-01T00:00:00",
+                "duration": 259200,
+                "look_side": "right"
+            }
+        }
+    )
+
+
+class AccessWindowItem(BaseModel):
+    """관측 가능 시간 구간 스키마"""
+    
+    aoi_index: int = Field(..., description="관심 지역 인덱스 (aoi_locations 순서)")
+    start_time: datetime = Field(..., description="구간 시작 시각 (UTC)")
+    end_time: datetime = Field(..., description="구간 종료 시각 (UTC)")
+    duration: float = Field(..., description="구간 길이 (단위: s)")
+
+
+class AccessWindowResponse(BaseModel):
+    """관측 기회(Access Window) 탐색 응답 스키마"""
+    
+    success: bool = Field(..., description="성공 여부")
+    message: str = Field(..., description="응답 메시지")
+    tle_id: str = Field(..., description="TLE ID")
+    start_time: datetime = Field(..., description="탐색 시작 시각 (UTC)")
+    off_nadir_range: List[float] = Field(..., description="사용된 off-nadir 각도 범위 [최소, 최대] (단위: deg)")
+    num_windows: int = Field(..., description="관측 가능 구간 수")
+    windows: List[AccessWindowItem] = Field(..., description="시작 시각 순 관측 가능 구간 목록")
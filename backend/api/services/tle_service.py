@@ -1,16 +1,24 @@
 """
 TLE 서비스
 
-TLE의 CRUD 비즈니스 로직을 처리합니다.
+TLE의 CRUD 및 궤도 전파 비즈니스 로직을 처리합니다.
 """
 
+from collections import OrderedDict
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
-from typing import List
+from typing import List, Tuple
 from datetime import datetime
 
 from api.models.tle import TleModel
 from api.schemas.tle import TleCreateRequest, TleUpdateRequest
+from sar_simulator.orbit.tle_propagator import TlePropagator
+
+
+# 파싱된 TLE 전파기 캐시 {tle_id: (updated_at, TlePropagator)}
+# 개수가 한도를 넘으면 가장 오래 사용하지 않은 전파기부터 제거
+_propagator_cache: "OrderedDict[str, Tuple[datetime, TlePropagator]]" = OrderedDict()
+MAX_CACHED_PROPAGATORS = 64
 
 
 def create_tle(db: Session, tle_data: TleCreateRequest) -> TleModel:
@@ -137,6 +145,7 @@ def update_tle(db: Session, tle_id: str, tle_data: TleUpdateRequest) -> TleModel
     
     db.commit()
     db.refresh(db_tle)
+    invalidate_tle_propagator(tle_id)
     
     return db_tle
 
@@ -166,5 +175,59 @@ def delete_tle(db: Session, tle_id: str) -> bool:
     
     db.delete(db_tle)
     db.commit()
+    invalidate_tle_propagator(tle_id)
     
     return True
+
+
+def get_tle_propagator(db: Session, tle_id: str) -> TlePropagator:
+    """
+    TLE 궤도 전파기 조회
+    
+    파싱된 전파기를 최근 사용 순으로 최대 MAX_CACHED_PROPAGATORS개까지 메모리에 캐시하며,
+    TLE의 updated_at이 바뀌면 다시 파싱합니다.
+    
+    Parameters:
+    -----------
+    db : Session
+        데이터베이스 세션
+    tle_id : str
+        TLE ID (UUID)
+    
+    Returns:
+    --------
+    TlePropagator
+        TLE 궤도 전파기
+    
+    Raises:
+    -------
+    HTTPException
+        TLE를 찾을 수 없는 경우 404 에러
+    ValueError
+        TLE 파싱에 실패한 경우
+    """
+    tle = get_tle(db, tle_id)
+    
+    cached = _propagator_cache.get(tle_id)
+    if cached is not None and cached[0] == tle.updated_at:
+        _propagator_cache.move_to_end(tle_id)
+        return cached[1]
+    
+    propagator = TlePropagator(tle.tle_data)
+    _propagator_cache[tle_id] = (tle.updated_at, propagator)
+    _propagator_cache.move_to_end(tle_id)
+    while len(_propagator_cache) > MAX_CACHED_PROPAGATORS:
+        _propagator_cache.popitem(last=False)
+    return propagator
+
+
+def invalidate_tle_propagator(tle_id: str):
+    """
+    TLE 궤도 전파기 캐시 무효화
+    
+    Parameters:
+    -----------
+    tle_id : str
+        TLE ID (UUID)
+    """
+    _propagator_cache.pop(tle_id, None)
@@ -19,6 +19,18 @@ from sar_simulator.common.target_model import (
     TargetList,
 )
 
+from sar_simulator.common.cint16_echo import (
+    CInt16Echo,
+    quantize_cint16,
+    cint16_scale,
+    quantize_cint16_into,
+)
+
+from sar_simulator.common.target_aggregation import (
+    AggregationReport,
+    aggregate_targets,
+)
+
 from sar_simulator.common.geometry_utils import (
     calc_distance_to_target,
     calc_2way_range,
@@ -26,6 +38,19 @@ from sar_simulator.common.geometry_utils import (
     calc_ambiguous_time_delay,
 )
 
+from sar_simulator.common.coordinates import (
+    llh_to_ecef,
+    ecef_to_llh,
+    llh_to_ecef_array,
+    ecef_to_llh_array,
+    enu_rotation,
+    ned_rotation,
+    ecef_to_enu,
+    enu_to_ecef,
+    ecef_to_ned,
+    ned_to_ecef,
+)
+
 from sar_simulator.common.propagation_model import (
     calc_atmospheric_loss,
     calc_path_loss,
@@ -46,10 +71,26 @@ __all__ = [
     "SarSystemConfig",
     "Target",
     "TargetList",
+    "CInt16Echo",
+    "quantize_cint16",
+    "cint16_scale",
+    "quantize_cint16_into",
+    "AggregationReport",
+    "aggregate_targets",
     "calc_distance_to_target",
     "calc_2way_range",
     "calc_time_delay",
     "calc_ambiguous_time_delay",
+    "llh_to_ecef",
+    "ecef_to_llh",
+    "llh_to_ecef_array",
+    "ecef_to_llh_array",
+    "enu_rotation",
+    "ned_rotation",
+    "ecef_to_enu",
+    "enu_to_ecef",
+    "ecef_to_ned",
+    "ned_to_ecef",
     "calc_atmospheric_loss",
     "calc_path_loss",
     "dB",
@@ -0,0 +1,270 @@
+"""
+CInt16 Echo 컨테이너
+
+ADC 양자화된 Echo를 int16 (I, Q) 쌍과 스케일 팩터로 보관합니다.
+complex64 대비 메모리/전송/저장 크기가 절반이며, slicing한 구간만 complex64로 복원합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional, Iterator, Tuple
+
+
+# 블록 단위 양자화/복원 시 기본 펄스 수
+DEFAULT_CINT16_BLOCK_PULSES = 256
+
+
+@dataclass
+class CInt16Echo:
+    """
+    CInt16 Echo 데이터
+    
+    복소 샘플 값은 (I + jQ) * scale 입니다. shape [num_pulses, num_samples], dtype complex64인
+    배열처럼 slicing할 수 있으며, 인덱싱 결과는 해당 구간만 복원한 complex64 배열입니다.
+    
+    Attributes:
+    -----------
+    data : np.ndarray
+        양자화 코드 (shape: [num_pulses, num_samples, 2], dtype: int16, 마지막 축은 I, Q)
+    scale : float
+        코드 1에 해당하는 진폭 (LSB 크기)
+    adc_bits : int
+        양자화 비트 수 (코드 범위: ±(2^(adc_bits-1) - 1))
+    """
+    data: np.ndarray
+    scale: float
+    adc_bits: int = 16
+    
+    def __post_init__(self):
+        if self.data.dtype != np.int16 or self.data.ndim != 3 or self.data.shape[2] != 2:
+            raise ValueError(f"data는 [펄스 수, 샘플 수, 2] int16 배열이어야 합니다: {self.data.dtype}, {self.data.shape}")
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """복소 Echo shape [num_pulses, num_samples]"""
+        return self.data.shape[:2]
+    
+    @property
+    def dtype(self) -> np.dtype:
+        """복원 dtype (complex64)"""
+        return np.dtype(np.complex64)
+    
+    @property
+    def ndim(self) -> int:
+        """차원 수"""
+        return 2
+    
+    @property
+    def nbytes(self) -> int:
+        """양자화 코드 크기 (bytes)"""
+        return self.data.nbytes
+    
+    def __len__(self) -> int:
+        """펄스 수"""
+        return self.data.shape[0]
+    
+    def __getitem__(self, key) -> np.ndarray:
+        """
+        펄스/샘플 구간을 complex64로 복원
+        
+        Parameters:
+        -----------
+        key : int, slice, 배열 또는 (펄스, 샘플) tuple
+        
+        Returns:
+        --------
+        np.ndarray
+            complex64 Echo 데이터 (정수 인덱스 차원은 제거)
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > 2:
+            raise IndexError("CInt16Echo는 2차원 (펄스, 샘플) 인덱스만 지원합니다.")
+        return self._decode(self.data[key + (slice(None),) * (2 - len(key))])
+    
+    def __array__(self, dtype=None, copy=None):
+        """np.asarray() 변환 (전체 복원)"""
+        data = self.to_complex64()
+        return data if dtype is None else data.astype(dtype)
+    
+    def to_complex64(self) -> np.ndarray:
+        """
+        전체 Echo를 complex64로 복원
+        
+        Returns:
+        --------
+        np.ndarray
+            Echo 데이터 (shape: [num_pulses, num_samples], dtype: complex64)
+        """
+        return self._decode(self.data)
+    
+    def iter_blocks(self, block_pulses: int = DEFAULT_CINT16_BLOCK_PULSES) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        펄스 블록 단위 complex64 복원
+        
+        Parameters:
+        -----------
+        block_pulses : int
+            블록당 펄스 수 (기본값: 256)
+        
+        Returns:
+        --------
+        Iterator[Tuple[int, np.ndarray]]
+            (블록 첫 펄스 인덱스, complex64 Echo 블록)
+        """
+        if block_pulses <= 0:
+            raise ValueError("block_pulses는 0보다 커야 합니다.")
+        for start in range(0, len(self), block_pulses):
+            yield start, self._decode(self.data[start:start + block_pulses])
+    
+    def tobytes(self) -> bytes:
+        """
+        전송용 바이트열 ([I, Q, I, Q, ...] int16 little-endian)
+        
+        Returns:
+        --------
+        bytes
+            양자화 코드 바이트열
+        """
+        return self.data.astype('<i2', copy=False).tobytes()
+    
+    @classmethod
+    def frombuffer(
+        cls,
+        buffer: bytes,
+        shape: Tuple[int, int],
+        scale: float,
+        adc_bits: int = 16
+    ) -> "CInt16Echo":
+        """
+        tobytes() 바이트열에서 생성
+        
+        Parameters:
+        -----------
+        buffer : bytes
+            [I, Q, I, Q, ...] int16 little-endian 바이트열
+        shape : Tuple[int, int]
+            Echo shape [num_pulses, num_samples]
+        scale : float
+            스케일 팩터 (코드 1에 해당하는 진폭)
+        adc_bits : int
+            양자화 비트 수
+        
+        Returns:
+        --------
+        CInt16Echo
+            CInt16 Echo 데이터
+        """
+        codes = np.frombuffer(buffer, dtype='<i2')
+        num_pulses, num_samples = shape
+        if codes.size != num_pulses * num_samples * 2:
+            raise ValueError(f"CInt16 데이터 크기({codes.size // 2})가 shape {list(shape)}와 맞지 않습니다.")
+        return cls(codes.astype(np.int16).reshape(num_pulses, num_samples, 2), float(scale), adc_bits)
+    
+    def _decode(self, codes: np.ndarray) -> np.ndarray:
+        """int16 (I, Q) 코드를 complex64로 복원"""
+        pairs = codes.astype(np.float32)
+        pairs *= np.float32(self.scale)
+        return pairs.view(np.complex64)[..., 0]
+
+
+def quantize_cint16(
+    echo_signals: np.ndarray,
+    adc_bits: int = 16,
+    full_scale: Optional[float] = None,
+    block_pulses: int = DEFAULT_CINT16_BLOCK_PULSES
+) -> CInt16Echo:
+    """
+    complex Echo를 ADC 양자화하여 CInt16Echo 생성
+    
+    I, Q 각각을 ±full_scale 범위에서 adc_bits 비트 대칭 균일 양자화합니다
+    (scale = full_scale / (2^(adc_bits-1) - 1), 범위를 넘는 값은 포화).
+    펄스 블록 단위로 변환하여 임시 배열 크기를 제한합니다.
+    
+    Parameters:
+    -----------
+    echo_signals : np.ndarray
+        Echo 신호 (shape: [num_pulses, num_samples], 복소수)
+    adc_bits : int
+        ADC 비트 수 (2 ~ 16, 기본값: 16)
+    full_scale : float, optional
+        ADC 최대 입력 진폭 (None이면 I, Q 절댓값의 최댓값)
+    block_pulses : int
+        블록당 펄스 수 (기본값: 256)
+    
+    Returns:
+    --------
+    CInt16Echo
+        양자화된 Echo
+    """
+    if not 2 <= adc_bits <= 16:
+        raise ValueError(f"CInt16 양자화 비트 수는 2 ~ 16이어야 합니다: {adc_bits}")
+    if np.ndim(echo_signals) != 2:
+        raise ValueError(f"Echo 신호는 [펄스 수, 샘플 수] 배열이어야 합니다: {echo_signals.shape}")
+    if full_scale is not None and full_scale <= 0:
+        raise ValueError(f"full_scale은 0보다 커야 합니다: {full_scale}")
+    
+    echo_signals = np.ascontiguousarray(echo_signals, dtype=np.complex64)
+    if full_scale is None:
+        components = echo_signals.view(np.float32)
+        full_scale = max(float(np.max(components, initial=0.0)), -float(np.min(components, initial=0.0)))
+    
+    scale = cint16_scale(full_scale, adc_bits) if full_scale > 0 else 1.0
+    
+    codes = np.empty(echo_signals.shape + (2,), dtype=np.int16)
+    for start in range(0, echo_signals.shape[0], block_pulses):
+        quantize_cint16_into(echo_signals[start:start + block_pulses], codes[start:start + block_pulses], scale, adc_bits)
+    
+    return CInt16Echo(codes, scale, adc_bits)
+
+
+def cint16_scale(full_scale: float, adc_bits: int = 16) -> float:
+    """
+    ADC 양자화 스케일 (코드 1에 해당하는 진폭)
+    
+    Parameters:
+    -----------
+    full_scale : float
+        ADC 최대 입력 진폭
+    adc_bits : int
+        ADC 비트 수 (2 ~ 16, 기본값: 16)
+    
+    Returns:
+    --------
+    float
+        full_scale / (2^(adc_bits-1) - 1)
+    """
+    if not 2 <= adc_bits <= 16:
+        raise ValueError(f"CInt16 양자화 비트 수는 2 ~ 16이어야 합니다: {adc_bits}")
+    if full_scale <= 0:
+        raise ValueError(f"full_scale은 0보다 커야 합니다: {full_scale}")
+    return full_scale / ((1 << (adc_bits - 1)) - 1)
+
+
+def quantize_cint16_into(
+    echo_block: np.ndarray,
+    codes: np.ndarray,
+    scale: float,
+    adc_bits: int = 16
+) -> None:
+    """
+    complex Echo 블록을 미리 할당한 int16 코드 버퍼에 양자화
+    
+    Echo를 펄스 블록 단위로 생성하면서 바로 양자화할 때 사용하므로
+    전체 complex64 Echo를 만들지 않고 CInt16Echo 코드를 채울 수 있습니다.
+    
+    Parameters:
+    -----------
+    echo_block : np.ndarray
+        Echo 블록 (shape: [block_pulses, num_samples], 복소수)
+    codes : np.ndarray
+        양자화 코드 출력 버퍼 (shape: [block_pulses, num_samples, 2], dtype: int16)
+    scale : float
+        코드 1에 해당하는 진폭 (cint16_scale() 결과, 범위를 넘는 값은 포화)
+    adc_bits : int
+        ADC 비트 수 (기본값: 16)
+    """
+    max_code = (1 << (adc_bits - 1)) - 1
+    echo_block = np.ascontiguousarray(echo_block, dtype=np.complex64)
+    pairs = echo_block.view(np.float32).reshape(echo_block.shape + (2,))
+    codes[...] = np.clip(np.rint(pairs / np.float32(scale)), -max_code, max_code)
@@ -18,3 +18,12 @@ PI: float = np.pi
 # 각도 변환 상수
 DEG2RAD: float = PI / 180.0
 RAD2DEG: float = 180.0 / PI
+
+# 지구 중력 상수 GM (m³/s²)
+EARTH_GM: float = 3.986004418e14
+
+# 지구 J2 계수 (편평도에 의한 2차 zonal 조화항)
+EARTH_J2: float = 1.08262668e-3
+
+# 지구 자전 각속도 (rad/s)
+EARTH_ROTATION_RATE: float = 7.2921150e-5
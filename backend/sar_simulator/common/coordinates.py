@@ -0,0 +1,271 @@
+"""
+좌표 변환
+
+WGS84 지리 좌표(LLH)와 ECEF 좌표 간 변환, 로컬 ENU/NED 좌표계 변환을 수행합니다.
+모든 함수는 스칼라와 배열 입력을 모두 지원하며 반복문 없이 NumPy 연산으로 계산합니다.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+# WGS84 타원체 파라미터
+WGS84_A = 6378137.0  # 장반경 (m)
+WGS84_F = 1.0 / 298.257223563  # 편평률
+WGS84_B = WGS84_A * (1 - WGS84_F)  # 단반경 (m)
+WGS84_E2 = WGS84_F * (2.0 - WGS84_F)  # 제1 이심률 제곱
+
+
+def llh_to_ecef(latitude, longitude, height) -> np.ndarray:
+    """
+    지리 좌표(위도, 경도, 고도)를 ECEF 좌표로 변환
+    
+    스칼라 또는 같은 shape의 배열을 입력받을 수 있습니다.
+    
+    Parameters:
+    -----------
+    latitude : float or np.ndarray
+        위도 (단위: deg)
+    longitude : float or np.ndarray
+        경도 (단위: deg)
+    height : float or np.ndarray
+        고도 (단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        ECEF 좌표 [x, y, z] (shape: [..., 3], 단위: m)
+    """
+    lat_rad = np.deg2rad(latitude)
+    lon_rad = np.deg2rad(longitude)
+    
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_lon = np.sin(lon_rad)
+    cos_lon = np.cos(lon_rad)
+    
+    # 타원체의 곡률 반경
+    N = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+    
+    # ECEF 좌표 계산
+    x = (N + height) * cos_lat * cos_lon
+    y = (N + height) * cos_lat * sin_lon
+    z = (N * (1 - WGS84_E2) + height) * sin_lat
+    
+    return np.stack([x, y, z], axis=-1)
+
+
+def ecef_to_llh(x, y, z) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    ECEF 좌표를 지리 좌표(위도, 경도, 고도)로 변환 (Vermeille 닫힌 해)
+    
+    반복 계산 없이 닫힌 형태로 계산하며, 지구 중심 부근(약 43 km 이내)을 제외한
+    모든 위치에서 서브 밀리미터 정확도를 가집니다.
+    스칼라 또는 같은 shape의 배열을 입력받을 수 있습니다.
+    
+    Parameters:
+    -----------
+    x, y, z : float or np.ndarray
+        ECEF 좌표 (단위: m)
+    
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        (위도, 경도, 고도) (단위: [deg, deg, m])
+    """
+    e4 = WGS84_E2 * WGS84_E2
+    
+    rho2 = x * x + y * y
+    p = rho2 / (WGS84_A * WGS84_A)
+    q = (1.0 - WGS84_E2) * z * z / (WGS84_A * WGS84_A)
+    r = (p + q - e4) / 6.0
+    s = e4 * p * q / (4.0 * r ** 3)
+    t = np.cbrt(1.0 + s + np.sqrt(s * (2.0 + s)))
+    u = r * (1.0 + t + 1.0 / t)
+    v = np.sqrt(u * u + e4 * q)
+    w = WGS84_E2 * (u + v - q) / (2.0 * v)
+    k = np.sqrt(u + v + w * w) - w
+    D = k * np.sqrt(rho2) / (k + WGS84_E2)
+    Dz = np.sqrt(D * D + z * z)
+    
+    lat = 2.0 * np.arctan2(z, D + Dz)
+    lon = np.arctan2(y, x)
+    h = (k + WGS84_E2 - 1.0) / k * Dz
+    
+    return (np.rad2deg(lat), np.rad2deg(lon), h)
+
+
+def ecef_to_llh_array(positions: np.ndarray) -> np.ndarray:
+    """
+    ECEF 좌표 배열을 지리 좌표 배열로 변환
+    
+    Parameters:
+    -----------
+    positions : np.ndarray
+        ECEF 좌표 (shape: [..., 3], 단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        지리 좌표 [위도, 경도, 고도] (shape: [..., 3], 단위: [deg, deg, m])
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    return np.stack(ecef_to_llh(positions[..., 0], positions[..., 1], positions[..., 2]), axis=-1)
+
+
+def llh_to_ecef_array(llh: np.ndarray) -> np.ndarray:
+    """
+    지리 좌표 배열을 ECEF 좌표 배열로 변환
+    
+    Parameters:
+    -----------
+    llh : np.ndarray
+        지리 좌표 [위도, 경도, 고도] (shape: [..., 3], 단위: [deg, deg, m])
+    
+    Returns:
+    --------
+    np.ndarray
+        ECEF 좌표 (shape: [..., 3], 단위: m)
+    """
+    llh = np.asarray(llh, dtype=np.float64)
+    return llh_to_ecef(llh[..., 0], llh[..., 1], llh[..., 2])
+
+
+def enu_rotation(latitude, longitude) -> np.ndarray:
+    """
+    ECEF → 로컬 ENU 회전 행렬
+    
+    행은 각각 East, North, Up 단위 벡터(ECEF 표현)입니다.
+    
+    Parameters:
+    -----------
+    latitude : float or np.ndarray
+        기준점 위도 (단위: deg)
+    longitude : float or np.ndarray
+        기준점 경도 (단위: deg)
+    
+    Returns:
+    --------
+    np.ndarray
+        회전 행렬 (shape: [..., 3, 3])
+    """
+    lat_rad = np.deg2rad(latitude)
+    lon_rad = np.deg2rad(longitude)
+    
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_lon = np.sin(lon_rad)
+    cos_lon = np.cos(lon_rad)
+    zero = np.zeros_like(sin_lat * sin_lon)
+    
+    east = np.stack([-sin_lon + zero, cos_lon + zero, zero], axis=-1)
+    north = np.stack([-sin_lat * cos_lon, -sin_lat * sin_lon, cos_lat + zero], axis=-1)
+    up = np.stack([cos_lat * cos_lon, cos_lat * sin_lon, sin_lat + zero], axis=-1)
+    
+    return np.stack([east, north, up], axis=-2)
+
+
+def ned_rotation(latitude, longitude) -> np.ndarray:
+    """
+    ECEF → 로컬 NED 회전 행렬
+    
+    행은 각각 North, East, Down 단위 벡터(ECEF 표현)입니다.
+    
+    Parameters:
+    -----------
+    latitude : float or np.ndarray
+        기준점 위도 (단위: deg)
+    longitude : float or np.ndarray
+        기준점 경도 (단위: deg)
+    
+    Returns:
+    --------
+    np.ndarray
+        회전 행렬 (shape: [..., 3, 3])
+    """
+    enu = enu_rotation(latitude, longitude)
+    return np.stack([enu[..., 1, :], enu[..., 0, :], -enu[..., 2, :]], axis=-2)
+
+
+def ecef_to_enu(positions: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    ECEF 위치를 기준점의 로컬 ENU 좌표로 변환
+    
+    Parameters:
+    -----------
+    positions : np.ndarray
+        ECEF 위치 (shape: [..., 3], 단위: m)
+    reference : np.ndarray
+        기준점 ECEF 위치 (shape: [3], 단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        ENU 좌표 (shape: [..., 3], 단위: m)
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    rotation = enu_rotation(*ecef_to_llh(*reference)[:2])
+    return (np.asarray(positions, dtype=np.float64) - reference) @ rotation.T
+
+
+def enu_to_ecef(enu: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    기준점의 로컬 ENU 좌표를 ECEF 위치로 변환
+    
+    Parameters:
+    -----------
+    enu : np.ndarray
+        ENU 좌표 (shape: [..., 3], 단위: m)
+    reference : np.ndarray
+        기준점 ECEF 위치 (shape: [3], 단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        ECEF 위치 (shape: [..., 3], 단위: m)
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    rotation = enu_rotation(*ecef_to_llh(*reference)[:2])
+    return np.asarray(enu, dtype=np.float64) @ rotation + reference
+
+
+def ecef_to_ned(positions: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    ECEF 위치를 기준점의 로컬 NED 좌표로 변환
+    
+    Parameters:
+    -----------
+    positions : np.ndarray
+        ECEF 위치 (shape: [..., 3], 단위: m)
+    reference : np.ndarray
+        기준점 ECEF 위치 (shape: [3], 단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        NED 좌표 (shape: [..., 3], 단위: m)
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    rotation = ned_rotation(*ecef_to_llh(*reference)[:2])
+    return (np.asarray(positions, dtype=np.float64) - reference) @ rotation.T
+
+
+def ned_to_ecef(ned: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """
+    기준점의 로컬 NED 좌표를 ECEF 위치로 변환
+    
+    Parameters:
+    -----------
+    ned : np.ndarray
+        NED 좌표 (shape: [..., 3], 단위: m)
+    reference : np.ndarray
+        기준점 ECEF 위치 (shape: [3], 단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        ECEF 위치 (shape: [..., 3], 단위: m)
+    """
+    reference = np.asarray(reference, dtype=np.float64)
+    rotation = ned_rotation(*ecef_to_llh(*reference)[:2])
+    return np.asarray(ned, dtype=np.float64) @ rotation + reference
@@ -122,3 +122,8 @@ class SarSystemConfig:
         import numpy as np
         from sar_simulator.common.constants import BOLZMAN_CONST
         return np.sqrt(BOLZMAN_CONST * self.Tsys / self.num_samples / num_pulses)
+    
+    def get_noise_power(self) -> float:
+        """복소 샘플당 열잡음 전력 k·Tsys·bw (W, NF는 get_loss_linear()에 포함)"""
+        from sar_simulator.common.constants import BOLZMAN_CONST
+        return BOLZMAN_CONST * self.Tsys * self.bw
@@ -10,86 +10,33 @@ from typing import List, Tuple, Optional
 from astropy.coordinates import EarthLocation
 from astropy import units as u
 
+# WGS84 상수와 llh_to_ecef, ecef_to_llh는 coordinates 모듈을 다시 export (기존 import 경로 호환)
+from sar_simulator.common.coordinates import (
+    WGS84_A,
+    WGS84_F,
+    WGS84_B,
+    WGS84_E2,
+    llh_to_ecef,
+    ecef_to_llh,
+    ecef_to_llh_array,
+)
 
-# WGS84 타원체 파라미터
-WGS84_A = 6378137.0  # 장반경 (m)
-WGS84_F = 1.0 / 298.257223563  # 편평률
-WGS84_B = WGS84_A * (1 - WGS84_F)  # 단반경 (m)
-WGS84_E2 = WGS84_F * (2.0 - WGS84_F)  # 제1 이심률 제곱
-
-
-def llh_to_ecef(latitude: float, longitude: float, height: float) -> np.ndarray:
-    """
-    지리 좌표(위도, 경도, 고도)를 ECEF 좌표로 변환
-    
-    Parameters:
-    -----------
-    latitude : float
-        위도 (단위: deg)
-    longitude : float
-        경도 (단위: deg)
-    height : float
-        고도 (단위: m)
-    
-    Returns:
-    --------
-    np.ndarray
-        ECEF 좌표 [x, y, z] (단위: m)
-    """
-    lat_rad = np.deg2rad(latitude)
-    lon_rad = np.deg2rad(longitude)
-    
-    sin_lat = np.sin(lat_rad)
-    cos_lat = np.cos(lat_rad)
-    sin_lon = np.sin(lon_rad)
-    cos_lon = np.cos(lon_rad)
-    
-    # 타원체의 곡률 반경
-    N = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
-    
-    # ECEF 좌표 계산
-    x = (N + height) * cos_lat * cos_lon
-    y = (N + height) * cos_lat * sin_lon
-    z = (N * (1 - WGS84_E2) + height) * sin_lat
-    
-    return np.array([x, y, z])
-
-
-def ecef_to_llh(x: float, y: float, z: float) -> Tuple[float, float, float]:
-    """
-    ECEF 좌표를 지리 좌표(위도, 경도, 고도)로 변환
-    
-    Parameters:
-    -----------
-    x, y, z : float
-        ECEF 좌표 (단위: m)
-    
-    Returns:
-    --------
-    Tuple[float, float, float]
-        (위도, 경도, 고도) (단위: [deg, deg, m])
-    """
-    # 경도 계산
-    lon = np.arctan2(y, x)
-    p = np.hypot(x, y)
-    
-    # 위도 계산 (반복법)
-    lat = np.arctan2(z, p * (1.0 - WGS84_E2))
-    for _ in range(6):
-        sin_lat = np.sin(lat)
-        N = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
-        h = p / np.cos(lat) - N
-        lat = np.arctan2(z, p * (1.0 - WGS84_E2 * (N / (N + h))))
-    
-    # 최종 고도 계산
-    sin_lat = np.sin(lat)
-    N = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
-    h = p / np.cos(lat) - N
-    
-    lat_deg = np.rad2deg(lat)
-    lon_deg = np.rad2deg(lon)
-    
-    return (lat_deg, lon_deg, h)
+__all__ = [
+    "WGS84_A",
+    "WGS84_F",
+    "WGS84_B",
+    "WGS84_E2",
+    "llh_to_ecef",
+    "ecef_to_llh",
+    "calc_direction_vector",
+    "calc_beam_direction_to_target",
+    "calc_crossing_point_ellipsoid",
+    "calculate_mission_direction",
+    "calc_beam_direction_to_target_batch",
+    "calc_crossing_point_ellipsoid_batch",
+    "calc_heading_batch",
+    "calculate_mission_direction_batch",
+]
 
 
 def calc_direction_vector(pos: np.ndarray, vel: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
@@ -271,67 +218,187 @@ def calculate_mission_direction(
         - heading: Heading 각도 (단위: deg, 0-360)
         - crossing_point: 빔과 지구 교차점 (지리 좌표: [경도, 위도, 고도])
     """
+    batch = calculate_mission_direction_batch(
+        np.reshape(satellite_position_ecef, (1, 3)),
+        np.reshape(satellite_velocity_ecef, (1, 3)),
+        mission_location_llh
+    )
+    
+    crossing_point_llh = None
+    if batch["crossing_valid"][0]:
+        crossing_point_llh = batch["crossing_points"][0].tolist()
+    
+    return {
+        "beam_direction": batch["beam_directions"][0].tolist(),
+        "heading": float(batch["headings"][0]),
+        "crossing_point": crossing_point_llh
+    }
+
+
+def calc_beam_direction_to_target_batch(
+    satellite_positions: np.ndarray,
+    target_positions: np.ndarray
+) -> np.ndarray:
+    """
+    여러 위성 위치에서 타겟으로의 빔 방향 벡터 계산 (벡터화)
+    
+    Parameters:
+    -----------
+    satellite_positions : np.ndarray
+        위성 위치 (ECEF, shape: [N, 3], 단위: m)
+    target_positions : np.ndarray
+        타겟 위치 (ECEF, shape: [N, 3] 또는 [3], 단위: m)
+    
+    Returns:
+    --------
+    np.ndarray
+        빔 방향 벡터 (ECEF, 정규화된 벡터, shape: [N, 3])
+        위성과 타겟이 거의 같은 위치인 경우 [0, 0, -1]
+    """
+    target_vectors = np.asarray(target_positions, dtype=np.float64) - np.asarray(satellite_positions, dtype=np.float64)
+    target_distances = np.linalg.norm(target_vectors, axis=-1, keepdims=True)
+    
+    too_close = target_distances < 1e-6
+    beam_directions = target_vectors / np.where(too_close, 1.0, target_distances)
+    return np.where(too_close, np.array([0.0, 0.0, -1.0]), beam_directions)
+
+
+def calc_crossing_point_ellipsoid_batch(
+    positions: np.ndarray,
+    directions: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    여러 빔 벡터와 지구 타원체의 교차점 계산 (벡터화)
+    
+    calc_crossing_point_ellipsoid와 같은 규칙으로 교차점을 선택합니다.
+    
+    Parameters:
+    -----------
+    positions : np.ndarray
+        시작 위치 (ECEF, shape: [N, 3], 단위: m)
+    directions : np.ndarray
+        방향 벡터 (정규화된 벡터, shape: [N, 3])
+    
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        (교차점 ECEF 좌표 (shape: [N, 3], 단위: m, 교차점이 없으면 NaN),
+         교차 여부 (shape: [N], dtype: bool))
+    """
+    p = np.asarray(positions, dtype=np.float64)
+    v = np.asarray(directions, dtype=np.float64)
+    
+    # 타원체 축으로 정규화하면 단위 구와의 교차 문제가 됨
+    scale = np.array([1.0 / WGS84_A, 1.0 / WGS84_A, 1.0 / WGS84_B])
+    ps = p * scale
+    vs = v * scale
+    
+    a_coeff = np.sum(vs * vs, axis=-1)
+    b_coeff = 2.0 * np.sum(ps * vs, axis=-1)
+    c_coeff = np.sum(ps * ps, axis=-1) - 1.0
+    
+    discriminant = b_coeff**2 - 4.0 * a_coeff * c_coeff
+    sqrt_disc = np.sqrt(np.maximum(discriminant, 0.0))
+    t1 = (-b_coeff + sqrt_disc) / (2.0 * a_coeff)
+    t2 = (-b_coeff - sqrt_disc) / (2.0 * a_coeff)
+    
+    # 두 교차점 중 위성에서 가까운 점 선택
+    t = np.where((t1 > 0) & (t2 > 0), np.minimum(t1, t2), np.maximum(t1, t2))
+    valid = (discriminant >= 0) & (t >= 0)
+    
+    crossing_points = p + t[..., np.newaxis] * v
+    crossing_points[~valid] = np.nan
+    return crossing_points, valid
+
+
+def calc_heading_batch(
+    satellite_positions: np.ndarray,
+    satellite_velocities: np.ndarray
+) -> np.ndarray:
+    """
+    여러 위성 상태의 Heading 계산 (벡터화)
+    
+    현재 위치와 1초 후 위치의 지리 좌표로부터 방위각을 계산합니다.
+    
+    Parameters:
+    -----------
+    satellite_positions : np.ndarray
+        위성 위치 (ECEF, shape: [N, 3], 단위: m)
+    satellite_velocities : np.ndarray
+        위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+    
+    Returns:
+    --------
+    np.ndarray
+        Heading 각도 (shape: [N], 단위: deg, 0-360), 속도가 0인 상태는 0
+    """
+    satellite_positions = np.asarray(satellite_positions, dtype=np.float64)
+    satellite_velocities = np.asarray(satellite_velocities, dtype=np.float64)
+    
+    current_llh = ecef_to_llh_array(satellite_positions)
+    next_llh = ecef_to_llh_array(satellite_positions + satellite_velocities)
+    
+    d_lon = np.deg2rad(next_llh[..., 1] - current_llh[..., 1])
+    lat1_rad = np.deg2rad(current_llh[..., 0])
+    lat2_rad = np.deg2rad(next_llh[..., 0])
+    
+    y = np.sin(d_lon) * np.cos(lat2_rad)
+    x = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(d_lon)
+    
+    headings = np.mod(np.rad2deg(np.arctan2(y, x)), 360.0)
+    stationary = np.linalg.norm(satellite_velocities, axis=-1) <= 1e-6
+    return np.where(stationary, 0.0, headings)
+
+
+def calculate_mission_direction_batch(
+    satellite_positions_ecef: np.ndarray,
+    satellite_velocities_ecef: np.ndarray,
+    mission_location_llh: List[float]
+) -> dict:
+    """
+    궤적 전체에 대해 미션 위치를 지나가도록 위성 방향 계산 (벡터화)
+    
+    Parameters:
+    -----------
+    satellite_positions_ecef : np.ndarray
+        위성 위치 (ECEF, shape: [N, 3], 단위: m)
+    satellite_velocities_ecef : np.ndarray
+        위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+    mission_location_llh : List[float]
+        미션 위치 (지리 좌표: [경도, 위도], 단위: [deg, deg])
+    
+    Returns:
+    --------
+    dict
+        미션 방향 정보
+        - beam_directions: 빔 방향 벡터 (ECEF, 정규화된 벡터, shape: [N, 3])
+        - headings: Heading 각도 (단위: deg, 0-360, shape: [N])
+        - crossing_points: 빔과 지구 교차점 (지리 좌표: [경도, 위도, 고도], shape: [N, 3])
+          교차점이 없는 상태는 NaN
+        - crossing_valid: 교차 여부 (shape: [N], dtype: bool)
+    """
+    satellite_positions_ecef = np.asarray(satellite_positions_ecef, dtype=np.float64)
+    satellite_velocities_ecef = np.asarray(satellite_velocities_ecef, dtype=np.float64)
+    if satellite_positions_ecef.ndim != 2 or satellite_positions_ecef.shape[1] != 3:
+        raise ValueError("위성 위치는 [N, 3] 배열이어야 합니다.")
+    if satellite_velocities_ecef.shape != satellite_positions_ecef.shape:
+        raise ValueError("위성 위치와 속도의 개수가 일치하지 않습니다.")
+    
     # 미션 위치를 ECEF로 변환 (고도는 0으로 가정)
     mission_lon, mission_lat = mission_location_llh
     mission_position_ecef = llh_to_ecef(mission_lat, mission_lon, 0.0)
     
-    # 위성에서 미션 위치로의 빔 방향 계산
-    beam_direction = calc_beam_direction_to_target(
-        satellite_position_ecef,
-        satellite_velocity_ecef,
-        mission_position_ecef
-    )
-    
-    # 빔 방향과 지구 타원체의 교차점 계산
-    crossing_point_ecef = calc_crossing_point_ellipsoid(
-        satellite_position_ecef,
-        beam_direction
+    beam_directions = calc_beam_direction_to_target_batch(satellite_positions_ecef, mission_position_ecef)
+    crossing_points_ecef, crossing_valid = calc_crossing_point_ellipsoid_batch(
+        satellite_positions_ecef,
+        beam_directions
     )
     
-    crossing_point_llh = None
-    if crossing_point_ecef is not None:
-        lat, lon, h = ecef_to_llh(
-            crossing_point_ecef[0],
-            crossing_point_ecef[1],
-            crossing_point_ecef[2]
-        )
-        crossing_point_llh = [lon, lat, h]
-    
-    # Heading 계산 (위성 속도 방향 기준)
-    # 위성 속도 벡터의 방위각 계산
-    vel_norm = np.linalg.norm(satellite_velocity_ecef)
-    if vel_norm > 1e-6:
-        # 속도 벡터를 지리 좌표계로 변환하여 heading 계산
-        sat_lat, sat_lon, sat_h = ecef_to_llh(
-            satellite_position_ecef[0],
-            satellite_position_ecef[1],
-            satellite_position_ecef[2]
-        )
-        
-        # 다음 위치 계산 (1초 후)
-        next_position_ecef = satellite_position_ecef + satellite_velocity_ecef
-        next_lat, next_lon, _ = ecef_to_llh(
-            next_position_ecef[0],
-            next_position_ecef[1],
-            next_position_ecef[2]
-        )
-        
-        # 두 지점 간의 방위각 계산
-        d_lon = np.deg2rad(next_lon - sat_lon)
-        lat1_rad = np.deg2rad(sat_lat)
-        lat2_rad = np.deg2rad(next_lat)
-        
-        y = np.sin(d_lon) * np.cos(lat2_rad)
-        x = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(d_lon)
-        
-        heading = np.rad2deg(np.arctan2(y, x))
-        if heading < 0:
-            heading += 360.0
-    else:
-        heading = 0.0
+    crossing_points_llh = ecef_to_llh_array(crossing_points_ecef)[:, [1, 0, 2]]
     
     return {
-        "beam_direction": beam_direction.tolist(),
-        "heading": float(heading),
-        "crossing_point": crossing_point_llh
+        "beam_directions": beam_directions,
+        "headings": calc_heading_batch(satellite_positions_ecef, satellite_velocities_ecef),
+        "crossing_points": crossing_points_llh,
+        "crossing_valid": crossing_valid
     }
@@ -0,0 +1,358 @@
+"""
+Scene 생성기
+
+지리 좌표가 지정된 반사도 래스터(PNG 또는 .npy 격자)를 벡터화된 연산으로
+점 타겟 집합(TargetList)으로 변환합니다.
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+from sar_simulator.common.target_model import TargetList, TARGET_ARRAY_COLUMNS
+from sar_simulator.common.coordinates import WGS84_A, WGS84_E2, llh_to_ecef, ecef_to_llh, enu_rotation
+
+
+# 블록 처리 시 한 번에 계산하는 픽셀 수
+_BLOCK_ELEMENTS: int = 1 << 16
+
+
+def load_reflectivity_raster(filepath: Union[str, Path]) -> np.ndarray:
+    """
+    반사도 래스터 파일 읽기
+    
+    Parameters:
+    -----------
+    filepath : str or Path
+        래스터 파일 경로 (.npy: 메모리 맵으로 읽음, 그 외: 그레이스케일 이미지)
+    
+    Returns:
+    --------
+    np.ndarray
+        반사도 래스터 (shape: [rows, cols])
+    """
+    filepath = Path(filepath)
+    
+    if filepath.suffix.lower() == '.npy':
+        raster = np.load(filepath, mmap_mode='r')
+    else:
+        from PIL import Image
+        with Image.open(filepath) as image:
+            raster = np.asarray(image.convert('F'), dtype=np.float32)
+    
+    if raster.ndim != 2:
+        raise ValueError(f"반사도 래스터는 2차원이어야 합니다: shape={raster.shape}")
+    
+    return raster
+
+
+def build_scene_from_raster(
+    reflectivity: np.ndarray,
+    upper_left: Tuple[float, float],
+    lower_right: Tuple[float, float],
+    height: Union[float, np.ndarray] = 0.0,
+    reflectivity_scale: float = 1.0,
+    jitter: bool = False,
+    speckle_phase: bool = False,
+    min_reflectivity: Optional[float] = None,
+    seed: Optional[int] = None
+) -> TargetList:
+    """
+    반사도 래스터를 점 타겟 집합으로 변환
+    
+    각 픽셀 중심을 행 블록 단위로 ECEF로 변환합니다. 지터가 없으면 N(φ), sinφ, cosφ는
+    행마다, cosλ, sinλ는 열마다 한 번만 계산하여 외적으로 X/Y/Z를 구성하고,
+    지터를 적용하면 픽셀 내 무작위 위치를 벡터화된 llh_to_ecef로 변환합니다.
+    
+    Parameters:
+    -----------
+    reflectivity : np.ndarray
+        반사도 래스터 (shape: [rows, cols], 0행이 북쪽)
+    upper_left : Tuple[float, float]
+        래스터 좌상단 모서리 (위도, 경도) (단위: deg)
+    lower_right : Tuple[float, float]
+        래스터 우하단 모서리 (위도, 경도) (단위: deg)
+    height : float or np.ndarray
+        타원체 고도 (스칼라 또는 shape: [rows, cols], 단위: m)
+    reflectivity_scale : float
+        래스터 값에 곱할 반사도 스케일 (RCS, 단위: m²)
+    jitter : bool
+        픽셀 내부 무작위 위치 지터 적용 여부 (±0.5 픽셀, 균일 분포)
+    speckle_phase : bool
+        무작위 스펙클 위상 적용 여부 (0 ~ 360 deg, 균일 분포)
+    min_reflectivity : float, optional
+        이 값 이하의 반사도를 가진 픽셀 제외 (None인 경우 모든 픽셀 사용)
+    seed : int, optional
+        난수 시드
+    
+    Returns:
+    --------
+    TargetList
+        생성된 타겟 리스트 (shape: [rows * cols, 5], 행 우선 순서)
+    """
+    reflectivity = np.asarray(reflectivity)
+    if reflectivity.ndim != 2:
+        raise ValueError(f"반사도 래스터는 2차원이어야 합니다: shape={reflectivity.shape}")
+    
+    rows, cols = reflectivity.shape
+    rng = np.random.default_rng(seed)
+    
+    # 픽셀 중심 위도/경도 (행/열 단위, deg)
+    lat_step = (lower_right[0] - upper_left[0]) / rows
+    lon_step = (lower_right[1] - upper_left[1]) / cols
+    lat = (upper_left[0] + (np.arange(rows) + 0.5) * lat_step)[:, np.newaxis]
+    lon = (upper_left[1] + (np.arange(cols) + 0.5) * lon_step)[np.newaxis, :]
+    
+    height = np.asarray(height, dtype=np.float64)
+    
+    # 지터가 없을 때 사용하는 행/열 단위 삼각함수 및 곡률 반경 (llh_to_ecef와 같은 식)
+    lat_rad = np.deg2rad(lat)
+    lon_rad = np.deg2rad(lon)
+    sin_lat = np.sin(lat_rad)
+    cos_lat = np.cos(lat_rad)
+    sin_lon = np.sin(lon_rad)
+    cos_lon = np.cos(lon_rad)
+    N = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
+    
+    # ECEF 좌표를 타겟 배열에 직접 기록 (임시 배열 크기를 줄이기 위해 행 블록 단위로 처리)
+    target_array = np.empty((rows * cols, TARGET_ARRAY_COLUMNS), dtype=np.float64)
+    grid = target_array.reshape(rows, cols, TARGET_ARRAY_COLUMNS)
+    
+    block_rows = min(rows, max(1, _BLOCK_ELEMENTS // cols))
+    for r0 in range(0, rows, block_rows):
+        r1 = min(r0 + block_rows, rows)
+        block = grid[r0:r1]
+        h = height[r0:r1] if height.ndim == 2 else height
+        
+        if jitter:
+            block_lat = lat[r0:r1] + (rng.random(block.shape[:2]) - 0.5) * lat_step
+            block_lon = lon + (rng.random(block.shape[:2]) - 0.5) * lon_step
+            block[:, :, :3] = llh_to_ecef(block_lat, block_lon, h)
+        else:
+            # 행 값 (N + h)·cosφ, (N(1 - e²) + h)·sinφ와 열 값 cosλ, sinλ의 외적
+            radial = (N[r0:r1] + h) * cos_lat[r0:r1]
+            np.multiply(radial, cos_lon, out=block[:, :, 0])
+            np.multiply(radial, sin_lon, out=block[:, :, 1])
+            block[:, :, 2] = (N[r0:r1] * (1 - WGS84_E2) + h) * sin_lat[r0:r1]
+        np.multiply(reflectivity[r0:r1], reflectivity_scale, out=block[:, :, 3])
+        
+        if speckle_phase:
+            block[:, :, 4] = rng.random(block.shape[:2]) * 360.0
+        else:
+            block[:, :, 4] = 0.0
+    
+    target_list = TargetList.from_array(target_array)
+    
+    if min_reflectivity is not None:
+        target_list = target_list.filter(target_list.reflectivity > min_reflectivity)
+    
+    return target_list
+
+
+def build_scene_from_raster_file(
+    filepath: Union[str, Path],
+    upper_left: Tuple[float, float],
+    lower_right: Tuple[float, float],
+    **kwargs
+) -> TargetList:
+    """
+    반사도 래스터 파일을 점 타겟 집합으로 변환
+    
+    Parameters:
+    -----------
+    filepath : str or Path
+        래스터 파일 경로 (PNG 또는 .npy)
+    upper_left : Tuple[float, float]
+        래스터 좌상단 모서리 (위도, 경도) (단위: deg)
+    lower_right : Tuple[float, float]
+        래스터 우하단 모서리 (위도, 경도) (단위: deg)
+    **kwargs
+        build_scene_from_raster의 추가 인자
+    
+    Returns:
+    --------
+    TargetList
+        생성된 타겟 리스트
+    """
+    raster = load_reflectivity_raster(filepath)
+    return build_scene_from_raster(raster, upper_left, lower_right, **kwargs)
+
+
+def calc_shadow_layover_mask(
+    positions: np.ndarray,
+    satellite_position: np.ndarray,
+    line_spacing: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    레이더 음영(shadow)과 겹침(layover) 마스크 계산
+    
+    Scene 중심의 로컬 ENU 좌표계에서 지상 거리(ground range) g, 방위 좌표 a,
+    고도 h를 구한 뒤, 방위 좌표로 묶은 range line마다 근거리 → 원거리 방향으로
+    누적 최대값을 계산합니다. 입사각 θ는 scene 중심 값으로 고정합니다 (국소 DEM 가정).
+    
+    - 음영: s = h + g·cot(θ)가 더 가까운 셀들의 최대 s보다 작은 셀
+    - 겹침: 경사 거리 r = g·sin(θ) - h·cos(θ)의 순서가 뒤바뀌는 셀
+      (가까운 셀들의 최대 r보다 작거나, 먼 셀들의 최소 r보다 큰 셀)
+    
+    Parameters:
+    -----------
+    positions : np.ndarray
+        셀 위치 배열 (ECEF, shape: [num_cells, 3], 단위: m)
+    satellite_position : np.ndarray
+        위성 위치 (ECEF, shape: [3], 단위: m)
+    line_spacing : float
+        range line 방위 간격 (단위: m, 보통 DEM 셀 크기)
+    
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        (음영 마스크, 겹침 마스크) (각 shape: [num_cells], dtype: bool)
+    """
+    positions = np.asarray(positions, dtype=np.float64)
+    satellite_position = np.asarray(satellite_position, dtype=np.float64)
+    
+    # Scene 중심의 로컬 ENU 기저
+    center = positions.mean(axis=0)
+    east, north, up = enu_rotation(*ecef_to_llh(*center)[:2])
+    
+    # 중심에서 위성 방향 벡터 → 입사각과 지상 거리 방향
+    to_satellite = satellite_position - center
+    to_satellite /= np.linalg.norm(to_satellite)
+    cos_inc = np.dot(to_satellite, up)
+    horizontal = to_satellite - cos_inc * up
+    horizontal_norm = np.linalg.norm(horizontal)
+    if horizontal_norm < 1e-9:
+        raise ValueError("위성이 scene 천정에 있어 지상 거리 방향을 정의할 수 없습니다.")
+    
+    range_dir = -horizontal / horizontal_norm  # 레이더에서 멀어지는 방향
+    azimuth_dir = np.cross(up, range_dir)
+    sin_inc = np.sqrt(max(0.0, 1.0 - cos_inc ** 2))
+    
+    offsets = positions - center
+    g = offsets @ range_dir
+    a = offsets @ azimuth_dir
+    h = offsets @ up
+    
+    # range line별 정렬 (방위 bin → 지상 거리)
+    line_bins = np.floor(a / line_spacing).astype(np.int64)
+    order = np.lexsort((g, line_bins))
+    _, line_ids = np.unique(line_bins[order], return_inverse=True)
+    line_start = np.ones(len(order), dtype=bool)
+    line_start[1:] = line_ids[1:] != line_ids[:-1]
+    line_end = np.ones(len(order), dtype=bool)
+    line_end[:-1] = line_start[1:]
+    
+    s = (h + g * cos_inc / max(sin_inc, 1e-12))[order]
+    r = (g * sin_inc - h * cos_inc)[order]
+    
+    tolerance = 1e-3
+    shadow_sorted = s < _segmented_previous_max(s, line_ids, line_start) - tolerance
+    layover_sorted = (
+        (r < _segmented_previous_max(r, line_ids, line_start) - tolerance) |
+        (r > -_segmented_previous_max(-r[::-1], line_ids[::-1].max() - line_ids[::-1], line_end[::-1])[::-1] + tolerance)
+    )
+    
+    shadow = np.empty(len(order), dtype=bool)
+    layover = np.empty(len(order), dtype=bool)
+    shadow[order] = shadow_sorted
+    layover[order] = layover_sorted
+    
+    return shadow, layover
+
+
+def build_scene_from_dem(
+    dem: np.ndarray,
+    upper_left: Tuple[float, float],
+    lower_right: Tuple[float, float],
+    satellite_position: np.ndarray,
+    reflectivity: Union[float, np.ndarray] = 1.0,
+    drop_shadow: bool = True,
+    drop_layover: bool = False,
+    **kwargs
+) -> TargetList:
+    """
+    DEM 격자를 점 타겟 집합으로 변환 (음영/겹침 마스킹 포함)
+    
+    각 DEM 셀을 산란체로 변환하고, 주어진 위성 위치에서 본 음영 셀은 Echo 합성 전에
+    제거합니다. 음영/겹침 여부는 'shadow', 'layover' 타겟 속성으로 남습니다.
+    
+    Parameters:
+    -----------
+    dem : np.ndarray
+        타원체 고도 격자 (shape: [rows, cols], 0행이 북쪽, 단위: m)
+    upper_left : Tuple[float, float]
+        DEM 좌상단 모서리 (위도, 경도) (단위: deg)
+    lower_right : Tuple[float, float]
+        DEM 우하단 모서리 (위도, 경도) (단위: deg)
+    satellite_position : np.ndarray
+        관측 패스의 대표 위성 위치 (ECEF, shape: [3], 단위: m)
+    reflectivity : float or np.ndarray
+        셀 반사도 (스칼라 또는 shape: [rows, cols], 단위: m²)
+    drop_shadow : bool
+        음영 셀 제거 여부 (기본값: True)
+    drop_layover : bool
+        겹침 셀 제거 여부 (기본값: False, 겹침 셀도 Echo를 반환하므로 유지)
+    **kwargs
+        build_scene_from_raster의 추가 인자 (jitter, speckle_phase, seed 등)
+    
+    Returns:
+    --------
+    TargetList
+        생성된 타겟 리스트
+    """
+    dem = np.asarray(dem, dtype=np.float64)
+    if dem.ndim != 2:
+        raise ValueError(f"DEM은 2차원이어야 합니다: shape={dem.shape}")
+    
+    rows, cols = dem.shape
+    reflectivity = np.broadcast_to(np.asarray(reflectivity, dtype=np.float64), dem.shape)
+    
+    target_list = build_scene_from_raster(
+        reflectivity, upper_left, lower_right, height=dem, **kwargs
+    )
+    
+    # DEM 셀 크기 (m)
+    mean_lat = np.deg2rad(0.5 * (upper_left[0] + lower_right[0]))
+    cell_north = abs(np.deg2rad(lower_right[0] - upper_left[0])) / rows * WGS84_A
+    cell_east = abs(np.deg2rad(lower_right[1] - upper_left[1])) / cols * WGS84_A * np.cos(mean_lat)
+    
+    shadow, layover = calc_shadow_layover_mask(
+        target_list.positions,
+        satellite_position,
+        line_spacing=min(cell_north, cell_east)
+    )
+    target_list.set_attribute('shadow', shadow)
+    target_list.set_attribute('layover', layover)
+    
+    keep = np.ones(len(target_list), dtype=bool)
+    if drop_shadow:
+        keep &= ~shadow
+    if drop_layover:
+        keep &= ~layover
+    
+    if np.all(keep):
+        return target_list
+    return target_list.filter(keep)
+
+
+def _segmented_previous_max(
+    values: np.ndarray,
+    segment_ids: np.ndarray,
+    segment_start: np.ndarray
+) -> np.ndarray:
+    """
+    구간별 이전 원소들의 누적 최대값 (구간 첫 원소는 -inf)
+    
+    segment_ids는 정렬된 순서에서 0부터 증가하는 구간 번호입니다.
+    구간 번호만큼 큰 오프셋을 더해 한 번의 np.maximum.accumulate로 계산합니다.
+    """
+    base = values.min()
+    span = values.max() - base + 1.0
+    offset = segment_ids * span
+    
+    running = np.maximum.accumulate(values - base + offset) - offset + base
+    
+    previous = np.empty_like(running)
+    previous[1:] = running[:-1]
+    previous[segment_start] = -np.inf
+    return previous
@@ -5,15 +5,21 @@ SAR 시뮬레이션에서 사용하는 타겟을 정의하는 모듈입니다.
 """
 
 import numpy as np
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass
 
 
+# 타겟 배열 컬럼 수: [x, y, z, reflectivity, phase]
+TARGET_ARRAY_COLUMNS: int = 5
+
+
 @dataclass
 class Target:
     """
     단일 타겟 정의
     
+    TargetList에서 인덱스로 가져온 Target의 position은 TargetList 내부 배열의 view입니다.
+    
     Attributes:
     -----------
     position : np.ndarray
@@ -38,7 +44,10 @@ class TargetList:
     """
     타겟 리스트 클래스
     
-    여러 타겟을 관리하고 벡터화된 연산을 제공합니다.
+    타겟을 연속된 NumPy 컬럼(struct-of-arrays)으로 저장합니다.
+    내부 배열은 [num_targets, 5] float64 블록 ([x, y, z, reflectivity, phase])이며,
+    to_array()와 positions/reflectivity/phase 속성은 복사 없이 view를 반환합니다.
+    추가 속성(attributes)은 이름별 1차원 배열로 관리됩니다.
     """
     
     def __init__(self, targets: List[Target] = None):
@@ -50,68 +59,309 @@ class TargetList:
         targets : List[Target], optional
             타겟 리스트
         """
-        self.targets: List[Target] = targets if targets is not None else []
+        self._data: np.ndarray = np.zeros((0, TARGET_ARRAY_COLUMNS), dtype=np.float64)
+        self._size: int = 0
+        self._attributes: Dict[str, np.ndarray] = {}
+        
+        if targets:
+            self.add_targets(targets)
+    
+    @classmethod
+    def from_array(cls, array: np.ndarray, **attributes: np.ndarray) -> 'TargetList':
+        """
+        배열로부터 TargetList 생성
+        
+        array가 C-contiguous float64 배열이면 복사 없이 그대로 사용합니다.
+        
+        Parameters:
+        -----------
+        array : np.ndarray
+            타겟 배열 (shape: [num_targets, 5])
+            각 행: [x, y, z, reflectivity, phase]
+        **attributes : np.ndarray
+            추가 속성 (각 shape: [num_targets])
+        
+        Returns:
+        --------
+        TargetList
+            생성된 TargetList
+        """
+        array = np.ascontiguousarray(array, dtype=np.float64)
+        if array.ndim != 2 or array.shape[1] != TARGET_ARRAY_COLUMNS:
+            raise ValueError(f"타겟 배열은 shape [num_targets, {TARGET_ARRAY_COLUMNS}]이어야 합니다.")
+        
+        target_list = cls()
+        target_list._data = array
+        target_list._size = array.shape[0]
+        for name, values in attributes.items():
+            target_list._attributes[name] = target_list._check_attribute(name, values, array.shape[0])
+        
+        return target_list
+    
+    @classmethod
+    def from_columns(
+        cls,
+        positions: np.ndarray,
+        reflectivity: Union[float, np.ndarray] = 1.0,
+        phase: Union[float, np.ndarray] = 0.0,
+        **attributes: np.ndarray
+    ) -> 'TargetList':
+        """
+        컬럼 배열로부터 TargetList 생성
+        
+        Parameters:
+        -----------
+        positions : np.ndarray
+            타겟 위치 배열 (ECEF, shape: [num_targets, 3], 단위: m)
+        reflectivity : float or np.ndarray
+            반사도 (스칼라 또는 shape: [num_targets], 단위: m²)
+        phase : float or np.ndarray
+            위상 (스칼라 또는 shape: [num_targets], 단위: deg)
+        **attributes : np.ndarray
+            추가 속성 (각 shape: [num_targets])
+        
+        Returns:
+        --------
+        TargetList
+            생성된 TargetList
+        """
+        target_list = cls()
+        target_list.append(positions, reflectivity, phase, **attributes)
+        return target_list
+    
+    @classmethod
+    def from_scene_file(
+        cls,
+        filepath: str,
+        satellite_positions: Optional[np.ndarray] = None,
+        beam_directions: Optional[np.ndarray] = None,
+        half_angle: Optional[float] = None
+    ) -> 'TargetList':
+        """
+        Scene 파일로부터 TargetList 로드
+        
+        빔 정보가 주어지면 빔 footprint와 겹치는 타일만 읽습니다.
+        자세한 내용은 sar_simulator.io.scene_file.SceneFile.load 참고.
+        
+        Parameters:
+        -----------
+        filepath : str
+            Scene 파일 경로
+        satellite_positions : np.ndarray, optional
+            위성 위치 (shape: [3] 또는 [num_pulses, 3], 단위: m)
+        beam_directions : np.ndarray, optional
+            빔 방향 벡터 (shape: [3] 또는 [num_pulses, 3])
+        half_angle : float, optional
+            빔 원뿔 반각 (단위: rad)
+        
+        Returns:
+        --------
+        TargetList
+            로드된 TargetList
+        """
+        from sar_simulator.io.scene_file import SceneFile
+        
+        with SceneFile(filepath) as scene_file:
+            return scene_file.load(satellite_positions, beam_directions, half_angle)
+    
+    @property
+    def positions(self) -> np.ndarray:
+        """타겟 위치 view (shape: [num_targets, 3], 단위: m)"""
+        return self._data[:self._size, 0:3]
+    
+    @property
+    def reflectivity(self) -> np.ndarray:
+        """반사도 view (shape: [num_targets], 단위: m²)"""
+        return self._data[:self._size, 3]
+    
+    @property
+    def phase(self) -> np.ndarray:
+        """위상 view (shape: [num_targets], 단위: deg)"""
+        return self._data[:self._size, 4]
+    
+    @property
+    def attributes(self) -> Dict[str, np.ndarray]:
+        """추가 속성 view 딕셔너리 (각 shape: [num_targets])"""
+        return {name: values[:self._size] for name, values in self._attributes.items()}
+    
+    @property
+    def targets(self) -> List[Target]:
+        """Target 객체 리스트 (하위 호환용, 타겟마다 객체를 생성하므로 느림)"""
+        return [self[i] for i in range(self._size)]
+    
+    @property
+    def nbytes(self) -> int:
+        """타겟 데이터가 차지하는 메모리 크기 (단위: byte)"""
+        row_bytes = self._data.itemsize * TARGET_ARRAY_COLUMNS
+        row_bytes += sum(values.itemsize for values in self._attributes.values())
+        return self._size * row_bytes
+    
+    def get_attribute(self, name: str) -> np.ndarray:
+        """
+        추가 속성 view 가져오기
+        
+        Raises:
+        -------
+        KeyError
+            속성이 존재하지 않는 경우
+        """
+        if name not in self._attributes:
+            raise KeyError(f"타겟 속성 '{name}'이(가) 존재하지 않습니다.")
+        return self._attributes[name][:self._size]
+    
+    def set_attribute(self, name: str, values: Union[float, np.ndarray]):
+        """
+        추가 속성 설정 (기존 속성은 덮어씀)
+        
+        Parameters:
+        -----------
+        name : str
+            속성 이름
+        values : float or np.ndarray
+            속성 값 (스칼라 또는 shape: [num_targets])
+        """
+        values = np.broadcast_to(np.asarray(values), (self._size,))
+        self._attributes[name] = np.array(values)
     
     def add_target(self, target: Target):
         """타겟 추가"""
-        self.targets.append(target)
+        self.append(target.position[np.newaxis, :], target.reflectivity, target.phase)
     
     def add_targets(self, targets: List[Target]):
         """여러 타겟 추가"""
-        self.targets.extend(targets)
+        if len(targets) == 0:
+            return
+        
+        positions = np.array([target.position for target in targets], dtype=np.float64)
+        reflectivity = np.array([target.reflectivity for target in targets], dtype=np.float64)
+        phase = np.array([target.phase for target in targets], dtype=np.float64)
+        self.append(positions, reflectivity, phase)
     
-    def to_array(self) -> np.ndarray:
+    def append(
+        self,
+        positions: np.ndarray,
+        reflectivity: Union[float, np.ndarray] = 1.0,
+        phase: Union[float, np.ndarray] = 0.0,
+        **attributes: np.ndarray
+    ):
         """
-        타겟 리스트를 배열로 변환
+        여러 타겟을 배열 단위로 추가
         
-        Returns:
-        --------
-        np.ndarray
-            타겟 배열 (shape: [num_targets, 5])
-            각 행: [x, y, z, reflectivity, phase]
+        Parameters:
+        -----------
+        positions : np.ndarray
+            타겟 위치 배열 (ECEF, shape: [num_new, 3], 단위: m)
+        reflectivity : float or np.ndarray
+            반사도 (스칼라 또는 shape: [num_new], 단위: m²)
+        phase : float or np.ndarray
+            위상 (스칼라 또는 shape: [num_new], 단위: deg)
+        **attributes : np.ndarray
+            추가 속성 (각 shape: [num_new])
+            기존 속성 중 지정되지 않은 속성은 0으로 채워짐
         """
-        if len(self.targets) == 0:
-            return np.zeros((0, 5), dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.ndim != 2 or positions.shape[1] != 3:
+            raise ValueError("positions는 shape [num_targets, 3]이어야 합니다.")
+        
+        num_new = positions.shape[0]
+        if num_new == 0:
+            return
+        
+        start = self._size
+        end = start + num_new
+        self._reserve(end)
         
-        array = np.zeros((len(self.targets), 5), dtype=np.float64)
-        for i, target in enumerate(self.targets):
-            array[i, 0:3] = target.position
-            array[i, 3] = target.reflectivity
-            array[i, 4] = target.phase
+        self._data[start:end, 0:3] = positions
+        self._data[start:end, 3] = reflectivity
+        self._data[start:end, 4] = phase
         
-        return array
+        for name in set(self._attributes) | set(attributes):
+            if name not in self._attributes:
+                self._attributes[name] = np.zeros(self._data.shape[0], dtype=np.asarray(attributes[name]).dtype)
+            elif len(self._attributes[name]) < self._data.shape[0]:
+                self._attributes[name] = self._grow(self._attributes[name], self._data.shape[0])
+            self._attributes[name][start:end] = attributes.get(name, 0)
+        
+        self._size = end
     
-    @classmethod
-    def from_array(cls, array: np.ndarray) -> 'TargetList':
+    def filter(self, mask: np.ndarray) -> 'TargetList':
         """
-        배열로부터 TargetList 생성
+        마스크 또는 인덱스 배열로 타겟 선택
         
         Parameters:
         -----------
-        array : np.ndarray
-            타겟 배열 (shape: [num_targets, 5])
-            각 행: [x, y, z, reflectivity, phase]
+        mask : np.ndarray
+            불리언 마스크 (shape: [num_targets]) 또는 정수 인덱스 배열
         
         Returns:
         --------
         TargetList
-            생성된 TargetList
+            선택된 타겟으로 구성된 새 TargetList
         """
-        targets = []
-        for row in array:
-            target = Target(
-                position=row[0:3],
-                reflectivity=row[3],
-                phase=row[4]
-            )
-            targets.append(target)
+        attributes = {name: values[mask] for name, values in self.attributes.items()}
+        return TargetList.from_array(self.to_array()[mask], **attributes)
+    
+    def to_array(self) -> np.ndarray:
+        """
+        타겟 리스트를 배열로 변환
+        
+        내부 저장 배열의 view를 반환합니다 (복사 없음).
         
-        return cls(targets)
+        Returns:
+        --------
+        np.ndarray
+            타겟 배열 (shape: [num_targets, 5])
+            각 행: [x, y, z, reflectivity, phase]
+        """
+        return self._data[:self._size]
     
     def __len__(self) -> int:
         """타겟 개수 반환"""
-        return len(self.targets)
+        return self._size
+    
+    def __iter__(self) -> Iterator[Target]:
+        """Target view 순회"""
+        for i in range(self._size):
+            yield self[i]
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[Target, List[Target]]:
+        """인덱스로 타겟 접근 (position은 내부 배열의 view)"""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._size))]
+        
+        if index < 0:
+            index += self._size
+        if index < 0 or index >= self._size:
+            raise IndexError(f"인덱스 {index}가 범위 [0, {self._size})를 벗어났습니다.")
+        
+        row = self._data[index]
+        return Target(
+            position=row[0:3],
+            reflectivity=float(row[3]),
+            phase=float(row[4])
+        )
+    
+    def _reserve(self, capacity: int):
+        """내부 배열 용량 확보 (2배씩 증가)"""
+        if capacity <= self._data.shape[0] and self._data.flags['WRITEABLE'] and self._data.flags['OWNDATA']:
+            return
+        
+        new_capacity = max(capacity, 2 * self._size, 16)
+        self._data = self._grow(self._data[:self._size], new_capacity)
+        for name, values in self._attributes.items():
+            self._attributes[name] = self._grow(values[:self._size], new_capacity)
+    
+    @staticmethod
+    def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+        """앞쪽 데이터를 유지하며 첫 번째 축 길이를 capacity로 늘린 새 배열 반환"""
+        grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
     
-    def __getitem__(self, index: int) -> Target:
-        """인덱스로 타겟 접근"""
-        return self.targets[index]
+    @staticmethod
+    def _check_attribute(name: str, values: np.ndarray, num_targets: int) -> np.ndarray:
+        """추가 속성 배열 shape 검증"""
+        values = np.asarray(values)
+        if values.shape != (num_targets,):
+            raise ValueError(f"타겟 속성 '{name}'의 shape는 [{num_targets}]이어야 합니다.")
+        return values
@@ -5,7 +5,21 @@ Echo 신호 생성 및 타겟 반사 모델링을 담당합니다.
 """
 
 from sar_simulator.echo.echo_simulator import SarEchoSimulator
+from sar_simulator.echo.clutter_generator import ClutterGenerator
+from sar_simulator.echo.burst_scheduler import BurstTask, plan_burst_tasks, generate_bursts
+from sar_simulator.echo.thermal_noise import (
+    thermal_noise_power,
+    add_thermal_noise,
+    saturate_adc,
+)
 
 __all__ = [
     "SarEchoSimulator",
+    "ClutterGenerator",
+    "BurstTask",
+    "plan_burst_tasks",
+    "generate_bursts",
+    "thermal_noise_power",
+    "add_thermal_noise",
+    "saturate_adc",
 ]
@@ -0,0 +1,274 @@
+"""
+다중 Burst 생성 스케줄러
+
+STRIPMAP 연속 Burst나 SCANSAR 서브스와스 Burst를 여러 프로세스에서 동시에 시뮬레이션하여
+Burst별 임시 HDF5 파일에 저장한 뒤, 하나의 HDF5 파일로 통합합니다.
+"""
+
+import dataclasses
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, List, Sequence, Dict, Any, Union
+
+from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.common.target_model import TargetList
+from sar_simulator.echo.echo_simulator import SarEchoSimulator
+from sar_simulator.echo.thermal_noise import new_noise_seed
+from sar_simulator.io.burst_merge import MERGE_MODES, merge_burst_files
+from sar_simulator.io.raw_data_writer import RawDataWriter
+from sar_simulator.orbit.attitude import AttitudeProfile
+from sar_simulator.orbit.ephemeris import Ephemeris
+from sar_simulator.orbit.ground_track import calc_look_directions
+
+
+# 지원하는 SAR 모드
+BURST_MODES = ("STRIPMAP", "SCANSAR")
+
+
+@dataclass
+class BurstTask:
+    """
+    Burst 하나의 생성 작업
+    
+    Attributes:
+    -----------
+    group_name : str
+        저장 그룹 이름 (예: 'SSG00')
+    config : SarSystemConfig
+        SAR 시스템 설정 (서브스와스별 beam_id 등)
+    target_list : TargetList
+        타겟 리스트
+    ephemeris : Ephemeris
+        위성 궤도력
+    num_pulses : int
+        펄스 개수
+    start_time : float, optional
+        첫 펄스 시각 (단위: s, None이면 궤도력 첫 노드 시각)
+    off_nadir_angle : float, optional
+        빔 off-nadir 각도 (단위: deg, None이면 nadir 방향)
+    attitude : AttitudeProfile, optional
+        버스 자세 프로파일
+    range_compressed : bool
+        Range 압축된 Echo 생성 여부
+    add_noise : bool
+        수신기 열잡음 추가 여부
+    noise_seed : int, optional
+        잡음 seed (Burst들이 같은 seed를 공유하고 first_pulse로 잡음 스트림을 구분)
+    first_pulse : int
+        Burst 첫 펄스의 전체 펄스 인덱스
+    """
+    group_name: str
+    config: SarSystemConfig
+    target_list: TargetList
+    ephemeris: Ephemeris
+    num_pulses: int
+    start_time: Optional[float] = None
+    off_nadir_angle: Optional[float] = None
+    attitude: Optional[AttitudeProfile] = None
+    range_compressed: bool = False
+    add_noise: bool = False
+    noise_seed: Optional[int] = None
+    first_pulse: int = 0
+
+
+def plan_burst_tasks(
+    mode: str,
+    config: SarSystemConfig,
+    target_list: TargetList,
+    ephemeris: Ephemeris,
+    burst_pulses: int,
+    num_bursts: int = 1,
+    off_nadir_angles: Optional[Sequence[float]] = None,
+    start_time: Optional[float] = None,
+    attitude: Optional[AttitudeProfile] = None,
+    range_compressed: bool = False,
+    add_noise: bool = False,
+    noise_seed: Optional[int] = None
+) -> List[BurstTask]:
+    """
+    SAR 모드에 따른 Burst 작업 목록 생성
+    
+    - STRIPMAP: 같은 빔으로 num_bursts개의 연속 구간을 나누어 생성 (off_nadir_angles는 최대 1개)
+    - SCANSAR: 서브스와스(off_nadir_angles)를 순서대로 전환하며 num_bursts 주기만큼 생성,
+      서브스와스 j의 beam_id는 'Beam{j:04d}'
+    
+    Burst는 시간 순서로 이어지며 그룹 이름은 'SSG00', 'SSG01', ... 입니다.
+    add_noise이면 모든 Burst가 같은 잡음 seed를 쓰고 Burst 첫 펄스 인덱스로 잡음 스트림을 구분하므로,
+    병렬 생성 결과가 작업 순서와 관계없이 재현됩니다.
+    
+    Parameters:
+    -----------
+    mode : str
+        SAR 모드 ("STRIPMAP" 또는 "SCANSAR", 대소문자 무시)
+    config : SarSystemConfig
+        SAR 시스템 설정
+    target_list : TargetList
+        타겟 리스트
+    ephemeris : Ephemeris
+        위성 궤도력
+    burst_pulses : int
+        Burst당 펄스 개수
+    num_bursts : int
+        STRIPMAP: Burst 개수, SCANSAR: 서브스와스 순환 주기 수 (기본값: 1)
+    off_nadir_angles : Sequence[float], optional
+        빔 off-nadir 각도 (단위: deg, SCANSAR는 서브스와스별로 필수)
+    start_time : float, optional
+        첫 펄스 시각 (단위: s, None이면 궤도력 첫 노드 시각)
+    attitude : AttitudeProfile, optional
+        버스 자세 프로파일
+    range_compressed : bool
+        Range 압축된 Echo 생성 여부
+    add_noise : bool
+        수신기 열잡음 추가 여부
+    noise_seed : int, optional
+        잡음 seed (None이면 임의 seed를 하나 정해 모든 Burst에 사용)
+    
+    Returns:
+    --------
+    List[BurstTask]
+        Burst 작업 목록
+    """
+    mode = mode.upper()
+    if mode not in BURST_MODES:
+        raise ValueError(f"지원하지 않는 SAR 모드입니다: {mode} (사용 가능: {', '.join(BURST_MODES)})")
+    if burst_pulses <= 0 or num_bursts <= 0:
+        raise ValueError("burst_pulses와 num_bursts는 0보다 커야 합니다.")
+    
+    if mode == "STRIPMAP":
+        if off_nadir_angles is not None and len(off_nadir_angles) > 1:
+            raise ValueError("STRIPMAP 모드는 하나의 off-nadir 각도만 사용할 수 있습니다.")
+        angle = off_nadir_angles[0] if off_nadir_angles else None
+        beams = [(config, angle)] * num_bursts
+    else:
+        if not off_nadir_angles:
+            raise ValueError("SCANSAR 모드에는 서브스와스별 off_nadir_angles가 필요합니다.")
+        subswaths = [
+            (dataclasses.replace(config, beam_id=f"Beam{index:04d}"), angle)
+            for index, angle in enumerate(off_nadir_angles)
+        ]
+        beams = subswaths * num_bursts
+    
+    if start_time is None:
+        start_time = ephemeris.start_time
+    burst_duration = burst_pulses / config.prf
+    if add_noise and noise_seed is None:
+        noise_seed = new_noise_seed()
+    
+    return [
+        BurstTask(
+            group_name=f"SSG{index:02d}",
+            config=burst_config,
+            target_list=target_list,
+            ephemeris=ephemeris,
+            num_pulses=burst_pulses,
+            start_time=start_time + index * burst_duration,
+            off_nadir_angle=angle,
+            attitude=attitude,
+            range_compressed=range_compressed,
+            add_noise=add_noise,
+            noise_seed=noise_seed,
+            first_pulse=index * burst_pulses
+        )
+        for index, (burst_config, angle) in enumerate(beams)
+    ]
+
+
+def generate_bursts(
+    tasks: Sequence[BurstTask],
+    output_path: Union[str, Path],
+    max_workers: Optional[int] = None,
+    merge_mode: str = "virtual",
+    writer_options: Optional[Dict[str, Any]] = None
+) -> Path:
+    """
+    여러 Burst를 병렬로 생성하여 하나의 HDF5 파일로 통합
+    
+    각 작업은 별도 프로세스에서 Echo를 시뮬레이션하고 '<출력 이름>_parts/<그룹 이름>.h5'에
+    저장합니다. 모든 작업이 끝나면 merge_burst_files()로 통합합니다
+    (virtual/external은 parts 디렉터리를 참조하므로 유지, copy는 parts 디렉터리 삭제).
+    
+    Parameters:
+    -----------
+    tasks : Sequence[BurstTask]
+        Burst 작업 목록 (그룹 이름이 서로 달라야 함)
+    output_path : str or Path
+        통합 HDF5 파일 경로
+    max_workers : int, optional
+        최대 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+    merge_mode : str
+        통합 방식 ("virtual", "external", "copy", 기본값: "virtual")
+    writer_options : Dict[str, Any], optional
+        RawDataWriter 추가 인자 (compression, baq_bits 등)
+    
+    Returns:
+    --------
+    Path
+        통합 HDF5 파일 경로
+    """
+    group_names = [task.group_name for task in tasks]
+    if not tasks:
+        raise ValueError("Burst 작업이 없습니다.")
+    if len(set(group_names)) != len(group_names):
+        raise ValueError("Burst 작업의 그룹 이름이 중복됩니다.")
+    if merge_mode not in MERGE_MODES:
+        raise ValueError(f"지원하지 않는 통합 방식입니다: {merge_mode} (사용 가능: {', '.join(MERGE_MODES)})")
+    
+    output_path = Path(output_path)
+    parts_dir = output_path.parent / f"{output_path.stem}_parts"
+    parts_dir.mkdir(parents=True, exist_ok=True)
+    part_files = [parts_dir / f"{name}.h5" for name in group_names]
+    writer_options = writer_options or {}
+    
+    if max_workers == 1:
+        for task, part_file in zip(tasks, part_files):
+            _generate_burst(task, part_file, writer_options)
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_generate_burst, task, part_file, writer_options)
+                for task, part_file in zip(tasks, part_files)
+            ]
+            for future in futures:
+                future.result()
+    
+    merge_burst_files(part_files, output_path, mode=merge_mode)
+    if merge_mode == "copy":
+        shutil.rmtree(parts_dir, ignore_errors=True)
+    return output_path
+
+
+def _generate_burst(task: BurstTask, part_file: Path, writer_options: Dict[str, Any]) -> Path:
+    """작업 프로세스: Burst 하나를 시뮬레이션하여 파일로 저장"""
+    config = task.config
+    timestamps = task.ephemeris.pulse_times(task.num_pulses, config.prf, task.start_time)
+    positions, velocities = task.ephemeris.evaluate(timestamps)
+    
+    beam_directions = None
+    if task.off_nadir_angle is not None:
+        beam_directions = calc_look_directions(positions, velocities, task.off_nadir_angle)
+    
+    echo_data = SarEchoSimulator(config).simulate_multiple_pulses(
+        task.target_list,
+        positions,
+        velocities,
+        beam_directions=beam_directions,
+        range_compressed=task.range_compressed,
+        attitude=task.attitude,
+        timestamps=timestamps,
+        add_noise=task.add_noise,
+        noise_seed=task.noise_seed,
+        first_pulse=task.first_pulse
+    )
+    
+    with RawDataWriter(str(part_file), config, **writer_options) as writer:
+        writer.write_burst(
+            task.group_name,
+            echo_data,
+            positions,
+            velocities,
+            timestamps,
+            attitude=task.attitude
+        )
+    return part_file
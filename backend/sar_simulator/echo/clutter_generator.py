@@ -0,0 +1,271 @@
+"""
+분포 클러터 생성기
+
+균질한 지표(초지, 해면 등) 영역의 Echo 기여분을 점 타겟 없이
+range-Doppler 영역의 스펙트럼 성형 복소 가우시안 잡음으로 직접 합성합니다.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+from scipy.signal import fftconvolve
+
+from sar_simulator.common.constants import LIGHT_SPEED, PI
+from sar_simulator.common.coordinates import llh_to_ecef
+from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.common.propagation_model import calc_atmospheric_loss
+from sar_simulator.common.math_utils import dB2Linear10
+from sar_simulator.echo.compressed_pulse_kernel import CompressedPulseKernel
+
+
+# 영역 경계 샘플링 격자 크기 (slant range / along-track 범위 계산용)
+_AREA_GRID_SIZE = 9
+
+# Doppler 스펙트럼 계산 시 고려하는 PRF 모호성 차수 (±)
+_DOPPLER_ALIASES = 3
+
+
+class ClutterGenerator:
+    """
+    분포 클러터 생성기 클래스
+    
+    위경도 경계로 주어진 균질 영역(후방산란계수 σ⁰)에 대해 펄스 × range 샘플의
+    클러터 Echo를 생성합니다. 계산량은 펄스 수와 샘플 수에만 비례하며 영역 크기와 무관합니다.
+    
+    모델:
+    - Range: 샘플별 slant range 링의 평균 전력
+      P(R) = Pt λ² σ⁰ G_el²(R) ΔA(R) / ((4π)³ L L_atm R⁴),
+      ΔA(R) = (c / 2fs) / sin(θ_inc) × (azimuth 방향 G² 등가 폭)
+    - Azimuth: 안테나 패턴(EchoGenerator와 같은 가우시안 빔)에 따른 Doppler 스펙트럼으로
+      성형한 복소 가우시안 잡음, 영역과 빔 footprint의 along-track 겹침 비율로 펄스별 가중
+    - 송신 파형: Chirp(또는 Range 압축 커널)과 range 방향 컨볼루션
+    지구는 영역 중심 반경의 구로 근사하며, 관측 구간 중앙 펄스를 기준 기하로 사용합니다.
+    """
+    
+    def __init__(
+        self,
+        config: SarSystemConfig,
+        sigma0_db: float,
+        upper_left: Tuple[float, float],
+        lower_right: Tuple[float, float],
+        height: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        """
+        ClutterGenerator 초기화
+        
+        Parameters:
+        -----------
+        config : SarSystemConfig
+            SAR 시스템 설정
+        sigma0_db : float
+            후방산란계수 σ⁰ (단위: dB)
+        upper_left : Tuple[float, float]
+            영역 좌상단 (위도, 경도) (단위: deg)
+        lower_right : Tuple[float, float]
+            영역 우하단 (위도, 경도) (단위: deg)
+        height : float
+            영역 고도 (단위: m, 기본값: 0.0)
+        seed : int, optional
+            난수 시드
+        """
+        if upper_left[0] <= lower_right[0] or upper_left[1] >= lower_right[1]:
+            raise ValueError("upper_left는 lower_right보다 북서쪽이어야 합니다.")
+        
+        self.config = config
+        self.sigma0 = dB2Linear10(sigma0_db)
+        self.rng = np.random.default_rng(seed)
+        
+        lat = np.linspace(lower_right[0], upper_left[0], _AREA_GRID_SIZE)
+        lon = np.linspace(upper_left[1], lower_right[1], _AREA_GRID_SIZE)
+        lat_grid, lon_grid = np.meshgrid(lat, lon, indexing='ij')
+        self.area_points = llh_to_ecef(lat_grid, lon_grid, height).reshape(-1, 3)
+        self.area_center = llh_to_ecef(
+            0.5 * (upper_left[0] + lower_right[0]),
+            0.5 * (upper_left[1] + lower_right[1]),
+            height
+        )
+    
+    def generate(
+        self,
+        satellite_positions: np.ndarray,
+        satellite_velocities: np.ndarray,
+        beam_directions: Optional[np.ndarray] = None,
+        chirp_signal: Optional[np.ndarray] = None,
+        compressed_kernel: Optional[CompressedPulseKernel] = None
+    ) -> np.ndarray:
+        """
+        클러터 Echo 생성
+        
+        chirp_signal과 compressed_kernel 중 하나를 지정해야 합니다.
+        
+        Parameters:
+        -----------
+        satellite_positions : np.ndarray
+            위성 위치 배열 (shape: [num_pulses, 3], 단위: m)
+        satellite_velocities : np.ndarray
+            위성 속도 배열 (shape: [num_pulses, 3], 단위: m/s)
+        beam_directions : np.ndarray, optional
+            빔 방향 벡터 배열 (shape: [num_pulses, 3])
+            None인 경우 지구 중심 방향
+        chirp_signal : np.ndarray, optional
+            Chirp 신호 (Raw Echo 생성 시)
+        compressed_kernel : CompressedPulseKernel, optional
+            압축 펄스 커널 (Range 압축 Echo 생성 시)
+        
+        Returns:
+        --------
+        np.ndarray
+            클러터 Echo (shape: [num_pulses, num_samples], dtype: complex64)
+        """
+        if (chirp_signal is None) == (compressed_kernel is None):
+            raise ValueError("chirp_signal과 compressed_kernel 중 하나만 지정해야 합니다.")
+        
+        satellite_positions = np.atleast_2d(np.asarray(satellite_positions, dtype=np.float64))
+        satellite_velocities = np.atleast_2d(np.asarray(satellite_velocities, dtype=np.float64))
+        num_pulses = satellite_positions.shape[0]
+        num_samples = self.config.num_samples
+        
+        # 기준 기하 (중앙 펄스)
+        ref = num_pulses // 2
+        satellite_position = satellite_positions[ref]
+        satellite_velocity = satellite_velocities[ref]
+        if beam_directions is not None:
+            beam_direction = np.asarray(beam_directions, dtype=np.float64).reshape(-1, 3)[ref]
+        else:
+            beam_direction = -satellite_position
+        beam_direction = beam_direction / np.linalg.norm(beam_direction)
+        
+        # 송신 파형 응답 h와 중심 인덱스 (echo[n] = Σ_k field[k] h[n - k + center])
+        if compressed_kernel is not None:
+            half_width = compressed_kernel.half_width
+            pulse_response = compressed_kernel.evaluate(np.arange(-half_width, half_width + 1))
+            response_center = half_width
+        else:
+            pulse_response = np.asarray(chirp_signal)
+            response_center = 0
+        
+        # 샘플링 윈도우에 기여하는 field 샘플 (윈도우 이전 지연 포함)
+        field_samples = np.arange(response_center - len(pulse_response) + 1, num_samples + response_center)
+        
+        power = self._calc_range_power(field_samples, satellite_position, beam_direction)
+        active = np.flatnonzero(power > 0.0)
+        clutter = np.zeros((num_pulses, num_samples), dtype=np.complex64)
+        if len(active) == 0:
+            return clutter
+        
+        # 유효 range 구간만 합성
+        k0, k1 = active[0], active[-1] + 1
+        spectrum = self._calc_doppler_spectrum(num_pulses, satellite_velocity, beam_direction)
+        illumination = self._calc_illumination(satellite_positions, satellite_velocity, satellite_position, beam_direction)
+        
+        noise = (self.rng.standard_normal((num_pulses, k1 - k0), dtype=np.float32)
+                 + 1j * self.rng.standard_normal((num_pulses, k1 - k0), dtype=np.float32))
+        noise *= np.float32(np.sqrt(0.5 * num_pulses))
+        noise *= np.sqrt(spectrum, dtype=np.float32)[:, np.newaxis]
+        field = np.fft.ifft(noise, axis=0).astype(np.complex64)
+        field *= np.sqrt(power[k0:k1]).astype(np.float32)[np.newaxis, :]
+        field *= np.sqrt(illumination).astype(np.float32)[:, np.newaxis]
+        
+        # 송신 파형과 range 방향 컨볼루션
+        convolved = fftconvolve(field, pulse_response[np.newaxis, :].astype(np.complex64), axes=1)
+        
+        # convolved[:, t] → echo[t + field_samples[k0] - center]
+        start = field_samples[k0] - response_center
+        n0 = max(start, 0)
+        n1 = min(start + convolved.shape[1], num_samples)
+        if n1 > n0:
+            clutter[:, n0:n1] = convolved[:, n0 - start:n1 - start]
+        
+        return clutter
+    
+    def _calc_range_power(
+        self,
+        field_samples: np.ndarray,
+        satellite_position: np.ndarray,
+        beam_direction: np.ndarray
+    ) -> np.ndarray:
+        """range 샘플별 클러터 평균 전력 (영역 밖은 0)"""
+        config = self.config
+        
+        # 샘플 지연 (EchoGenerator와 같이 샘플링 윈도우 기준)
+        delay = config.swst + field_samples / config.fs
+        slant_range = 0.5 * LIGHT_SPEED * delay
+        
+        # 구형 지구 기하 (영역 중심 반경)
+        satellite_radius = np.linalg.norm(satellite_position)
+        earth_radius = np.linalg.norm(self.area_center)
+        cos_look = (satellite_radius ** 2 + slant_range ** 2 - earth_radius ** 2) / (2.0 * satellite_radius * slant_range)
+        look = np.arccos(np.clip(cos_look, -1.0, 1.0))
+        sin_incidence = satellite_radius * np.sin(look) / earth_radius
+        
+        # 영역 slant range 범위
+        area_ranges = np.linalg.norm(self.area_points - satellite_position, axis=1)
+        inside = ((slant_range >= area_ranges.min()) & (slant_range <= area_ranges.max())
+                  & (np.abs(cos_look) <= 1.0) & (sin_incidence > 0.0) & (sin_incidence < 1.0))
+        
+        # 안테나 게인 (EchoGenerator와 같은 가우시안 빔: G = exp(-2 α² / h²))
+        half_beamwidth = np.deg2rad(config.beamwidth_el) / 2.0
+        boresight_look = np.arccos(np.clip(np.dot(beam_direction, -satellite_position / satellite_radius), -1.0, 1.0))
+        elevation_gain_sq = np.exp(-4.0 * (look - boresight_look) ** 2 / half_beamwidth ** 2)
+        
+        # 링 면적: ground range 폭 × azimuth 방향 G² 등가 폭 (∫exp(-4α²/h²) R dα = R h √π / 2)
+        ground_width = (0.5 * LIGHT_SPEED / config.fs) / np.where(inside, sin_incidence, 1.0)
+        azimuth_width = slant_range * half_beamwidth * np.sqrt(PI) / 2.0
+        
+        atmospheric_loss = calc_atmospheric_loss(beam_direction, satellite_position)
+        power = (config.Pt * config.wavelength ** 2 * self.sigma0 * elevation_gain_sq * ground_width * azimuth_width
+                 / ((4.0 * PI) ** 3 * config.get_loss_linear() * atmospheric_loss * slant_range ** 4))
+        
+        return np.where(inside, power, 0.0)
+    
+    def _calc_doppler_spectrum(
+        self,
+        num_pulses: int,
+        satellite_velocity: np.ndarray,
+        beam_direction: np.ndarray
+    ) -> np.ndarray:
+        """azimuth 안테나 패턴으로 정해지는 Doppler 전력 스펙트럼 (평균 1로 정규화)"""
+        config = self.config
+        speed = np.linalg.norm(satellite_velocity)
+        half_beamwidth = np.deg2rad(config.beamwidth_el) / 2.0
+        doppler_centroid = 2.0 * np.dot(satellite_velocity, beam_direction) / config.wavelength
+        
+        frequencies = np.fft.fftfreq(num_pulses, d=1.0 / config.prf)
+        spectrum = np.zeros(num_pulses)
+        for alias in range(-_DOPPLER_ALIASES, _DOPPLER_ALIASES + 1):
+            sin_angle = config.wavelength * (frequencies + alias * config.prf - doppler_centroid) / (2.0 * speed)
+            angle = np.arcsin(np.clip(sin_angle, -1.0, 1.0))
+            spectrum += np.exp(-4.0 * angle ** 2 / half_beamwidth ** 2)
+        
+        return spectrum / spectrum.mean()
+    
+    def _calc_illumination(
+        self,
+        satellite_positions: np.ndarray,
+        satellite_velocity: np.ndarray,
+        reference_position: np.ndarray,
+        beam_direction: np.ndarray
+    ) -> np.ndarray:
+        """펄스별 빔 footprint와 영역의 along-track 겹침 비율"""
+        along_track = satellite_velocity / np.linalg.norm(satellite_velocity)
+        satellite_radius = np.linalg.norm(reference_position)
+        earth_radius = np.linalg.norm(self.area_center)
+        
+        # 기준 빔 중심의 지표 교차점 (구형 지구)
+        b = np.dot(reference_position, beam_direction)
+        discriminant = b ** 2 - (satellite_radius ** 2 - earth_radius ** 2)
+        if discriminant < 0:
+            return np.zeros(len(satellite_positions))
+        beam_range = -b - np.sqrt(discriminant)
+        beam_center = reference_position + beam_range * beam_direction
+        
+        # footprint along-track 등가 폭 및 펄스별 이동량 (지표 속도로 환산)
+        half_beamwidth = np.deg2rad(self.config.beamwidth_el) / 2.0
+        footprint_width = beam_range * half_beamwidth * np.sqrt(PI) / 2.0
+        footprint_center = (satellite_positions - reference_position) @ along_track * (earth_radius / satellite_radius)
+        
+        area_along = (self.area_points - beam_center) @ along_track
+        overlap = (np.minimum(footprint_center + footprint_width / 2.0, area_along.max())
+                   - np.maximum(footprint_center - footprint_width / 2.0, area_along.min()))
+        
+        return np.clip(overlap / footprint_width, 0.0, 1.0)
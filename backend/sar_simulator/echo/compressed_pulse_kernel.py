@@ -0,0 +1,121 @@
+"""
+압축 펄스 커널
+
+Chirp 신호와 RDA 참조 신호의 상관(autocorrelation) 응답을 오버샘플링된 테이블로
+미리 계산해 두고, 분수 지연(fractional delay) 위치에서 보간하여 반환합니다.
+Range 압축된 Echo를 직접 생성할 때 사용합니다.
+"""
+
+import numpy as np
+from typing import Optional
+
+from sar_simulator.common.constants import PI
+from sar_simulator.common.sar_system_config import SarSystemConfig
+
+
+class CompressedPulseKernel:
+    """
+    압축 펄스 커널 클래스
+    
+    RDAProcessor.pulse_compression과 동일한 참조 신호로 상관한 Chirp 응답 K(u)를
+    u ∈ [-half_width, half_width] 샘플 구간에서 1/oversample 샘플 간격으로 저장합니다.
+    Echo 파형은 fs로 샘플링된 단일 LFM Chirp (ChirpGenerator.generate(num_chirps=1))로 가정합니다.
+    """
+    
+    def __init__(
+        self,
+        config: SarSystemConfig,
+        oversample: int = 16,
+        half_width: int = 16
+    ):
+        """
+        CompressedPulseKernel 초기화
+        
+        Parameters:
+        -----------
+        config : SarSystemConfig
+            SAR 시스템 설정
+        oversample : int
+            샘플당 커널 테이블 분할 수 (기본값: 16)
+        half_width : int
+            커널 반폭 (단위: 샘플, 기본값: 16)
+        """
+        if oversample < 1:
+            raise ValueError("oversample은 1 이상이어야 합니다.")
+        if half_width < 1:
+            raise ValueError("half_width는 1 이상이어야 합니다.")
+        
+        self.config = config
+        self.oversample = oversample
+        self.half_width = half_width
+        self.table: Optional[np.ndarray] = None
+    
+    def build(self) -> np.ndarray:
+        """
+        커널 테이블 계산 (최초 1회만 수행)
+        
+        Returns:
+        --------
+        np.ndarray
+            커널 테이블 (shape: [2 * half_width * oversample + 1], dtype: complex128)
+        """
+        if self.table is not None:
+            return self.table
+        
+        dt = self.config.dt
+        taup = self.config.taup
+        Kr = self.config.chirp_rate
+        num_samples_in_chirp = self.config.num_samples_in_chirp
+        
+        # RDA 참조 신호 (RDAProcessor.pulse_compression과 동일)
+        t_ref = np.arange(-taup / 2, taup / 2, dt)
+        ref_conj = np.conj(np.exp(1j * PI * Kr * t_ref ** 2))
+        
+        # 커널 lag 배열 (단위: 샘플)
+        lags = np.arange(-self.half_width * self.oversample,
+                         self.half_width * self.oversample + 1) / self.oversample
+        
+        table = np.zeros(len(lags), dtype=np.complex128)
+        
+        # 메모리 사용량 제한을 위해 lag 단위로 나누어 계산
+        chunk = 64
+        for start in range(0, len(lags), chunk):
+            u = lags[start:start + chunk, np.newaxis]
+            
+            # 지연된 Chirp의 연속 시간 (ChirpGenerator와 동일한 샘플 그리드)
+            t = t_ref[np.newaxis, :] + u * dt
+            x = t / dt + num_samples_in_chirp / 2.0
+            support = (x >= -1e-6) & (x < num_samples_in_chirp - 1e-6)
+            
+            s = np.exp(1j * PI * Kr * t ** 2) * support
+            table[start:start + chunk] = np.sum(s * ref_conj[np.newaxis, :], axis=1)
+        
+        self.table = table
+        return self.table
+    
+    def evaluate(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        분수 지연 위치에서 커널 값 계산 (선형 보간)
+        
+        Parameters:
+        -----------
+        offsets : np.ndarray
+            커널 중심으로부터의 오프셋 (단위: 샘플, 임의 shape)
+        
+        Returns:
+        --------
+        np.ndarray
+            커널 값 (offsets와 같은 shape, dtype: complex128)
+            |offset| > half_width 인 위치는 0
+        """
+        table = self.build()
+        
+        pos = (np.asarray(offsets, dtype=np.float64) + self.half_width) * self.oversample
+        inside = (pos >= 0) & (pos <= len(table) - 1)
+        pos = np.clip(pos, 0, len(table) - 1)
+        
+        i0 = np.minimum(np.floor(pos).astype(np.int64), len(table) - 2)
+        frac = pos - i0
+        
+        values = table[i0] * (1.0 - frac) + table[i0 + 1] * frac
+        return np.where(inside, values, 0.0)
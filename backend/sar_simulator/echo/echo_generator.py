@@ -5,7 +5,7 @@ Chirp 신호와 타겟 정보를 기반으로 Echo 신호를 생성합니다.
 """
 
 import numpy as np
-from typing import Optional
+from typing import Optional, Tuple
 from math import sqrt, pi
 
 from sar_simulator.common.constants import LIGHT_SPEED, BOLZMAN_CONST, PI
@@ -22,6 +22,7 @@ from sar_simulator.common.propagation_model import (
     calc_atmospheric_loss,
     calc_path_loss
 )
+from sar_simulator.echo.compressed_pulse_kernel import CompressedPulseKernel
 
 
 class EchoGenerator:
@@ -31,7 +32,12 @@ class EchoGenerator:
     Chirp 신호를 받아 타겟에서 반사된 Echo 신호를 생성합니다.
     """
     
-    def __init__(self, config: SarSystemConfig):
+    def __init__(
+        self,
+        config: SarSystemConfig,
+        kernel_oversample: int = 16,
+        kernel_half_width: int = 16
+    ):
         """
         EchoGenerator 초기화
         
@@ -39,8 +45,19 @@ class EchoGenerator:
         -----------
         config : SarSystemConfig
             SAR 시스템 설정
+        kernel_oversample : int
+            Range 압축 모드 커널의 샘플당 분할 수 (기본값: 16)
+        kernel_half_width : int
+            Range 압축 모드 커널 반폭 (단위: 샘플, 기본값: 16)
         """
         self.config = config
+        
+        # Range 압축 모드용 커널 (최초 사용 시 계산)
+        self.compressed_kernel = CompressedPulseKernel(
+            config,
+            oversample=kernel_oversample,
+            half_width=kernel_half_width
+        )
     
     def generate(
         self,
@@ -72,13 +89,122 @@ class EchoGenerator:
         np.ndarray
             Echo 신호 (shape: [num_samples], dtype: complex64)
         """
+        echo_signal = np.zeros(self.config.num_samples, dtype=np.complex64)
+        
+        target_response = self._calc_target_response(
+            target_list,
+            satellite_position,
+            beam_direction
+        )
+        if target_response is None:
+            return echo_signal
+        
+        coeffs, sample_positions = target_response
+        
+        # 각 타겟에 대해 Echo 신호 생성
+        for coeff, sample_pos in zip(coeffs, sample_positions):
+            idx0 = int(np.ceil(sample_pos))
+            idx1 = idx0 + len(chirp_signal)
+            
+            # Chirp 신호를 Echo 신호에 추가
+            if idx1 <= 0 or idx0 >= self.config.num_samples:
+                continue
+            
+            if idx0 < 0:
+                # Chirp의 일부만 사용
+                echo_signal[0:idx1] += chirp_signal[-idx0:] * coeff
+            elif idx1 > self.config.num_samples:
+                # Chirp의 일부만 사용
+                echo_signal[idx0:] += chirp_signal[:self.config.num_samples - idx0] * coeff
+            else:
+                # 전체 Chirp 사용
+                echo_signal[idx0:idx1] += chirp_signal * coeff
+        
+        return echo_signal
+    
+    def generate_range_compressed(
+        self,
+        target_list: TargetList,
+        satellite_position: np.ndarray,
+        satellite_velocity: np.ndarray,
+        beam_direction: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Range 압축된 Echo 신호 생성
+        
+        Chirp 합성과 정합 필터링을 생략하고, 타겟 지연 위치에 압축 펄스 커널을
+        분수 지연 보간으로 직접 배치합니다. 결과는 RDAProcessor.pulse_compression
+        출력과 같은 range 샘플 축을 가지며 RDA의 Doppler 단계에 바로 입력할 수 있습니다.
+        
+        Parameters:
+        -----------
+        target_list : TargetList
+            타겟 리스트
+        satellite_position : np.ndarray
+            위성 위치 (shape: [3], 단위: m)
+        satellite_velocity : np.ndarray
+            위성 속도 (shape: [3], 단위: m/s)
+        beam_direction : np.ndarray, optional
+            빔 방향 벡터 (shape: [3])
+            None인 경우 기본 방향 사용
+        
+        Returns:
+        --------
+        np.ndarray
+            Range 압축된 Echo 신호 (shape: [num_samples], dtype: complex64)
+        """
+        num_samples = self.config.num_samples
+        
+        target_response = self._calc_target_response(
+            target_list,
+            satellite_position,
+            beam_direction
+        )
+        if target_response is None:
+            return np.zeros(num_samples, dtype=np.complex64)
+        
+        coeffs, sample_positions = target_response
+        
+        # 커널 탭 위치 (타겟별 2 * half_width 샘플)
+        half_width = self.compressed_kernel.half_width
+        taps = np.arange(-half_width + 1, half_width + 1)
+        indices = np.floor(sample_positions).astype(np.int64)[:, np.newaxis] + taps
+        
+        # 분수 지연 커널 값
+        values = self.compressed_kernel.evaluate(indices - sample_positions[:, np.newaxis])
+        values *= coeffs[:, np.newaxis]
+        
+        # 샘플링 윈도우 내부만 누적
+        inside = (indices >= 0) & (indices < num_samples)
+        indices = indices[inside]
+        values = values[inside]
+        
+        compressed_signal = np.empty(num_samples, dtype=np.complex64)
+        compressed_signal.real = np.bincount(indices, weights=values.real, minlength=num_samples)
+        compressed_signal.imag = np.bincount(indices, weights=values.imag, minlength=num_samples)
+        
+        return compressed_signal
+    
+    def _calc_target_response(
+        self,
+        target_list: TargetList,
+        satellite_position: np.ndarray,
+        beam_direction: Optional[np.ndarray]
+    ) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        유효 타겟의 복소 계수와 샘플 위치 계산
+        
+        Returns:
+        --------
+        Optional[Tuple[np.ndarray, np.ndarray]]
+            (복소 계수 [num_valid], 샘플링 윈도우 기준 분수 샘플 위치 [num_valid])
+            유효한 타겟이 없는 경우 None
+        """
         if len(target_list) == 0:
-            # 타겟이 없으면 제로 신호 반환
-            return np.zeros(self.config.num_samples, dtype=np.complex64)
+            return None
         
         # 타겟 배열로 변환
         target_array = target_list.to_array()
-        num_targets = len(target_list)
         
         # 거리 계산
         R = calc_distance_to_target(
@@ -129,40 +255,20 @@ class EchoGenerator:
         
         # 유효한 타겟만 선택 (노이즈 임계값 이상 & 시간 조건 만족)
         valid_mask = (c > noise_threshold) & time_valid
-        valid_indices = np.where(valid_mask)[0]
         
-        if len(valid_indices) == 0:
-            return np.zeros(self.config.num_samples, dtype=np.complex64)
+        if not np.any(valid_mask):
+            return None
         
-        # Echo 신호 초기화
-        echo_signal = np.zeros(self.config.num_samples, dtype=np.complex64)
+        # 최종 계수
+        # coeff = c * exp(-j*2π*fc*td) * exp(j*φ)  (φ: 타겟 위상)
+        # 주의: c1 계산에서 이미 ant_gain² (G_tx * G_rx)를 사용했으므로
+        # 여기서 sqrt(G_rx)를 다시 곱하면 안 됨
+        # ant_gain은 타겟 방향에 따른 안테나 게인 (monostatic이므로 G_tx = G_rx = ant_gain)
+        coeffs = c[valid_mask] * np.exp(
+            1j * (np.deg2rad(target_array[valid_mask, 4]) - 2.0 * PI * self.config.fc * td[valid_mask])
+        )
         
-        # 각 타겟에 대해 Echo 신호 생성
-        for idx in valid_indices:
-            # 최종 계수
-            # coeff = c * exp(-j*2π*fc*td)
-            # 주의: c1 계산에서 이미 ant_gain² (G_tx * G_rx)를 사용했으므로
-            # 여기서 sqrt(G_rx)를 다시 곱하면 안 됨
-            # ant_gain은 타겟 방향에 따른 안테나 게인 (monostatic이므로 G_tx = G_rx = ant_gain)
-            coeff = c[idx] * np.exp(-1j * 2.0 * PI * self.config.fc * td[idx])
-            
-            # 샘플 위치 계산
-            sample_pos = (td_amb[idx] - self.config.swst) * self.config.fs
-            idx0 = int(np.ceil(sample_pos))
-            idx1 = idx0 + len(chirp_signal)
-            
-            # Chirp 신호를 Echo 신호에 추가
-            if idx1 <= 0 or idx0 >= self.config.num_samples:
-                continue
-            
-            if idx0 < 0:
-                # Chirp의 일부만 사용
-                echo_signal[0:idx1] += chirp_signal[-idx0:] * coeff
-            elif idx1 > self.config.num_samples:
-                # Chirp의 일부만 사용
-                echo_signal[idx0:] += chirp_signal[:self.config.num_samples - idx0] * coeff
-            else:
-                # 전체 Chirp 사용
-                echo_signal[idx0:idx1] += chirp_signal * coeff
+        # 샘플 위치 계산
+        sample_positions = (td_amb[valid_mask] - self.config.swst) * self.config.fs
         
-        return echo_signal
+        return coeffs, sample_positions
@@ -5,11 +5,22 @@ Echo 신호 생성 및 타겟 반사 모델링을 수행하는 메인 시뮬레
 """
 
 import numpy as np
-from typing import Optional
+from typing import Optional, Union
 
+from sar_simulator.common.cint16_echo import (
+    CInt16Echo,
+    DEFAULT_CINT16_BLOCK_PULSES,
+    quantize_cint16,
+    cint16_scale,
+    quantize_cint16_into,
+)
 from sar_simulator.common.sar_system_config import SarSystemConfig
 from sar_simulator.common.target_model import TargetList
 from sar_simulator.echo.echo_generator import EchoGenerator
+from sar_simulator.echo.thermal_noise import thermal_noise_power, new_noise_seed, add_thermal_noise, saturate_adc
+from sar_simulator.echo.clutter_generator import ClutterGenerator
+from sar_simulator.orbit.attitude import AttitudeProfile
+from sar_simulator.orbit.ephemeris import Ephemeris
 from sar_simulator.sensor.sensor_simulator import SarSensorSimulator
 
 
@@ -39,7 +50,8 @@ class SarEchoSimulator:
         satellite_position: np.ndarray,
         satellite_velocity: np.ndarray,
         beam_direction: Optional[np.ndarray] = None,
-        chirp_signal: Optional[np.ndarray] = None
+        chirp_signal: Optional[np.ndarray] = None,
+        range_compressed: bool = False
     ) -> np.ndarray:
         """
         Echo 신호 시뮬레이션
@@ -58,12 +70,23 @@ class SarEchoSimulator:
         chirp_signal : np.ndarray, optional
             Chirp 신호 (shape: [num_samples_in_chirp], dtype: complex64)
             None인 경우 자동 생성
+        range_compressed : bool
+            True인 경우 Chirp 합성 없이 Range 압축된 Echo 생성
+            (RDAProcessor.process(..., range_compressed=True)로 바로 처리 가능)
         
         Returns:
         --------
         np.ndarray
             Echo 신호 (shape: [num_samples], dtype: complex64)
         """
+        if range_compressed:
+            return self.echo_generator.generate_range_compressed(
+                target_list=target_list,
+                satellite_position=satellite_position,
+                satellite_velocity=satellite_velocity,
+                beam_direction=beam_direction
+            )
+        
         # Chirp 신호 생성 (제공되지 않은 경우)
         if chirp_signal is None:
             chirp_signal = self.sensor_simulator.generate_chirp_signal()
@@ -79,16 +102,76 @@ class SarEchoSimulator:
         
         return echo_signal
     
+    def pulse_beam_directions(
+        self,
+        satellite_positions: np.ndarray,
+        satellite_velocities: np.ndarray,
+        beam_directions: Optional[np.ndarray] = None,
+        attitude: Optional[AttitudeProfile] = None,
+        timestamps: Optional[np.ndarray] = None
+    ) -> Optional[np.ndarray]:
+        """
+        버스 자세를 적용한 펄스별 빔 방향
+        
+        simulate_multiple_pulses()가 안테나 게인 계산에 사용하는 빔 방향과 같습니다
+        (Scene 파일 타일 선택 등 시뮬레이션 전에 빔 방향이 필요할 때 사용).
+        
+        Parameters:
+        -----------
+        satellite_positions : np.ndarray
+            위성 위치 배열 (shape: [num_pulses, 3], 단위: m)
+        satellite_velocities : np.ndarray
+            위성 속도 배열 (shape: [num_pulses, 3], 단위: m/s)
+        beam_directions : np.ndarray, optional
+            빔 방향 벡터 배열 (shape: [num_pulses, 3])
+        attitude : AttitudeProfile, optional
+            버스 자세 프로파일 (beam_directions가 없으면 nadir 방향에 적용)
+        timestamps : np.ndarray, optional
+            자세 계산용 펄스 시각 (shape: [num_pulses], 단위: s, None이면 PRF 간격 시각)
+        
+        Returns:
+        --------
+        np.ndarray or None
+            빔 방향 벡터 배열 (shape: [num_pulses, 3], attitude가 없으면 beam_directions 그대로)
+        """
+        if attitude is None:
+            return beam_directions
+        if timestamps is None:
+            timestamps = np.arange(satellite_positions.shape[0]) / self.config.prf
+        return attitude.apply(timestamps, satellite_positions, satellite_velocities, beam_directions)
+    
     def simulate_multiple_pulses(
         self,
         target_list: TargetList,
         satellite_positions: np.ndarray,
         satellite_velocities: np.ndarray,
-        beam_directions: Optional[np.ndarray] = None
-    ) -> np.ndarray:
+        beam_directions: Optional[np.ndarray] = None,
+        range_compressed: bool = False,
+        clutter_generator: Optional[ClutterGenerator] = None,
+        attitude: Optional[AttitudeProfile] = None,
+        timestamps: Optional[np.ndarray] = None,
+        add_noise: bool = False,
+        noise_seed: Optional[int] = None,
+        first_pulse: int = 0,
+        adc_quantize: bool = False,
+        adc_full_scale: Optional[float] = None
+    ) -> Union[np.ndarray, CInt16Echo]:
         """
         여러 펄스에 대한 Echo 신호 시뮬레이션
         
+        attitude가 지정되면 모든 펄스의 빔 방향에 버스 자세를 한 번에 적용한 뒤
+        안테나 게인 계산에 사용합니다.
+        수신 단계는 Echo 버퍼에서 제자리로 수행합니다: add_noise이면 (seed, 전체 펄스 인덱스)로 정해지는
+        펄스별 독립 난수 스트림으로 열잡음(thermal_noise_power())을 더하고, adc_full_scale이 있으면 I, Q를 포화시킵니다.
+        adc_quantize가 True이면 마지막 단계에서 config.adc_bits로 ADC 양자화하여
+        CInt16Echo(complex64 대비 절반 크기)를 반환합니다.
+        
+        adc_full_scale이 있고 clutter_generator가 없으면 펄스 블록마다 Echo 생성, 잡음, 포화를 마친 뒤
+        바로 미리 할당한 int16 버퍼에 양자화하므로 전체 complex64 Echo를 만들지 않습니다
+        (최대 메모리: int16 코드 + complex64 블록 하나). adc_full_scale이 없으면 스케일을 정할
+        Echo 전체 최댓값이, 클러터가 있으면 전체 펄스의 방위 스펙트럼이 필요하므로 complex64 Echo
+        전체를 만든 뒤 양자화합니다 (최대 메모리: complex64 Echo의 약 1.5배).
+        
         Parameters:
         -----------
         target_list : TargetList
@@ -99,26 +182,176 @@ class SarEchoSimulator:
             위성 속도 배열 (shape: [num_pulses, 3], 단위: m/s)
         beam_directions : np.ndarray, optional
             빔 방향 벡터 배열 (shape: [num_pulses, 3])
+        range_compressed : bool
+            True인 경우 Range 압축된 Echo 생성
+        clutter_generator : ClutterGenerator, optional
+            분포 클러터 생성기 (지정 시 클러터 Echo를 점 타겟 Echo에 더함)
+        attitude : AttitudeProfile, optional
+            버스 자세 프로파일 (beam_directions가 없으면 nadir 방향에 적용)
+        timestamps : np.ndarray, optional
+            자세 계산용 펄스 시각 (shape: [num_pulses], 단위: s, None이면 PRF 간격 시각)
+        add_noise : bool
+            수신기 열잡음 추가 여부
+        noise_seed : int, optional
+            잡음 seed (None이면 임의 seed)
+        first_pulse : int
+            첫 펄스의 전체 펄스 인덱스 (Burst를 나누어 생성할 때 잡음 스트림 위치)
+        adc_quantize : bool
+            ADC 양자화 여부 (True이면 CInt16Echo 반환)
+        adc_full_scale : float, optional
+            ADC 최대 입력 진폭 (지정 시 초과 값은 포화, None이면 포화 없이 양자화는 Echo I, Q 최대 절댓값 기준)
         
         Returns:
         --------
-        np.ndarray
+        np.ndarray 또는 CInt16Echo
             Echo 신호 배열 (shape: [num_pulses, num_samples], dtype: complex64)
+            또는 ADC 양자화된 CInt16Echo
         """
         num_pulses = satellite_positions.shape[0]
-        echo_signals = np.zeros((num_pulses, self.config.num_samples), dtype=np.complex64)
         
-        chirp_signal = self.sensor_simulator.generate_chirp_signal()
+        # 버스 자세를 적용한 펄스별 빔 방향
+        beam_directions = self.pulse_beam_directions(
+            satellite_positions, satellite_velocities, beam_directions, attitude, timestamps
+        )
+        
+        chirp_signal = None if range_compressed else self.sensor_simulator.generate_chirp_signal()
+        noise_power = thermal_noise_power(self.config, range_compressed) if add_noise else None
+        if add_noise and noise_seed is None:
+            noise_seed = new_noise_seed()
+        
+        # 고정 스케일 양자화: 펄스 블록 단위로 생성 → 잡음 → 포화 → int16 버퍼에 양자화
+        if adc_quantize and adc_full_scale is not None and clutter_generator is None:
+            scale = cint16_scale(adc_full_scale, self.config.adc_bits)
+            codes = np.empty((num_pulses, self.config.num_samples, 2), dtype=np.int16)
+            block = np.empty((min(DEFAULT_CINT16_BLOCK_PULSES, num_pulses), self.config.num_samples), dtype=np.complex64)
+            for start in range(0, num_pulses, DEFAULT_CINT16_BLOCK_PULSES):
+                stop = min(start + DEFAULT_CINT16_BLOCK_PULSES, num_pulses)
+                echo_block = block[:stop - start]
+                self._simulate_pulse_block(
+                    echo_block, start, target_list, satellite_positions, satellite_velocities,
+                    beam_directions, chirp_signal, range_compressed
+                )
+                if add_noise:
+                    add_thermal_noise(echo_block, noise_power, noise_seed, first_pulse + start)
+                saturate_adc(echo_block, adc_full_scale)
+                quantize_cint16_into(echo_block, codes[start:stop], scale, self.config.adc_bits)
+            return CInt16Echo(codes, scale, self.config.adc_bits)
         
-        for i in range(num_pulses):
-            beam_dir = beam_directions[i] if beam_directions is not None else None
-            
-            echo_signals[i] = self.simulate_echo(
+        echo_signals = np.empty((num_pulses, self.config.num_samples), dtype=np.complex64)
+        self._simulate_pulse_block(
+            echo_signals, 0, target_list, satellite_positions, satellite_velocities,
+            beam_directions, chirp_signal, range_compressed
+        )
+        
+        # 분포 클러터 추가
+        if clutter_generator is not None:
+            echo_signals += clutter_generator.generate(
+                satellite_positions,
+                satellite_velocities,
+                beam_directions,
+                chirp_signal=chirp_signal,
+                compressed_kernel=self.echo_generator.compressed_kernel if range_compressed else None
+            )
+        
+        # 수신기 열잡음과 ADC 포화 (Echo 버퍼에서 제자리 수행)
+        if add_noise:
+            add_thermal_noise(echo_signals, noise_power, noise_seed, first_pulse)
+        if adc_full_scale is not None:
+            saturate_adc(echo_signals, adc_full_scale)
+        
+        if adc_quantize:
+            return quantize_cint16(echo_signals, self.config.adc_bits, adc_full_scale)
+        return echo_signals
+    
+    def _simulate_pulse_block(
+        self,
+        echo_block: np.ndarray,
+        start: int,
+        target_list: TargetList,
+        satellite_positions: np.ndarray,
+        satellite_velocities: np.ndarray,
+        beam_directions: Optional[np.ndarray],
+        chirp_signal: Optional[np.ndarray],
+        range_compressed: bool
+    ):
+        """start번 펄스부터 echo_block 행 수만큼의 펄스 Echo를 echo_block에 기록"""
+        for offset in range(echo_block.shape[0]):
+            i = start + offset
+            echo_block[offset] = self.simulate_echo(
                 target_list=target_list,
                 satellite_position=satellite_positions[i],
                 satellite_velocity=satellite_velocities[i],
-                beam_direction=beam_dir,
-                chirp_signal=chirp_signal
+                beam_direction=beam_directions[i] if beam_directions is not None else None,
+                chirp_signal=chirp_signal,
+                range_compressed=range_compressed
             )
+    
+    def simulate_pulses_from_ephemeris(
+        self,
+        target_list: TargetList,
+        ephemeris: Ephemeris,
+        num_pulses: int,
+        start_time: Optional[float] = None,
+        beam_directions: Optional[np.ndarray] = None,
+        range_compressed: bool = False,
+        clutter_generator: Optional[ClutterGenerator] = None,
+        attitude: Optional[AttitudeProfile] = None,
+        add_noise: bool = False,
+        noise_seed: Optional[int] = None,
+        adc_quantize: bool = False,
+        adc_full_scale: Optional[float] = None
+    ) -> Union[np.ndarray, CInt16Echo]:
+        """
+        궤도력으로부터 PRF 간격 펄스의 Echo 신호 시뮬레이션
         
-        return echo_signals
+        펄스별 위성 상태를 궤도력에서 보간한 뒤 simulate_multiple_pulses를 수행합니다.
+        
+        Parameters:
+        -----------
+        target_list : TargetList
+            타겟 리스트
+        ephemeris : Ephemeris
+            위성 궤도력
+        num_pulses : int
+            펄스 개수
+        start_time : float, optional
+            첫 펄스 시각 (단위: s, None이면 궤도력 첫 노드 시각)
+        beam_directions : np.ndarray, optional
+            빔 방향 벡터 배열 (shape: [num_pulses, 3])
+        range_compressed : bool
+            True인 경우 Range 압축된 Echo 생성
+        clutter_generator : ClutterGenerator, optional
+            분포 클러터 생성기
+        attitude : AttitudeProfile, optional
+            버스 자세 프로파일 (궤도력 펄스 시각 기준으로 적용)
+        add_noise : bool
+            수신기 열잡음 추가 여부
+        noise_seed : int, optional
+            잡음 seed (None이면 임의 seed)
+        adc_quantize : bool
+            ADC 양자화 여부 (True이면 CInt16Echo 반환)
+        adc_full_scale : float, optional
+            ADC 최대 입력 진폭 (지정 시 초과 값은 포화)
+        
+        Returns:
+        --------
+        np.ndarray 또는 CInt16Echo
+            Echo 신호 배열 (shape: [num_pulses, num_samples], dtype: complex64)
+            또는 ADC 양자화된 CInt16Echo
+        """
+        timestamps = ephemeris.pulse_times(num_pulses, self.config.prf, start_time)
+        satellite_positions, satellite_velocities = ephemeris.evaluate(timestamps)
+        return self.simulate_multiple_pulses(
+            target_list,
+            satellite_positions,
+            satellite_velocities,
+            beam_directions=beam_directions,
+            range_compressed=range_compressed,
+            clutter_generator=clutter_generator,
+            attitude=attitude,
+            timestamps=timestamps,
+            add_noise=add_noise,
+            noise_seed=noise_seed,
+            adc_quantize=adc_quantize,
+            adc_full_scale=adc_full_scale
+        )
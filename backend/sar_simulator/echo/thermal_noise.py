@@ -0,0 +1,180 @@
+"""
+수신기 열잡음 및 ADC 포화
+
+Echo 버퍼에 복소 가우시안 열잡음을 펄스 블록 단위로 더하고 ADC 입력 범위로 포화시킵니다.
+펄스마다 (seed, 전체 펄스 인덱스)로 만든 독립 numpy.random.Generator를 사용하므로
+블록 크기, Burst 분할, 처리 순서나 병렬 실행 여부와 관계없이 같은 seed는 같은 잡음을 만듭니다.
+"""
+
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from sar_simulator.common.sar_system_config import SarSystemConfig
+
+
+# 잡음 생성/포화 시 블록당 기본 펄스 수
+DEFAULT_NOISE_BLOCK_PULSES = 256
+
+
+def thermal_noise_power(config: SarSystemConfig, range_compressed: bool = False) -> float:
+    """
+    복소 샘플당 열잡음 전력
+    
+    Echo 진폭과 같은 기준(수신 전력의 제곱근)에서 k·Tsys·bw 입니다.
+    NF는 get_loss_linear()로 신호 쪽에 이미 반영되어 있으므로 다시 곱하지 않습니다.
+    Range 압축 Echo에는 정합 필터 잡음 이득(참조 신호 샘플 수)을 곱합니다.
+    
+    Parameters:
+    -----------
+    config : SarSystemConfig
+        SAR 시스템 설정
+    range_compressed : bool
+        Range 압축된 Echo 기준 여부
+    
+    Returns:
+    --------
+    float
+        잡음 전력 (I, Q 분산의 합)
+    """
+    noise_power = config.get_noise_power()
+    if range_compressed:
+        noise_power *= len(np.arange(-config.taup / 2, config.taup / 2, config.dt))
+    return noise_power
+
+
+def new_noise_seed() -> int:
+    """임의 잡음 seed (OS 엔트로피 기반 64비트 정수)"""
+    return int(np.random.SeedSequence().generate_state(1, np.uint64)[0])
+
+
+def noise_pulse_generator(seed: int, pulse: int) -> np.random.Generator:
+    """
+    펄스 잡음 생성기
+    
+    Parameters:
+    -----------
+    seed : int
+        잡음 seed
+    pulse : int
+        전체 펄스 인덱스 (SeedSequence spawn key)
+    
+    Returns:
+    --------
+    np.random.Generator
+        펄스 전용 난수 생성기
+    """
+    return np.random.Generator(np.random.PCG64(np.random.SeedSequence(seed, spawn_key=(pulse,))))
+
+
+def add_thermal_noise(
+    echo_signals: np.ndarray,
+    noise_power: float,
+    seed: Optional[int] = None,
+    first_pulse: int = 0,
+    block_pulses: int = DEFAULT_NOISE_BLOCK_PULSES,
+    max_workers: Optional[int] = 1
+) -> int:
+    """
+    Echo 버퍼에 복소 가우시안 열잡음을 제자리(in-place)로 더함
+    
+    블록마다 한 블록 크기의 float32 작업 버퍼에 잡음을 만든 뒤 Echo의 float32 뷰에 더하므로
+    Echo 크기의 잡음 행렬을 따로 만들지 않습니다. 각 펄스 잡음은 noise_pulse_generator(seed,
+    first_pulse + 펄스 인덱스)로 생성되므로 결과는 seed와 전체 펄스 인덱스에만 의존하고
+    블록 크기, Burst 분할, 처리 순서, 스레드 수와 무관합니다.
+    
+    Parameters:
+    -----------
+    echo_signals : np.ndarray
+        Echo 신호 (shape: [num_pulses, num_samples], dtype: complex64, C-contiguous)
+    noise_power : float
+        복소 샘플당 잡음 전력 (I, Q 각각 분산 noise_power / 2)
+    seed : int, optional
+        잡음 seed (None이면 임의 seed)
+    first_pulse : int
+        echo_signals 첫 펄스의 전체 펄스 인덱스 (Burst를 나누어 생성할 때 사용)
+    block_pulses : int
+        블록당 펄스 수 (기본값: 256)
+    max_workers : int, optional
+        블록 잡음 생성 스레드 수 (기본값: 1, None이면 CPU 수)
+    
+    Returns:
+    --------
+    int
+        사용한 seed
+    """
+    components = _float32_pairs(echo_signals)
+    if noise_power < 0:
+        raise ValueError(f"noise_power는 0 이상이어야 합니다: {noise_power}")
+    if block_pulses <= 0:
+        raise ValueError("block_pulses는 0보다 커야 합니다.")
+    if seed is None:
+        seed = new_noise_seed()
+    
+    sigma = np.float32(np.sqrt(noise_power / 2.0))
+    
+    def add_block(start: int):
+        block = components[start:start + block_pulses]
+        noise = np.empty(block.shape, dtype=np.float32)
+        for offset, pulse_noise in enumerate(noise):
+            noise_pulse_generator(seed, first_pulse + start + offset).standard_normal(dtype=np.float32, out=pulse_noise)
+        noise *= sigma
+        block += noise
+    
+    starts = range(0, components.shape[0], block_pulses)
+    if max_workers == 1:
+        for start in starts:
+            add_block(start)
+    else:
+        # Generator는 난수 생성 중 GIL을 해제하므로 블록별 스레드로 병렬 생성
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(add_block, starts))
+    
+    return seed
+
+
+def saturate_adc(
+    echo_signals: np.ndarray,
+    full_scale: float,
+    block_pulses: int = DEFAULT_NOISE_BLOCK_PULSES
+) -> int:
+    """
+    ADC 입력 범위 포화 (I, Q 각각 ±full_scale로 제자리 clipping)
+    
+    Parameters:
+    -----------
+    echo_signals : np.ndarray
+        Echo 신호 (shape: [num_pulses, num_samples], dtype: complex64, C-contiguous)
+    full_scale : float
+        ADC 최대 입력 진폭
+    block_pulses : int
+        블록당 펄스 수 (기본값: 256)
+    
+    Returns:
+    --------
+    int
+        포화된 I, Q 성분 수
+    """
+    components = _float32_pairs(echo_signals)
+    if full_scale <= 0:
+        raise ValueError(f"full_scale은 0보다 커야 합니다: {full_scale}")
+    if block_pulses <= 0:
+        raise ValueError("block_pulses는 0보다 커야 합니다.")
+    
+    limit = np.float32(full_scale)
+    num_saturated = 0
+    for start in range(0, components.shape[0], block_pulses):
+        block = components[start:start + block_pulses]
+        num_saturated += int(np.count_nonzero(block > limit) + np.count_nonzero(block < -limit))
+        np.clip(block, -limit, limit, out=block)
+    return num_saturated
+
+
+def _float32_pairs(echo_signals: np.ndarray) -> np.ndarray:
+    """complex64 Echo 버퍼를 복사 없이 float32 [펄스, 샘플 * 2] 뷰로 변환"""
+    if (
+        not isinstance(echo_signals, np.ndarray) or echo_signals.dtype != np.complex64
+        or echo_signals.ndim != 2 or not echo_signals.flags.c_contiguous
+    ):
+        raise ValueError("Echo 신호는 C-contiguous complex64 [펄스 수, 샘플 수] 배열이어야 합니다.")
+    return echo_signals.view(np.float32)
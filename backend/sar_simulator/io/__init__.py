@@ -5,9 +5,48 @@ SAR Raw Data의 읽기/쓰기를 담당합니다.
 """
 
 from sar_simulator.io.raw_data_writer import RawDataWriter
-from sar_simulator.io.png_writer import save_echo_signals_as_grayscale_png
+from sar_simulator.io.raw_data_reader import RawDataReader, BurstArray, ADX_DTYPE, read_burst_echo
+from sar_simulator.io.async_writer import AsyncBurstWriter
+from sar_simulator.io.burst_merge import merge_burst_files
+from sar_simulator.io.compression import (
+    available_codecs,
+    get_filter_options,
+    choose_chunk_shape,
+    deflate_chunk,
+    benchmark_compression,
+)
+from sar_simulator.io.baq import (
+    BaqEncodedData,
+    baq_encode,
+    baq_decode,
+)
+from sar_simulator.io.png_writer import (
+    save_echo_signals_as_grayscale_png,
+    save_echo_signals_as_grayscale_png_streaming,
+)
+from sar_simulator.io.image_tiles import ImagePyramid, build_image_pyramid
+from sar_simulator.io.scene_file import SceneFile, write_scene_file
 
 __all__ = [
     "RawDataWriter",
+    "RawDataReader",
+    "BurstArray",
+    "ADX_DTYPE",
+    "read_burst_echo",
+    "AsyncBurstWriter",
+    "merge_burst_files",
+    "available_codecs",
+    "get_filter_options",
+    "choose_chunk_shape",
+    "deflate_chunk",
+    "benchmark_compression",
+    "BaqEncodedData",
+    "baq_encode",
+    "baq_decode",
     "save_echo_signals_as_grayscale_png",
+    "save_echo_signals_as_grayscale_png_streaming",
+    "ImagePyramid",
+    "build_image_pyramid",
+    "SceneFile",
+    "write_scene_file",
 ]
@@ -0,0 +1,215 @@
+"""
+비동기 Raw Data 저장
+
+RawDataWriter의 스트리밍 Burst 기록을 전용 writer 스레드에서 수행하여
+Echo 생성이 파일 기록을 기다리지 않고 다음 블록을 계산하게 합니다. h5py 호출은 h5py 전역 잠금으로
+직렬화되고 빌드에 따라 HDF5 필터 압축 동안 GIL을 잡고 있을 수 있으므로, gzip Burst는 RawDataWriter가
+청크를 zlib으로 직접 압축(GIL과 h5py 잠금 밖에서 실행)한 뒤 write_direct_chunk()로 기록합니다.
+계산과 기록이 실제로 동시에 실행되어 전체 시간이 줄어드는 정도는 CPU 코어 수와 h5py 빌드에 따라 다릅니다.
+"""
+
+import queue
+import threading
+import numpy as np
+from typing import Optional, Dict, Union
+
+from sar_simulator.common.cint16_echo import CInt16Echo
+from sar_simulator.io.raw_data_writer import RawDataWriter
+from sar_simulator.orbit.attitude import AttitudeProfile
+from sar_simulator.orbit.ephemeris import Ephemeris
+
+
+# writer 스레드 종료 신호
+_STOP = object()
+
+
+class AsyncBurstWriter:
+    """
+    비동기 Burst Writer 클래스
+    
+    begin_burst()/append_pulses()/end_burst() 호출을 크기가 제한된 큐에 넣고,
+    전용 writer 스레드가 순서대로 RawDataWriter에 기록합니다.
+    
+    - 큐가 가득 차면 생산자(append_pulses 호출 측)가 대기합니다 (back-pressure).
+    - writer 스레드에서 발생한 예외는 생산자의 다음 호출 또는 flush()/close()에서 다시 발생합니다.
+    - 스레드가 동작하는 동안 같은 RawDataWriter를 직접 호출하지 않아야 합니다.
+    - 계산과 기록이 실제로 동시에 실행되려면 CPU 코어가 2개 이상이어야 합니다.
+    """
+    
+    def __init__(self, writer: RawDataWriter, max_pending_blocks: int = 4):
+        """
+        AsyncBurstWriter 초기화
+        
+        Parameters:
+        -----------
+        writer : RawDataWriter
+            파일이 열린 RawDataWriter
+        max_pending_blocks : int
+            기록 대기 중인 최대 작업 수 (기본값: 4, 대기 블록만큼 메모리 사용)
+        """
+        if max_pending_blocks < 1:
+            raise ValueError("max_pending_blocks는 1 이상이어야 합니다.")
+        
+        self.writer = writer
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending_blocks)
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._queued_pulses: Dict[str, int] = {}
+    
+    def start(self):
+        """writer 스레드 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="AsyncBurstWriter", daemon=True)
+            self._thread.start()
+    
+    def close(self):
+        """
+        대기 중인 작업을 모두 기록하고 writer 스레드 종료
+        
+        writer 스레드에서 예외가 발생했다면 다시 발생시킵니다.
+        """
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        self._raise_error()
+    
+    def __enter__(self):
+        """Context manager 진입"""
+        self.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager 종료 (본문 예외가 있으면 writer 예외보다 우선)"""
+        try:
+            self.close()
+        except Exception:
+            if exc_type is None:
+                raise
+    
+    def begin_burst(
+        self,
+        group_name: str,
+        num_samples: Optional[int] = None,
+        chunk_pulses: Optional[int] = None,
+        ephemeris: Optional[Ephemeris] = None,
+        attitude: Optional[AttitudeProfile] = None,
+        cint16_scale: Optional[float] = None
+    ):
+        """
+        스트리밍 Burst 작성 시작 (RawDataWriter.begin_burst 비동기 호출)
+        
+        Parameters:
+        -----------
+        group_name : str
+            그룹 이름 (예: 'SSG00')
+        num_samples : int, optional
+            펄스당 샘플 수 (None이면 config.num_samples)
+        chunk_pulses : int, optional
+            청크당 펄스 수
+        ephemeris : Ephemeris, optional
+            위성 궤도력
+        attitude : AttitudeProfile, optional
+            버스 자세 프로파일
+        cint16_scale : float, optional
+            CInt16 저장 스케일 팩터 (None이면 float32 또는 BAQ 저장)
+        """
+        self._queued_pulses[group_name] = 0
+        self._submit(self.writer.begin_burst, group_name, num_samples, chunk_pulses, ephemeris, attitude, cint16_scale)
+    
+    def append_pulses(
+        self,
+        group_name: str,
+        echo_block: Union[np.ndarray, CInt16Echo],
+        satellite_positions: Optional[np.ndarray] = None,
+        satellite_velocities: Optional[np.ndarray] = None,
+        timestamps: Optional[np.ndarray] = None
+    ) -> int:
+        """
+        펄스 블록 기록 요청 (RawDataWriter.append_pulses 비동기 호출)
+        
+        블록은 복사되어 큐에 들어가므로 호출 후 바로 버퍼를 재사용할 수 있습니다.
+        CInt16Echo 블록은 complex64로 복원하지 않고 int16 코드를 그대로 복사합니다.
+        큐가 가득 차 있으면 자리가 날 때까지 대기합니다.
+        
+        Parameters:
+        -----------
+        group_name : str
+            begin_burst()로 시작한 그룹 이름
+        echo_block : np.ndarray 또는 CInt16Echo
+            Echo 블록 (shape: [block_pulses, num_samples], 복소수)
+        satellite_positions : np.ndarray, optional
+            블록 위성 위치 (shape: [block_pulses, 3], 단위: m)
+        satellite_velocities : np.ndarray, optional
+            블록 위성 속도 (shape: [block_pulses, 3], 단위: m/s)
+        timestamps : np.ndarray, optional
+            블록 타임스탬프 (shape: [block_pulses], 단위: s)
+        
+        Returns:
+        --------
+        int
+            지금까지 기록 요청된 전체 펄스 개수
+        """
+        if isinstance(echo_block, CInt16Echo):
+            echo_block = CInt16Echo(np.array(echo_block.data, copy=True), echo_block.scale, echo_block.adc_bits)
+        else:
+            echo_block = np.array(echo_block, dtype=np.complex64, copy=True)
+        self._submit(
+            self.writer.append_pulses,
+            group_name,
+            echo_block,
+            _copy_optional(satellite_positions),
+            _copy_optional(satellite_velocities),
+            _copy_optional(timestamps)
+        )
+        self._queued_pulses[group_name] = self._queued_pulses.get(group_name, 0) + len(echo_block)
+        return self._queued_pulses[group_name]
+    
+    def end_burst(self, group_name: str):
+        """
+        스트리밍 Burst 작성 종료 요청 (RawDataWriter.end_burst 비동기 호출)
+        
+        Parameters:
+        -----------
+        group_name : str
+            begin_burst()로 시작한 그룹 이름
+        """
+        self._submit(self.writer.end_burst, group_name)
+    
+    def flush(self):
+        """대기 중인 작업이 모두 기록될 때까지 대기 (writer 예외는 다시 발생)"""
+        if self._thread is not None:
+            self._queue.join()
+        self._raise_error()
+    
+    def _submit(self, method, *args):
+        """작업을 큐에 추가 (큐가 가득 차면 대기)"""
+        self._raise_error()
+        if self._thread is None:
+            raise ValueError("writer 스레드가 시작되지 않았습니다. start()를 먼저 호출하세요.")
+        self._queue.put((method, args))
+    
+    def _raise_error(self):
+        """writer 스레드 예외를 생산자 스레드에서 다시 발생"""
+        if self._error is not None:
+            raise self._error
+    
+    def _run(self):
+        """writer 스레드 본문: 예외 발생 후에는 남은 작업을 버려 생산자가 막히지 않게 함"""
+        while True:
+            task = self._queue.get()
+            try:
+                if task is _STOP:
+                    return
+                if self._error is None:
+                    method, args = task
+                    method(*args)
+            except BaseException as error:
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+
+def _copy_optional(array: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """None이 아니면 배열 복사"""
+    return None if array is None else np.array(array, copy=True)
@@ -0,0 +1,96 @@
+"""
+Burst 파일 통합
+
+Burst별로 따로 생성한 HDF5 Raw Data 파일들을 하나의 HDF5 파일로 통합합니다.
+데이터를 복사하지 않는 가상 데이터셋(VDS)/외부 링크 방식과, 단일 파일로 복사하는 방식을 제공합니다.
+"""
+
+import os
+import h5py
+from pathlib import Path
+from typing import Sequence, Union
+
+
+# 통합 방식
+MERGE_MODES = ("virtual", "external", "copy")
+
+
+def merge_burst_files(
+    part_files: Sequence[Union[str, Path]],
+    output_path: Union[str, Path],
+    mode: str = "virtual"
+) -> Path:
+    """
+    Burst 파일 통합
+    
+    각 파일의 최상위 그룹(예: 'SSG00')을 output_path의 같은 이름 그룹으로 통합합니다.
+    루트 속성은 첫 번째 파일에서 복사합니다.
+    
+    - virtual: 그룹/속성을 만들고 데이터셋은 원본 파일을 가리키는 가상 데이터셋으로 생성 (데이터 복사 없음)
+    - external: 그룹 자체를 원본 파일 그룹으로의 외부 링크로 생성 (가장 빠름)
+    - copy: 그룹을 통째로 복사한 단일 파일 생성 후 원본 파일 삭제
+    
+    virtual/external은 원본 파일을 출력 파일 기준 상대 경로로 참조하므로
+    원본 파일을 출력 파일과 함께 보관/이동해야 합니다.
+    
+    Parameters:
+    -----------
+    part_files : Sequence[str or Path]
+        Burst 파일 경로 목록 (그룹 이름이 서로 겹치지 않아야 함)
+    output_path : str or Path
+        통합 파일 경로 (기존 파일은 덮어씀)
+    mode : str
+        통합 방식 ("virtual", "external", "copy", 기본값: "virtual")
+    
+    Returns:
+    --------
+    Path
+        통합 파일 경로
+    """
+    if mode not in MERGE_MODES:
+        raise ValueError(f"지원하지 않는 통합 방식입니다: {mode} (사용 가능: {', '.join(MERGE_MODES)})")
+    if not part_files:
+        raise ValueError("통합할 Burst 파일이 없습니다.")
+    
+    output_path = Path(output_path)
+    part_files = [Path(part_file) for part_file in part_files]
+    
+    with h5py.File(output_path, 'w') as output:
+        for index, part_file in enumerate(part_files):
+            source_name = Path(os.path.relpath(part_file.absolute(), output_path.absolute().parent)).as_posix()
+            with h5py.File(part_file, 'r') as part:
+                if index == 0:
+                    output.attrs.update(part.attrs)
+                
+                for group_name, group in part.items():
+                    if group_name in output:
+                        raise ValueError(f"그룹 이름이 중복됩니다: {group_name} ({part_file})")
+                    
+                    if mode == "external":
+                        output[group_name] = h5py.ExternalLink(source_name, group.name)
+                    elif mode == "copy":
+                        part.copy(group, output, name=group_name)
+                    else:
+                        _create_virtual_group(output, group, source_name)
+    
+    if mode == "copy":
+        for part_file in part_files:
+            part_file.unlink()
+    
+    return output_path
+
+
+def _create_virtual_group(output: h5py.File, group: h5py.Group, source_name: str):
+    """원본 그룹의 데이터셋을 가리키는 가상 데이터셋 그룹 생성"""
+    virtual_group = output.create_group(group.name)
+    virtual_group.attrs.update(group.attrs)
+    
+    for dataset_name, dataset in group.items():
+        if dataset.size == 0:
+            # 빈 데이터셋은 가상 데이터셋으로 만들 수 없으므로 복사
+            group.file.copy(dataset, virtual_group, name=dataset_name)
+            continue
+        layout = h5py.VirtualLayout(shape=dataset.shape, dtype=dataset.dtype)
+        layout[...] = h5py.VirtualSource(source_name, dataset.name, shape=dataset.shape)
+        virtual_dataset = virtual_group.create_virtual_dataset(dataset_name, layout)
+        virtual_dataset.attrs.update(dataset.attrs)
@@ -0,0 +1,236 @@
+"""
+Raw Data 압축 설정
+
+HDF5 압축 필터(gzip, lzf, Blosc/zstd) 옵션과 펄스/샘플 수에 맞춘 청크 크기를 계산하고,
+gzip 청크를 HDF5 필터 대신 직접 압축하는 함수와 코덱별 쓰기 처리량과 압축률을
+비교하는 벤치마크를 제공합니다.
+Blosc/zstd는 hdf5plugin 패키지가 설치된 경우에만 사용할 수 있습니다.
+"""
+
+import os
+import tempfile
+import time
+import zlib
+import h5py
+import numpy as np
+from typing import Optional, List, Tuple, Dict, Any
+
+
+# 압축 코덱별 기본 압축 레벨 (lzf는 레벨 없음)
+DEFAULT_COMPRESSION_LEVELS = {
+    "gzip": 4,
+    "lzf": None,
+    "blosc-zstd": 5,
+}
+
+# 기본 청크 크기 (bytes)
+DEFAULT_CHUNK_BYTES = 1 << 20
+
+# float32 (실수, 허수) 한 샘플의 크기 (bytes)
+_SAMPLE_BYTES = 8
+
+
+def available_codecs() -> List[str]:
+    """
+    사용 가능한 압축 코덱 목록
+    
+    Returns:
+    --------
+    List[str]
+        코덱 이름 목록 ("none", "gzip", "lzf", hdf5plugin 설치 시 "blosc-zstd")
+    """
+    codecs = ["none", "gzip", "lzf"]
+    if _load_hdf5plugin() is not None:
+        codecs.append("blosc-zstd")
+    return codecs
+
+
+def get_filter_options(compression: Optional[str], level: Optional[int] = None) -> Dict[str, Any]:
+    """
+    h5py create_dataset에 전달할 압축 필터 옵션
+    
+    gzip/lzf는 바이트 셔플 필터를 함께 사용하고, Blosc/zstd는 Blosc 내부 셔플을 사용합니다.
+    
+    Parameters:
+    -----------
+    compression : str, optional
+        압축 코덱 (None 또는 "none": 압축 없음, "gzip", "lzf", "blosc-zstd")
+    level : int, optional
+        압축 레벨 (None이면 코덱 기본값, gzip: 0-9, blosc-zstd: 0-9)
+    
+    Returns:
+    --------
+    Dict[str, Any]
+        create_dataset 키워드 인자 (압축 없음이면 빈 dict)
+    """
+    if compression is None or compression == "none":
+        return {}
+    if compression not in DEFAULT_COMPRESSION_LEVELS:
+        raise ValueError(f"지원하지 않는 압축 코덱입니다: {compression} (사용 가능: {', '.join(available_codecs())})")
+    
+    if level is None:
+        level = DEFAULT_COMPRESSION_LEVELS[compression]
+    elif compression == "lzf":
+        raise ValueError("lzf 코덱은 압축 레벨을 지원하지 않습니다.")
+    elif not 0 <= level <= 9:
+        raise ValueError("압축 레벨은 0에서 9 사이여야 합니다.")
+    
+    if compression == "gzip":
+        return {"compression": "gzip", "compression_opts": level, "shuffle": True}
+    if compression == "lzf":
+        return {"compression": "lzf", "shuffle": True}
+    
+    hdf5plugin = _load_hdf5plugin()
+    if hdf5plugin is None:
+        raise ValueError("blosc-zstd 코덱에는 hdf5plugin 패키지가 필요합니다.")
+    return dict(hdf5plugin.Blosc(cname="zstd", clevel=level, shuffle=hdf5plugin.Blosc.SHUFFLE))
+
+
+def choose_chunk_shape(
+    num_pulses: Optional[int],
+    num_samples: int,
+    target_bytes: int = DEFAULT_CHUNK_BYTES
+) -> Tuple[int, int, int]:
+    """
+    펄스/샘플 수에 맞춘 Echo 데이터셋 청크 크기
+    
+    한 청크가 target_bytes 이하가 되도록 전체 펄스(행)를 우선 묶고,
+    한 펄스가 target_bytes보다 크면 샘플 방향으로 나눕니다.
+    
+    Parameters:
+    -----------
+    num_pulses : int, optional
+        전체 펄스 수 (None이면 스트리밍처럼 제한 없음)
+    num_samples : int
+        펄스당 샘플 수
+    target_bytes : int
+        목표 청크 크기 (bytes, 기본값: 1 MiB)
+    
+    Returns:
+    --------
+    Tuple[int, int, int]
+        청크 크기 (펄스, 샘플, 2)
+    """
+    if num_samples <= 0 or target_bytes <= 0:
+        raise ValueError("num_samples와 target_bytes는 0보다 커야 합니다.")
+    
+    samples_per_chunk = max(1, target_bytes // _SAMPLE_BYTES)
+    if num_samples >= samples_per_chunk:
+        # 한 펄스가 목표보다 크면 샘플 방향 분할 (균등한 조각으로)
+        num_pieces = -(-num_samples // samples_per_chunk)
+        return (1, -(-num_samples // num_pieces), 2)
+    
+    chunk_pulses = samples_per_chunk // num_samples
+    if num_pulses is not None:
+        chunk_pulses = min(chunk_pulses, max(1, num_pulses))
+    return (chunk_pulses, num_samples, 2)
+
+
+def deflate_chunk(chunk: np.ndarray, level: int) -> bytes:
+    """
+    HDF5 shuffle + gzip 필터 형식으로 청크 압축
+    
+    HDF5 필터는 h5py가 GIL을 잡은 채로 실행하므로, 바이트 셔플(numpy 복사)과
+    deflate(zlib)를 직접 수행하여 압축 중에 GIL을 해제합니다.
+    결과는 dataset.id.write_direct_chunk()로 필터 없이 그대로 기록합니다.
+    
+    Parameters:
+    -----------
+    chunk : np.ndarray
+        데이터셋 청크 크기와 같은 shape의 청크 데이터
+    level : int
+        gzip 압축 레벨 (0-9)
+    
+    Returns:
+    --------
+    bytes
+        shuffle → deflate 순서로 인코딩한 청크
+    """
+    chunk = np.ascontiguousarray(chunk)
+    shuffled = chunk.view(np.uint8).reshape(-1, chunk.itemsize).T.copy()
+    return zlib.compress(shuffled, level)
+
+
+def benchmark_compression(
+    echo_data: np.ndarray,
+    codecs: Optional[List[str]] = None,
+    levels: Optional[Dict[str, Optional[int]]] = None,
+    target_bytes: int = DEFAULT_CHUNK_BYTES,
+    directory: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    압축 코덱별 쓰기 처리량과 압축률 측정
+    
+    코덱마다 임시 HDF5 파일에 Echo 데이터를 기록하여 쓰기 시간(파일 닫기까지)과
+    저장 크기를 측정합니다.
+    
+    Parameters:
+    -----------
+    echo_data : np.ndarray
+        Echo 데이터 (shape: [num_pulses, num_samples], 복소수)
+    codecs : List[str], optional
+        비교할 코덱 목록 (None이면 available_codecs())
+    levels : Dict[str, int], optional
+        코덱별 압축 레벨 (없으면 코덱 기본값)
+    target_bytes : int
+        목표 청크 크기 (bytes)
+    directory : str, optional
+        임시 파일 디렉터리 (None이면 시스템 임시 디렉터리)
+    
+    Returns:
+    --------
+    List[Dict[str, Any]]
+        코덱별 결과
+        - codec / level: 코덱 이름과 압축 레벨
+        - chunks: 청크 크기
+        - write_seconds: 쓰기 시간 (s)
+        - throughput_mb_s: 원본 데이터 기준 쓰기 처리량 (MB/s)
+        - stored_bytes: 데이터셋 저장 크기 (bytes)
+        - compression_ratio: 원본 크기 / 저장 크기
+    """
+    echo_data = np.ascontiguousarray(echo_data, dtype=np.complex64)
+    if echo_data.ndim != 2:
+        raise ValueError("Echo 데이터는 [펄스 수, 샘플 수] 배열이어야 합니다.")
+    if codecs is None:
+        codecs = available_codecs()
+    levels = levels or {}
+    
+    pairs = echo_data.view(np.float32).reshape(echo_data.shape + (2,))
+    chunks = choose_chunk_shape(echo_data.shape[0], echo_data.shape[1], target_bytes)
+    results = []
+    
+    for codec in codecs:
+        options = get_filter_options(codec, levels.get(codec))
+        handle, path = tempfile.mkstemp(suffix=".h5", dir=directory)
+        os.close(handle)
+        try:
+            start = time.perf_counter()
+            with h5py.File(path, 'w') as f:
+                f.create_dataset('B000', data=pairs, chunks=chunks, **options)
+            write_seconds = time.perf_counter() - start
+            
+            with h5py.File(path, 'r') as f:
+                stored_bytes = f['B000'].id.get_storage_size()
+        finally:
+            os.remove(path)
+        
+        results.append({
+            "codec": codec,
+            "level": levels.get(codec, DEFAULT_COMPRESSION_LEVELS.get(codec)),
+            "chunks": chunks,
+            "write_seconds": write_seconds,
+            "throughput_mb_s": pairs.nbytes / 1e6 / max(write_seconds, 1e-9),
+            "stored_bytes": stored_bytes,
+            "compression_ratio": pairs.nbytes / max(stored_bytes, 1)
+        })
+    
+    return results
+
+
+def _load_hdf5plugin():
+    """hdf5plugin 모듈 (설치되지 않았으면 None)"""
+    try:
+        import hdf5plugin
+    except ImportError:
+        return None
+    return hdf5plugin
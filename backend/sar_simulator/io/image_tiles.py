@@ -0,0 +1,407 @@
+"""
+SAR 이미지 타일 피라미드 모듈
+
+RDA로 생성한 dB 스케일 SAR 이미지를 여러 해상도의 256×256 타일 피라미드로 변환합니다.
+Cesium의 GeographicTilingScheme(지정 rectangle)과 같은 타일 배치를 사용하므로
+클라이언트는 화면에 보이는 타일만 필요한 해상도로 요청할 수 있습니다.
+"""
+
+import io
+import hashlib
+import numpy as np
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Optional, List, Sequence, Tuple, Dict, Any, Union
+from PIL import Image
+
+
+# 기본 타일 크기 (pixel)
+DEFAULT_TILE_SIZE = 256
+
+
+@dataclass
+class ImagePyramid:
+    """
+    SAR 이미지 타일 피라미드
+    
+    level 0이 가장 낮은 해상도이고 마지막 level이 원본 해상도입니다.
+    level L은 tiles_x * 2^L × tiles_y * 2^L 개의 타일로 구성되며,
+    원본 이미지 밖의 영역은 투명(alpha=0)으로 채워집니다.
+    이미지의 행 0은 북쪽(north), 열 0은 서쪽(west)에 대응합니다.
+    level별 영상은 이미지 영역을 덮는 타일까지만 저장하고, 그 밖의 타일과
+    유효 영역 마스크는 get_tile()에서 level 크기와 이미지 범위로 만듭니다.
+    
+    Attributes:
+    -----------
+    levels : List[np.ndarray]
+        level별 8bit 그레이스케일 영상 (shape: valid_shape(L)을 tile_size 배수로 올림, 이미지 밖은 0)
+    image_shape : Tuple[int, int]
+        원본 이미지 shape [azimuth_samples, range_samples]
+    tile_size : int
+        타일 크기 (pixel)
+    tiles_x : int
+        level 0의 가로 타일 개수
+    tiles_y : int
+        level 0의 세로 타일 개수
+    min_value : float
+        0에 대응하는 값 (dB)
+    max_value : float
+        255에 대응하는 값 (dB)
+    range_extent : np.ndarray, optional
+        Range 범위 [min, max] (m)
+    azimuth_extent : np.ndarray, optional
+        Azimuth 범위 [min, max] (m)
+    bounds : Tuple[float, float, float, float], optional
+        원본 이미지를 감싸는 경위도 사각형 (west, south, east, north, 단위: deg)
+    """
+    levels: List[np.ndarray]
+    image_shape: Tuple[int, int]
+    tile_size: int
+    tiles_x: int
+    tiles_y: int
+    min_value: float
+    max_value: float
+    range_extent: Optional[np.ndarray] = None
+    azimuth_extent: Optional[np.ndarray] = None
+    bounds: Optional[Tuple[float, float, float, float]] = None
+    
+    @property
+    def num_levels(self) -> int:
+        """피라미드 level 개수"""
+        return len(self.levels)
+    
+    @property
+    def nbytes(self) -> int:
+        """level 영상 전체 메모리 크기 (bytes)"""
+        return sum(level.nbytes for level in self.levels)
+    
+    @cached_property
+    def pyramid_id(self) -> str:
+        """피라미드 내용 해시 (타일 URL/캐시 키로 사용)"""
+        digest = hashlib.sha1()
+        digest.update(self.levels[-1].tobytes())
+        digest.update(repr((self.image_shape, self.tile_size, self.tiles_x, self.tiles_y, self.bounds)).encode())
+        return digest.hexdigest()[:16]
+    
+    @property
+    def tiling_bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        """
+        타일 격자 전체를 감싸는 경위도 사각형 (west, south, east, north, 단위: deg)
+        
+        격자는 원본 이미지보다 크므로 bounds를 동쪽/남쪽으로 같은 비율만큼 확장합니다.
+        Cesium GeographicTilingScheme의 rectangle로 사용합니다.
+        """
+        if self.bounds is None:
+            return None
+        west, south, east, north = self.bounds
+        num_x, num_y = self.tile_counts(self.num_levels - 1)
+        grid_height, grid_width = num_y * self.tile_size, num_x * self.tile_size
+        height, width = self.image_shape
+        return (
+            west,
+            north - (north - south) * grid_height / height,
+            west + (east - west) * grid_width / width,
+            north
+        )
+    
+    def tile_counts(self, level: int) -> Tuple[int, int]:
+        """
+        level의 타일 개수
+        
+        Parameters:
+        -----------
+        level : int
+            피라미드 level
+        
+        Returns:
+        --------
+        Tuple[int, int]
+            (가로 타일 개수, 세로 타일 개수)
+        """
+        self._check_level(level)
+        return self.tiles_x << level, self.tiles_y << level
+    
+    def valid_shape(self, level: int) -> Tuple[int, int]:
+        """
+        level에서 원본 이미지가 차지하는 영역 크기
+        
+        Parameters:
+        -----------
+        level : int
+            피라미드 level
+        
+        Returns:
+        --------
+        Tuple[int, int]
+            (행 수, 열 수) (원본 크기를 2^(마지막 level - level)로 나누어 올림)
+        """
+        self._check_level(level)
+        scale = 1 << (self.num_levels - 1 - level)
+        height, width = self.image_shape
+        return -(-height // scale), -(-width // scale)
+    
+    def get_tile(self, level: int, x: int, y: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        타일 하나 추출
+        
+        Parameters:
+        -----------
+        level : int
+            피라미드 level
+        x : int
+            가로 타일 인덱스 (서쪽에서 0)
+        y : int
+            세로 타일 인덱스 (북쪽에서 0)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (8bit 그레이스케일 타일, 유효 영역 마스크) (shape: [tile_size, tile_size])
+        """
+        num_x, num_y = self.tile_counts(level)
+        if not (0 <= x < num_x and 0 <= y < num_y):
+            raise ValueError(f"타일 인덱스가 범위를 벗어났습니다: level={level}, x={x}, y={y} (범위: {num_x}×{num_y})")
+        
+        row0, col0 = y * self.tile_size, x * self.tile_size
+        tile = np.zeros((self.tile_size, self.tile_size), dtype=np.uint8)
+        stored = self.levels[level][row0:row0 + self.tile_size, col0:col0 + self.tile_size]
+        tile[:stored.shape[0], :stored.shape[1]] = stored
+        
+        valid_rows, valid_cols = self.valid_shape(level)
+        mask = np.zeros((self.tile_size, self.tile_size), dtype=bool)
+        mask[:max(0, valid_rows - row0), :max(0, valid_cols - col0)] = True
+        return tile, mask
+    
+    def tile_png(self, level: int, x: int, y: int) -> bytes:
+        """
+        타일을 그레이스케일+알파 PNG로 인코딩
+        
+        Parameters:
+        -----------
+        level : int
+            피라미드 level
+        x : int
+            가로 타일 인덱스
+        y : int
+            세로 타일 인덱스
+        
+        Returns:
+        --------
+        bytes
+            PNG 데이터
+        """
+        tile, mask = self.get_tile(level, x, y)
+        alpha = np.where(mask, 255, 0).astype(np.uint8)
+        image = Image.fromarray(np.stack([tile, alpha], axis=-1), mode='LA')
+        
+        buffer = io.BytesIO()
+        image.save(buffer, 'PNG', compress_level=2)
+        return buffer.getvalue()
+    
+    def metadata(self) -> Dict[str, Any]:
+        """
+        피라미드 메타데이터 (JSON 직렬화 가능)
+        
+        Returns:
+        --------
+        Dict[str, Any]
+            pyramid_id, 타일 크기/개수, level 수, 값 범위, 범위, 경위도 사각형
+        """
+        return {
+            "pyramid_id": self.pyramid_id,
+            "tile_size": self.tile_size,
+            "num_levels": self.num_levels,
+            "tiles_x": self.tiles_x,
+            "tiles_y": self.tiles_y,
+            "image_shape": list(self.image_shape),
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "range_extent": None if self.range_extent is None else [float(v) for v in self.range_extent],
+            "azimuth_extent": None if self.azimuth_extent is None else [float(v) for v in self.azimuth_extent],
+            "bounds": None if self.bounds is None else list(self.bounds),
+            "tiling_bounds": None if self.bounds is None else list(self.tiling_bounds),
+        }
+    
+    def save(self, directory: Union[str, Path]) -> Path:
+        """
+        모든 타일을 '{level}/{x}/{y}.png' 구조로 저장
+        
+        Parameters:
+        -----------
+        directory : str or Path
+            출력 디렉토리
+        
+        Returns:
+        --------
+        Path
+            출력 디렉토리
+        """
+        directory = Path(directory)
+        for level in range(self.num_levels):
+            num_x, num_y = self.tile_counts(level)
+            for x in range(num_x):
+                tile_dir = directory / str(level) / str(x)
+                tile_dir.mkdir(parents=True, exist_ok=True)
+                for y in range(num_y):
+                    (tile_dir / f"{y}.png").write_bytes(self.tile_png(level, x, y))
+        return directory
+    
+    def _check_level(self, level: int):
+        if not 0 <= level < self.num_levels:
+            raise ValueError(f"level이 범위를 벗어났습니다: {level} (범위: 0-{self.num_levels - 1})")
+
+
+def build_image_pyramid(
+    image_db: np.ndarray,
+    range_extent: Optional[np.ndarray] = None,
+    azimuth_extent: Optional[np.ndarray] = None,
+    bounds: Optional[Sequence[float]] = None,
+    tile_size: int = DEFAULT_TILE_SIZE,
+    min_value: Optional[float] = None,
+    max_value: Optional[float] = None
+) -> ImagePyramid:
+    """
+    dB 스케일 SAR 이미지로 타일 피라미드 생성
+    
+    원본 이미지를 2×2 평균으로 반씩 축소하며 level을 만듭니다. 평균은 dB 값이 아닌 선형 전력
+    (10^(dB/10))으로 계산하므로 (dB 평균은 기하 평균이라 어둡게 치우침) 낮은 해상도 level도
+    원본과 같은 밝기를 가집니다. level 0은 긴 변이 타일 하나에
+    들어가는 해상도입니다. 축소는 이미지 영역에서만 수행하고 (홀수 끝 행/열은 이미지 안쪽 원본
+    픽셀 수로 가중 평균), 각 level은 [min_value, max_value]를 0-255로 양자화하여 이미지 영역을
+    덮는 타일 크기까지만 저장합니다. 따라서 메모리는 원본 크기에 비례하고, 가늘고 긴 이미지도
+    타일 격자 전체 크기로 확장하지 않습니다.
+    
+    Parameters:
+    -----------
+    image_db : np.ndarray
+        SAR 이미지 (dB 스케일, shape: [azimuth_samples, range_samples])
+    range_extent : np.ndarray, optional
+        Range 범위 [min, max] (m)
+    azimuth_extent : np.ndarray, optional
+        Azimuth 범위 [min, max] (m)
+    bounds : Sequence[float], optional
+        이미지를 감싸는 경위도 사각형 [west, south, east, north] (단위: deg)
+    tile_size : int
+        타일 크기 (기본값: 256)
+    min_value : float, optional
+        0에 대응하는 값 (dB, None이면 이미지 최솟값)
+    max_value : float, optional
+        255에 대응하는 값 (dB, None이면 이미지 최댓값)
+    
+    Returns:
+    --------
+    ImagePyramid
+        타일 피라미드
+    """
+    image_db = np.asarray(image_db, dtype=np.float32)
+    if image_db.ndim != 2 or image_db.size == 0:
+        raise ValueError(f"image_db는 비어 있지 않은 2차원 배열이어야 합니다: shape={image_db.shape}")
+    if tile_size <= 0:
+        raise ValueError(f"tile_size는 0보다 커야 합니다: {tile_size}")
+    if bounds is not None:
+        if len(bounds) != 4:
+            raise ValueError("bounds는 [west, south, east, north] 형식이어야 합니다.")
+        bounds = tuple(float(value) for value in bounds)
+        west, south, east, north = bounds
+        if not (west < east and south < north):
+            raise ValueError(f"bounds는 west < east, south < north 이어야 합니다: {list(bounds)}")
+    
+    if min_value is None:
+        min_value = float(np.min(image_db))
+    if max_value is None:
+        max_value = float(np.max(image_db))
+    
+    # level 0에서 긴 변이 타일 하나에 들어가도록 level 수 결정
+    height, width = image_db.shape
+    max_level = max(0, int(np.ceil(np.log2(max(height, width) / tile_size))))
+    tiles_x = -(-width // (tile_size << max_level))
+    tiles_y = -(-height // (tile_size << max_level))
+    
+    # 행/열 가중치: level 픽셀이 덮는 원본 행/열 수 (이미지 영역이 사각형이므로 분리 가능)
+    row_weights = np.ones(height, dtype=np.float32)
+    col_weights = np.ones(width, dtype=np.float32)
+    
+    # 축소는 최댓값 기준 상대 선형 전력으로 계산 (float32 overflow 방지)
+    reference = float(np.max(image_db))
+    values = (image_db - reference) * np.float32(0.1)
+    np.power(np.float32(10.0), values, out=values)
+    
+    levels = [_quantize_tiles(image_db, tile_size, min_value, max_value)]
+    for _ in range(max_level):
+        values, row_weights = _weighted_pair_mean(values, row_weights)
+        values, col_weights = _weighted_pair_mean(values.T, col_weights)
+        values = values.T
+        levels.append(_quantize_tiles(_power_to_db(values, reference), tile_size, min_value, max_value))
+    
+    return ImagePyramid(
+        levels=levels[::-1],
+        image_shape=(height, width),
+        tile_size=tile_size,
+        tiles_x=tiles_x,
+        tiles_y=tiles_y,
+        min_value=min_value,
+        max_value=max_value,
+        range_extent=None if range_extent is None else np.asarray(range_extent),
+        azimuth_extent=None if azimuth_extent is None else np.asarray(azimuth_extent),
+        bounds=bounds
+    )
+
+
+def _weighted_pair_mean(values: np.ndarray, weights: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    인접한 두 행의 가중 평균으로 행 수를 절반으로 축소 (홀수 행이면 마지막 행은 그대로)
+    
+    Parameters:
+    -----------
+    values : np.ndarray
+        영상 (shape: [rows, cols])
+    weights : np.ndarray
+        행 가중치 (shape: [rows])
+    
+    Returns:
+    --------
+    Tuple[np.ndarray, np.ndarray]
+        (축소 영상 [ceil(rows / 2), cols], 합친 행 가중치)
+    """
+    rows = values.shape[0]
+    pairs = rows // 2
+    even_weights = weights[0:2 * pairs:2, np.newaxis]
+    odd_weights = weights[1:2 * pairs:2, np.newaxis]
+    
+    reduced = np.empty((rows - pairs, values.shape[1]), dtype=np.float32)
+    head = reduced[:pairs]
+    np.multiply(values[0:2 * pairs:2], even_weights, out=head)
+    head += values[1:2 * pairs:2] * odd_weights
+    head /= even_weights + odd_weights
+    
+    reduced_weights = np.empty(rows - pairs, dtype=np.float32)
+    np.add(even_weights[:, 0], odd_weights[:, 0], out=reduced_weights[:pairs])
+    if rows % 2:
+        reduced[-1] = values[-1]
+        reduced_weights[-1] = weights[-1]
+    return reduced, reduced_weights
+
+
+def _power_to_db(power: np.ndarray, reference: float) -> np.ndarray:
+    """상대 선형 전력을 dB로 변환 (reference dB 기준, 전력 0은 -inf)"""
+    with np.errstate(divide='ignore'):
+        values = np.log10(power)
+    values *= np.float32(10.0)
+    values += np.float32(reference)
+    return values
+
+
+def _quantize_tiles(values: np.ndarray, tile_size: int, min_value: float, max_value: float) -> np.ndarray:
+    """[min_value, max_value]를 0-255로 양자화하여 타일 크기 배수 영상에 기록 (이미지 밖은 0)"""
+    height, width = values.shape
+    tiles = np.zeros((-(-height // tile_size) * tile_size, -(-width // tile_size) * tile_size), dtype=np.uint8)
+    
+    span = max_value - min_value
+    if span > 0:
+        scaled = (values - min_value) * (255.0 / span)
+        np.round(scaled, out=scaled)
+        np.clip(scaled, 0, 255, out=tiles[:height, :width], casting='unsafe')
+    else:
+        tiles[:height, :width] = 255
+    return tiles
@@ -3,15 +3,22 @@ PNG 이미지 저장 모듈
 
 Echo 신호를 그레이스케일 PNG 이미지로 저장하는 기능을 제공합니다.
 echo_simulator_cmd와 동일한 형태의 PNG 파일을 생성합니다.
+대용량 Echo는 행 블록 단위로 처리하여 PNG를 점진적으로 기록하는 스트리밍 버전을 사용합니다.
 """
 
+import struct
+import zlib
 import numpy as np
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Iterator, Tuple
 from PIL import Image
 from scipy.ndimage import zoom
 
 
+# 스트리밍 저장 시 한 번에 읽는 기본 행(펄스) 개수
+DEFAULT_PNG_BLOCK_ROWS = 256
+
+
 def save_echo_signals_as_grayscale_png(
     echo_signals: np.ndarray,
     output_path: Path,
@@ -72,3 +79,155 @@ def save_echo_signals_as_grayscale_png(
     print(f"  크기: {image_data.shape[0]} x {image_data.shape[1]} (pulses x samples)")
     print(f"  최대 진폭: {max_amplitude:.6e}")
     print(f"  리샘플링 비율: {resample_ratio}")
+
+
+def save_echo_signals_as_grayscale_png_streaming(
+    echo_signals,
+    output_path: Path,
+    max_amplitude: Optional[float] = None,
+    resample_ratio: float = 1.0,
+    block_rows: int = DEFAULT_PNG_BLOCK_ROWS
+) -> None:
+    """
+    Echo 신호를 행 블록 단위로 그레이스케일 PNG에 스트리밍 저장
+    
+    save_echo_signals_as_grayscale_png()와 같은 정규화로 저장하지만, 전체 magnitude 배열을 만들지 않고
+    block_rows개 펄스씩 읽어 magnitude 계산/축소/양자화 후 PNG IDAT를 바로 압축하여 기록합니다.
+    최대 메모리는 몇 개의 행 블록 수준이며, np.ndarray뿐 아니라 h5py Dataset이나
+    RawDataReader의 BurstArray처럼 행 slicing을 지원하는 객체를 그대로 입력할 수 있습니다.
+    
+    리샘플링은 bilinear zoom 대신 영역 평균(area average)을 사용합니다.
+    출력 픽셀 i는 입력 구간 [floor(i * N / M), floor((i + 1) * N / M))의 평균이며
+    (N: 입력 크기, M: 출력 크기 = round(N * resample_ratio)), 업샘플링은 최근접 픽셀 복제입니다.
+    
+    Parameters:
+    -----------
+    echo_signals : np.ndarray or array-like
+        Echo 신호 (shape: [num_pulses, num_samples], 행 slicing 지원)
+    output_path : Path
+        출력 PNG 파일 경로
+    max_amplitude : float, optional
+        최대 진폭 (None인 경우 블록 단위 1차 스캔으로 계산)
+    resample_ratio : float
+        리샘플링 비율 (기본값: 1.0, 리샘플링 없음)
+    block_rows : int
+        한 번에 읽는 행(펄스) 개수 (기본값: 256)
+    """
+    num_rows, num_cols = echo_signals.shape
+    if resample_ratio <= 0:
+        raise ValueError(f"resample_ratio는 0보다 커야 합니다: {resample_ratio}")
+    if block_rows <= 0:
+        raise ValueError(f"block_rows는 0보다 커야 합니다: {block_rows}")
+    
+    if max_amplitude is None:
+        max_amplitude = 0.0
+        for _, block in _iter_magnitude_blocks(echo_signals, block_rows):
+            max_amplitude = max(max_amplitude, float(np.max(block)))
+    
+    out_rows = max(1, int(round(num_rows * resample_ratio)))
+    out_cols = max(1, int(round(num_cols * resample_ratio)))
+    row_start, row_stop = _area_bounds(num_rows, out_rows)
+    col_start, col_stop = _area_bounds(num_cols, out_cols)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'wb') as f:
+        writer = _GrayscalePngStream(f, out_cols, out_rows)
+        
+        # 열 방향 축소한 행을 보관하다가 출력 행 구간이 채워지면 행 방향 평균
+        pending = np.empty((0, out_cols), dtype=np.float32)
+        pending_offset = 0
+        next_row = 0
+        for start, block in _iter_magnitude_blocks(echo_signals, block_rows):
+            stop = start + block.shape[0]
+            pending = np.concatenate([pending, _area_average(block, col_start, col_stop, axis=1)])
+            
+            ready = next_row + int(np.searchsorted(row_stop[next_row:], stop, side='right'))
+            if ready > next_row:
+                rows = _area_average(
+                    pending, row_start[next_row:ready] - pending_offset, row_stop[next_row:ready] - pending_offset, axis=0
+                )
+                writer.write_rows(_quantize(rows, max_amplitude))
+                next_row = ready
+            
+            keep_from = row_start[next_row] if next_row < out_rows else stop
+            pending = pending[keep_from - pending_offset:]
+            pending_offset = keep_from
+        
+        writer.close()
+    
+    print(f"그레이스케일 PNG 스트리밍 저장 완료: {output_path}")
+    print(f"  크기: {out_rows} x {out_cols} (pulses x samples)")
+    print(f"  최대 진폭: {max_amplitude:.6e}")
+    print(f"  리샘플링 비율: {resample_ratio}")
+
+
+def _iter_magnitude_blocks(echo_signals, block_rows: int) -> Iterator[Tuple[int, np.ndarray]]:
+    """행 블록별 magnitude (float32) 생성"""
+    for start in range(0, echo_signals.shape[0], block_rows):
+        block = np.asarray(echo_signals[start:start + block_rows])
+        yield start, np.abs(block).astype(np.float32, copy=False)
+
+
+def _quantize(magnitude: np.ndarray, max_amplitude: float) -> np.ndarray:
+    """save_echo_signals_as_grayscale_png()와 같은 0-255 정규화"""
+    if max_amplitude > 0:
+        return (magnitude / max_amplitude * 255.0).clip(0, 255).astype(np.uint8)
+    return np.zeros(magnitude.shape, dtype=np.uint8)
+
+
+def _area_bounds(num_in: int, num_out: int) -> Tuple[np.ndarray, np.ndarray]:
+    """출력 픽셀별 입력 구간 [start, stop) (업샘플링은 길이 1 구간)"""
+    index = np.arange(num_out, dtype=np.int64)
+    start = index * num_in // num_out
+    stop = np.maximum((index + 1) * num_in // num_out, start + 1)
+    return start, stop
+
+
+def _area_average(values: np.ndarray, start: np.ndarray, stop: np.ndarray, axis: int) -> np.ndarray:
+    """axis 방향 구간 평균 (구간이 겹치지 않고 이어지면 reduceat, 아니면 최근접 복제)"""
+    values = values[:stop[-1]] if axis == 0 else values[:, :stop[-1]]
+    if len(start) == values.shape[axis] and np.array_equal(start, np.arange(len(start))):
+        return values
+    if np.array_equal(start[1:], stop[:-1]):
+        sums = np.add.reduceat(values, start, axis=axis)
+        counts = (stop - start).astype(np.float32)
+        return sums / (counts[:, None] if axis == 0 else counts)
+    return np.take(values, start, axis=axis)
+
+
+class _GrayscalePngStream:
+    """8bit 그레이스케일 PNG를 행 단위로 압축하여 기록 (IDAT 청크를 점진적으로 출력)"""
+    
+    def __init__(self, f, width: int, height: int, compress_level: int = 2):
+        self._file = f
+        self._width = width
+        self._height = height
+        self._rows_written = 0
+        self._compressor = zlib.compressobj(compress_level)
+        
+        f.write(b'\x89PNG\r\n\x1a\n')
+        # bit depth 8, color type 0 (grayscale), compression/filter/interlace 0
+        self._write_chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 0, 0, 0, 0))
+    
+    def write_rows(self, rows: np.ndarray):
+        """uint8 행 추가 (shape: [n, width], 각 행 앞에 필터 타입 0 바이트)"""
+        if rows.shape[1] != self._width or self._rows_written + rows.shape[0] > self._height:
+            raise ValueError(f"PNG 행 크기가 맞지 않습니다: {rows.shape}")
+        scanlines = np.zeros((rows.shape[0], self._width + 1), dtype=np.uint8)
+        scanlines[:, 1:] = rows
+        data = self._compressor.compress(scanlines.tobytes())
+        if data:
+            self._write_chunk(b'IDAT', data)
+        self._rows_written += rows.shape[0]
+    
+    def close(self):
+        """남은 압축 데이터와 IEND 기록"""
+        if self._rows_written != self._height:
+            raise ValueError(f"PNG 행 개수가 맞지 않습니다: {self._rows_written} != {self._height}")
+        self._write_chunk(b'IDAT', self._compressor.flush())
+        self._write_chunk(b'IEND', b'')
+    
+    def _write_chunk(self, chunk_type: bytes, data: bytes):
+        self._file.write(struct.pack('>I', len(data)))
+        self._file.write(chunk_type)
+        self._file.write(data)
+        self._file.write(struct.pack('>I', zlib.crc32(chunk_type + data) & 0xFFFFFFFF))
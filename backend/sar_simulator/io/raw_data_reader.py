@@ -0,0 +1,399 @@
+"""
+SAR Raw Data Reader
+
+RawDataWriter로 저장한 HDF5 Raw Data를 읽는 모듈입니다.
+Burst Echo는 지연 로딩 배열(BurstArray)로 노출되어 slicing한 펄스/샘플 구간만
+디스크에서 읽고 complex64로 복원하며, ADX 상태 벡터는 구조화 배열로 제공합니다.
+"""
+
+import h5py
+import numpy as np
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Iterator, Tuple, Union
+
+from sar_simulator.io.baq import baq_decode
+from sar_simulator.io.compression import DEFAULT_CHUNK_BYTES, choose_chunk_shape
+
+
+# ADX 행 (15열 float64)의 구조화 배열 dtype
+ADX_DTYPE = np.dtype([
+    ("time", np.float64),
+    ("window_start_time", np.float64),
+    ("position", np.float64, (3,)),
+    ("velocity", np.float64, (3,)),
+    ("attitude_quaternion", np.float64, (4,)),
+    ("angular_velocity", np.float64, (3,)),
+])
+
+
+class BurstArray:
+    """
+    Burst Echo 지연 로딩 배열
+    
+    shape [num_pulses, num_samples], dtype complex64인 배열처럼 slicing할 수 있으며,
+    요청한 구간만 읽어 복원합니다. 정수/slice 인덱스(음수, step 포함)를 지원합니다.
+    RawDataReader가 열려 있는 동안에만 사용할 수 있습니다.
+    """
+    
+    def __init__(self, group: h5py.Group):
+        """
+        BurstArray 초기화
+        
+        Parameters:
+        -----------
+        group : h5py.Group
+            B000 데이터셋이 있는 그룹
+        """
+        self.group = group
+        self._dataset = group['B000']
+        self.encoding = str(self._dataset.attrs.get('Encoding', 'FLOAT32'))
+        
+        if self.encoding == 'BAQ':
+            self._scales = group['B000_baq_scale']
+            self.bits = int(self._dataset.attrs['BAQ Bits'])
+            self.block_samples = int(self._dataset.attrs['BAQ Block Samples'])
+            num_samples = int(self._dataset.attrs['Samples per Line'])
+        elif self.encoding == 'CINT16':
+            self.scale = float(self._dataset.attrs['Scale Factor'])
+            num_samples = self._dataset.shape[1]
+        else:
+            num_samples = self._dataset.shape[1]
+        
+        self.shape: Tuple[int, int] = (self._dataset.shape[0], num_samples)
+        self.dtype = np.dtype(np.complex64)
+        self._mapped = self._map_dataset()
+    
+    @property
+    def ndim(self) -> int:
+        """차원 수"""
+        return 2
+    
+    @property
+    def size(self) -> int:
+        """전체 샘플 수"""
+        return self.shape[0] * self.shape[1]
+    
+    @property
+    def chunk_pulses(self) -> int:
+        """기본 블록 펄스 수 (청크 데이터셋은 청크 펄스 수, contiguous는 약 1 MiB)"""
+        if self._dataset.chunks is not None:
+            return self._dataset.chunks[0]
+        return choose_chunk_shape(self.shape[0], self.shape[1], DEFAULT_CHUNK_BYTES)[0]
+    
+    @property
+    def is_memory_mapped(self) -> bool:
+        """memory-map으로 읽는지 여부 (압축/청크 없는 float32 데이터셋)"""
+        return self._mapped is not None
+    
+    def __len__(self) -> int:
+        """펄스 수"""
+        return self.shape[0]
+    
+    def __array__(self, dtype=None, copy=None):
+        """np.asarray() 변환 (전체 읽기)"""
+        data = self[:, :]
+        return data if dtype is None else data.astype(dtype)
+    
+    def __getitem__(self, key) -> np.ndarray:
+        """
+        펄스/샘플 구간 읽기
+        
+        Parameters:
+        -----------
+        key : int, slice, 또는 (펄스, 샘플) tuple
+        
+        Returns:
+        --------
+        np.ndarray
+            complex64 Echo 데이터 (정수 인덱스 차원은 제거)
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        if len(key) > 2:
+            raise IndexError("BurstArray는 2차원 (펄스, 샘플) 인덱스만 지원합니다.")
+        key = key + (slice(None),) * (2 - len(key))
+        
+        pulse_range, pulse_index = _split_index(key[0], self.shape[0])
+        sample_range, sample_index = _split_index(key[1], self.shape[1])
+        
+        block = self._read(pulse_range, sample_range)
+        return block[:, sample_index][pulse_index]
+    
+    def iter_blocks(
+        self,
+        block_pulses: Optional[int] = None,
+        samples: slice = slice(None)
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        펄스 블록 단위 순차 읽기 (out-of-core 처리용)
+        
+        Parameters:
+        -----------
+        block_pulses : int, optional
+            블록당 펄스 수 (None이면 chunk_pulses)
+        samples : slice
+            읽을 샘플 구간 (기본값: 전체)
+        
+        Returns:
+        --------
+        Iterator[Tuple[int, np.ndarray]]
+            (블록 첫 펄스 인덱스, complex64 Echo 블록 [block_pulses, num_samples])
+        """
+        if block_pulses is None:
+            block_pulses = self.chunk_pulses
+        if block_pulses <= 0:
+            raise ValueError("block_pulses는 0보다 커야 합니다.")
+        
+        for start in range(0, self.shape[0], block_pulses):
+            yield start, self[start:start + block_pulses, samples]
+    
+    def memmap(self) -> np.ndarray:
+        """
+        Echo 전체를 복사 없이 memory-map으로 반환
+        
+        Returns:
+        --------
+        np.ndarray
+            읽기 전용 complex64 memory-map (shape: [num_pulses, num_samples])
+        """
+        if self._mapped is None:
+            raise ValueError("memory-map은 압축/청크 없는 float32 Burst에서만 사용할 수 있습니다.")
+        return self._mapped
+    
+    def _read(self, pulses: slice, samples: slice) -> np.ndarray:
+        """연속 구간 (step 1) 읽기 및 complex64 복원"""
+        num_pulses = pulses.stop - pulses.start
+        num_samples = samples.stop - samples.start
+        if num_pulses == 0 or num_samples == 0:
+            return np.zeros((num_pulses, num_samples), dtype=np.complex64)
+        
+        if self._mapped is not None:
+            return np.array(self._mapped[pulses, samples])
+        if self.encoding == 'BAQ':
+            return self._read_baq(pulses, samples)
+        if self.encoding == 'CINT16':
+            pairs = self._dataset[pulses, samples].astype(np.float32)
+            pairs *= np.float32(self.scale)
+            return pairs.view(np.complex64)[..., 0]
+        if self._dataset.ndim == 2:
+            return self._dataset[pulses, samples].astype(np.complex64)
+        
+        pairs = np.ascontiguousarray(self._dataset[pulses, samples], dtype=np.float32)
+        return pairs.view(np.complex64)[..., 0]
+    
+    def _read_baq(self, pulses: slice, samples: slice) -> np.ndarray:
+        """BAQ 코드 중 샘플 구간을 덮는 블록만 읽어 복원"""
+        block_bits = 2 * self.block_samples * self.bits
+        if block_bits % 8 != 0:
+            # 블록 경계가 바이트 경계와 맞지 않으면 펄스 전체 복원
+            decoded = baq_decode(
+                self._dataset[pulses], self._scales[pulses],
+                self.shape[1], self.bits, self.block_samples
+            )
+            return decoded[:, samples]
+        
+        first_block = samples.start // self.block_samples
+        stop_block = -(-samples.stop // self.block_samples)
+        first_sample = first_block * self.block_samples
+        stop_sample = min(stop_block * self.block_samples, self.shape[1])
+        
+        byte_start = first_block * block_bits // 8
+        byte_stop = -(-2 * stop_sample * self.bits // 8)
+        decoded = baq_decode(
+            self._dataset[pulses, byte_start:byte_stop],
+            self._scales[pulses, first_block:stop_block],
+            stop_sample - first_sample, self.bits, self.block_samples
+        )
+        return decoded[:, samples.start - first_sample:samples.stop - first_sample]
+    
+    def _map_dataset(self) -> Optional[np.ndarray]:
+        """
+        contiguous float32 [..., 2] 데이터셋을 complex64 memory-map으로 연결 (불가능하면 None)
+        
+        외부 링크로 연결된 그룹도 있으므로 데이터셋이 실제로 저장된 파일을 연결합니다.
+        """
+        dataset = self._dataset
+        if self.encoding != 'FLOAT32' or dataset.ndim != 3 or dataset.dtype != np.dtype('<f4'):
+            return None
+        offset = dataset.id.get_offset()
+        if offset is None or dataset.size == 0:
+            return None
+        return np.memmap(dataset.file.filename, dtype=np.complex64, mode='r', offset=offset, shape=self.shape)
+
+
+class RawDataReader:
+    """
+    SAR Raw Data Reader 클래스
+    
+    파일을 열 때는 헤더만 읽고, Burst Echo는 BurstArray로 필요한 구간만 읽습니다.
+    """
+    
+    def __init__(self, filepath: Union[str, Path]):
+        """
+        RawDataReader 초기화
+        
+        Parameters:
+        -----------
+        filepath : str or Path
+            HDF5 파일 경로
+        """
+        self.filepath = Path(filepath)
+        self.hdf_file: Optional[h5py.File] = None
+    
+    def open(self):
+        """HDF5 파일 열기"""
+        if self.hdf_file is not None:
+            return
+        
+        self.hdf_file = h5py.File(self.filepath, 'r')
+        if self.hdf_file.attrs.get('Product Type') != 'SAR_RAW_DATA':
+            self.close()
+            raise ValueError(f"Raw Data 파일이 아닙니다: {self.filepath}")
+    
+    def close(self):
+        """HDF5 파일 닫기"""
+        if self.hdf_file is not None:
+            self.hdf_file.close()
+            self.hdf_file = None
+    
+    def __enter__(self):
+        """Context manager 진입"""
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager 종료"""
+        self.close()
+    
+    @property
+    def attrs(self) -> Dict[str, Any]:
+        """루트 속성"""
+        return dict(self._require_open().attrs)
+    
+    @property
+    def group_names(self) -> List[str]:
+        """Burst 데이터가 있는 그룹 이름 목록"""
+        hdf_file = self._require_open()
+        return [name for name, item in hdf_file.items() if isinstance(item, h5py.Group) and 'B000' in item]
+    
+    def group_attributes(self, group_name: str) -> Dict[str, Any]:
+        """
+        그룹 속성 (PRF, Sampling Rate 등)
+        
+        Parameters:
+        -----------
+        group_name : str
+            그룹 이름
+        
+        Returns:
+        --------
+        Dict[str, Any]
+            그룹 속성
+        """
+        return dict(self._get_group(group_name).attrs)
+    
+    def burst(self, group_name: str) -> BurstArray:
+        """
+        Burst Echo 지연 로딩 배열
+        
+        Parameters:
+        -----------
+        group_name : str
+            그룹 이름
+        
+        Returns:
+        --------
+        BurstArray
+            Burst Echo 배열
+        """
+        return BurstArray(self._get_group(group_name))
+    
+    def state_vectors(self, group_name: str, pulses: slice = slice(None)) -> np.ndarray:
+        """
+        ADX 상태 벡터를 구조화 배열로 읽기
+        
+        Parameters:
+        -----------
+        group_name : str
+            그룹 이름
+        pulses : slice
+            읽을 펄스 구간 (기본값: 전체)
+        
+        Returns:
+        --------
+        np.ndarray
+            ADX_DTYPE 구조화 배열 (shape: [num_pulses])
+            필드: time, window_start_time, position, velocity, attitude_quaternion, angular_velocity
+        """
+        group = self._get_group(group_name)
+        if 'B000_adx' not in group:
+            raise ValueError(f"ADX 데이터가 없습니다: {group_name}/B000_adx")
+        
+        adx_data = np.ascontiguousarray(group['B000_adx'][pulses], dtype=np.float64)
+        return adx_data.view(ADX_DTYPE)[:, 0]
+    
+    def _get_group(self, group_name: str) -> h5py.Group:
+        """Burst 그룹 조회"""
+        hdf_file = self._require_open()
+        if group_name not in hdf_file or 'B000' not in hdf_file[group_name]:
+            raise ValueError(f"Burst 데이터가 없습니다: {group_name}/B000")
+        return hdf_file[group_name]
+    
+    def _require_open(self) -> h5py.File:
+        """열린 HDF5 파일 반환"""
+        if self.hdf_file is None:
+            raise ValueError("HDF5 파일이 열려있지 않습니다. open()을 먼저 호출하세요.")
+        return self.hdf_file
+
+
+def read_burst_echo(
+    filepath: str,
+    group_name: str = "SSG00",
+    pulses: Optional[slice] = None
+) -> np.ndarray:
+    """
+    Burst Echo 데이터 읽기
+    
+    float32 (실수, 허수) 저장, BAQ 인코딩 저장, CInt16 저장을 모두 complex64로 복원하므로
+    결과를 RDAProcessor.process()에 바로 전달할 수 있습니다.
+    
+    Parameters:
+    -----------
+    filepath : str
+        HDF5 파일 경로
+    group_name : str
+        그룹 이름 (기본값: 'SSG00')
+    pulses : slice, optional
+        읽을 펄스 구간 (None이면 전체)
+    
+    Returns:
+    --------
+    np.ndarray
+        Echo 데이터 (shape: [num_pulses, num_samples], dtype: complex64)
+    """
+    with RawDataReader(filepath) as reader:
+        return reader.burst(group_name)[pulses if pulses is not None else slice(None)]
+
+
+def _split_index(index, length: int) -> Tuple[slice, Union[int, slice, np.ndarray]]:
+    """
+    정수/slice 인덱스를 (연속 읽기 구간, 읽은 구간 안에서의 인덱스)로 변환
+    """
+    if isinstance(index, (int, np.integer)):
+        position = int(index) + length if index < 0 else int(index)
+        if not 0 <= position < length:
+            raise IndexError(f"인덱스가 범위를 벗어났습니다: {index} (크기: {length})")
+        return slice(position, position + 1), 0
+    
+    if not isinstance(index, slice):
+        raise TypeError("BurstArray 인덱스는 정수 또는 slice여야 합니다.")
+    
+    positions = range(*index.indices(length))
+    if len(positions) == 0:
+        return slice(0, 0), slice(None)
+    
+    low = min(positions[0], positions[-1])
+    high = max(positions[0], positions[-1]) + 1
+    if positions.step == 1:
+        return slice(low, high), slice(None)
+    return slice(low, high), np.asarray(positions) - low
@@ -6,10 +6,19 @@ SAR Raw Data를 HDF5 형식으로 저장하는 모듈입니다.
 
 import h5py
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from pathlib import Path
 
+from sar_simulator.common.cint16_echo import CInt16Echo, quantize_cint16
 from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.io.baq import DEFAULT_BAQ_BLOCK_SAMPLES, baq_encode, packed_bytes_per_pulse, validate_baq_parameters
+from sar_simulator.io.compression import DEFAULT_CHUNK_BYTES, choose_chunk_shape, deflate_chunk, get_filter_options
+from sar_simulator.orbit.attitude import AttitudeProfile
+from sar_simulator.orbit.ephemeris import Ephemeris
+
+
+# 스트리밍 ADX 데이터셋 청크당 행 수
+_ADX_CHUNK_ROWS = 4096
 
 
 class RawDataWriter:
@@ -17,9 +26,22 @@ class RawDataWriter:
     SAR Raw Data Writer 클래스
     
     Echo 신호를 HDF5 형식으로 저장합니다.
+    write_burst()는 Burst 전체를, begin_burst()/append_pulses()/end_burst()는
+    펄스 블록 단위 스트리밍으로 저장합니다.
+    baq_bits를 지정하면 Echo를 BAQ 인코딩하여 저장합니다 (read_burst_echo()로 복원).
+    CInt16Echo는 int16 (I, Q) 코드와 스케일 팩터를 그대로 저장합니다 (complex64 대비 절반 크기).
     """
     
-    def __init__(self, filepath: str, config: SarSystemConfig):
+    def __init__(
+        self,
+        filepath: str,
+        config: SarSystemConfig,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None,
+        chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+        baq_bits: Optional[int] = None,
+        baq_block_samples: int = DEFAULT_BAQ_BLOCK_SAMPLES
+    ):
         """
         RawDataWriter 초기화
         
@@ -29,10 +51,32 @@ class RawDataWriter:
             저장할 HDF5 파일 경로
         config : SarSystemConfig
             SAR 시스템 설정
+        compression : str, optional
+            Echo 데이터 압축 코덱 (None: 압축 없음, "gzip", "lzf", "blosc-zstd")
+        compression_level : int, optional
+            압축 레벨 (None이면 코덱 기본값)
+        chunk_bytes : int
+            자동 청크 크기 목표 (bytes, 기본값: 1 MiB)
+        baq_bits : int, optional
+            BAQ 인코딩 비트 수 (None이면 float32 저장, 1 ~ config.adc_bits, 최대 8)
+        baq_block_samples : int
+            BAQ 블록 크기 (range 샘플 수, 기본값: 128)
         """
         self.filepath = Path(filepath)
         self.config = config
+        self.compression = compression
+        self.chunk_bytes = chunk_bytes
+        self._filter_options = get_filter_options(compression, compression_level)
+        self.baq_bits = baq_bits
+        self.baq_block_samples = baq_block_samples
+        if baq_bits is not None:
+            validate_baq_parameters(baq_bits, baq_block_samples)
+            if baq_bits > config.adc_bits:
+                raise ValueError(f"BAQ 비트 수({baq_bits})는 ADC 비트 수({config.adc_bits})보다 클 수 없습니다.")
+            if self._filter_options:
+                raise ValueError("BAQ 인코딩과 압축 필터는 함께 사용할 수 없습니다.")
         self.hdf_file: Optional[h5py.File] = None
+        self._streams: Dict[str, Dict[str, Any]] = {}
         
         # 파일이 이미 존재하면 삭제
         if self.filepath.exists():
@@ -45,8 +89,11 @@ class RawDataWriter:
             self._write_root_attributes()
     
     def close(self):
-        """HDF5 파일 닫기"""
+        """HDF5 파일 닫기 (종료되지 않은 스트리밍 Burst의 남은 펄스도 기록)"""
         if self.hdf_file is not None:
+            for stream in self._streams.values():
+                self._flush_pending_pulses(stream)
+            self._streams.clear()
             self.hdf_file.close()
             self.hdf_file = None
     
@@ -75,10 +122,12 @@ class RawDataWriter:
     def write_burst(
         self,
         group_name: str,
-        echo_data: np.ndarray,
+        echo_data: Union[np.ndarray, CInt16Echo],
         satellite_positions: Optional[np.ndarray] = None,
         satellite_velocities: Optional[np.ndarray] = None,
         timestamps: Optional[np.ndarray] = None,
+        ephemeris: Optional[Ephemeris] = None,
+        attitude: Optional[AttitudeProfile] = None,
         **kwargs
     ):
         """
@@ -88,67 +137,381 @@ class RawDataWriter:
         -----------
         group_name : str
             그룹 이름 (예: 'SSG00')
-        echo_data : np.ndarray
+        echo_data : np.ndarray 또는 CInt16Echo
             Echo 데이터 (shape: [num_pulses, num_samples], dtype: complex64)
+            CInt16Echo는 int16 코드로 저장 (BAQ 저장 시에는 복원 후 인코딩)
         satellite_positions : np.ndarray, optional
             위성 위치 배열 (shape: [num_pulses, 3], 단위: m)
         satellite_velocities : np.ndarray, optional
             위성 속도 배열 (shape: [num_pulses, 3], 단위: m/s)
         timestamps : np.ndarray, optional
             타임스탬프 배열 (shape: [num_pulses], 단위: s)
+        ephemeris : Ephemeris, optional
+            위성 궤도력 (지정 시 위치/속도를 펄스 시각에서 보간,
+            timestamps가 없으면 첫 노드부터 PRF 간격 시각 사용)
+        attitude : AttitudeProfile, optional
+            버스 자세 프로파일 (지정 시 ADX 자세 쿼터니언/각속도 열을 채움,
+            위성 위치/속도 필요, timestamps가 없으면 PRF 간격 시각 사용)
         **kwargs
             추가 속성들
         """
         if self.hdf_file is None:
             raise ValueError("HDF5 파일이 열려있지 않습니다. open()을 먼저 호출하세요.")
         
-        # 그룹 생성
-        if group_name not in self.hdf_file:
-            group = self.hdf_file.create_group(group_name)
-            self._write_group_attributes(group)
-        else:
-            group = self.hdf_file[group_name]
+        group = self._get_group(group_name)
         
         # Burst 이름
         burst_name = f"{group_name}/B000"
         
-        # 데이터셋 생성 (복소수를 실수/허수로 분리)
-        if echo_data.dtype == np.complex64:
-            data_shape = (echo_data.shape[0], echo_data.shape[1], 2)
-            dataset = group.create_dataset(
-                'B000',
-                shape=data_shape,
-                dtype=np.float32
-            )
-            dataset[:, :, 0] = echo_data.real
-            dataset[:, :, 1] = echo_data.imag
+        # 데이터셋 생성 (complex64는 float32 [..., 2] 뷰로 한 번에 기록, 압축 시 자동 청크)
+        if self.baq_bits is not None:
+            encoded = baq_encode(np.asarray(echo_data), self.baq_bits, self.baq_block_samples)
+            group.create_dataset('B000', data=encoded.codes)
+            group.create_dataset('B000_baq_scale', data=encoded.scales)
+            self._write_baq_attributes(group['B000'], echo_data.shape[1])
+        elif isinstance(echo_data, CInt16Echo):
+            # int16 샘플(4 bytes)은 float32 쌍의 절반이므로 같은 청크 크기가 되도록 목표를 2배로
+            if self._filter_options:
+                chunks = choose_chunk_shape(echo_data.shape[0], echo_data.shape[1], 2 * self.chunk_bytes)
+                group.create_dataset('B000', data=echo_data.data, chunks=chunks, **self._filter_options)
+            else:
+                group.create_dataset('B000', data=echo_data.data)
+            self._write_cint16_attributes(group['B000'], echo_data.scale, echo_data.adc_bits)
+        elif echo_data.dtype == np.complex64:
+            if self._filter_options:
+                chunks = choose_chunk_shape(echo_data.shape[0], echo_data.shape[1], self.chunk_bytes)
+                group.create_dataset('B000', data=_as_float32_pairs(echo_data), chunks=chunks, **self._filter_options)
+            else:
+                group.create_dataset('B000', data=_as_float32_pairs(echo_data))
         else:
-            dataset = group.create_dataset('B000', data=echo_data)
+            group.create_dataset('B000', data=echo_data, **self._filter_options)
         
         # Burst 속성 작성
         self._write_burst_attributes(group, burst_name, echo_data.shape[0])
         
         # ADX 데이터 작성 (위성 상태 벡터 등)
-        if satellite_positions is not None or satellite_velocities is not None or timestamps is not None:
-            num_pulses = echo_data.shape[0]
-            adx_data = np.zeros((num_pulses, 15), dtype=np.float64)
-            
-            if timestamps is not None:
-                adx_data[:, 0] = timestamps
-                adx_data[:, 1] = timestamps + (self.config.swst)
-            
-            if satellite_positions is not None:
-                adx_data[:, 2:5] = satellite_positions
-            
-            if satellite_velocities is not None:
-                adx_data[:, 5:8] = satellite_velocities
-            
-            # 자세 및 각속도는 0으로 설정 (필요시 추가)
-            # adx_data[:, 8:12] = attitude quaternions
-            # adx_data[:, 12:15] = angular velocity
-            
+        adx_data = self._build_adx_rows(
+            0, echo_data.shape[0], satellite_positions, satellite_velocities, timestamps, ephemeris, attitude
+        )
+        if adx_data is not None:
             group.create_dataset('B000_adx', data=adx_data)
     
+    def begin_burst(
+        self,
+        group_name: str,
+        num_samples: Optional[int] = None,
+        chunk_pulses: Optional[int] = None,
+        ephemeris: Optional[Ephemeris] = None,
+        attitude: Optional[AttitudeProfile] = None,
+        cint16_scale: Optional[float] = None
+    ):
+        """
+        스트리밍 Burst 작성 시작
+        
+        펄스 방향으로 크기를 늘릴 수 있는 청크 데이터셋을 만들고, 이후 append_pulses()로
+        펄스 블록을 이어서 기록합니다. Burst 전체를 메모리에 올리지 않고 저장할 수 있습니다.
+        cint16_scale을 지정하면 int16 (I, Q) 데이터셋을 만들고, 스케일이 같은 CInt16Echo 블록은
+        그대로, 그 외 블록은 해당 스케일과 config.adc_bits로 양자화하여 기록합니다.
+        gzip 압축이면 청크를 채운 펄스만 deflate_chunk()로 직접 압축하여 기록하고, 청크를
+        채우지 못한 마지막 펄스들은 end_burst()에서 기록합니다.
+        
+        Parameters:
+        -----------
+        group_name : str
+            그룹 이름 (예: 'SSG00')
+        num_samples : int, optional
+            펄스당 샘플 수 (None이면 config.num_samples)
+        chunk_pulses : int, optional
+            청크당 펄스 수 (None이면 chunk_bytes에 맞춰 자동 계산)
+        ephemeris : Ephemeris, optional
+            위성 궤도력 (블록별 위치/속도를 펄스 시각에서 보간)
+        attitude : AttitudeProfile, optional
+            버스 자세 프로파일 (블록별 ADX 자세 쿼터니언/각속도 열을 채움)
+        cint16_scale : float, optional
+            CInt16 저장 스케일 팩터 (코드 1에 해당하는 진폭, None이면 float32 또는 BAQ 저장)
+        """
+        if self.hdf_file is None:
+            raise ValueError("HDF5 파일이 열려있지 않습니다. open()을 먼저 호출하세요.")
+        if group_name in self._streams:
+            raise ValueError(f"이미 스트리밍 중인 그룹입니다: {group_name}")
+        
+        group = self._get_group(group_name)
+        if 'B000' in group:
+            raise ValueError(f"Burst 데이터가 이미 존재합니다: {group_name}/B000")
+        
+        if num_samples is None:
+            num_samples = self.config.num_samples
+        if num_samples <= 0 or (chunk_pulses is not None and chunk_pulses <= 0):
+            raise ValueError("num_samples와 chunk_pulses는 0보다 커야 합니다.")
+        if cint16_scale is not None:
+            if cint16_scale <= 0:
+                raise ValueError(f"cint16_scale은 0보다 커야 합니다: {cint16_scale}")
+            if self.baq_bits is not None:
+                raise ValueError("BAQ 인코딩과 CInt16 저장은 함께 사용할 수 없습니다.")
+        
+        scales = None
+        deflate_level = None
+        if self.baq_bits is not None:
+            # BAQ: 펄스당 묶음 코드 행과 블록별 표준편차 행
+            row_bytes = packed_bytes_per_pulse(num_samples, self.baq_bits)
+            num_blocks = -(-num_samples // self.baq_block_samples)
+            if chunk_pulses is None:
+                chunk_pulses = max(1, self.chunk_bytes // row_bytes)
+            dataset = group.create_dataset(
+                'B000', shape=(0, row_bytes), maxshape=(None, row_bytes),
+                chunks=(chunk_pulses, row_bytes), dtype=np.uint8
+            )
+            scales = group.create_dataset(
+                'B000_baq_scale', shape=(0, num_blocks), maxshape=(None, num_blocks),
+                chunks=(chunk_pulses, num_blocks), dtype=np.float32
+            )
+            self._write_baq_attributes(dataset, num_samples)
+        else:
+            # CInt16 샘플은 float32 쌍의 절반 크기
+            sample_dtype = np.float32 if cint16_scale is None else np.int16
+            if chunk_pulses is None:
+                target_bytes = self.chunk_bytes if cint16_scale is None else 2 * self.chunk_bytes
+                chunks = choose_chunk_shape(None, num_samples, target_bytes)
+            else:
+                chunks = (chunk_pulses, num_samples, 2)
+            
+            dataset = group.create_dataset(
+                'B000',
+                shape=(0, num_samples, 2),
+                maxshape=(None, num_samples, 2),
+                chunks=chunks,
+                dtype=sample_dtype,
+                **self._filter_options
+            )
+            if cint16_scale is not None:
+                self._write_cint16_attributes(dataset, cint16_scale, self.config.adc_bits)
+            if self._filter_options.get("compression") == "gzip":
+                deflate_level = self._filter_options["compression_opts"]
+        self._write_burst_attributes(group, f"{group_name}/B000", 0)
+        
+        self._streams[group_name] = {
+            "group": group,
+            "dataset": dataset,
+            "scales": scales,
+            "cint16_scale": cint16_scale,
+            "num_samples": num_samples,
+            "adx": None,
+            "num_pulses": 0,
+            "deflate_level": deflate_level,
+            "pending": None,
+            "ephemeris": ephemeris,
+            "attitude": attitude
+        }
+    
+    def append_pulses(
+        self,
+        group_name: str,
+        echo_block: np.ndarray,
+        satellite_positions: Optional[np.ndarray] = None,
+        satellite_velocities: Optional[np.ndarray] = None,
+        timestamps: Optional[np.ndarray] = None
+    ) -> int:
+        """
+        스트리밍 Burst에 펄스 블록 추가
+        
+        Echo 블록은 complex64 버퍼를 float32 [..., 2]로 본 배열을 한 번에 기록하고
+        (BAQ 인코딩 시 블록을 인코딩하여 코드/표준편차 행을, CInt16 저장 시 int16 코드를 기록),
+        ADX 행도 같은 호출에서 이어서 기록합니다. gzip 압축이면 청크를 직접 압축하므로
+        압축 중에는 GIL이 해제됩니다 (AsyncBurstWriter에서 Echo 생성과 동시에 실행될 수 있음).
+        
+        Parameters:
+        -----------
+        group_name : str
+            begin_burst()로 시작한 그룹 이름
+        echo_block : np.ndarray 또는 CInt16Echo
+            Echo 블록 (shape: [block_pulses, num_samples], 복소수)
+        satellite_positions : np.ndarray, optional
+            블록 위성 위치 (shape: [block_pulses, 3], 단위: m)
+        satellite_velocities : np.ndarray, optional
+            블록 위성 속도 (shape: [block_pulses, 3], 단위: m/s)
+        timestamps : np.ndarray, optional
+            블록 타임스탬프 (shape: [block_pulses], 단위: s)
+        
+        Returns:
+        --------
+        int
+            지금까지 기록된 전체 펄스 개수
+        """
+        stream = self._streams.get(group_name)
+        if stream is None:
+            raise ValueError(f"스트리밍 중인 그룹이 아닙니다. begin_burst()를 먼저 호출하세요: {group_name}")
+        
+        dataset = stream["dataset"]
+        if stream["cint16_scale"] is not None:
+            echo_block = _as_cint16(echo_block, stream["cint16_scale"], self.config.adc_bits)
+        else:
+            echo_block = np.asarray(echo_block, dtype=np.complex64)
+        num_samples = stream["num_samples"]
+        if echo_block.ndim != 2 or echo_block.shape[1] != num_samples:
+            raise ValueError(f"Echo 블록은 [펄스 수, {num_samples}] 배열이어야 합니다.")
+        
+        first_pulse = stream["num_pulses"]
+        block_pulses = echo_block.shape[0]
+        
+        # ADX 행은 첫 블록부터 모든 블록에 있어야 펄스 행과 맞춰짐
+        adx_rows = self._build_adx_rows(
+            first_pulse, block_pulses, satellite_positions, satellite_velocities, timestamps,
+            stream["ephemeris"], stream["attitude"]
+        )
+        if adx_rows is None and stream["adx"] is not None:
+            raise ValueError("ADX를 기록 중인 Burst에는 모든 블록의 위성 상태가 필요합니다.")
+        if adx_rows is not None and stream["adx"] is None:
+            if first_pulse > 0:
+                raise ValueError("ADX는 첫 블록부터 기록해야 합니다.")
+            stream["adx"] = stream["group"].create_dataset(
+                'B000_adx',
+                shape=(0, 15),
+                maxshape=(None, 15),
+                chunks=(_ADX_CHUNK_ROWS, 15),
+                dtype=np.float64
+            )
+        
+        end_pulse = first_pulse + block_pulses
+        dataset.resize(end_pulse, axis=0)
+        if stream["scales"] is not None:
+            encoded = baq_encode(echo_block, self.baq_bits, self.baq_block_samples)
+            dataset[first_pulse:end_pulse] = encoded.codes
+            stream["scales"].resize(end_pulse, axis=0)
+            stream["scales"][first_pulse:end_pulse] = encoded.scales
+        else:
+            rows = echo_block.data if stream["cint16_scale"] is not None else _as_float32_pairs(echo_block)
+            if stream["deflate_level"] is not None:
+                self._write_deflate_rows(stream, first_pulse, rows)
+            else:
+                dataset[first_pulse:end_pulse] = rows
+        if adx_rows is not None:
+            stream["adx"].resize(end_pulse, axis=0)
+            stream["adx"][first_pulse:end_pulse] = adx_rows
+        
+        stream["num_pulses"] = end_pulse
+        dataset.attrs['Lines per Burst'] = end_pulse
+        return end_pulse
+    
+    def end_burst(self, group_name: str) -> int:
+        """
+        스트리밍 Burst 작성 종료
+        
+        Parameters:
+        -----------
+        group_name : str
+            begin_burst()로 시작한 그룹 이름
+        
+        Returns:
+        --------
+        int
+            기록된 전체 펄스 개수
+        """
+        stream = self._streams.pop(group_name, None)
+        if stream is None:
+            raise ValueError(f"스트리밍 중인 그룹이 아닙니다: {group_name}")
+        self._flush_pending_pulses(stream)
+        self.hdf_file.flush()
+        return stream["num_pulses"]
+    
+    def _write_deflate_rows(self, stream: Dict[str, Any], first_pulse: int, rows: np.ndarray):
+        """
+        gzip 스트리밍 Burst에 펄스 행 기록
+        
+        이전 호출에서 남은 펄스와 합쳐 청크를 채운 펄스만 기록하고, 나머지는 복사하여 보관합니다.
+        
+        Parameters:
+        -----------
+        stream : Dict[str, Any]
+            스트리밍 Burst 상태
+        first_pulse : int
+            rows 첫 펄스 인덱스
+        rows : np.ndarray
+            펄스 행 (shape: [block_pulses, num_samples, 2])
+        """
+        pending = stream["pending"]
+        if pending is not None:
+            first_pulse -= pending.shape[0]
+            rows = np.concatenate([pending, rows])
+        
+        chunk_pulses = stream["dataset"].chunks[0]
+        num_full = rows.shape[0] // chunk_pulses * chunk_pulses
+        _write_deflate_chunks(stream["dataset"], first_pulse, rows[:num_full], stream["deflate_level"])
+        stream["pending"] = rows[num_full:].copy() if num_full < rows.shape[0] else None
+    
+    def _flush_pending_pulses(self, stream: Dict[str, Any]):
+        """gzip 스트리밍 Burst에서 청크를 채우지 못한 마지막 펄스 기록"""
+        pending = stream.get("pending")
+        if pending is not None:
+            first_pulse = stream["num_pulses"] - pending.shape[0]
+            _write_deflate_chunks(stream["dataset"], first_pulse, pending, stream["deflate_level"])
+            stream["pending"] = None
+    
+    def _get_group(self, group_name: str) -> h5py.Group:
+        """그룹 조회 (없으면 생성 후 그룹 속성 작성)"""
+        if group_name not in self.hdf_file:
+            group = self.hdf_file.create_group(group_name)
+            self._write_group_attributes(group)
+        else:
+            group = self.hdf_file[group_name]
+        return group
+    
+    def _build_adx_rows(
+        self,
+        first_pulse: int,
+        num_pulses: int,
+        satellite_positions: Optional[np.ndarray],
+        satellite_velocities: Optional[np.ndarray],
+        timestamps: Optional[np.ndarray],
+        ephemeris: Optional[Ephemeris],
+        attitude: Optional[AttitudeProfile]
+    ) -> Optional[np.ndarray]:
+        """
+        펄스 구간 [first_pulse, first_pulse + num_pulses)의 ADX 행 생성
+        
+        Returns:
+        --------
+        Optional[np.ndarray]
+            ADX 행 (shape: [num_pulses, 15]), 기록할 위성 상태가 없으면 None
+        """
+        pulse_indices = first_pulse + np.arange(num_pulses)
+        
+        # 궤도력에서 펄스별 위성 상태 보간
+        if ephemeris is not None:
+            if timestamps is None:
+                timestamps = ephemeris.start_time + pulse_indices / self.config.prf
+            ephemeris_positions, ephemeris_velocities = ephemeris.evaluate(timestamps)
+            if satellite_positions is None:
+                satellite_positions = ephemeris_positions
+            if satellite_velocities is None:
+                satellite_velocities = ephemeris_velocities
+        
+        if satellite_positions is None and satellite_velocities is None and timestamps is None:
+            return None
+        
+        adx_data = np.zeros((num_pulses, 15), dtype=np.float64)
+        
+        if timestamps is not None:
+            adx_data[:, 0] = timestamps
+            adx_data[:, 1] = timestamps + (self.config.swst)
+        
+        if satellite_positions is not None:
+            adx_data[:, 2:5] = satellite_positions
+        
+        if satellite_velocities is not None:
+            adx_data[:, 5:8] = satellite_velocities
+        
+        # 자세: 동체 → ECEF 쿼터니언 [w, x, y, z], 동체 좌표계 각속도 (rad/s)
+        if attitude is not None:
+            if satellite_positions is None or satellite_velocities is None:
+                raise ValueError("자세 계산에는 위성 위치와 속도가 필요합니다.")
+            attitude_times = timestamps if timestamps is not None else pulse_indices / self.config.prf
+            adx_data[:, 8:12] = attitude.body_to_ecef_quaternions(
+                attitude_times, satellite_positions, satellite_velocities
+            )
+            adx_data[:, 12:15] = attitude.angular_velocities(attitude_times)
+        
+        return adx_data
+    
     def _write_group_attributes(self, group: h5py.Group):
         """그룹 속성 작성"""
         group.attrs['Beam ID'] = self.config.beam_id
@@ -165,3 +528,45 @@ class RawDataWriter:
         burst = group[burst_name.split('/')[-1]]
         burst.attrs['Lines per Burst'] = num_pulses
         burst.attrs['Range Chirp Samples'] = self.config.num_samples_in_chirp
+    
+    def _write_baq_attributes(self, dataset: h5py.Dataset, num_samples: int):
+        """BAQ 인코딩 속성 작성 (묶음 코드 데이터셋에는 샘플 수가 드러나지 않으므로 함께 기록)"""
+        dataset.attrs['Encoding'] = 'BAQ'
+        dataset.attrs['BAQ Bits'] = self.baq_bits
+        dataset.attrs['BAQ Block Samples'] = self.baq_block_samples
+        dataset.attrs['Samples per Line'] = num_samples
+        dataset.attrs['ADC Bits'] = self.config.adc_bits
+    
+    def _write_cint16_attributes(self, dataset: h5py.Dataset, scale: float, adc_bits: int):
+        """CInt16 저장 속성 작성 (복소 샘플 = (I + jQ) * Scale Factor)"""
+        dataset.attrs['Encoding'] = 'CINT16'
+        dataset.attrs['Scale Factor'] = scale
+        dataset.attrs['ADC Bits'] = adc_bits
+
+
+def _write_deflate_chunks(dataset: h5py.Dataset, first_pulse: int, rows: np.ndarray, level: int):
+    """청크 경계에서 시작하는 펄스 행을 청크마다 직접 압축하여 기록 (끝 청크는 0으로 채움)"""
+    chunk_pulses, chunk_samples = dataset.chunks[:2]
+    num_samples = rows.shape[1]
+    for r0 in range(0, rows.shape[0], chunk_pulses):
+        for s0 in range(0, num_samples, chunk_samples):
+            chunk = rows[r0:r0 + chunk_pulses, s0:s0 + chunk_samples]
+            if chunk.shape[:2] != (chunk_pulses, chunk_samples):
+                padded = np.zeros((chunk_pulses, chunk_samples, 2), dtype=rows.dtype)
+                padded[:chunk.shape[0], :chunk.shape[1]] = chunk
+                chunk = padded
+            dataset.id.write_direct_chunk((first_pulse + r0, s0, 0), deflate_chunk(chunk, level))
+
+
+def _as_cint16(echo_block: Union[np.ndarray, CInt16Echo], scale: float, adc_bits: int) -> CInt16Echo:
+    """스트리밍 CInt16 Burst의 스케일로 블록 변환 (스케일이 같은 CInt16Echo는 그대로 사용)"""
+    if isinstance(echo_block, CInt16Echo) and echo_block.scale == scale:
+        return echo_block
+    full_scale = scale * ((1 << (adc_bits - 1)) - 1)
+    return quantize_cint16(np.asarray(echo_block), adc_bits, full_scale)
+
+
+def _as_float32_pairs(echo_data: np.ndarray) -> np.ndarray:
+    """complex64 배열을 복사 없이 float32 [..., 2] (실수, 허수) 배열로 변환"""
+    echo_data = np.ascontiguousarray(echo_data, dtype=np.complex64)
+    return echo_data.view(np.float32).reshape(echo_data.shape + (2,))
@@ -0,0 +1,359 @@
+"""
+Scene 파일 입출력
+
+대규모 타겟 Scene을 HDF5 기반 바이너리 형식으로 저장하고,
+빔 footprint와 겹치는 타일만 memory-map으로 읽어오는 모듈입니다.
+
+파일 구조:
+- /targets : [num_targets, 5] float64 (contiguous, 타일 순서로 정렬)
+             각 행: [x, y, z, reflectivity, phase]
+- /attributes/<name> : [num_targets] 추가 속성 (targets와 같은 순서)
+- /tiles : [num_tiles, 6] float64
+           각 행: [start, stop, center_x, center_y, center_z, radius]
+- 루트 속성: CRS, Bounds([lat_min, lon_min, lat_max, lon_max]), Height Range, Tile Size 등
+"""
+
+import h5py
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from sar_simulator.common.coordinates import ecef_to_llh
+from sar_simulator.common.target_model import TargetList, TARGET_ARRAY_COLUMNS
+from sar_simulator.orbit.ground_track import decimate_indices
+
+
+SCENE_FILE_VERSION: int = 1
+SCENE_FILE_CRS: str = "EPSG:4978"  # WGS84 ECEF
+
+# Bounds 계산 시 한 번에 변환할 타겟 수
+_BOUNDS_BLOCK_SIZE = 1 << 20
+
+# 빔 원뿔 검사에 사용할 최대 펄스 수 (궤적을 균등 간격으로 추출)
+_BEAM_SAMPLE_POINTS = 256
+
+# 빔 원뿔 검사 시 한 번에 계산할 (펄스 × 타일) 원소 수
+_BEAM_BLOCK_SIZE = 1 << 20
+
+
+def write_scene_file(
+    filepath: Union[str, Path],
+    target_list: TargetList,
+    tile_size: float = 1000.0
+) -> Path:
+    """
+    TargetList를 Scene 파일로 저장
+    
+    타겟은 tile_size 크기의 ECEF 격자 타일 순서로 정렬되어 저장되며,
+    타일별 경계 구(bounding sphere)가 함께 기록됩니다.
+    
+    Parameters:
+    -----------
+    filepath : str or Path
+        저장할 파일 경로 (기존 파일은 덮어씀)
+    target_list : TargetList
+        저장할 타겟 리스트
+    tile_size : float
+        타일 한 변의 길이 (ECEF 격자, 단위: m, 기본값: 1000.0)
+    
+    Returns:
+    --------
+    Path
+        저장된 파일 경로
+    """
+    if tile_size <= 0:
+        raise ValueError("tile_size는 0보다 커야 합니다.")
+    
+    filepath = Path(filepath)
+    data = target_list.to_array()
+    positions = data[:, 0:3]
+    num_targets = len(target_list)
+    
+    # 타일 키 계산 및 타일 순서로 정렬
+    if num_targets > 0:
+        cells = np.floor(positions / tile_size).astype(np.int64)
+        cells -= cells.min(axis=0)
+        keys = np.ravel_multi_index(cells.T, tuple(cells.max(axis=0) + 1))
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    else:
+        order = np.zeros(0, dtype=np.int64)
+        starts = np.zeros(0, dtype=np.int64)
+    
+    sorted_data = data[order]
+    tiles = _calc_tile_table(sorted_data[:, 0:3], starts)
+    lat_range, lon_range, height_range = _calc_bounds(sorted_data[:, 0:3])
+    
+    with h5py.File(filepath, 'w') as hdf_file:
+        hdf_file.attrs['Product Type'] = 'SAR_SCENE'
+        hdf_file.attrs['Format Version'] = SCENE_FILE_VERSION
+        hdf_file.attrs['CRS'] = SCENE_FILE_CRS
+        hdf_file.attrs['Bounds'] = [lat_range[0], lon_range[0], lat_range[1], lon_range[1]]
+        hdf_file.attrs['Height Range'] = list(height_range)
+        hdf_file.attrs['Tile Size'] = tile_size
+        hdf_file.attrs['Number of Targets'] = num_targets
+        
+        # memory-map 가능하도록 청크/압축 없이 contiguous로 저장
+        hdf_file.create_dataset('targets', data=sorted_data)
+        hdf_file.create_dataset('tiles', data=tiles)
+        
+        attributes = hdf_file.create_group('attributes')
+        for name, values in target_list.attributes.items():
+            attributes.create_dataset(name, data=values[order])
+    
+    return filepath
+
+
+class SceneFile:
+    """
+    Scene 파일 리더 클래스
+    
+    파일을 열 때는 헤더와 타일 테이블만 읽고, 타겟 데이터는 memory-map으로
+    연결만 해 둡니다. load()에서 선택된 타일 구간만 디스크에서 읽습니다.
+    """
+    
+    def __init__(self, filepath: Union[str, Path]):
+        """
+        SceneFile 초기화
+        
+        Parameters:
+        -----------
+        filepath : str or Path
+            Scene 파일 경로
+        """
+        self.filepath = Path(filepath)
+        self.hdf_file: Optional[h5py.File] = None
+        self.tiles: Optional[np.ndarray] = None
+        self._targets: Optional[np.ndarray] = None
+        self._attributes: Dict[str, np.ndarray] = {}
+    
+    def open(self):
+        """Scene 파일 열기 (헤더 및 타일 테이블 로드)"""
+        if self.hdf_file is not None:
+            return
+        
+        self.hdf_file = h5py.File(self.filepath, 'r')
+        if self.hdf_file.attrs.get('Product Type') != 'SAR_SCENE':
+            self.close()
+            raise ValueError(f"Scene 파일이 아닙니다: {self.filepath}")
+        
+        self.tiles = self.hdf_file['tiles'][...]
+        self._targets = self._map_dataset(self.hdf_file['targets'])
+        self._attributes = {
+            name: self._map_dataset(dataset)
+            for name, dataset in self.hdf_file['attributes'].items()
+        }
+    
+    def close(self):
+        """Scene 파일 닫기"""
+        if self.hdf_file is not None:
+            self.hdf_file.close()
+            self.hdf_file = None
+        self._targets = None
+        self._attributes = {}
+    
+    def __enter__(self):
+        """Context manager 진입"""
+        self.open()
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager 종료"""
+        self.close()
+    
+    @property
+    def num_targets(self) -> int:
+        """전체 타겟 수"""
+        return int(self._require_open().attrs['Number of Targets'])
+    
+    @property
+    def crs(self) -> str:
+        """좌표계 식별자"""
+        return str(self._require_open().attrs['CRS'])
+    
+    @property
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """지리 경계 (lat_min, lon_min, lat_max, lon_max) (단위: deg)"""
+        return tuple(float(v) for v in self._require_open().attrs['Bounds'])
+    
+    def select_tiles_in_beam(
+        self,
+        satellite_positions: np.ndarray,
+        beam_directions: np.ndarray,
+        half_angle: float
+    ) -> np.ndarray:
+        """
+        빔 원뿔과 겹치는 타일 선택
+        
+        타일 경계 구가 하나 이상의 위성 위치에서의 빔 원뿔(반각 half_angle)과
+        겹치면 선택됩니다. 펄스가 많으면 최대 _BEAM_SAMPLE_POINTS개로 균등 간격
+        추출한 펄스만 검사하고, 추출 간격 동안의 위성 이동 거리만큼 경계 구 반경을,
+        빔 방향 변화만큼 원뿔 반각을 넓혀 추출로 빠지는 타일이 없도록 합니다.
+        
+        Parameters:
+        -----------
+        satellite_positions : np.ndarray
+            위성 위치 (shape: [3] 또는 [num_pulses, 3], 단위: m)
+        beam_directions : np.ndarray
+            빔 방향 벡터 (shape: [3] 또는 [num_pulses, 3])
+        half_angle : float
+            빔 원뿔 반각 (단위: rad)
+        
+        Returns:
+        --------
+        np.ndarray
+            타일 선택 마스크 (shape: [num_tiles], dtype: bool)
+        """
+        self._require_open()
+        satellite_positions = np.atleast_2d(np.asarray(satellite_positions, dtype=np.float64))
+        beam_directions = np.atleast_2d(np.asarray(beam_directions, dtype=np.float64))
+        beam_directions = beam_directions / np.linalg.norm(beam_directions, axis=1, keepdims=True)
+        beam_directions = np.broadcast_to(beam_directions, satellite_positions.shape)
+        
+        # 균등 간격 펄스 추출 및 추출 간격만큼 경계 구/원뿔 확장
+        indices = decimate_indices(len(satellite_positions), _BEAM_SAMPLE_POINTS)
+        positions = satellite_positions[indices]
+        directions = beam_directions[indices]
+        spacing = 0.0
+        turn = 0.0
+        if len(indices) < len(satellite_positions):
+            spacing = float(np.max(np.linalg.norm(np.diff(positions, axis=0), axis=1)))
+            cos_turn = np.sum(directions[1:] * directions[:-1], axis=1)
+            turn = float(np.max(np.arccos(np.clip(cos_turn, -1.0, 1.0))))
+        
+        centers = self.tiles[:, 2:5]
+        radii = self.tiles[:, 5] + spacing
+        selected = np.zeros(len(self.tiles), dtype=bool)
+        if len(self.tiles) == 0:
+            return selected
+        
+        # (펄스 × 타일) 블록 단위 벡터화 검사
+        block_size = max(1, _BEAM_BLOCK_SIZE // len(self.tiles))
+        for start in range(0, len(positions), block_size):
+            vectors = centers[np.newaxis, :, :] - positions[start:start + block_size, np.newaxis, :]
+            distances = np.linalg.norm(vectors, axis=2)
+            cos_angle = np.einsum('ptk,pk->pt', vectors, directions[start:start + block_size]) / distances
+            angle = np.arccos(np.clip(cos_angle, -1.0, 1.0))
+            
+            # 경계 구가 원뿔 축에서 보이는 각 반경
+            angular_radius = np.arcsin(np.clip(radii / np.maximum(distances, radii), 0.0, 1.0))
+            selected |= np.any((angle - angular_radius) <= half_angle + turn, axis=0)
+        
+        return selected
+    
+    def load(
+        self,
+        satellite_positions: Optional[np.ndarray] = None,
+        beam_directions: Optional[np.ndarray] = None,
+        half_angle: Optional[float] = None
+    ) -> TargetList:
+        """
+        타겟 로드
+        
+        빔 정보가 주어지지 않으면 전체 Scene을 memory-map view로 반환하고
+        (복사 없음), 주어지면 빔 footprint와 겹치는 타일만 읽습니다.
+        
+        Parameters:
+        -----------
+        satellite_positions : np.ndarray, optional
+            위성 위치 (shape: [3] 또는 [num_pulses, 3], 단위: m)
+        beam_directions : np.ndarray, optional
+            빔 방향 벡터 (shape: [3] 또는 [num_pulses, 3])
+            None이면 지구 중심 방향
+        half_angle : float, optional
+            빔 원뿔 반각 (단위: rad)
+        
+        Returns:
+        --------
+        TargetList
+            로드된 타겟 리스트
+        """
+        self._require_open()
+        
+        if satellite_positions is None:
+            return TargetList.from_array(self._targets, **self._attributes)
+        
+        if half_angle is None:
+            raise ValueError("satellite_positions가 주어진 경우 half_angle이 필요합니다.")
+        
+        satellite_positions = np.atleast_2d(np.asarray(satellite_positions, dtype=np.float64))
+        if beam_directions is None:
+            beam_directions = -satellite_positions
+        
+        selected = self.select_tiles_in_beam(satellite_positions, beam_directions, half_angle)
+        slices = self._merge_tile_ranges(self.tiles[selected, 0:2].astype(np.int64))
+        
+        data = self._read_slices(self._targets, slices, (0, TARGET_ARRAY_COLUMNS))
+        attributes = {
+            name: self._read_slices(values, slices, (0,))
+            for name, values in self._attributes.items()
+        }
+        return TargetList.from_array(data, **attributes)
+    
+    def _require_open(self) -> h5py.File:
+        """열린 HDF5 파일 반환"""
+        if self.hdf_file is None:
+            raise ValueError("Scene 파일이 열려있지 않습니다. open()을 먼저 호출하세요.")
+        return self.hdf_file
+    
+    def _map_dataset(self, dataset: h5py.Dataset) -> np.ndarray:
+        """contiguous 데이터셋을 memory-map으로 연결 (불가능하면 전체 읽기)"""
+        offset = dataset.id.get_offset()
+        if offset is None or dataset.size == 0:
+            return dataset[...]
+        return np.memmap(self.filepath, dtype=dataset.dtype, mode='r', offset=offset, shape=dataset.shape)
+    
+    @staticmethod
+    def _merge_tile_ranges(ranges: np.ndarray) -> List[Tuple[int, int]]:
+        """인접한 타일 구간 [start, stop)을 병합"""
+        slices: List[Tuple[int, int]] = []
+        for start, stop in ranges:
+            if slices and slices[-1][1] == start:
+                slices[-1] = (slices[-1][0], stop)
+            else:
+                slices.append((start, stop))
+        return slices
+    
+    @staticmethod
+    def _read_slices(source: np.ndarray, slices: List[Tuple[int, int]], empty_shape: Tuple[int, ...]) -> np.ndarray:
+        """선택된 구간만 읽어 하나의 배열로 결합"""
+        if not slices:
+            return np.zeros(empty_shape, dtype=source.dtype)
+        return np.concatenate([np.asarray(source[start:stop]) for start, stop in slices])
+
+
+def _calc_tile_table(sorted_positions: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """타일별 [start, stop, center_x, center_y, center_z, radius] 테이블 계산"""
+    tiles = np.zeros((len(starts), 6), dtype=np.float64)
+    if len(starts) == 0:
+        return tiles
+    
+    stops = np.r_[starts[1:], len(sorted_positions)]
+    box_min = np.minimum.reduceat(sorted_positions, starts, axis=0)
+    box_max = np.maximum.reduceat(sorted_positions, starts, axis=0)
+    
+    tiles[:, 0] = starts
+    tiles[:, 1] = stops
+    tiles[:, 2:5] = 0.5 * (box_min + box_max)
+    tiles[:, 5] = 0.5 * np.linalg.norm(box_max - box_min, axis=1)
+    return tiles
+
+
+def _calc_bounds(positions: np.ndarray) -> Tuple[Tuple[float, float], Tuple[float, float], Tuple[float, float]]:
+    """타겟 위치의 위도/경도/고도 범위 계산 (블록 단위 변환)"""
+    if len(positions) == 0:
+        return (0.0, 0.0), (0.0, 0.0), (0.0, 0.0)
+    
+    lat_range = [np.inf, -np.inf]
+    lon_range = [np.inf, -np.inf]
+    height_range = [np.inf, -np.inf]
+    
+    for start in range(0, len(positions), _BOUNDS_BLOCK_SIZE):
+        block = positions[start:start + _BOUNDS_BLOCK_SIZE]
+        lat, lon, h = ecef_to_llh(block[:, 0], block[:, 1], block[:, 2])
+        for value_range, values in ((lat_range, lat), (lon_range, lon), (height_range, h)):
+            value_range[0] = min(value_range[0], float(np.min(values)))
+            value_range[1] = max(value_range[1], float(np.max(values)))
+    
+    return tuple(lat_range), tuple(lon_range), tuple(height_range)
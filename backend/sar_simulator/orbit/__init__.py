@@ -0,0 +1,50 @@
+"""
+궤도 모듈
+
+위성 궤도 전파, 펄스 단위 상태 벡터 생성, 지상 궤적/Swath 계산, 관측 기회 탐색 및 버스 자세 계산을 담당합니다.
+"""
+
+from sar_simulator.orbit.kepler_propagator import KeplerianElements, KeplerPropagator
+from sar_simulator.orbit.tle_propagator import TlePropagator
+from sar_simulator.orbit.ephemeris import Ephemeris
+from sar_simulator.orbit.ground_track import decimate_indices, calc_look_directions, calculate_swath_footprint
+from sar_simulator.orbit.access_window import (
+    AccessWindow,
+    estimate_rank,
+    calc_slant_range_window,
+    slant_range_to_off_nadir,
+    calc_off_nadir_limits,
+    find_access_windows,
+)
+from sar_simulator.orbit.attitude import (
+    AttitudeProfile,
+    quaternion_multiply,
+    quaternion_from_euler,
+    quaternion_to_matrix,
+    matrix_to_quaternion,
+    rotate_vectors,
+    orbital_frame,
+)
+
+__all__ = [
+    "KeplerianElements",
+    "KeplerPropagator",
+    "TlePropagator",
+    "Ephemeris",
+    "decimate_indices",
+    "calc_look_directions",
+    "calculate_swath_footprint",
+    "AccessWindow",
+    "estimate_rank",
+    "calc_slant_range_window",
+    "slant_range_to_off_nadir",
+    "calc_off_nadir_limits",
+    "find_access_windows",
+    "AttitudeProfile",
+    "quaternion_multiply",
+    "quaternion_from_euler",
+    "quaternion_to_matrix",
+    "matrix_to_quaternion",
+    "rotate_vectors",
+    "orbital_frame",
+]
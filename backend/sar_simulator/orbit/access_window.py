@@ -0,0 +1,385 @@
+"""
+관측 기회(Access Window) 탐색
+
+SAR 시스템 설정의 샘플링 윈도우(swst/swl)로부터 관측 가능한 off-nadir 각도 범위를 구하고,
+궤도 전파 결과에서 여러 관심 지역(AOI)을 관측할 수 있는 시간 구간을 찾습니다.
+거친 시간 격자에서 전체 AOI를 행렬 연산으로 한 번에 평가한 뒤,
+구간 시작/종료 시각을 제약 조건 여유값의 근 찾기(이분법)로 정밀화합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Callable, List, Tuple
+
+from sar_simulator.common.constants import LIGHT_SPEED
+from sar_simulator.common.coordinates import WGS84_A, enu_rotation, llh_to_ecef
+from sar_simulator.common.sar_system_config import SarSystemConfig
+
+
+# 격자 평가 시 한 번에 처리하는 최대 원소 수 (시간 × AOI)
+_GRID_CHUNK_ELEMENTS = 2_000_000
+
+# 거친 격자 여유값 행렬의 최대 원소 수 (격자 시각 × AOI, float64 약 160 MB)
+MAX_GRID_ELEMENTS = 20_000_000
+
+# 세분 단계마다 구간을 나누는 개수
+_SUBDIVISIONS = 8
+
+# 여유값 변화율 상한의 안전 계수
+_RATE_SAFETY_FACTOR = 1.5
+
+
+@dataclass
+class AccessWindow:
+    """
+    관측 가능 시간 구간
+    
+    Attributes:
+    -----------
+    aoi_index : int
+        관심 지역 인덱스
+    start_time : float
+        구간 시작 시각 (단위: s, 탐색 시작 기준)
+    end_time : float
+        구간 종료 시각 (단위: s, 탐색 시작 기준)
+    """
+    aoi_index: int
+    start_time: float
+    end_time: float
+    
+    @property
+    def duration(self) -> float:
+        """구간 길이 (단위: s)"""
+        return self.end_time - self.start_time
+
+
+def estimate_rank(config: SarSystemConfig, nominal_look_angle: float = 30.0) -> int:
+    """
+    Rank(수신 창 이전에 송신된 펄스 수) 추정
+    
+    rank = ceil((2·h/cos(look_angle)/c - swst)·prf)
+    
+    Parameters:
+    -----------
+    config : SarSystemConfig
+        SAR 시스템 설정
+    nominal_look_angle : float
+        공칭 look angle (단위: deg, 기본값: 30)
+    
+    Returns:
+    --------
+    int
+        추정 rank (0 이상)
+    """
+    min_range = config.orbit_height / np.cos(np.deg2rad(nominal_look_angle))
+    return max(0, int(np.ceil((2.0 * min_range / LIGHT_SPEED - config.swst) * config.prf)))
+
+
+def calc_slant_range_window(config: SarSystemConfig, rank: int) -> Tuple[float, float]:
+    """
+    샘플링 윈도우에 해당하는 near/far slant range 계산
+    
+    near = c/2·(rank/prf + swst), far = c/2·(rank/prf + swst + swl - taup)
+    
+    Parameters:
+    -----------
+    config : SarSystemConfig
+        SAR 시스템 설정
+    rank : int
+        Rank
+    
+    Returns:
+    --------
+    Tuple[float, float]
+        (near slant range, far slant range) (단위: m)
+    """
+    near = 0.5 * LIGHT_SPEED * (rank / config.prf + config.swst)
+    far = 0.5 * LIGHT_SPEED * (rank / config.prf + config.swst + config.swl - config.taup)
+    return near, far
+
+
+def slant_range_to_off_nadir(slant_range, orbit_height: float, earth_radius: float = WGS84_A):
+    """
+    구형 지구 가정에서 slant range를 off-nadir 각도로 변환
+    
+    Parameters:
+    -----------
+    slant_range : float or np.ndarray
+        Slant range (단위: m, 궤도 높이 이상 지평선 거리 이하)
+    orbit_height : float
+        궤도 높이 (단위: m)
+    earth_radius : float
+        지구 반경 (단위: m, 기본값: WGS84 장반경)
+    
+    Returns:
+    --------
+    float or np.ndarray
+        Off-nadir 각도 (단위: deg)
+    """
+    satellite_radius = earth_radius + orbit_height
+    horizon_range = np.sqrt(satellite_radius**2 - earth_radius**2)
+    if np.any(slant_range < orbit_height) or np.any(slant_range > horizon_range):
+        raise ValueError(
+            f"slant range는 궤도 높이({orbit_height:.0f} m)와 지평선 거리({horizon_range:.0f} m) 사이여야 합니다."
+        )
+    cos_angle = (satellite_radius**2 + slant_range**2 - earth_radius**2) / (2.0 * satellite_radius * slant_range)
+    return np.rad2deg(np.arccos(np.clip(cos_angle, -1.0, 1.0)))
+
+
+def calc_off_nadir_limits(config: SarSystemConfig, nominal_look_angle: float = 30.0) -> Tuple[float, float]:
+    """
+    샘플링 윈도우(swst/swl)로 관측 가능한 off-nadir 각도 범위 계산
+    
+    Parameters:
+    -----------
+    config : SarSystemConfig
+        SAR 시스템 설정
+    nominal_look_angle : float
+        Rank 추정에 사용할 공칭 look angle (단위: deg, 기본값: 30)
+    
+    Returns:
+    --------
+    Tuple[float, float]
+        (최소 off-nadir 각도, 최대 off-nadir 각도) (단위: deg)
+    """
+    near, far = calc_slant_range_window(config, estimate_rank(config, nominal_look_angle))
+    if far <= near:
+        raise ValueError("샘플링 윈도우 길이(swl)는 펄스 폭(taup)보다 커야 합니다.")
+    return (
+        float(slant_range_to_off_nadir(near, config.orbit_height)),
+        float(slant_range_to_off_nadir(far, config.orbit_height))
+    )
+
+
+def find_access_windows(
+    propagate: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+    aoi_locations: np.ndarray,
+    duration: float,
+    off_nadir_range: Tuple[float, float],
+    look_side: str = "right",
+    step: float = 20.0,
+    resolution: float = 0.5,
+    tolerance: float = 1e-3,
+    min_elevation: float = 0.0
+) -> List[AccessWindow]:
+    """
+    여러 관심 지역의 관측 가능 시간 구간 탐색
+    
+    관측 조건은 위성에서 본 AOI의 off-nadir 각도가 off_nadir_range 안에 있고,
+    AOI에서 본 위성 고도각이 min_elevation 이상이며, AOI가 look_side 쪽에 있는 것입니다.
+    조건 여유값(deg)의 최대 변화율 L로 격자 구간 안에서 여유값이 0이 될 수 있는지 판정하여,
+    step 간격 격자에서 시작해 가능성이 있는 (구간, AOI) 쌍만 resolution 이하가 될 때까지 세분하고,
+    부호가 바뀌는 구간의 경계를 tolerance까지 이분법으로 정밀화합니다.
+    resolution보다 짧은 구간(또는 구간 사이 간격)만 놓칠 수 있습니다.
+    거친 격자 (duration / step + 1) × AOI 개수가 MAX_GRID_ELEMENTS를 넘으면 ValueError를 발생시킵니다.
+    
+    Parameters:
+    -----------
+    propagate : Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]]
+        탐색 시작 기준 경과 시간(s) 배열 → ECEF (위치, 속도) 전파 함수
+        (예: KeplerPropagator.propagate, functools.partial(TlePropagator.propagate, start_time=...))
+    aoi_locations : np.ndarray
+        관심 지역 (지리 좌표: [위도, 경도] 또는 [위도, 경도, 고도], shape: [A, 2 또는 3], 단위: [deg, deg, m])
+    duration : float
+        탐색 기간 (단위: s)
+    off_nadir_range : Tuple[float, float]
+        관측 가능 off-nadir 각도 범위 (단위: deg)
+    look_side : str
+        관측 방향 ("right", "left", "both")
+    step : float
+        거친 격자 시간 간격 (단위: s, 기본값: 20)
+    resolution : float
+        세분 종료 구간 길이 (단위: s, 기본값: 0.5)
+    tolerance : float
+        구간 경계 시각 정밀도 (단위: s, 기본값: 1e-3)
+    min_elevation : float
+        AOI에서 본 최소 위성 고도각 (단위: deg, 기본값: 0)
+    
+    Returns:
+    --------
+    List[AccessWindow]
+        시작 시각 순으로 정렬된 관측 가능 구간 목록
+    """
+    if look_side not in ("right", "left", "both"):
+        raise ValueError("look_side는 'right', 'left', 'both' 중 하나여야 합니다.")
+    if duration <= 0 or step <= 0 or resolution <= 0 or tolerance <= 0:
+        raise ValueError("duration, step, resolution, tolerance는 0보다 커야 합니다.")
+    min_angle, max_angle = off_nadir_range
+    if not 0.0 <= min_angle < max_angle < 90.0:
+        raise ValueError("off_nadir_range는 0 <= 최소 < 최대 < 90 (deg)이어야 합니다.")
+    
+    aoi_locations = np.atleast_2d(np.asarray(aoi_locations, dtype=np.float64))
+    if aoi_locations.ndim != 2 or aoi_locations.shape[1] not in (2, 3):
+        raise ValueError("aoi_locations는 [A, 2] 또는 [A, 3] 배열이어야 합니다.")
+    latitudes = aoi_locations[:, 0]
+    longitudes = aoi_locations[:, 1]
+    heights = aoi_locations[:, 2] if aoi_locations.shape[1] == 3 else np.zeros(len(aoi_locations))
+    targets = llh_to_ecef(latitudes, longitudes, heights)
+    normals = enu_rotation(latitudes, longitudes)[:, 2, :]
+    num_aoi = len(targets)
+    num_steps = int(np.ceil(duration / step))
+    if (num_steps + 1) * num_aoi > MAX_GRID_ELEMENTS:
+        raise ValueError(
+            f"탐색 격자가 너무 큽니다: 격자 시각 {num_steps + 1} × AOI {num_aoi} > {MAX_GRID_ELEMENTS} "
+            "(duration을 줄이거나 step을 늘리세요)"
+        )
+    
+    def pair_margin(times: np.ndarray, index: np.ndarray) -> np.ndarray:
+        # 같은 시각은 한 번만 전파
+        unique_times, inverse = np.unique(times, return_inverse=True)
+        positions, velocities = propagate(unique_times)
+        return _access_margin(
+            positions[inverse], velocities[inverse], targets[index], normals[index],
+            off_nadir_range, min_elevation, look_side, pairwise=True
+        )
+    
+    # 거친 격자 평가 (시간 × AOI 행렬을 나누어 계산)
+    grid_times = np.linspace(0.0, duration, num_steps + 1)
+    grid_positions, grid_velocities = propagate(grid_times)
+    max_rate = _max_margin_rate(grid_positions, grid_velocities, heights.max())
+    grid_margin = np.empty((len(grid_times), num_aoi))
+    chunk = max(1, _GRID_CHUNK_ELEMENTS // num_aoi)
+    for begin in range(0, len(grid_times), chunk):
+        end = begin + chunk
+        grid_margin[begin:end] = _access_margin(
+            grid_positions[begin:end], grid_velocities[begin:end], targets, normals,
+            off_nadir_range, min_elevation, look_side
+        )
+    
+    # 격자 구간 (시작 시각, AOI, 양 끝 여유값)
+    width = grid_times[1] - grid_times[0]
+    cell_index, aoi_index = np.nonzero(
+        _may_cross_zero(grid_margin[:-1], grid_margin[1:], max_rate * width)
+    )
+    cell_start = grid_times[cell_index]
+    margin_start = grid_margin[cell_index, aoi_index]
+    margin_end = grid_margin[cell_index + 1, aoi_index]
+    
+    # 여유값이 0이 될 수 있는 구간만 세분
+    while width > resolution and len(cell_start):
+        sub_width = width / _SUBDIVISIONS
+        offsets = sub_width * np.arange(1, _SUBDIVISIONS)
+        interior = pair_margin(
+            (cell_start[:, np.newaxis] + offsets).ravel(),
+            np.repeat(aoi_index, _SUBDIVISIONS - 1)
+        ).reshape(len(cell_start), _SUBDIVISIONS - 1)
+        margins = np.column_stack([margin_start, interior, margin_end])
+        
+        keep = _may_cross_zero(margins[:, :-1], margins[:, 1:], max_rate * sub_width)
+        row, column = np.nonzero(keep)
+        cell_start = cell_start[row] + column * sub_width
+        aoi_index = aoi_index[row]
+        margin_start = margins[row, column]
+        margin_end = margins[row, column + 1]
+        width = sub_width
+    
+    # 부호가 바뀌는 구간의 경계를 이분법으로 정밀화
+    crossing = (margin_start > 0.0) != (margin_end > 0.0)
+    aoi_index = aoi_index[crossing]
+    rising = margin_end[crossing] > 0.0
+    lower = cell_start[crossing]
+    upper = np.minimum(lower + width, duration)
+    num_iterations = int(np.ceil(np.log2(max(width / tolerance, 1.0))))
+    for _ in range(num_iterations if len(lower) else 0):
+        middle = 0.5 * (lower + upper)
+        inside = pair_margin(middle, aoi_index) > 0.0
+        # 진입 경계는 안쪽이 위쪽, 이탈 경계는 안쪽이 아래쪽
+        move_upper = inside == rising
+        upper = np.where(move_upper, middle, upper)
+        lower = np.where(move_upper, lower, middle)
+    crossings = 0.5 * (lower + upper)
+    
+    # AOI별 진입/이탈 경계를 구간으로 묶음
+    windows: List[AccessWindow] = []
+    order = np.lexsort((crossings, aoi_index))
+    for index in range(num_aoi):
+        selected = order[aoi_index[order] == index]
+        starts = list(crossings[selected][rising[selected]])
+        ends = list(crossings[selected][~rising[selected]])
+        if grid_margin[0, index] > 0.0:
+            starts.insert(0, 0.0)
+        if grid_margin[-1, index] > 0.0:
+            ends.append(float(duration))
+        windows.extend(
+            AccessWindow(index, float(start), float(end)) for start, end in zip(starts, ends)
+        )
+    
+    windows.sort(key=lambda window: (window.start_time, window.aoi_index))
+    return windows
+
+
+def _may_cross_zero(margin_start: np.ndarray, margin_end: np.ndarray, max_change: float) -> np.ndarray:
+    """
+    변화율 한계 안에서 구간 내 여유값이 0을 지날 수 있는지 판정
+    
+    양 끝 부호가 다르거나, 같은 부호라도 |m0 + m1| < L·w 이면
+    (구간 중간에서 극값이 0에 닿을 수 있으면) True입니다.
+    """
+    return ((margin_start > 0.0) != (margin_end > 0.0)) | (np.abs(margin_start + margin_end) < max_change)
+
+
+def _max_margin_rate(positions: np.ndarray, velocities: np.ndarray, max_target_height: float) -> float:
+    """
+    관측 조건 여유값의 최대 변화율 (단위: deg/s)
+    
+    시선 방향 회전율(|v|/최소 slant range)과 nadir/측면 방향 회전율(|v|/|r|)의
+    합에 안전 계수를 곱한 상한입니다.
+    """
+    speed = np.max(np.linalg.norm(velocities, axis=-1))
+    radius = np.min(np.linalg.norm(positions, axis=-1))
+    min_slant_range = radius - WGS84_A - max(max_target_height, 0.0)
+    if min_slant_range <= 0:
+        raise ValueError("위성 고도가 관심 지역보다 낮습니다.")
+    return float(np.rad2deg(speed / min_slant_range + 2.0 * speed / radius) * _RATE_SAFETY_FACTOR)
+
+
+def _access_margin(
+    positions: np.ndarray,
+    velocities: np.ndarray,
+    targets: np.ndarray,
+    normals: np.ndarray,
+    off_nadir_range: Tuple[float, float],
+    min_elevation: float,
+    look_side: str,
+    pairwise: bool = False
+) -> np.ndarray:
+    """
+    관측 조건 여유값 (단위: deg, 양수면 관측 가능)
+    
+    pairwise가 False이면 모든 위성 상태 × 모든 AOI 행렬([T, A])을,
+    True이면 같은 행의 위성 상태와 AOI 쌍에 대한 값([K])을 계산합니다.
+    """
+    min_angle, max_angle = off_nadir_range
+    
+    radius = np.linalg.norm(positions, axis=-1)
+    radial = positions / radius[:, np.newaxis]
+    side = np.cross(-radial, velocities)
+    side /= np.linalg.norm(side, axis=-1, keepdims=True)
+    if look_side == "left":
+        side = -side
+    if not pairwise:
+        radius = radius[:, np.newaxis]
+    
+    target_radius2 = np.sum(targets * targets, axis=-1)
+    target_height = np.sum(targets * normals, axis=-1)
+    
+    # 위성 → AOI 시선 벡터의 크기와 방향 성분 (시선 벡터 배열 없이 내적으로 계산)
+    slant_range = np.sqrt(np.maximum(radius**2 + target_radius2 - 2.0 * _dot(positions, targets, pairwise), 1e-6))
+    nadir_component = radius - _dot(radial, targets, pairwise)
+    up_component = _dot(positions, normals, pairwise) - target_height
+    
+    off_nadir = np.rad2deg(np.arccos(np.clip(nadir_component / slant_range, -1.0, 1.0)))
+    elevation = np.rad2deg(np.arcsin(np.clip(up_component / slant_range, -1.0, 1.0)))
+    result = np.minimum(np.minimum(off_nadir - min_angle, max_angle - off_nadir), elevation - min_elevation)
+    
+    if look_side != "both":
+        side_angle = np.rad2deg(np.arcsin(np.clip(_dot(side, targets, pairwise) / slant_range, -1.0, 1.0)))
+        result = np.minimum(result, side_angle)
+    return result
+
+
+def _dot(a: np.ndarray, b: np.ndarray, pairwise: bool) -> np.ndarray:
+    """행별 내적(pairwise) 또는 모든 행 조합의 내적 행렬"""
+    if pairwise:
+        return np.einsum('ij,ij->i', a, b)
+    return a @ b.T
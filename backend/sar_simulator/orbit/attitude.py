@@ -0,0 +1,321 @@
+"""
+위성 버스 자세 모델
+
+버스 롤/피치/요 각도와 각속도로부터 펄스별 자세를 쿼터니언 배열로 계산하고,
+빔 방향(boresight)에 자세를 적용하는 연산을 반복문 없이 NumPy 연산으로 수행합니다.
+
+좌표계 정의:
+- 궤도 좌표계: x = 진행 방향, y = 진행 방향 오른쪽 (nadir × 속도), z = nadir (지구 중심 방향)
+- 자세: 궤도 좌표계 기준 요(z) → 피치(y) → 롤(x) 순서 (3-2-1) 회전
+- 쿼터니언: [w, x, y, z] (스칼라 우선), 벡터를 동체 좌표계에서 기준 좌표계로 변환
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Optional
+
+
+def quaternion_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """
+    쿼터니언 곱 q1 ⊗ q2 (벡터화)
+    
+    Parameters:
+    -----------
+    q1, q2 : np.ndarray
+        쿼터니언 [w, x, y, z] (shape: [..., 4], 브로드캐스팅 가능)
+    
+    Returns:
+    --------
+    np.ndarray
+        쿼터니언 곱 (shape: [..., 4])
+    """
+    w1, x1, y1, z1 = np.moveaxis(np.asarray(q1, dtype=np.float64), -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(np.asarray(q2, dtype=np.float64), -1, 0)
+    return np.stack([
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    ], axis=-1)
+
+
+def quaternion_from_euler(roll, pitch, yaw) -> np.ndarray:
+    """
+    3-2-1 (요 → 피치 → 롤) 오일러 각도를 쿼터니언으로 변환 (벡터화)
+    
+    Parameters:
+    -----------
+    roll, pitch, yaw : float or np.ndarray
+        롤/피치/요 각도 (단위: deg, 브로드캐스팅 가능)
+    
+    Returns:
+    --------
+    np.ndarray
+        쿼터니언 [w, x, y, z] (shape: [..., 4])
+    """
+    half_roll, half_pitch, half_yaw = np.broadcast_arrays(
+        0.5 * np.deg2rad(roll), 0.5 * np.deg2rad(pitch), 0.5 * np.deg2rad(yaw)
+    )
+    cr, sr = np.cos(half_roll), np.sin(half_roll)
+    cp, sp = np.cos(half_pitch), np.sin(half_pitch)
+    cy, sy = np.cos(half_yaw), np.sin(half_yaw)
+    return np.stack([
+        cr * cp * cy + sr * sp * sy,
+        sr * cp * cy - cr * sp * sy,
+        cr * sp * cy + sr * cp * sy,
+        cr * cp * sy - sr * sp * cy
+    ], axis=-1)
+
+
+def quaternion_to_matrix(quaternions: np.ndarray) -> np.ndarray:
+    """
+    쿼터니언을 회전 행렬로 변환 (벡터화)
+    
+    Parameters:
+    -----------
+    quaternions : np.ndarray
+        단위 쿼터니언 [w, x, y, z] (shape: [..., 4])
+    
+    Returns:
+    --------
+    np.ndarray
+        회전 행렬 (shape: [..., 3, 3])
+    """
+    w, x, y, z = np.moveaxis(np.asarray(quaternions, dtype=np.float64), -1, 0)
+    return np.stack([
+        np.stack([1.0 - 2.0 * (y * y + z * z), 2.0 * (x * y - w * z), 2.0 * (x * z + w * y)], axis=-1),
+        np.stack([2.0 * (x * y + w * z), 1.0 - 2.0 * (x * x + z * z), 2.0 * (y * z - w * x)], axis=-1),
+        np.stack([2.0 * (x * z - w * y), 2.0 * (y * z + w * x), 1.0 - 2.0 * (x * x + y * y)], axis=-1)
+    ], axis=-2)
+
+
+def matrix_to_quaternion(matrices: np.ndarray) -> np.ndarray:
+    """
+    회전 행렬을 쿼터니언으로 변환 (벡터화)
+    
+    w >= 0인 쿼터니언을 반환합니다.
+    
+    Parameters:
+    -----------
+    matrices : np.ndarray
+        회전 행렬 (shape: [..., 3, 3])
+    
+    Returns:
+    --------
+    np.ndarray
+        단위 쿼터니언 [w, x, y, z] (shape: [..., 4])
+    """
+    m = np.asarray(matrices, dtype=np.float64)
+    m00, m11, m22 = m[..., 0, 0], m[..., 1, 1], m[..., 2, 2]
+    
+    w = 0.5 * np.sqrt(np.maximum(0.0, 1.0 + m00 + m11 + m22))
+    x = 0.5 * np.sqrt(np.maximum(0.0, 1.0 + m00 - m11 - m22))
+    y = 0.5 * np.sqrt(np.maximum(0.0, 1.0 - m00 + m11 - m22))
+    z = 0.5 * np.sqrt(np.maximum(0.0, 1.0 - m00 - m11 + m22))
+    x = np.copysign(x, m[..., 2, 1] - m[..., 1, 2])
+    y = np.copysign(y, m[..., 0, 2] - m[..., 2, 0])
+    z = np.copysign(z, m[..., 1, 0] - m[..., 0, 1])
+    
+    quaternions = np.stack([w, x, y, z], axis=-1)
+    return quaternions / np.linalg.norm(quaternions, axis=-1, keepdims=True)
+
+
+def rotate_vectors(quaternions: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+    """
+    쿼터니언으로 벡터 회전 (벡터화)
+    
+    Parameters:
+    -----------
+    quaternions : np.ndarray
+        단위 쿼터니언 [w, x, y, z] (shape: [..., 4])
+    vectors : np.ndarray
+        회전할 벡터 (shape: [..., 3], 브로드캐스팅 가능)
+    
+    Returns:
+    --------
+    np.ndarray
+        회전된 벡터 (shape: [..., 3])
+    """
+    quaternions = np.asarray(quaternions, dtype=np.float64)
+    w = quaternions[..., :1]
+    axis = quaternions[..., 1:]
+    # v' = v + 2w(u × v) + 2u × (u × v)
+    t = 2.0 * np.cross(axis, vectors)
+    return vectors + w * t + np.cross(axis, t)
+
+
+def orbital_frame(satellite_positions: np.ndarray, satellite_velocities: np.ndarray) -> np.ndarray:
+    """
+    위성 상태별 궤도 좌표계 축 계산 (벡터화)
+    
+    Parameters:
+    -----------
+    satellite_positions : np.ndarray
+        위성 위치 (ECEF, shape: [N, 3], 단위: m)
+    satellite_velocities : np.ndarray
+        위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+    
+    Returns:
+    --------
+    np.ndarray
+        궤도 좌표계 → ECEF 회전 행렬 (shape: [N, 3, 3], 열: x 진행 방향, y 오른쪽, z nadir)
+    """
+    satellite_positions = np.asarray(satellite_positions, dtype=np.float64)
+    satellite_velocities = np.asarray(satellite_velocities, dtype=np.float64)
+    if satellite_positions.ndim != 2 or satellite_positions.shape[1] != 3:
+        raise ValueError("위성 위치는 [N, 3] 배열이어야 합니다.")
+    if satellite_velocities.shape != satellite_positions.shape:
+        raise ValueError("위성 위치와 속도의 개수가 일치하지 않습니다.")
+    
+    z_axis = -satellite_positions / np.linalg.norm(satellite_positions, axis=-1, keepdims=True)
+    y_axis = np.cross(z_axis, satellite_velocities)
+    y_norm = np.linalg.norm(y_axis, axis=-1, keepdims=True)
+    if np.any(y_norm <= 1e-6):
+        raise ValueError("위성 속도가 0이거나 지구 중심 방향과 평행합니다.")
+    y_axis = y_axis / y_norm
+    x_axis = np.cross(y_axis, z_axis)
+    return np.stack([x_axis, y_axis, z_axis], axis=-1)
+
+
+@dataclass
+class AttitudeProfile:
+    """
+    버스 자세 프로파일
+    
+    궤도 좌표계 기준 롤/피치/요 각도가 기준 시각부터 일정한 각속도로 변한다고 가정합니다.
+    """
+    
+    roll_angle: float = 0.0  # 롤 각도 (deg)
+    pitch_angle: float = 0.0  # 피치 각도 (deg)
+    yaw_angle: float = 0.0  # 요 각도 (deg)
+    roll_rate: float = 0.0  # 롤 각속도 (deg/s)
+    pitch_rate: float = 0.0  # 피치 각속도 (deg/s)
+    yaw_rate: float = 0.0  # 요 각속도 (deg/s)
+    reference_time: float = 0.0  # 각도 기준 시각 (s)
+    
+    def euler_angles(self, times: np.ndarray) -> np.ndarray:
+        """
+        시각별 롤/피치/요 각도
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            시각 (shape: [N], 단위: s)
+        
+        Returns:
+        --------
+        np.ndarray
+            [롤, 피치, 요] 각도 (shape: [N, 3], 단위: deg)
+        """
+        elapsed = np.asarray(times, dtype=np.float64)[:, np.newaxis] - self.reference_time
+        angles = np.array([self.roll_angle, self.pitch_angle, self.yaw_angle])
+        rates = np.array([self.roll_rate, self.pitch_rate, self.yaw_rate])
+        return angles + elapsed * rates
+    
+    def quaternions(self, times: np.ndarray) -> np.ndarray:
+        """
+        시각별 동체 → 궤도 좌표계 쿼터니언
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            시각 (shape: [N], 단위: s)
+        
+        Returns:
+        --------
+        np.ndarray
+            쿼터니언 [w, x, y, z] (shape: [N, 4])
+        """
+        angles = self.euler_angles(times)
+        return quaternion_from_euler(angles[:, 0], angles[:, 1], angles[:, 2])
+    
+    def angular_velocities(self, times: np.ndarray) -> np.ndarray:
+        """
+        시각별 동체 좌표계 각속도 (궤도 좌표계 기준)
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            시각 (shape: [N], 단위: s)
+        
+        Returns:
+        --------
+        np.ndarray
+            동체 좌표계 각속도 [p, q, r] (shape: [N, 3], 단위: rad/s)
+        """
+        angles = np.deg2rad(self.euler_angles(times))
+        roll_rate, pitch_rate, yaw_rate = np.deg2rad([self.roll_rate, self.pitch_rate, self.yaw_rate])
+        sin_roll, cos_roll = np.sin(angles[:, 0]), np.cos(angles[:, 0])
+        sin_pitch, cos_pitch = np.sin(angles[:, 1]), np.cos(angles[:, 1])
+        return np.stack([
+            roll_rate - yaw_rate * sin_pitch,
+            pitch_rate * cos_roll + yaw_rate * sin_roll * cos_pitch,
+            -pitch_rate * sin_roll + yaw_rate * cos_roll * cos_pitch
+        ], axis=-1)
+    
+    def body_to_ecef_quaternions(
+        self,
+        times: np.ndarray,
+        satellite_positions: np.ndarray,
+        satellite_velocities: np.ndarray
+    ) -> np.ndarray:
+        """
+        시각별 동체 → ECEF 쿼터니언
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            시각 (shape: [N], 단위: s)
+        satellite_positions : np.ndarray
+            위성 위치 (ECEF, shape: [N, 3], 단위: m)
+        satellite_velocities : np.ndarray
+            위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+        
+        Returns:
+        --------
+        np.ndarray
+            쿼터니언 [w, x, y, z] (shape: [N, 4], w >= 0)
+        """
+        frame = matrix_to_quaternion(orbital_frame(satellite_positions, satellite_velocities))
+        quaternions = quaternion_multiply(frame, self.quaternions(times))
+        return quaternions * np.where(quaternions[:, :1] < 0.0, -1.0, 1.0)
+    
+    def apply(
+        self,
+        times: np.ndarray,
+        satellite_positions: np.ndarray,
+        satellite_velocities: np.ndarray,
+        beam_directions: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        펄스별 빔 방향에 버스 자세 적용
+        
+        빔 방향을 궤도 좌표계에 고정된 지향 방향으로 보고, 자세 회전을 적용한
+        ECEF 방향을 계산합니다.
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            펄스 시각 (shape: [N], 단위: s)
+        satellite_positions : np.ndarray
+            위성 위치 (ECEF, shape: [N, 3], 단위: m)
+        satellite_velocities : np.ndarray
+            위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+        beam_directions : np.ndarray, optional
+            자세 오차가 없을 때의 빔 방향 (ECEF, shape: [N, 3] 또는 [3], None이면 nadir)
+        
+        Returns:
+        --------
+        np.ndarray
+            자세가 적용된 빔 방향 (ECEF, 정규화된 벡터, shape: [N, 3])
+        """
+        frame = orbital_frame(satellite_positions, satellite_velocities)
+        if beam_directions is None:
+            body_directions = np.array([0.0, 0.0, 1.0])
+        else:
+            beam_directions = np.asarray(beam_directions, dtype=np.float64)
+            beam_directions = beam_directions / np.linalg.norm(beam_directions, axis=-1, keepdims=True)
+            body_directions = np.einsum('nji,nj->ni', frame, np.broadcast_to(beam_directions, (len(frame), 3)))
+        
+        rotated = rotate_vectors(self.quaternions(times), body_directions)
+        return np.einsum('nij,nj->ni', frame, rotated)
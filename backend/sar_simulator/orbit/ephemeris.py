@@ -0,0 +1,245 @@
+"""
+궤도력 (Ephemeris)
+
+듬성한 간격(1~10 s)의 위성 상태 벡터를 보관하고, 임의의 펄스 시각에서
+위치/속도를 3차 Hermite 보간으로 한 번에 계산합니다.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+
+# 구간 중앙 위치 오차 대비 구간 내 최대 속도 오차 비율 (× 1/h), 16/(3√3)
+_VELOCITY_ERROR_FACTOR = 16.0 / (3.0 * np.sqrt(3.0))
+
+
+class Ephemeris:
+    """
+    상태 벡터 궤도력
+    
+    노드 구간마다 양 끝의 위치와 속도를 모두 맞추는 3차 Hermite 다항식으로 보간합니다.
+    보간 오차는 노드 간격 h에 대해 위치 O(h⁴), 속도 O(h³)로 줄어들며,
+    estimate_error()로 노드를 하나씩 건너뛴 보간과 비교하여 추정할 수 있습니다.
+    """
+    
+    def __init__(self, times: np.ndarray, positions: np.ndarray, velocities: np.ndarray):
+        """
+        Ephemeris 초기화
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            노드 시각 (shape: [M], 단위: s, 엄격히 증가)
+        positions : np.ndarray
+            노드 위치 (shape: [M, 3], 단위: m)
+        velocities : np.ndarray
+            노드 속도 (shape: [M, 3], 단위: m/s)
+        """
+        times = np.asarray(times, dtype=np.float64)
+        positions = np.asarray(positions, dtype=np.float64)
+        velocities = np.asarray(velocities, dtype=np.float64)
+        
+        if times.ndim != 1 or len(times) < 2:
+            raise ValueError("궤도력 노드는 2개 이상이어야 합니다.")
+        if positions.shape != (len(times), 3) or velocities.shape != (len(times), 3):
+            raise ValueError("positions와 velocities는 [노드 수, 3] 배열이어야 합니다.")
+        if np.any(np.diff(times) <= 0):
+            raise ValueError("노드 시각은 엄격히 증가해야 합니다.")
+        
+        self.times = times
+        self.positions = positions
+        self.velocities = velocities
+    
+    @classmethod
+    def from_propagator(cls, propagator, times: np.ndarray) -> 'Ephemeris':
+        """
+        궤도 전파기로부터 궤도력 생성
+        
+        Parameters:
+        -----------
+        propagator : KeplerPropagator or TlePropagator
+            propagate(times) -> (positions, velocities)를 제공하는 전파기
+        times : np.ndarray
+            노드 시각 (shape: [M], 단위: s)
+        
+        Returns:
+        --------
+        Ephemeris
+            궤도력
+        """
+        positions, velocities = propagator.propagate(times)
+        return cls(times, positions, velocities)
+    
+    @classmethod
+    def from_adx(cls, adx_data: np.ndarray) -> 'Ephemeris':
+        """
+        ADX 데이터로부터 궤도력 생성
+        
+        Parameters:
+        -----------
+        adx_data : np.ndarray
+            ADX 배열 (shape: [M, 15], 열 0: 시각, 열 2-4: 위치, 열 5-7: 속도)
+        
+        Returns:
+        --------
+        Ephemeris
+            궤도력
+        """
+        adx_data = np.asarray(adx_data, dtype=np.float64)
+        return cls(adx_data[:, 0], adx_data[:, 2:5], adx_data[:, 5:8])
+    
+    @property
+    def start_time(self) -> float:
+        """첫 노드 시각 (단위: s)"""
+        return float(self.times[0])
+    
+    @property
+    def end_time(self) -> float:
+        """마지막 노드 시각 (단위: s)"""
+        return float(self.times[-1])
+    
+    def __len__(self) -> int:
+        """노드 개수"""
+        return len(self.times)
+    
+    def evaluate(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        임의 시각의 위치/속도 보간
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            보간할 시각 (shape: [N], 단위: s, 노드 시각 범위 안)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [N, 3], 단위: m, m/s)
+        """
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        if times.size and (times.min() < self.times[0] or times.max() > self.times[-1]):
+            raise ValueError(
+                f"보간 시각이 궤도력 범위 [{self.start_time}, {self.end_time}] s를 벗어났습니다."
+            )
+        return _hermite_interpolate(self.times, self.positions, self.velocities, times)
+    
+    def pulse_times(self, num_pulses: int, prf: float, start_time: Optional[float] = None) -> np.ndarray:
+        """
+        PRF 간격 펄스 시각 배열
+        
+        Parameters:
+        -----------
+        num_pulses : int
+            펄스 개수
+        prf : float
+            펄스 반복 주파수 (단위: Hz)
+        start_time : float, optional
+            첫 펄스 시각 (단위: s, None이면 첫 노드 시각)
+        
+        Returns:
+        --------
+        np.ndarray
+            펄스 시각 (shape: [num_pulses], 단위: s)
+        """
+        if prf <= 0:
+            raise ValueError("prf는 0보다 커야 합니다.")
+        if start_time is None:
+            start_time = self.start_time
+        return start_time + np.arange(num_pulses) / prf
+    
+    def propagate_pulses(
+        self,
+        num_pulses: int,
+        prf: float,
+        start_time: Optional[float] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        PRF 간격의 펄스별 위치/속도 보간
+        
+        Parameters:
+        -----------
+        num_pulses : int
+            펄스 개수
+        prf : float
+            펄스 반복 주파수 (단위: Hz)
+        start_time : float, optional
+            첫 펄스 시각 (단위: s, None이면 첫 노드 시각)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [num_pulses, 3], 단위: m, m/s)
+        """
+        return self.evaluate(self.pulse_times(num_pulses, prf, start_time))
+    
+    def estimate_error(self) -> Tuple[float, float]:
+        """
+        보간 오차 추정
+        
+        내부 노드를 하나씩 건너뛴(간격 2h) 보간 값과 실제 노드 값의 차이로
+        구간 중앙 위치 오차 h⁴·f⁗/384를 추정하고(2h 오차의 1/16),
+        같은 4차 미분으로 구간 내 최대 속도 오차 h³·f⁗/(72√3)를 환산합니다.
+        
+        Returns:
+        --------
+        Tuple[float, float]
+            (최대 위치 오차 추정값, 최대 속도 오차 추정값) (단위: m, m/s)
+            노드가 3개 미만이면 (nan, nan)
+        """
+        if len(self.times) < 3:
+            return float('nan'), float('nan')
+        
+        position_error = 0.0
+        velocity_error = 0.0
+        for offset in (0, 1):
+            # 짝수/홀수 번째 노드만 사용한 궤도력으로 사이의 노드를 보간
+            keep = np.arange(offset, len(self.times), 2)
+            probe = keep[:-1] + 1
+            if len(probe) == 0:
+                continue
+            positions, _ = _hermite_interpolate(
+                self.times[keep], self.positions[keep], self.velocities[keep], self.times[probe]
+            )
+            errors = np.linalg.norm(positions - self.positions[probe], axis=1) / 16.0
+            spacing = 0.5 * (self.times[probe + 1] - self.times[probe - 1])
+            
+            position_error = max(position_error, float(np.max(errors)))
+            velocity_error = max(velocity_error, float(np.max(_VELOCITY_ERROR_FACTOR * errors / spacing)))
+        
+        return position_error, velocity_error
+
+
+def _hermite_interpolate(
+    node_times: np.ndarray,
+    node_positions: np.ndarray,
+    node_velocities: np.ndarray,
+    times: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """구간별 3차 Hermite 보간 (위치와 그 미분인 속도)"""
+    index = np.clip(np.searchsorted(node_times, times, side='right') - 1, 0, len(node_times) - 2)
+    
+    t0 = node_times[index]
+    h = (node_times[index + 1] - t0)[:, np.newaxis]
+    s = ((times - t0) / h[:, 0])[:, np.newaxis]
+    
+    p0 = node_positions[index]
+    p1 = node_positions[index + 1]
+    m0 = node_velocities[index] * h
+    m1 = node_velocities[index + 1] * h
+    
+    s2 = s * s
+    s3 = s2 * s
+    h00 = 2.0 * s3 - 3.0 * s2 + 1.0
+    h10 = s3 - 2.0 * s2 + s
+    h01 = -2.0 * s3 + 3.0 * s2
+    h11 = s3 - s2
+    positions = h00 * p0 + h10 * m0 + h01 * p1 + h11 * m1
+    
+    # 기저 함수의 s 미분 / h
+    d00 = 6.0 * s2 - 6.0 * s
+    d10 = 3.0 * s2 - 4.0 * s + 1.0
+    d01 = -d00
+    d11 = 3.0 * s2 - 2.0 * s
+    velocities = (d00 * p0 + d10 * m0 + d01 * p1 + d11 * m1) / h
+    
+    return positions, velocities
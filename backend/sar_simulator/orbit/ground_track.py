@@ -0,0 +1,154 @@
+"""
+지상 궤적 및 Swath Footprint 계산
+
+위성 궤적 전체에 대해 직하점(지상 궤적)과 빔 고각 방향 near/far 가장자리의
+지표면 교차점을 반복문 없이 NumPy 연산으로 계산합니다.
+"""
+
+import numpy as np
+from typing import Optional
+
+from sar_simulator.common.coordinates import ecef_to_llh_array
+from sar_simulator.common.satellite_orbit_service import calc_crossing_point_ellipsoid_batch
+
+
+def decimate_indices(num_points: int, max_points: Optional[int] = None) -> np.ndarray:
+    """
+    점 개수 제한에 맞춘 균등 간격 인덱스
+    
+    첫 점과 마지막 점은 항상 포함됩니다.
+    
+    Parameters:
+    -----------
+    num_points : int
+        전체 점 개수
+    max_points : int, optional
+        최대 점 개수 (None이면 모든 점 사용, 2 이상)
+    
+    Returns:
+    --------
+    np.ndarray
+        선택된 인덱스 (shape: [M], 오름차순)
+    """
+    if max_points is None or num_points <= max_points:
+        return np.arange(num_points)
+    if max_points < 2:
+        raise ValueError("max_points는 2 이상이어야 합니다.")
+    return np.unique(np.round(np.linspace(0, num_points - 1, max_points)).astype(np.int64))
+
+
+def calc_look_directions(
+    satellite_positions: np.ndarray,
+    satellite_velocities: np.ndarray,
+    off_nadir_angle: float,
+    look_side: str = "right"
+) -> np.ndarray:
+    """
+    위성 상태별 빔 고각 방향 벡터 계산 (벡터화)
+    
+    지구 중심 방향(nadir)에서 진행 방향에 수직인 측면으로 off_nadir_angle만큼
+    기울인 방향을 계산합니다.
+    
+    Parameters:
+    -----------
+    satellite_positions : np.ndarray
+        위성 위치 (ECEF, shape: [N, 3], 단위: m)
+    satellite_velocities : np.ndarray
+        위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+    off_nadir_angle : float
+        Off-nadir 각도 (단위: deg)
+    look_side : str
+        관측 방향 ("right": 진행 방향 오른쪽, "left": 왼쪽)
+    
+    Returns:
+    --------
+    np.ndarray
+        빔 방향 벡터 (ECEF, 정규화된 벡터, shape: [N, 3])
+    """
+    if look_side not in ("right", "left"):
+        raise ValueError("look_side는 'right' 또는 'left'여야 합니다.")
+    
+    nadir = -satellite_positions / np.linalg.norm(satellite_positions, axis=-1, keepdims=True)
+    side = np.cross(nadir, satellite_velocities)
+    side_norm = np.linalg.norm(side, axis=-1, keepdims=True)
+    if np.any(side_norm <= 1e-6):
+        raise ValueError("위성 속도가 0이거나 지구 중심 방향과 평행합니다.")
+    side = side / side_norm
+    if look_side == "left":
+        side = -side
+    
+    angle = np.deg2rad(off_nadir_angle)
+    return np.cos(angle) * nadir + np.sin(angle) * side
+
+
+def calculate_swath_footprint(
+    satellite_positions: np.ndarray,
+    satellite_velocities: np.ndarray,
+    look_angle: float,
+    beamwidth_el: float,
+    look_side: str = "right",
+    max_points: Optional[int] = None
+) -> dict:
+    """
+    궤적 전체의 지상 궤적과 Swath near/far 가장자리 계산 (벡터화)
+    
+    max_points로 균등 간격 추출한 위성 상태에 대해서만 계산합니다.
+    near/far 가장자리는 look_angle ∓ beamwidth_el/2 방향 빔과 WGS84 타원체의 교차점입니다.
+    
+    Parameters:
+    -----------
+    satellite_positions : np.ndarray
+        위성 위치 (ECEF, shape: [N, 3], 단위: m)
+    satellite_velocities : np.ndarray
+        위성 속도 (ECEF, shape: [N, 3], 단위: m/s)
+    look_angle : float
+        빔 중심 off-nadir 각도 (단위: deg)
+    beamwidth_el : float
+        고각 방향 빔폭 (단위: deg)
+    look_side : str
+        관측 방향 ("right" 또는 "left")
+    max_points : int, optional
+        최대 출력 점 개수 (None이면 모든 상태 사용)
+    
+    Returns:
+    --------
+    dict
+        Swath 정보
+        - indices: 사용된 위성 상태 인덱스 (shape: [M])
+        - ground_track: 위성 직하점 (지리 좌표: [경도, 위도, 고도], shape: [M, 3])
+        - near_edge / far_edge: Swath 가장자리 (지리 좌표: [경도, 위도, 고도], shape: [M, 3]),
+          교차점이 없는 상태는 NaN
+        - near_valid / far_valid: 교차 여부 (shape: [M], dtype: bool)
+        - swath_widths: near/far 가장자리 간 거리 (단위: m, shape: [M]), 교차점이 없으면 NaN
+    """
+    satellite_positions = np.asarray(satellite_positions, dtype=np.float64)
+    satellite_velocities = np.asarray(satellite_velocities, dtype=np.float64)
+    if satellite_positions.ndim != 2 or satellite_positions.shape[1] != 3:
+        raise ValueError("위성 위치는 [N, 3] 배열이어야 합니다.")
+    if satellite_velocities.shape != satellite_positions.shape:
+        raise ValueError("위성 위치와 속도의 개수가 일치하지 않습니다.")
+    
+    indices = decimate_indices(len(satellite_positions), max_points)
+    positions = satellite_positions[indices]
+    velocities = satellite_velocities[indices]
+    
+    near_points, near_valid = calc_crossing_point_ellipsoid_batch(
+        positions, calc_look_directions(positions, velocities, look_angle - beamwidth_el / 2.0, look_side)
+    )
+    far_points, far_valid = calc_crossing_point_ellipsoid_batch(
+        positions, calc_look_directions(positions, velocities, look_angle + beamwidth_el / 2.0, look_side)
+    )
+    
+    # 직하점: 위성 위치의 측지 위도/경도, 고도 0
+    ground_track = ecef_to_llh_array(positions)[:, [1, 0, 2]]
+    ground_track[:, 2] = 0.0
+    
+    return {
+        "indices": indices,
+        "ground_track": ground_track,
+        "near_edge": ecef_to_llh_array(near_points)[:, [1, 0, 2]],
+        "far_edge": ecef_to_llh_array(far_points)[:, [1, 0, 2]],
+        "near_valid": near_valid,
+        "far_valid": far_valid,
+        "swath_widths": np.linalg.norm(far_points - near_points, axis=-1)
+    }
@@ -0,0 +1,350 @@
+"""
+Kepler 궤도 전파기
+
+케플러 궤도 요소를 J2 영년(secular) 섭동과 함께 시간 배열에 대해 한 번에 전파하고,
+지구 자전을 반영한 ECEF 위치/속도를 계산합니다.
+"""
+
+import numpy as np
+from dataclasses import dataclass
+from typing import Tuple
+
+from sar_simulator.common.constants import EARTH_GM, EARTH_J2, EARTH_ROTATION_RATE
+from sar_simulator.common.coordinates import WGS84_A
+
+
+# Kepler 방정식 Newton 반복 설정
+_KEPLER_MAX_ITERATIONS = 20
+_KEPLER_TOLERANCE = 1e-14
+
+
+@dataclass
+class KeplerianElements:
+    """
+    케플러 궤도 요소 (기준 시각, 관성 좌표계)
+    
+    Attributes:
+    -----------
+    semi_major_axis : float
+        장반경 (단위: m)
+    eccentricity : float
+        이심률 (0 <= e < 1)
+    inclination : float
+        경사각 (단위: deg)
+    raan : float
+        승교점 적경 (단위: deg)
+    arg_perigee : float
+        근지점 인수 (단위: deg)
+    mean_anomaly : float
+        평균 근점 이각 (단위: deg)
+    """
+    semi_major_axis: float
+    eccentricity: float = 0.0
+    inclination: float = 0.0
+    raan: float = 0.0
+    arg_perigee: float = 0.0
+    mean_anomaly: float = 0.0
+    
+    def __post_init__(self):
+        """초기화 후 검증"""
+        if self.semi_major_axis <= 0:
+            raise ValueError("semi_major_axis는 0보다 커야 합니다.")
+        if not 0.0 <= self.eccentricity < 1.0:
+            raise ValueError("eccentricity는 0 이상 1 미만이어야 합니다.")
+    
+    @classmethod
+    def circular(
+        cls,
+        orbit_height: float,
+        inclination: float,
+        raan: float = 0.0,
+        argument_of_latitude: float = 0.0
+    ) -> 'KeplerianElements':
+        """
+        원형 궤도 요소 생성
+        
+        Parameters:
+        -----------
+        orbit_height : float
+            궤도 고도 (적도 반경 기준, 단위: m)
+        inclination : float
+            경사각 (단위: deg)
+        raan : float
+            승교점 적경 (단위: deg)
+        argument_of_latitude : float
+            기준 시각의 위도 인수 (승교점으로부터의 각도, 단위: deg)
+        
+        Returns:
+        --------
+        KeplerianElements
+            원형 궤도 요소
+        """
+        return cls(
+            semi_major_axis=WGS84_A + orbit_height,
+            eccentricity=0.0,
+            inclination=inclination,
+            raan=raan,
+            arg_perigee=0.0,
+            mean_anomaly=argument_of_latitude
+        )
+    
+    @classmethod
+    def from_state_vector(cls, position: np.ndarray, velocity: np.ndarray) -> 'KeplerianElements':
+        """
+        관성 좌표계 위치/속도로부터 궤도 요소 계산
+        
+        원형 궤도는 근지점 인수를 0으로, 적도 궤도는 승교점 적경을 0으로 둡니다.
+        
+        Parameters:
+        -----------
+        position : np.ndarray
+            위치 (관성 좌표계, shape: [3], 단위: m)
+        velocity : np.ndarray
+            속도 (관성 좌표계, shape: [3], 단위: m/s)
+        
+        Returns:
+        --------
+        KeplerianElements
+            궤도 요소
+        """
+        r = np.asarray(position, dtype=np.float64)
+        v = np.asarray(velocity, dtype=np.float64)
+        r_norm = np.linalg.norm(r)
+        
+        h = np.cross(r, v)
+        h_norm = np.linalg.norm(h)
+        if h_norm <= 0:
+            raise ValueError("위치와 속도가 평행하여 궤도를 정의할 수 없습니다.")
+        h_hat = h / h_norm
+        
+        energy = 0.5 * np.dot(v, v) - EARTH_GM / r_norm
+        if energy >= 0:
+            raise ValueError("타원 궤도가 아닙니다 (탈출 속도 이상).")
+        a = -EARTH_GM / (2.0 * energy)
+        
+        e_vec = np.cross(v, h) / EARTH_GM - r / r_norm
+        e = np.linalg.norm(e_vec)
+        
+        # 승교점 방향 (적도 궤도는 x축)
+        node = np.cross([0.0, 0.0, 1.0], h_hat)
+        node_norm = np.linalg.norm(node)
+        node = node / node_norm if node_norm > 1e-12 else np.array([1.0, 0.0, 0.0])
+        
+        # 근지점 방향 (원형 궤도는 승교점 방향)
+        perigee = e_vec / e if e > 1e-12 else node
+        
+        inclination = np.arccos(np.clip(h_hat[2], -1.0, 1.0))
+        raan = np.arctan2(node[1], node[0])
+        arg_perigee = np.arctan2(np.dot(h_hat, np.cross(node, perigee)), np.dot(node, perigee))
+        true_anomaly = np.arctan2(np.dot(h_hat, np.cross(perigee, r)), np.dot(perigee, r))
+        
+        E = np.arctan2(np.sqrt(1.0 - e * e) * np.sin(true_anomaly), e + np.cos(true_anomaly))
+        M = E - e * np.sin(E)
+        
+        return cls(
+            semi_major_axis=float(a),
+            eccentricity=float(e),
+            inclination=float(np.rad2deg(inclination)),
+            raan=float(np.mod(np.rad2deg(raan), 360.0)),
+            arg_perigee=float(np.mod(np.rad2deg(arg_perigee), 360.0)),
+            mean_anomaly=float(np.mod(np.rad2deg(M), 360.0))
+        )
+
+
+class KeplerPropagator:
+    """
+    J2 영년 섭동 Kepler 궤도 전파기
+    
+    승교점 적경, 근지점 인수, 평균 근점 이각에 J2 영년 변화율을 적용하고
+    시간 배열 전체를 반복문 없이 전파합니다.
+    ECEF 변환은 기준 시각의 그리니치 항성시와 지구 자전 각속도로 계산합니다.
+    """
+    
+    def __init__(
+        self,
+        elements: KeplerianElements,
+        gmst_at_epoch: float = 0.0,
+        use_j2: bool = True
+    ):
+        """
+        KeplerPropagator 초기화
+        
+        Parameters:
+        -----------
+        elements : KeplerianElements
+            기준 시각(t = 0)의 궤도 요소
+        gmst_at_epoch : float
+            기준 시각의 그리니치 평균 항성시 (단위: deg)
+        use_j2 : bool
+            J2 영년 섭동 적용 여부 (기본값: True)
+        """
+        self.elements = elements
+        self.gmst_at_epoch = gmst_at_epoch
+        self.use_j2 = use_j2
+        
+        a = elements.semi_major_axis
+        e = elements.eccentricity
+        cos_i = np.cos(np.deg2rad(elements.inclination))
+        
+        self.mean_motion = np.sqrt(EARTH_GM / a**3)
+        
+        # J2 영년 변화율 (단위: rad/s)
+        if use_j2:
+            p = a * (1.0 - e * e)
+            factor = 1.5 * self.mean_motion * EARTH_J2 * (WGS84_A / p) ** 2
+            self.raan_rate = -factor * cos_i
+            self.arg_perigee_rate = 0.5 * factor * (5.0 * cos_i**2 - 1.0)
+            self.mean_anomaly_rate = self.mean_motion + 0.5 * factor * np.sqrt(1.0 - e * e) * (3.0 * cos_i**2 - 1.0)
+        else:
+            self.raan_rate = 0.0
+            self.arg_perigee_rate = 0.0
+            self.mean_anomaly_rate = self.mean_motion
+    
+    @property
+    def period(self) -> float:
+        """교점 주기 (승교점 통과 간격, 단위: s)"""
+        return 2.0 * np.pi / (self.mean_anomaly_rate + self.arg_perigee_rate)
+    
+    def propagate_eci(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        관성 좌표계 위치/속도 전파
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            기준 시각으로부터의 경과 시간 (shape: [N], 단위: s)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [N, 3], 단위: m, m/s)
+        """
+        t = np.asarray(times, dtype=np.float64)
+        elements = self.elements
+        a = elements.semi_major_axis
+        e = elements.eccentricity
+        
+        raan = np.deg2rad(elements.raan) + self.raan_rate * t
+        arg_perigee = np.deg2rad(elements.arg_perigee) + self.arg_perigee_rate * t
+        mean_anomaly = np.deg2rad(elements.mean_anomaly) + self.mean_anomaly_rate * t
+        E = _solve_kepler(mean_anomaly, e)
+        
+        cos_E = np.cos(E)
+        sin_E = np.sin(E)
+        sqrt_1me2 = np.sqrt(1.0 - e * e)
+        
+        # 근점 좌표계 위치/속도 (평균 근점 이각 변화율 반영)
+        x_pf = a * (cos_E - e)
+        y_pf = a * sqrt_1me2 * sin_E
+        E_rate = self.mean_anomaly_rate / (1.0 - e * cos_E)
+        vx_pf = -a * sin_E * E_rate
+        vy_pf = a * sqrt_1me2 * cos_E * E_rate
+        
+        # 근점 좌표계 → 관성 좌표계 기저 (P: 근지점 방향, Q: 궤도면 내 수직 방향)
+        cos_O, sin_O = np.cos(raan), np.sin(raan)
+        cos_w, sin_w = np.cos(arg_perigee), np.sin(arg_perigee)
+        cos_i = np.cos(np.deg2rad(elements.inclination))
+        sin_i = np.sin(np.deg2rad(elements.inclination))
+        
+        P = np.stack([
+            cos_O * cos_w - sin_O * sin_w * cos_i,
+            sin_O * cos_w + cos_O * sin_w * cos_i,
+            sin_w * sin_i + 0.0 * t
+        ], axis=-1)
+        Q = np.stack([
+            -cos_O * sin_w - sin_O * cos_w * cos_i,
+            -sin_O * sin_w + cos_O * cos_w * cos_i,
+            cos_w * sin_i + 0.0 * t
+        ], axis=-1)
+        W = np.stack([sin_O * sin_i, -cos_O * sin_i, cos_i + 0.0 * t], axis=-1)
+        
+        positions = x_pf[..., np.newaxis] * P + y_pf[..., np.newaxis] * Q
+        velocities = vx_pf[..., np.newaxis] * P + vy_pf[..., np.newaxis] * Q
+        
+        # 근지점 인수/승교점 적경 회전에 의한 속도 성분
+        velocities += self.arg_perigee_rate * np.cross(W, positions)
+        velocities += self.raan_rate * np.cross([0.0, 0.0, 1.0], positions)
+        
+        return positions, velocities
+    
+    def propagate(self, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ECEF 위치/속도 전파
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            기준 시각으로부터의 경과 시간 (shape: [N], 단위: s)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [N, 3], ECEF, 단위: m, m/s)
+        """
+        t = np.asarray(times, dtype=np.float64)
+        positions_eci, velocities_eci = self.propagate_eci(t)
+        
+        # 관성 좌표계 → ECEF (z축 기준 -θ 회전)
+        theta = np.deg2rad(self.gmst_at_epoch) + EARTH_ROTATION_RATE * t
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+        
+        # 지구 자전에 의한 상대 속도: v_ecef = R(v_eci - ω × r_eci)
+        relative_velocities = velocities_eci - EARTH_ROTATION_RATE * np.cross([0.0, 0.0, 1.0], positions_eci)
+        
+        return _rotate_z(positions_eci, cos_t, -sin_t), _rotate_z(relative_velocities, cos_t, -sin_t)
+    
+    def propagate_pulses(
+        self,
+        num_pulses: int,
+        prf: float,
+        start_time: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        PRF 간격의 펄스별 ECEF 위치/속도 생성
+        
+        결과는 SarEchoSimulator.simulate_multiple_pulses와 RawDataWriter.write_burst에
+        그대로 전달할 수 있습니다.
+        
+        Parameters:
+        -----------
+        num_pulses : int
+            펄스 개수
+        prf : float
+            펄스 반복 주파수 (단위: Hz)
+        start_time : float
+            첫 펄스의 기준 시각으로부터의 경과 시간 (단위: s)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [num_pulses, 3], ECEF, 단위: m, m/s)
+        """
+        if prf <= 0:
+            raise ValueError("prf는 0보다 커야 합니다.")
+        times = start_time + np.arange(num_pulses) / prf
+        return self.propagate(times)
+
+
+def _solve_kepler(mean_anomaly: np.ndarray, eccentricity: float) -> np.ndarray:
+    """Kepler 방정식 M = E - e·sin(E)를 Newton 반복으로 풀어 이심 근점 이각 E 계산"""
+    M = np.mod(mean_anomaly, 2.0 * np.pi)
+    if eccentricity == 0.0:
+        return M
+    
+    E = np.where(eccentricity > 0.8, np.pi, M)
+    for _ in range(_KEPLER_MAX_ITERATIONS):
+        delta = (E - eccentricity * np.sin(E) - M) / (1.0 - eccentricity * np.cos(E))
+        E = E - delta
+        if np.max(np.abs(delta), initial=0.0) < _KEPLER_TOLERANCE:
+            break
+    return E
+
+
+def _rotate_z(vectors: np.ndarray, cos_angle: np.ndarray, sin_angle: np.ndarray) -> np.ndarray:
+    """z축 기준 회전 (각도별 cos/sin 배열 사용)"""
+    rotated = np.empty_like(vectors)
+    rotated[..., 0] = cos_angle * vectors[..., 0] - sin_angle * vectors[..., 1]
+    rotated[..., 1] = sin_angle * vectors[..., 0] + cos_angle * vectors[..., 1]
+    rotated[..., 2] = vectors[..., 2]
+    return rotated
@@ -0,0 +1,194 @@
+"""
+TLE 궤도 전파기
+
+TLE(Two-Line Element)를 파싱하여 SGP4로 시간 배열 전체를 한 번에 전파하고,
+TEME 좌표를 지구 자전을 반영한 ECEF 위치/속도로 변환합니다.
+"""
+
+import numpy as np
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from sgp4.api import Satrec, SGP4_ERRORS, jday
+
+from sar_simulator.common.constants import EARTH_ROTATION_RATE
+
+
+# TLE 한 줄의 최소 길이 (체크섬 제외)
+_TLE_LINE_LENGTH = 68
+
+# 하루 초 수
+_SECONDS_PER_DAY = 86400.0
+
+
+class TlePropagator:
+    """
+    SGP4 기반 TLE 궤도 전파기
+    
+    파싱된 궤도 요소(Satrec)를 보관하며, 시간 배열에 대한 전파는
+    sgp4 라이브러리의 배열 API로 한 번에 계산합니다.
+    TEME → ECEF 변환은 IAU-82 GMST 회전만 적용하고 극운동은 무시합니다.
+    """
+    
+    def __init__(self, tle_text: str):
+        """
+        TlePropagator 초기화
+        
+        Parameters:
+        -----------
+        tle_text : str
+            TLE 텍스트 (2줄 또는 이름 줄을 포함한 3줄 형식)
+        """
+        lines = [line.strip() for line in tle_text.strip().splitlines() if line.strip()]
+        if len(lines) not in (2, 3):
+            raise ValueError("TLE 데이터는 2줄 또는 3줄 형식이어야 합니다.")
+        
+        self.name: Optional[str] = lines[0] if len(lines) == 3 else None
+        line1, line2 = lines[-2], lines[-1]
+        if not line1.startswith("1 ") or not line2.startswith("2 "):
+            raise ValueError("TLE 1행은 '1 ', 2행은 '2 '로 시작해야 합니다.")
+        if len(line1) < _TLE_LINE_LENGTH or len(line2) < _TLE_LINE_LENGTH:
+            raise ValueError("TLE 행 길이가 너무 짧습니다.")
+        
+        self.satrec = Satrec.twoline2rv(line1, line2)
+        if self.satrec.error != 0:
+            raise ValueError(f"TLE 파싱 오류: {SGP4_ERRORS.get(self.satrec.error, self.satrec.error)}")
+    
+    @property
+    def epoch(self) -> datetime:
+        """TLE 기준 시각 (UTC, timezone 없는 datetime)"""
+        jd = self.satrec.jdsatepoch + self.satrec.jdsatepochF
+        return _julian_date_to_datetime(jd)
+    
+    def propagate_teme(
+        self,
+        times: np.ndarray,
+        start_time: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        TEME 좌표계 위치/속도 전파
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            start_time으로부터의 경과 시간 (shape: [N], 단위: s)
+        start_time : datetime, optional
+            기준 시각 (UTC, None이면 TLE 기준 시각)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [N, 3], TEME, 단위: m, m/s)
+        """
+        jd, fr = self._julian_dates(times, start_time)
+        errors, positions, velocities = self.satrec.sgp4_array(jd, fr)
+        
+        if np.any(errors != 0):
+            code = int(errors[np.flatnonzero(errors)[0]])
+            raise ValueError(f"SGP4 전파 오류: {SGP4_ERRORS.get(code, code)}")
+        
+        return positions * 1e3, velocities * 1e3
+    
+    def propagate(
+        self,
+        times: np.ndarray,
+        start_time: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        ECEF 위치/속도 전파
+        
+        Parameters:
+        -----------
+        times : np.ndarray
+            start_time으로부터의 경과 시간 (shape: [N], 단위: s)
+        start_time : datetime, optional
+            기준 시각 (UTC, None이면 TLE 기준 시각)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [N, 3], ECEF, 단위: m, m/s)
+        """
+        jd, fr = self._julian_dates(times, start_time)
+        positions_teme, velocities_teme = self.propagate_teme(times, start_time)
+        
+        # TEME → ECEF (z축 기준 -GMST 회전, 지구 자전에 의한 상대 속도 보정)
+        theta = _gmst(jd, fr)
+        cos_t = np.cos(theta)
+        sin_t = np.sin(theta)
+        
+        positions = np.empty_like(positions_teme)
+        positions[:, 0] = cos_t * positions_teme[:, 0] + sin_t * positions_teme[:, 1]
+        positions[:, 1] = -sin_t * positions_teme[:, 0] + cos_t * positions_teme[:, 1]
+        positions[:, 2] = positions_teme[:, 2]
+        
+        velocities = np.empty_like(velocities_teme)
+        velocities[:, 0] = cos_t * velocities_teme[:, 0] + sin_t * velocities_teme[:, 1] + EARTH_ROTATION_RATE * positions[:, 1]
+        velocities[:, 1] = -sin_t * velocities_teme[:, 0] + cos_t * velocities_teme[:, 1] - EARTH_ROTATION_RATE * positions[:, 0]
+        velocities[:, 2] = velocities_teme[:, 2]
+        
+        return positions, velocities
+    
+    def propagate_pulses(
+        self,
+        num_pulses: int,
+        prf: float,
+        start_time: Optional[datetime] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        PRF 간격의 펄스별 ECEF 위치/속도 생성
+        
+        Parameters:
+        -----------
+        num_pulses : int
+            펄스 개수
+        prf : float
+            펄스 반복 주파수 (단위: Hz)
+        start_time : datetime, optional
+            첫 펄스 시각 (UTC, None이면 TLE 기준 시각)
+        
+        Returns:
+        --------
+        Tuple[np.ndarray, np.ndarray]
+            (위치, 속도) (각 shape: [num_pulses, 3], ECEF, 단위: m, m/s)
+        """
+        if prf <= 0:
+            raise ValueError("prf는 0보다 커야 합니다.")
+        return self.propagate(np.arange(num_pulses) / prf, start_time)
+    
+    def _julian_dates(
+        self,
+        times: np.ndarray,
+        start_time: Optional[datetime]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """경과 시간 배열을 (정수부, 소수부) 율리우스일 배열로 변환"""
+        times = np.atleast_1d(np.asarray(times, dtype=np.float64))
+        if start_time is None:
+            jd0, fr0 = self.satrec.jdsatepoch, self.satrec.jdsatepochF
+        else:
+            if start_time.tzinfo is not None:
+                start_time = start_time.astimezone(timezone.utc)
+            jd0, fr0 = jday(
+                start_time.year, start_time.month, start_time.day,
+                start_time.hour, start_time.minute,
+                start_time.second + start_time.microsecond * 1e-6
+            )
+        
+        # 소수부 정밀도 유지를 위해 일 단위 정수부를 분리
+        fr = fr0 + times / _SECONDS_PER_DAY
+        days = np.floor(fr)
+        return jd0 + days, fr - days
+
+
+def _gmst(jd: np.ndarray, fr: np.ndarray) -> np.ndarray:
+    """IAU-82 그리니치 평균 항성시 (단위: rad, UT1 ≈ UTC), 율리우스일은 정수부/소수부로 받아 정밀도 유지"""
+    t_ut1 = ((jd - 2451545.0) + fr) / 36525.0
+    seconds = (-6.2e-6 * t_ut1**3 + 0.093104 * t_ut1**2
+               + (876600.0 * 3600.0 + 8640184.812866) * t_ut1 + 67310.54841)
+    return np.mod(np.deg2rad(seconds / 240.0), 2.0 * np.pi)
+
+
+def _julian_date_to_datetime(jd: float) -> datetime:
+    """율리우스일을 UTC datetime으로 변환"""
+    unix_seconds = (jd - 2440587.5) * _SECONDS_PER_DAY
+    return datetime.fromtimestamp(unix_seconds, tz=timezone.utc).replace(tzinfo=None)
@@ -5,7 +5,9 @@ SAR 신호 처리 알고리즘을 제공합니다.
 """
 
 from sar_simulator.processing.rda_processor import RDAProcessor
+from sar_simulator.processing.burst_processing import process_bursts
 
 __all__ = [
     "RDAProcessor",
+    "process_bursts",
 ]
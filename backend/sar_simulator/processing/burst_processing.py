@@ -0,0 +1,91 @@
+"""
+다중 Burst 병렬 처리
+
+하나의 Raw Data 파일에 저장된 여러 Burst(그룹)를 프로세스별로 나누어 RDA 처리합니다.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence, Dict, Any, Tuple, Union
+
+import numpy as np
+
+from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.io.raw_data_reader import RawDataReader
+from sar_simulator.processing.rda_processor import RDAProcessor
+
+
+def process_bursts(
+    filepath: Union[str, Path],
+    config: Union[SarSystemConfig, Dict[str, SarSystemConfig]],
+    group_names: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    **process_options: Any
+) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    여러 Burst를 병렬로 RDA 처리
+    
+    각 프로세스가 RawDataReader로 Burst 하나를 읽어 RDAProcessor.process()를 수행합니다.
+    ADX가 있으면 Burst 중앙 펄스의 위성 속도를 RDAProcessor에 전달합니다.
+    가상 데이터셋/외부 링크로 통합한 파일도 그대로 처리할 수 있습니다.
+    
+    Parameters:
+    -----------
+    filepath : str or Path
+        Raw Data HDF5 파일 경로
+    config : SarSystemConfig 또는 Dict[str, SarSystemConfig]
+        SAR 시스템 설정 (그룹별로 다르면 그룹 이름 → 설정 dict)
+    group_names : Sequence[str], optional
+        처리할 그룹 이름 (None이면 파일의 모든 Burst 그룹)
+    max_workers : int, optional
+        최대 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스에서 순차 실행)
+    **process_options
+        RDAProcessor.process() 추가 인자 (dynamic_range, process_full_swath, range_compressed 등)
+    
+    Returns:
+    --------
+    Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]
+        그룹 이름 → (SAR 이미지 dB, range 범위, azimuth 범위)
+    """
+    filepath = Path(filepath)
+    if group_names is None:
+        with RawDataReader(filepath) as reader:
+            group_names = reader.group_names
+    
+    configs = {}
+    for group_name in group_names:
+        if isinstance(config, dict):
+            if group_name not in config:
+                raise ValueError(f"그룹 설정이 없습니다: {group_name}")
+            configs[group_name] = config[group_name]
+        else:
+            configs[group_name] = config
+    
+    if max_workers == 1:
+        return {
+            group_name: _process_burst(filepath, group_name, configs[group_name], process_options)
+            for group_name in group_names
+        }
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            group_name: executor.submit(_process_burst, filepath, group_name, configs[group_name], process_options)
+            for group_name in group_names
+        }
+        return {group_name: future.result() for group_name, future in futures.items()}
+
+
+def _process_burst(
+    filepath: Path,
+    group_name: str,
+    config: SarSystemConfig,
+    process_options: Dict[str, Any]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """작업 프로세스: Burst 하나를 지연 로딩 BurstArray 그대로 RDA 처리 (Pulse Compression이 블록 단위로 읽음)"""
+    with RawDataReader(filepath) as reader:
+        burst = reader.burst(group_name)
+        satellite_velocity = None
+        if 'B000_adx' in burst.group:
+            satellite_velocity = reader.state_vectors(group_name)["velocity"][len(burst) // 2]
+        
+        return RDAProcessor(config, satellite_velocity).process(burst, **process_options)
@@ -9,11 +9,16 @@ import numpy as np
 from numpy.fft import fftshift, fft, ifft
 from scipy.interpolate import interp1d
 from numpy import hamming
-from typing import Tuple, Optional
+from typing import Tuple, Optional, Union
 
 from sar_simulator.common.sar_system_config import SarSystemConfig
 from sar_simulator.common.constants import LIGHT_SPEED, PI
 from sar_simulator.common.math_utils import dB
+from sar_simulator.common.cint16_echo import CInt16Echo
+
+
+# Pulse Compression 시 한 번에 complex64로 복원/FFT하는 펄스 수
+PULSE_COMPRESSION_BLOCK_PULSES = 64
 
 
 class RDAProcessor:
@@ -21,6 +26,8 @@ class RDAProcessor:
     RDA (Range Doppler Algorithm) 프로세서
     
     Echo 신호 배열을 SAR 이미지로 변환합니다.
+    CInt16Echo나 BurstArray처럼 slicing 시 complex64로 복원되는 입력은
+    Pulse Compression에서 펄스 블록 단위로만 복원합니다.
     """
     
     def __init__(self, config: SarSystemConfig, satellite_velocity: Optional[np.ndarray] = None):
@@ -68,17 +75,18 @@ class RDAProcessor:
     
     def process(
         self,
-        echo_signals: np.ndarray,
+        echo_signals: Union[np.ndarray, CInt16Echo],
         dynamic_range: float = 50.0,
         mid_range_index: Optional[int] = None,
-        process_full_swath: bool = False
+        process_full_swath: bool = False,
+        range_compressed: bool = False
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """
         전체 RDA 알고리즘 실행
         
         Parameters:
         -----------
-        echo_signals : np.ndarray
+        echo_signals : np.ndarray, CInt16Echo 또는 BurstArray
             Echo 신호 배열 (shape: [num_pulses, num_samples], dtype: complex64)
         dynamic_range : float
             SAR 이미지 동적 범위 (dB)
@@ -86,6 +94,9 @@ class RDAProcessor:
             중간 range 인덱스 (None인 경우 자동 계산, process_full_swath=True일 때 무시)
         process_full_swath : bool
             전체 swath 처리 여부 (False: 타겟 영역만, True: 전체 영역)
+        range_compressed : bool
+            입력이 이미 Range 압축된 신호인지 여부
+            (SarEchoSimulator의 range_compressed 모드 출력, True인 경우 Pulse Compression 생략)
         
         Returns:
         --------
@@ -98,8 +109,11 @@ class RDAProcessor:
         """
         num_pulses, num_range_samples = echo_signals.shape
         
-        # 1. Pulse Compression
-        pulse_compressed = self.pulse_compression(echo_signals)
+        # 1. Pulse Compression (Range 압축된 입력인 경우 생략)
+        if range_compressed:
+            pulse_compressed = echo_signals if isinstance(echo_signals, np.ndarray) else np.asarray(echo_signals)
+        else:
+            pulse_compressed = self.pulse_compression(echo_signals)
         
         # 2. Range 계산
         r = LIGHT_SPEED * self.swst / 2.0 + np.arange(pulse_compressed.shape[1]) * self.dr
@@ -146,8 +160,9 @@ class RDAProcessor:
     
     def process_both(
         self,
-        echo_signals: np.ndarray,
-        dynamic_range: float = 50.0
+        echo_signals: Union[np.ndarray, CInt16Echo],
+        dynamic_range: float = 50.0,
+        range_compressed: bool = False
     ) -> Tuple[
         Tuple[np.ndarray, np.ndarray, np.ndarray],
         Tuple[np.ndarray, np.ndarray, np.ndarray]
@@ -157,10 +172,12 @@ class RDAProcessor:
         
         Parameters:
         -----------
-        echo_signals : np.ndarray
+        echo_signals : np.ndarray, CInt16Echo 또는 BurstArray
             Echo 신호 배열 (shape: [num_pulses, num_samples], dtype: complex64)
         dynamic_range : float
             SAR 이미지 동적 범위 (dB)
+        range_compressed : bool
+            입력이 이미 Range 압축된 신호인지 여부
         
         Returns:
         --------
@@ -173,25 +190,29 @@ class RDAProcessor:
         target_result = self.process(
             echo_signals,
             dynamic_range=dynamic_range,
-            process_full_swath=False
+            process_full_swath=False,
+            range_compressed=range_compressed
         )
         
         # 전체 영역 처리
         full_result = self.process(
             echo_signals,
             dynamic_range=dynamic_range,
-            process_full_swath=True
+            process_full_swath=True,
+            range_compressed=range_compressed
         )
         
         return target_result, full_result
     
-    def pulse_compression(self, echo_signals: np.ndarray) -> np.ndarray:
+    def pulse_compression(self, echo_signals: Union[np.ndarray, CInt16Echo]) -> np.ndarray:
         """
         Pulse Compression (Range 방향 압축)
         
+        펄스 블록 단위로 입력을 complex64로 읽어 FFT 합니다.
+        
         Parameters:
         -----------
-        echo_signals : np.ndarray
+        echo_signals : np.ndarray, CInt16Echo 또는 BurstArray
             Echo 신호 배열 (shape: [num_pulses, num_samples])
         
         Returns:
@@ -211,11 +232,12 @@ class RDAProcessor:
         # 참조 신호의 FFT (conjugate)
         f_ref = np.conj(fft(ref, fft_len))
         
-        # 각 pulse에 대해 압축 수행
+        # 펄스 블록 단위로 압축 수행 (CInt16/지연 로딩 입력은 블록만 복원)
         pulse_compressed = np.zeros((num_pulses, fft_len), dtype=np.complex64)
-        for p in range(num_pulses):
-            f_sig = fft(echo_signals[p, :], fft_len)
-            pulse_compressed[p, :] = ifft(f_sig * f_ref)
+        for start in range(0, num_pulses, PULSE_COMPRESSION_BLOCK_PULSES):
+            stop = min(start + PULSE_COMPRESSION_BLOCK_PULSES, num_pulses)
+            f_sig = fft(echo_signals[start:stop], fft_len, axis=1)
+            pulse_compressed[start:stop] = ifft(f_sig * f_ref, axis=1)
         
         return pulse_compressed
     
@@ -25,49 +25,9 @@ from sar_simulator.common import SarSystemConfig, Target, TargetList
 from sar_simulator.echo import SarEchoSimulator
 from sar_simulator.processing import RDAProcessor
 from sar_simulator.common.constants import LIGHT_SPEED
+from sar_simulator.common.coordinates import llh_to_ecef
 import numpy as np
 
-# WGS84 파라미터
-WGS84_A = 6378137.0  # 장반경 (m)
-WGS84_F = 1.0 / 298.257223563  # 편평률
-WGS84_E2 = WGS84_F * (2.0 - WGS84_F)  # 이심률 제곱
-
-def llh_to_ecef(lat, lon, alt):
-    """
-    위도/경도/고도를 ECEF 좌표로 변환
-    
-    Parameters:
-    -----------
-    lat : float
-        위도 (degrees)
-    lon : float
-        경도 (degrees)
-    alt : float
-        고도 (m)
-    
-    Returns:
-    --------
-    np.ndarray
-        ECEF 좌표 [x, y, z] (m)
-    """
-    lat_rad = np.deg2rad(lat)
-    lon_rad = np.deg2rad(lon)
-    
-    sin_lat = np.sin(lat_rad)
-    cos_lat = np.cos(lat_rad)
-    sin_lon = np.sin(lon_rad)
-    cos_lon = np.cos(lon_rad)
-    
-    # 곡률 반경
-    N = WGS84_A / np.sqrt(1.0 - WGS84_E2 * sin_lat * sin_lat)
-    
-    # ECEF 좌표
-    x = (N + alt) * cos_lat * cos_lon
-    y = (N + alt) * cos_lat * sin_lon
-    z = (N * (1.0 - WGS84_E2) + alt) * sin_lat
-    
-    return np.array([x, y, z])
-
 # 출력 디렉토리
 OUTPUT_DIR = Path(__file__).parent.parent / "test_outputs"
 OUTPUT_DIR.mkdir(exist_ok=True)
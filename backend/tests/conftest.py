@@ -0,0 +1,75 @@
+"""
+테스트 공통 설정
+
+여러 테스트 모듈이 함께 사용하는 SAR 시스템 설정, 무작위 Echo 생성, 메모리 데이터베이스 fixture를 정의합니다.
+"""
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from api.main import app
+from api.database import Base, get_db
+from sar_simulator.common import SarSystemConfig
+
+
+# 테스트 공통 SAR 시스템 설정 파라미터
+CONFIG_PARAMS = {
+    "fc": 5.4e9, "bw": 150e6, "fs": 350e6, "taup": 10e-6, "prf": 5000,
+    "swst": 10e-6, "swl": 50e-6, "orbit_height": 517e3,
+    "antenna_width": 4.0, "antenna_height": 0.5
+}
+
+# 테스트용 메모리 데이터베이스
+test_engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool
+)
+TestSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+def override_get_db():
+    """테스트용 데이터베이스 세션"""
+    db = TestSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def config_params():
+    """SAR 시스템 설정 파라미터 (테스트마다 새 dict)"""
+    return dict(CONFIG_PARAMS)
+
+
+@pytest.fixture
+def config(config_params):
+    """SAR 시스템 설정"""
+    return SarSystemConfig(**config_params)
+
+
+@pytest.fixture
+def random_echo():
+    """정규분포 복소 Echo 데이터 생성 함수 (random_echo(num_pulses, num_samples, seed=0) -> complex64 배열)"""
+    def make(num_pulses, num_samples, seed=0):
+        rng = np.random.default_rng(seed)
+        return (rng.normal(size=(num_pulses, num_samples)) + 1j * rng.normal(size=(num_pulses, num_samples))).astype(np.complex64)
+    return make
+
+
+@pytest.fixture
+def db_session():
+    """테스트 데이터베이스 세션"""
+    Base.metadata.create_all(bind=test_engine)
+    app.dependency_overrides[get_db] = override_get_db
+    db = TestSessionLocal()
+    
+    yield db
+    
+    db.close()
+    app.dependency_overrides.clear()
+    Base.metadata.drop_all(bind=test_engine)
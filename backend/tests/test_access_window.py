@@ -0,0 +1,200 @@
+"""
+관측 기회(Access Window) 탐색 테스트
+
+샘플링 윈도우 기반 off-nadir 각도 범위, 전수 탐색 대비 구간 탐색 정확도,
+관측 기회 탐색 API를 검증합니다.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.schemas.tle import TleCreateRequest
+from api.services.tle_service import create_tle
+from sar_simulator.common import SarSystemConfig
+from sar_simulator.common.constants import LIGHT_SPEED
+from sar_simulator.orbit import (
+    KeplerianElements,
+    KeplerPropagator,
+    estimate_rank,
+    calc_slant_range_window,
+    slant_range_to_off_nadir,
+    calc_off_nadir_limits,
+    find_access_windows,
+)
+from sar_simulator.orbit.access_window import _access_margin
+from sar_simulator.common.coordinates import enu_rotation, llh_to_ecef
+
+
+SSO_TLE = (
+    "1 43013U 17073A   24001.50000000  .00000012  00000+0  25000-4 0  9999\n"
+    "2 43013  97.4500  10.0000 0001000  90.0000 270.0000 15.21000000 12345"
+)
+
+# C5 기본 빔 설정
+CONFIG_PARAMS = {
+    "fc": 5.4e9, "bw": 150e6, "fs": 250e6, "taup": 11e-6, "prf": 5930,
+    "swst": 47.8e-6, "swl": 45.5e-6, "orbit_height": 561e3,
+    "antenna_width": 4.0, "antenna_height": 0.5
+}
+
+
+def _brute_force_windows(propagator, aoi, duration, off_nadir_range, look_side, dt=0.05):
+    """짧은 시간 간격 전수 평가로 구한 관측 가능 구간 (시작, 종료) 목록"""
+    times = np.arange(0.0, duration, dt)
+    positions, velocities = propagator.propagate(times)
+    target = llh_to_ecef(aoi[0], aoi[1], 0.0)[np.newaxis]
+    normal = enu_rotation(aoi[0], aoi[1])[2][np.newaxis]
+    inside = _access_margin(positions, velocities, target, normal, off_nadir_range, 0.0, look_side)[:, 0] > 0.0
+    edges = np.flatnonzero(np.diff(inside.astype(np.int8)))
+    boundaries = list(times[edges] + 0.5 * dt)
+    if inside[0]:
+        boundaries.insert(0, 0.0)
+    if inside[-1]:
+        boundaries.append(duration)
+    return list(zip(boundaries[0::2], boundaries[1::2]))
+
+
+def test_off_nadir_limits_from_sampling_window():
+    """swst/swl 기반 rank, slant range, off-nadir 각도 범위 테스트"""
+    config = SarSystemConfig(**CONFIG_PARAMS)
+    
+    rank = estimate_rank(config)
+    assert rank == 26
+    near, far = calc_slant_range_window(config, rank)
+    assert np.isclose(near, 0.5 * LIGHT_SPEED * (26 / 5930 + 47.8e-6))
+    assert np.isclose(far - near, 0.5 * LIGHT_SPEED * (45.5e-6 - 11e-6))
+    
+    min_angle, max_angle = calc_off_nadir_limits(config)
+    assert 30.0 < min_angle < max_angle < 32.0
+    
+    # 직하점은 off-nadir 0°, 지평선 너머는 오류
+    assert np.isclose(slant_range_to_off_nadir(561e3, 561e3), 0.0, atol=1e-6)
+    with pytest.raises(ValueError):
+        slant_range_to_off_nadir(500e3, 561e3)
+    with pytest.raises(ValueError):
+        slant_range_to_off_nadir(4000e3, 561e3)
+
+
+def test_windows_match_brute_force():
+    """격자 세분/이분법 탐색 결과와 전수 탐색 결과 비교"""
+    propagator = KeplerPropagator(KeplerianElements.circular(561e3, 97.6, 20.0, 0.0))
+    aois = np.array([[37.5, 127.0], [-33.9, 151.2], [51.5, -0.1], [0.0, 40.0]])
+    duration = 43200.0
+    
+    for off_nadir_range, look_side in (((20.0, 45.0), "right"), ((30.9, 31.5), "left")):
+        windows = find_access_windows(propagator.propagate, aois, duration, off_nadir_range, look_side=look_side)
+        assert windows == sorted(windows, key=lambda window: window.start_time)
+        
+        for index, aoi in enumerate(aois):
+            expected = _brute_force_windows(propagator, aoi, duration, off_nadir_range, look_side)
+            found = [(w.start_time, w.end_time) for w in windows if w.aoi_index == index]
+            assert len(found) == len(expected)
+            assert np.allclose(found, expected, rtol=0.0, atol=0.05) if expected else True
+
+
+def test_look_side_and_validation():
+    """관측 방향별 구간 관계와 입력 검증 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(561e3, 97.6))
+    rng = np.random.default_rng(1)
+    aois = np.column_stack([rng.uniform(-70.0, 70.0, 20), rng.uniform(-180.0, 180.0, 20)])
+    
+    right = find_access_windows(propagator.propagate, aois, 86400.0, (20.0, 45.0), look_side="right")
+    left = find_access_windows(propagator.propagate, aois, 86400.0, (20.0, 45.0), look_side="left")
+    both = find_access_windows(propagator.propagate, aois, 86400.0, (20.0, 45.0), look_side="both")
+    assert len(right) > 0 and len(left) > 0
+    
+    # 양쪽 관측 구간은 오른쪽/왼쪽 구간의 합집합 (궤도면을 지나며 이어진 구간은 하나로 합쳐짐)
+    assert len(both) <= len(right) + len(left)
+    total = sum(window.duration for window in right + left)
+    assert np.isclose(sum(window.duration for window in both), total, rtol=0.0, atol=0.01 * len(both))
+    
+    with pytest.raises(ValueError):
+        find_access_windows(propagator.propagate, aois, 3600.0, (45.0, 20.0))
+    with pytest.raises(ValueError):
+        find_access_windows(propagator.propagate, aois, 3600.0, (20.0, 45.0), look_side="up")
+    with pytest.raises(ValueError):
+        find_access_windows(propagator.propagate, aois[:, :1], 3600.0, (20.0, 45.0))
+    
+    # 격자 크기 상한을 넘으면 궤도 전파 전에 거부
+    def fail_propagate(times):
+        raise AssertionError("격자 크기 검사 전에 전파하면 안 됩니다.")
+    
+    with pytest.raises(ValueError):
+        find_access_windows(fail_propagate, aois, 30 * 86400.0, (20.0, 45.0), step=0.1)
+
+
+def test_access_windows_endpoint(db_session):
+    """저장된 TLE의 관측 기회 탐색 API 테스트"""
+    tle = create_tle(db_session, TleCreateRequest(name="SSO", tle_data=SSO_TLE))
+    client = TestClient(app)
+    
+    response = client.post(f"/api/tle/{tle.id}/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0, 37.5], [151.2, -33.9], [-0.1, 51.5]],
+        "start_time": "2024-01-01T12:00:00",
+        "duration": 172800,
+        "off_nadir_range": [20.0, 45.0]
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["off_nadir_range"] == [20.0, 45.0]
+    assert data["num_windows"] == len(data["windows"]) > 0
+    assert {window["aoi_index"] for window in data["windows"]} <= {0, 1, 2}
+    for window in data["windows"]:
+        assert 0.0 < window["duration"] < 600.0
+        assert window["start_time"] >= "2024-01-01T12:00:00"
+    
+    # off_nadir_range를 생략하면 swst/swl에서 계산
+    response = client.post(f"/api/tle/{tle.id}/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0, 37.5]],
+        "duration": 86400
+    })
+    assert response.status_code == 200
+    min_angle, max_angle = response.json()["off_nadir_range"]
+    assert 30.0 < min_angle < max_angle < 32.0
+    
+    response = client.post("/api/tle/unknown-id/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0, 37.5]],
+        "duration": 86400
+    })
+    assert response.status_code == 404
+    
+    response = client.post(f"/api/tle/{tle.id}/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0]],
+        "duration": 86400
+    })
+    assert response.status_code == 400
+    
+    # step 하한(1 s)과 AOI 개수 상한(1,000개)은 스키마에서 거부
+    response = client.post(f"/api/tle/{tle.id}/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0, 37.5]],
+        "duration": 86400,
+        "step": 0.5
+    })
+    assert response.status_code == 422
+    
+    response = client.post(f"/api/tle/{tle.id}/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0, 37.5]] * 1001,
+        "duration": 86400
+    })
+    assert response.status_code == 422
+    
+    # 격자 시각 × AOI 개수가 상한을 넘으면 400
+    response = client.post(f"/api/tle/{tle.id}/access-windows", json={
+        "config": CONFIG_PARAMS,
+        "aoi_locations": [[127.0, 37.5]] * 1000,
+        "duration": 30 * 86400,
+        "step": 1.0
+    })
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
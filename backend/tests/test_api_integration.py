@@ -262,6 +262,80 @@ class TestEchoSimulation:
         echo_signals = (echo_float32[::2] + 1j * echo_float32[1::2]).reshape(num_pulses, data["num_samples"])
         assert echo_signals.shape == (num_pulses, data["num_samples"])
     
+    def test_simulate_echo_aggregation(self):
+        """해상도 셀 타겟 집계 옵션 테스트"""
+        request_data = {
+            "config": TEST_CONFIG,
+            "targets": [TEST_TARGET, TEST_TARGET],
+            "satellite_states": [TEST_SATELLITE_STATE] * 2,
+            "aggregate_cell_fraction": 0.5
+        }
+        
+        response = client.post("/api/echo/simulate-multiple", json=request_data)
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["num_targets_eliminated"] == 1
+        assert data["aggregation_error"] < 1e-9
+    
+    def test_simulate_echo_clutter(self):
+        """분포 클러터 옵션 테스트"""
+        request_data = {
+            "config": TEST_CONFIG,
+            "targets": [TEST_TARGET],
+            "satellite_states": [TEST_SATELLITE_STATE] * 4,
+            "clutter": {
+                "sigma0_db": -15.0,
+                "upper_left": [-0.01, 0.01],
+                "lower_right": [0.01, -0.01],
+                "seed": 0
+            }
+        }
+        
+        response = client.post("/api/echo/simulate-multiple", json=request_data)
+        assert response.status_code == 200
+        assert response.json()["shape"][0] == 4
+        
+        # 잘못된 영역 (좌상단이 우하단보다 남쪽)
+        request_data["clutter"]["upper_left"] = [-0.01, -0.02]
+        response = client.post("/api/echo/simulate-multiple", json=request_data)
+        assert response.status_code == 400
+    
+    def test_simulate_echo_scene_file(self):
+        """Scene 파일 타겟으로 Echo 시뮬레이션 테스트"""
+        from sar_simulator.common.target_model import TargetList
+        from sar_simulator.io.scene_file import write_scene_file
+        
+        # 빔 안의 타겟 1개 + 빔 밖의 타겟 1개
+        scene = TargetList.from_columns(
+            positions=np.array([TEST_TARGET["position"], [0.0, 6378137.0, 0.0]])
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            scene_path = os.path.join(tmpdir, "scene.h5")
+            write_scene_file(scene_path, scene)
+            
+            request_data = {
+                "config": TEST_CONFIG,
+                "scene_file": scene_path,
+                "satellite_state": TEST_SATELLITE_STATE
+            }
+            response = client.post("/api/echo/simulate", json=request_data)
+        
+        assert response.status_code == 200
+        
+        reference = client.post("/api/echo/simulate", json={
+            "config": TEST_CONFIG,
+            "targets": [TEST_TARGET],
+            "satellite_state": TEST_SATELLITE_STATE
+        })
+        assert abs(response.json()["max_amplitude"] - reference.json()["max_amplitude"]) < 1e-9
+        
+        # 존재하지 않는 Scene 파일
+        request_data["scene_file"] = "/nonexistent/scene.h5"
+        response = client.post("/api/echo/simulate", json=request_data)
+        assert response.status_code == 400
+    
     def test_simulate_echo_invalid_config(self):
         """잘못된 설정으로 Echo 시뮬레이션 테스트"""
         invalid_config = TEST_CONFIG.copy()
@@ -377,6 +451,68 @@ class TestRawDataSave:
                 assert dataset.shape[0] == num_pulses
 
 
+class TestSatelliteDirection:
+    """미션 방향 계산 테스트"""
+    
+    def test_calculate_direction_batch(self):
+        """일괄 계산 결과를 알려진 상태의 기준값과 단일 상태 계산 결과와 비교"""
+        positions = [
+            [6378137.0 + 517000.0, 0.0, 0.0],
+            [-4.03e6, 3.15e6, 4.37e6],
+            [0.0, 0.0, 7.0e6]
+        ]
+        velocities = [
+            [0.0, 7266.0, 0.0],
+            [1.0e3, -5.0e3, 5.0e3],
+            [7266.0, 0.0, 0.0]
+        ]
+        mission_location = [128.1, 37.1]
+        
+        # 적도 상공(미션 위치가 지평선 너머), 한국 상공, 북극 상공(모든 방향이 남쪽)
+        expected_beam_directions = [
+            [-0.875464433, 0.349570495, 0.333710197],
+            [0.65781433, 0.636205281, -0.403141597],
+            [-0.523686997, 0.667882785, -0.528852073]
+        ]
+        expected_headings = [90.0, 27.680837, 180.0]
+        expected_crossing_points = [
+            [1.8792927, 1.8051972, 0.0],
+            [128.1, 37.1, 0.0],
+            [128.1, 78.9999144, 0.0]
+        ]
+        
+        response = client.post("/api/satellite/calculate-direction-batch", json={
+            "positions": positions,
+            "velocities": velocities,
+            "mission_location": mission_location
+        })
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert data["num_states"] == 3
+        assert np.allclose(data["beam_directions"], expected_beam_directions, atol=1e-9)
+        assert np.allclose(data["headings"], expected_headings, atol=1e-6)
+        assert np.allclose(data["crossing_points"], expected_crossing_points, atol=1e-6)
+        
+        for i in range(3):
+            single = client.post("/api/satellite/calculate-direction", json={
+                "satellite_state": {"position": positions[i], "velocity": velocities[i]},
+                "mission_location": mission_location
+            }).json()
+            assert np.allclose(single["beam_direction"], expected_beam_directions[i], atol=1e-9)
+            assert np.isclose(single["heading"], expected_headings[i], atol=1e-6)
+            assert np.allclose(single["crossing_point"], expected_crossing_points[i], atol=1e-6)
+    
+    def test_calculate_direction_batch_mismatch(self):
+        """위치/속도 개수 불일치 테스트"""
+        response = client.post("/api/satellite/calculate-direction-batch", json={
+            "positions": [[6378137.0 + 517000.0, 0.0, 0.0]] * 2,
+            "velocities": [[0.0, 7266.0, 0.0]],
+            "mission_location": [128.1, 37.1]
+        })
+        assert response.status_code == 400
+
+
 class TestEndToEnd:
     """End-to-End 통합 테스트"""
     
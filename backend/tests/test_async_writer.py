@@ -0,0 +1,211 @@
+"""
+비동기 Burst Writer 테스트
+
+writer 스레드 기록 결과, 큐 크기 제한에 따른 생산자 대기(back-pressure),
+CInt16 Burst 기록, writer 예외 전파, gzip 청크 기록 중 다음 Echo 블록 계산 진행을 검증합니다.
+"""
+
+import threading
+import time
+
+import h5py
+import numpy as np
+import pytest
+
+from sar_simulator.common import CInt16Echo, quantize_cint16
+from sar_simulator.io import AsyncBurstWriter, RawDataReader, RawDataWriter
+from sar_simulator.orbit import Ephemeris, KeplerianElements, KeplerPropagator
+
+
+class GatedRawDataWriter(RawDataWriter):
+    """gate가 열릴 때까지 블록 기록을 차단하는 테스트용 Writer"""
+    
+    def __init__(self, filepath, config, gate):
+        super().__init__(filepath, config)
+        self.gate = gate
+        self.written_blocks = 0
+    
+    def append_pulses(self, *args, **kwargs):
+        self.gate.wait()
+        self.written_blocks += 1
+        return super().append_pulses(*args, **kwargs)
+
+
+def test_async_matches_sync(config, tmp_path):
+    """비동기 기록 결과와 동기 스트리밍 기록 결과 비교"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    ephemeris = Ephemeris.from_propagator(propagator, np.array([0.0, 10.0, 20.0]))
+    rng = np.random.default_rng(0)
+    blocks = [(rng.normal(size=(n, 64)) + 1j * rng.normal(size=(n, 64))).astype(np.complex64) for n in (5, 17, 1, 30)]
+    
+    sync_path = tmp_path / "sync.h5"
+    with RawDataWriter(str(sync_path), config) as writer:
+        writer.begin_burst("S01", num_samples=64, ephemeris=ephemeris)
+        for block in blocks:
+            writer.append_pulses("S01", block)
+        writer.end_burst("S01")
+    
+    async_path = tmp_path / "async.h5"
+    with RawDataWriter(str(async_path), config) as writer, AsyncBurstWriter(writer, max_pending_blocks=2) as sink:
+        sink.begin_burst("S01", num_samples=64, ephemeris=ephemeris)
+        buffer = np.empty((30, 64), dtype=np.complex64)
+        for block in blocks:
+            # 호출 후 버퍼를 바로 재사용해도 기록 결과에 영향 없음
+            buffer[:len(block)] = block
+            queued = sink.append_pulses("S01", buffer[:len(block)])
+            buffer[:] = 0.0
+        assert queued == 53
+        sink.end_burst("S01")
+        sink.flush()
+    
+    with h5py.File(sync_path, 'r') as expected, h5py.File(async_path, 'r') as actual:
+        assert np.array_equal(actual["S01/B000"][()], expected["S01/B000"][()])
+        assert np.array_equal(actual["S01/B000_adx"][()], expected["S01/B000_adx"][()])
+
+
+def test_async_cint16(config, tmp_path):
+    """CInt16Echo 블록을 복원하지 않고 int16 코드 그대로 기록하는지 테스트"""
+    rng = np.random.default_rng(1)
+    echo = quantize_cint16((rng.normal(size=(24, 64)) + 1j * rng.normal(size=(24, 64))).astype(np.complex64), 12)
+    received = []
+    
+    class RecordingRawDataWriter(RawDataWriter):
+        def append_pulses(self, group_name, echo_block, *args, **kwargs):
+            received.append(echo_block)
+            return super().append_pulses(group_name, echo_block, *args, **kwargs)
+    
+    filepath = tmp_path / "cint16.h5"
+    with RecordingRawDataWriter(str(filepath), config) as writer, AsyncBurstWriter(writer) as sink:
+        sink.begin_burst("S01", num_samples=64, cint16_scale=echo.scale)
+        block = CInt16Echo(echo.data[:10].copy(), echo.scale, echo.adc_bits)
+        sink.append_pulses("S01", block)
+        block.data[:] = 0
+        assert sink.append_pulses("S01", CInt16Echo(echo.data[10:], echo.scale, echo.adc_bits)) == 24
+        sink.end_burst("S01")
+    
+    assert all(isinstance(echo_block, CInt16Echo) for echo_block in received)
+    with RawDataReader(filepath) as reader:
+        burst = reader.burst("S01")
+        assert burst.encoding == 'CINT16'
+        assert np.array_equal(burst.group['B000'][()], echo.data)
+
+
+def test_back_pressure(config, tmp_path):
+    """큐가 가득 차면 생산자가 대기하는지 테스트"""
+    gate = threading.Event()
+    block = np.zeros((4, 64), dtype=np.complex64)
+    submitted = []
+    
+    with GatedRawDataWriter(str(tmp_path / "gate.h5"), config, gate) as writer:
+        with AsyncBurstWriter(writer, max_pending_blocks=2) as sink:
+            sink.begin_burst("S01", num_samples=64)
+            
+            def produce():
+                for _ in range(6):
+                    sink.append_pulses("S01", block)
+                    submitted.append(1)
+            
+            producer = threading.Thread(target=produce)
+            producer.start()
+            time.sleep(0.3)
+            
+            # writer가 막힌 동안: 처리 중 1개 + 큐 2개까지만 제출
+            assert producer.is_alive()
+            assert len(submitted) <= 3
+            assert writer.written_blocks == 0
+            
+            gate.set()
+            producer.join(timeout=5.0)
+            assert not producer.is_alive()
+            sink.end_burst("S01")
+        
+        assert writer.written_blocks == 6
+
+
+def test_error_propagation(config, tmp_path):
+    """writer 스레드 예외가 생산자에게 전달되는지 테스트"""
+    with RawDataWriter(str(tmp_path / "error.h5"), config) as writer:
+        sink = AsyncBurstWriter(writer, max_pending_blocks=1)
+        with pytest.raises(ValueError):
+            sink.append_pulses("S01", np.zeros((4, 64), dtype=np.complex64))
+        
+        sink.start()
+        sink.begin_burst("S01", num_samples=64)
+        sink.append_pulses("S01", np.zeros((4, 32), dtype=np.complex64))
+        with pytest.raises(ValueError, match="Echo 블록"):
+            sink.flush()
+        with pytest.raises(ValueError, match="Echo 블록"):
+            sink.append_pulses("S01", np.zeros((4, 64), dtype=np.complex64))
+        with pytest.raises(ValueError, match="Echo 블록"):
+            sink.close()
+    
+    # 본문 예외가 있으면 그대로 전달
+    with RawDataWriter(str(tmp_path / "body_error.h5"), config) as writer:
+        with pytest.raises(KeyError):
+            with AsyncBurstWriter(writer) as sink:
+                sink.append_pulses("unknown", np.zeros((4, 64), dtype=np.complex64))
+                raise KeyError("body")
+
+
+class HandshakeRawDataWriter(RawDataWriter):
+    """블록을 기록한 뒤 생산자가 다음 블록을 계산할 때까지 반환하지 않는 테스트용 Writer"""
+    
+    def __init__(self, filepath, config, num_blocks, **kwargs):
+        super().__init__(filepath, config, **kwargs)
+        self.writing = [threading.Event() for _ in range(num_blocks)]
+        self.computed = [threading.Event() for _ in range(num_blocks)]
+        self.overlapped = []
+    
+    def append_pulses(self, group_name, echo_block, *args, **kwargs):
+        index = len(self.overlapped)
+        self.writing[index].set()
+        result = super().append_pulses(group_name, echo_block, *args, **kwargs)
+        
+        # 마지막 블록 외에는 생산자가 다음 블록 계산을 끝내야 기록 호출이 끝남
+        self.overlapped.append(index + 1 == len(self.computed) or self.computed[index + 1].wait(timeout=10.0))
+        return result
+
+
+def _compute_block(phase, index):
+    """Echo 생성과 비슷한 numpy 연산 (위상 회전 누적)"""
+    echo = np.exp(1j * (phase + index))
+    for _ in range(3):
+        echo *= np.exp(1j * phase)
+    return echo.astype(np.complex64)
+
+
+def test_computes_during_gzip_writes(config, tmp_path):
+    """gzip 청크 기록이 진행 중인 동안 생산자가 다음 Echo 블록을 계산하는지 테스트 (시간 측정 없음)"""
+    num_blocks = 4
+    phase = np.random.default_rng(0).uniform(0.0, 2.0 * np.pi, size=(16, 4096))
+    blocks = [_compute_block(phase, index) for index in range(num_blocks)]
+    
+    serial_path = tmp_path / "serial.h5"
+    with RawDataWriter(str(serial_path), config, compression="gzip") as writer:
+        writer.begin_burst("S01", num_samples=4096, chunk_pulses=16)
+        for block in blocks:
+            writer.append_pulses("S01", block)
+        writer.end_burst("S01")
+    
+    # 블록 k 기록이 시작된 뒤에 블록 k + 1을 계산하고, 기록은 그 계산이 끝나야 반환됨
+    # 동기 기록이었다면 생산자가 기록 호출에 묶여 있으므로 다음 블록을 계산할 수 없음
+    async_path = tmp_path / "async.h5"
+    with HandshakeRawDataWriter(str(async_path), config, num_blocks, compression="gzip") as writer:
+        with AsyncBurstWriter(writer, max_pending_blocks=1) as sink:
+            sink.begin_burst("S01", num_samples=4096, chunk_pulses=16)
+            sink.append_pulses("S01", _compute_block(phase, 0))
+            for index in range(1, num_blocks):
+                assert writer.writing[index - 1].wait(timeout=10.0)
+                block = _compute_block(phase, index)
+                writer.computed[index].set()
+                sink.append_pulses("S01", block)
+            sink.end_burst("S01")
+        assert writer.overlapped == [True] * num_blocks
+    
+    with h5py.File(serial_path, 'r') as expected, h5py.File(async_path, 'r') as actual:
+        assert actual["S01/B000"].compression == "gzip"
+        assert np.array_equal(actual["S01/B000"][()], expected["S01/B000"][()])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
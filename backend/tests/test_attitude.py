@@ -0,0 +1,221 @@
+"""
+버스 자세 모델 테스트
+
+쿼터니언 변환, 궤도 좌표계, 자세 적용 빔 방향, 동체 각속도와
+ADX 자세 열 기록 및 Echo 시뮬레이션/API 연동을 검증합니다.
+"""
+
+import base64
+
+import h5py
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from sar_simulator.common import Target, TargetList
+from sar_simulator.common.coordinates import WGS84_A
+from sar_simulator.echo import SarEchoSimulator
+from sar_simulator.io.raw_data_writer import RawDataWriter
+from sar_simulator.orbit import (
+    AttitudeProfile,
+    KeplerianElements,
+    KeplerPropagator,
+    calc_look_directions,
+    quaternion_multiply,
+    quaternion_from_euler,
+    quaternion_to_matrix,
+    matrix_to_quaternion,
+    rotate_vectors,
+    orbital_frame,
+)
+
+
+def _rotation_x(angle):
+    c, s = np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))
+    return np.array([[1.0, 0.0, 0.0], [0.0, c, -s], [0.0, s, c]])
+
+
+def _rotation_y(angle):
+    c, s = np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))
+    return np.array([[c, 0.0, s], [0.0, 1.0, 0.0], [-s, 0.0, c]])
+
+
+def _rotation_z(angle):
+    c, s = np.cos(np.deg2rad(angle)), np.sin(np.deg2rad(angle))
+    return np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])
+
+
+def test_quaternion_conversions():
+    """3-2-1 오일러 각도/쿼터니언/회전 행렬 변환 테스트"""
+    rng = np.random.default_rng(0)
+    angles = rng.uniform(-170.0, 170.0, (50, 3))
+    quaternions = quaternion_from_euler(angles[:, 0], angles[:, 1] / 2.0, angles[:, 2])
+    assert np.allclose(np.linalg.norm(quaternions, axis=1), 1.0)
+    
+    matrices = quaternion_to_matrix(quaternions)
+    for (roll, pitch, yaw), matrix in zip(angles, matrices):
+        expected = _rotation_z(yaw) @ _rotation_y(pitch / 2.0) @ _rotation_x(roll)
+        assert np.allclose(matrix, expected, atol=1e-12)
+    
+    # 행렬 → 쿼터니언 왕복 (부호 모호성 제거)
+    recovered = matrix_to_quaternion(matrices)
+    signs = np.sign(np.sum(recovered * quaternions, axis=1))[:, np.newaxis]
+    assert np.allclose(recovered * signs, quaternions, atol=1e-12)
+    
+    # 벡터 회전과 쿼터니언 곱은 행렬 연산과 일치
+    vectors = rng.normal(size=(50, 3))
+    assert np.allclose(rotate_vectors(quaternions, vectors), np.einsum('nij,nj->ni', matrices, vectors))
+    product = quaternion_to_matrix(quaternion_multiply(quaternions[:-1], quaternions[1:]))
+    assert np.allclose(product, matrices[:-1] @ matrices[1:], atol=1e-12)
+
+
+def test_orbital_frame_and_beam_rotation():
+    """궤도 좌표계 축과 자세 적용 빔 방향 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4, 30.0, 10.0))
+    positions, velocities = propagator.propagate(np.linspace(0.0, 600.0, 20))
+    frame = orbital_frame(positions, velocities)
+    assert np.allclose(np.einsum('nji,njk->nik', frame, frame), np.eye(3), atol=1e-12)
+    assert np.allclose(np.linalg.det(frame), 1.0)
+    
+    times = np.zeros(len(positions))
+    
+    # 자세 오차가 없으면 nadir와 지정 빔 방향이 그대로 유지
+    level = AttitudeProfile()
+    nadir = -positions / np.linalg.norm(positions, axis=1, keepdims=True)
+    assert np.allclose(level.apply(times, positions, velocities), nadir, atol=1e-12)
+    look = calc_look_directions(positions, velocities, 30.0)
+    assert np.allclose(level.apply(times, positions, velocities, look), look, atol=1e-12)
+    
+    # 롤 -30°는 nadir를 진행 방향 오른쪽 off-nadir 30° 방향으로 회전
+    assert np.allclose(AttitudeProfile(roll_angle=-30.0).apply(times, positions, velocities), look, atol=1e-12)
+    
+    # 피치는 진행 방향으로, 요는 nadir 방향 빔을 바꾸지 않음
+    pitched = AttitudeProfile(pitch_angle=5.0).apply(times, positions, velocities)
+    assert np.allclose(np.einsum('ni,ni->n', pitched, frame[:, :, 0]), np.sin(np.deg2rad(5.0)))
+    assert np.allclose(AttitudeProfile(yaw_angle=40.0).apply(times, positions, velocities), nadir, atol=1e-12)
+
+
+def test_angular_velocity_and_body_quaternions():
+    """동체 각속도와 동체 → ECEF 쿼터니언 테스트"""
+    attitude = AttitudeProfile(1.0, -2.0, 3.0, 0.5, -0.3, 0.8, reference_time=10.0)
+    times = np.linspace(0.0, 20.0, 11)
+    assert np.allclose(attitude.euler_angles(times[:1]), [[-4.0, 1.0, -5.0]])
+    
+    # ω = 2 q* ⊗ dq/dt 의 벡터 부분 (수치 미분)
+    dt = 1e-4
+    q_minus = attitude.quaternions(times - dt)
+    q_plus = attitude.quaternions(times + dt)
+    q_dot = (q_plus - q_minus) / (2.0 * dt)
+    conjugate = attitude.quaternions(times) * np.array([1.0, -1.0, -1.0, -1.0])
+    expected = 2.0 * quaternion_multiply(conjugate, q_dot)[:, 1:]
+    assert np.allclose(attitude.angular_velocities(times), expected, rtol=0.0, atol=1e-9)
+    
+    # 동체 → ECEF 쿼터니언은 궤도 좌표계 회전과 자세 회전의 합성
+    positions = np.tile([WGS84_A + 517e3, 0.0, 0.0], (len(times), 1))
+    velocities = np.tile([0.0, 0.0, 7600.0], (len(times), 1))
+    quaternions = attitude.body_to_ecef_quaternions(times, positions, velocities)
+    assert np.all(quaternions[:, 0] >= 0.0)
+    expected_matrices = orbital_frame(positions, velocities) @ quaternion_to_matrix(attitude.quaternions(times))
+    assert np.allclose(quaternion_to_matrix(quaternions), expected_matrices, atol=1e-12)
+
+
+def test_adx_attitude_columns(tmp_path, config):
+    """ADX 자세 쿼터니언/각속도 열 기록 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    positions, velocities = propagator.propagate_pulses(16, config.prf)
+    attitude = AttitudeProfile(roll_angle=-30.0, roll_rate=0.1, yaw_rate=0.05)
+    
+    filepath = tmp_path / "attitude.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.write_burst("S01", np.ones((16, config.num_samples), dtype=np.complex64),
+                           positions, velocities, attitude=attitude)
+        with pytest.raises(ValueError):
+            writer.write_burst("S02", np.ones((16, config.num_samples), dtype=np.complex64),
+                               timestamps=np.arange(16) / config.prf, attitude=attitude)
+    
+    with h5py.File(filepath, 'r') as f:
+        adx_data = f["S01/B000_adx"][()]
+    
+    times = np.arange(16) / config.prf
+    assert np.allclose(adx_data[:, 8:12], attitude.body_to_ecef_quaternions(times, positions, velocities))
+    assert np.allclose(adx_data[:, 12:15], attitude.angular_velocities(times))
+    
+    # 동체 z축 (boresight)은 자세가 적용된 빔 방향과 일치
+    boresight = rotate_vectors(adx_data[:, 8:12], np.array([0.0, 0.0, 1.0]))
+    assert np.allclose(boresight, attitude.apply(times, positions, velocities), atol=1e-12)
+
+
+def test_echo_with_attitude(config):
+    """자세 오차에 따른 안테나 게인 변화 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    positions, velocities = propagator.propagate_pulses(4, config.prf)
+    
+    # nadir 방향 30 μs 지연 위치의 타겟
+    nadir = -positions[2] / np.linalg.norm(positions[2])
+    target_list = TargetList([Target(position=positions[2] + nadir * 30e-6 * 299792458.0 / 2.0)])
+    echo_sim = SarEchoSimulator(config)
+    
+    reference = echo_sim.simulate_multiple_pulses(target_list, positions, velocities)
+    level = echo_sim.simulate_multiple_pulses(target_list, positions, velocities, attitude=AttitudeProfile())
+    assert np.allclose(level, reference, rtol=1e-6, atol=0.0)
+    
+    # 고각 빔폭 절반만큼 롤 오차가 있으면 게인 (진폭) = exp(-2)배
+    tilted = echo_sim.simulate_multiple_pulses(
+        target_list, positions, velocities,
+        attitude=AttitudeProfile(roll_angle=config.beamwidth_el / 2.0)
+    )
+    ratio = np.max(np.abs(tilted)) / np.max(np.abs(reference))
+    assert np.isclose(ratio, np.exp(-2.0), rtol=1e-2)
+    
+    # 자세를 적용한 빔 방향을 직접 넘긴 결과와 같음
+    beam_directions = echo_sim.pulse_beam_directions(
+        positions, velocities, attitude=AttitudeProfile(roll_angle=config.beamwidth_el / 2.0)
+    )
+    assert echo_sim.pulse_beam_directions(positions, velocities) is None
+    assert np.array_equal(echo_sim.simulate_multiple_pulses(target_list, positions, velocities, beam_directions), tilted)
+
+
+def test_api_with_bus_attitude(tmp_path, config, config_params):
+    """config 버스 자세 필드의 Echo 시뮬레이션/Raw Data 저장 API 적용 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    positions, velocities = propagator.propagate_pulses(4, config.prf)
+    nadir = -positions[2] / np.linalg.norm(positions[2])
+    states = [{"position": p, "velocity": v} for p, v in zip(positions.tolist(), velocities.tolist())]
+    targets = [{
+        "position": (positions[2] + nadir * 30e-6 * 299792458.0 / 2.0).tolist(),
+        "reflectivity": 1.0, "phase": 0.0
+    }]
+    client = TestClient(app)
+    
+    def echo_peak(config_params):
+        response = client.post("/api/echo/simulate-multiple", json={
+            "config": config_params, "targets": targets, "satellite_states": states
+        })
+        assert response.status_code == 200
+        data = np.frombuffer(base64.b64decode(response.json()["data"]), dtype=np.float32)
+        return np.max(np.abs(data))
+    
+    tilted_params = {**config_params, "bus_roll_angle": config.beamwidth_el}
+    assert echo_peak(tilted_params) < 0.1 * echo_peak(config_params)
+    
+    filepath = tmp_path / "api_attitude.h5"
+    response = client.post("/api/raw-data/save", json={
+        "filepath": str(filepath),
+        "group_name": "S01",
+        "echo_data_base64": base64.b64encode(np.zeros((4, config.num_samples, 2), dtype=np.float32).tobytes()).decode(),
+        "config_request": {**config_params, "bus_pitch_angle": 0.5, "bus_yaw_rate": 0.01},
+        "satellite_states": states
+    })
+    assert response.status_code == 200
+    
+    with h5py.File(filepath, 'r') as f:
+        adx_data = f["S01/B000_adx"][()]
+    attitude = AttitudeProfile(pitch_angle=0.5, yaw_rate=0.01)
+    times = np.arange(4) / config.prf
+    assert np.allclose(adx_data[:, 8:12], attitude.body_to_ecef_quaternions(times, positions, velocities))
+    assert np.allclose(adx_data[:, 12:15], attitude.angular_velocities(times))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,148 @@
+"""
+BAQ 코덱 테스트
+
+비트 수별 양자화 SNR, 블록 적응 정규화, 비트 묶음 왕복,
+RawDataWriter BAQ 저장(일괄/스트리밍)과 read_burst_echo 복원을 검증합니다.
+"""
+
+import base64
+
+import h5py
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from sar_simulator.common import SarSystemConfig
+from sar_simulator.io import RawDataWriter, baq_encode, baq_decode, read_burst_echo
+from sar_simulator.io.baq import _pack_codes, _unpack_codes
+
+
+def _gaussian_echo(num_pulses, num_samples, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.normal(size=(num_pulses, num_samples)) + 1j * rng.normal(size=(num_pulses, num_samples))).astype(np.complex64)
+
+
+def _snr_db(reference, decoded):
+    return 10.0 * np.log10(np.mean(np.abs(reference) ** 2) / np.mean(np.abs(reference - decoded) ** 2))
+
+
+@pytest.mark.parametrize("bits,min_snr", [(2, 8.5), (3, 13.5), (4, 18.5), (8, 39.0)])
+def test_quantization_snr(bits, min_snr):
+    """비트 수별 양자화 SNR 테스트 (가우시안 입력 이론값: 약 6 dB/비트)"""
+    echo_data = _gaussian_echo(40, 1000)
+    encoded = baq_encode(echo_data, bits)
+    
+    assert encoded.codes.dtype == np.uint8
+    assert encoded.codes.shape == (40, -(-2000 * bits // 8))
+    assert encoded.scales.shape == (40, 8)
+    
+    decoded = encoded.decode()
+    assert decoded.dtype == np.complex64
+    assert decoded.shape == echo_data.shape
+    assert _snr_db(echo_data, decoded) > min_snr
+    assert encoded.compression_ratio > 64.0 / (2 * bits + 0.5)
+
+
+def test_block_adaptive_scaling():
+    """range 블록별 전력이 크게 달라도 블록마다 같은 SNR 유지"""
+    echo_data = _gaussian_echo(20, 512, seed=1)
+    gains = np.repeat([1e-3, 1.0, 1e2, 0.0], 128)
+    echo_data = (echo_data * gains).astype(np.complex64)
+    
+    encoded = baq_encode(echo_data, 3, block_samples=128)
+    decoded = encoded.decode()
+    for block in range(3):
+        samples = slice(block * 128, (block + 1) * 128)
+        assert _snr_db(echo_data[:, samples], decoded[:, samples]) > 13.5
+    
+    # 신호가 없는 블록은 0으로 복원
+    assert np.all(encoded.scales[:, 3] == 0.0)
+    assert np.all(decoded[:, 384:] == 0.0)
+    
+    # 일부 펄스 행만으로도 복원 가능
+    partial = baq_decode(encoded.codes[5:9], encoded.scales[5:9], 512, 3, 128)
+    assert np.array_equal(partial, decoded[5:9])
+
+
+@pytest.mark.parametrize("bits", range(1, 9))
+def test_bit_packing(bits):
+    """비트 묶음/풀기 왕복 테스트"""
+    rng = np.random.default_rng(bits)
+    codes = rng.integers(0, 1 << bits, size=(3, 37), dtype=np.uint8)
+    packed = _pack_codes(codes, bits)
+    assert packed.shape == (3, -(-37 * bits // 8))
+    assert np.array_equal(_unpack_codes(packed, bits, 37), codes)
+
+
+def test_writer_and_reader(config, tmp_path):
+    """BAQ 일괄/스트리밍 저장과 read_burst_echo 복원 테스트"""
+    echo_data = _gaussian_echo(64, config.num_samples, seed=2)
+    expected = baq_encode(echo_data, 3).decode()
+    
+    plain_path = tmp_path / "plain.h5"
+    with RawDataWriter(str(plain_path), config) as writer:
+        writer.write_burst("S01", echo_data)
+    
+    baq_path = tmp_path / "baq.h5"
+    with RawDataWriter(str(baq_path), config, baq_bits=3) as writer:
+        writer.write_burst("S01", echo_data)
+        writer.begin_burst("S02", chunk_pulses=16)
+        for start in range(0, 64, 24):
+            writer.append_pulses("S02", echo_data[start:start + 24])
+        writer.end_burst("S02")
+    
+    with h5py.File(baq_path, 'r') as f:
+        dataset = f["S01/B000"]
+        assert dataset.attrs['Encoding'] == 'BAQ'
+        assert dataset.attrs['BAQ Bits'] == 3
+        assert dataset.attrs['Samples per Line'] == config.num_samples
+        assert f["S02/B000"].attrs['Lines per Burst'] == 64
+        with h5py.File(plain_path, 'r') as plain:
+            stored_ratio = plain["S01/B000"].id.get_storage_size() / (
+                dataset.id.get_storage_size() + f["S01/B000_baq_scale"].id.get_storage_size()
+            )
+        assert stored_ratio > 8.0
+    
+    assert np.array_equal(read_burst_echo(str(baq_path), "S01"), expected)
+    assert np.array_equal(read_burst_echo(str(baq_path), "S02"), expected)
+    assert np.array_equal(read_burst_echo(str(baq_path), "S02", slice(10, 30)), expected[10:30])
+    assert np.array_equal(read_burst_echo(str(plain_path), "S01"), echo_data)
+    with pytest.raises(ValueError):
+        read_burst_echo(str(baq_path), "S03")
+
+
+def test_writer_validation(config, tmp_path, config_params):
+    """BAQ 설정 검증 테스트"""
+    low_adc = SarSystemConfig(**config_params, adc_bits=2)
+    with pytest.raises(ValueError, match="ADC"):
+        RawDataWriter(str(tmp_path / "a.h5"), low_adc, baq_bits=3)
+    with pytest.raises(ValueError):
+        RawDataWriter(str(tmp_path / "b.h5"), config, baq_bits=9)
+    with pytest.raises(ValueError):
+        RawDataWriter(str(tmp_path / "c.h5"), config, baq_bits=4, compression="gzip")
+
+
+def test_api_save_with_baq(config, tmp_path, config_params):
+    """Raw Data 저장 API BAQ 옵션 테스트"""
+    echo_data = _gaussian_echo(4, config.num_samples, seed=3)
+    request = {
+        "config_request": config_params,
+        "echo_data_base64": base64.b64encode(echo_data.tobytes()).decode(),
+        "satellite_states": [{"position": [6895e3, 0.0, 0.0], "velocity": [0.0, 0.0, 7600.0]}] * 4,
+        "filepath": str(tmp_path / "api.h5"),
+        "group_name": "S01",
+        "baq_bits": 4
+    }
+    client = TestClient(app)
+    
+    response = client.post("/api/raw-data/save", json=request)
+    assert response.status_code == 200
+    assert np.array_equal(read_burst_echo(str(tmp_path / "api.h5"), "S01"), baq_encode(echo_data, 4).decode())
+    
+    response = client.post("/api/raw-data/save", json={**request, "config_request": {**config_params, "adc_bits": 2}})
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,145 @@
+"""
+다중 Burst 병렬 생성/통합/처리 테스트
+
+SAR 모드별 Burst 작업 계획, 프로세스 병렬 생성 결과와 순차 시뮬레이션 비교,
+가상 데이터셋/외부 링크/복사 통합, Burst 병렬 RDA 처리를 검증합니다.
+"""
+
+import h5py
+import numpy as np
+import pytest
+
+from sar_simulator.common import Target, TargetList
+from sar_simulator.echo import SarEchoSimulator, BurstTask, plan_burst_tasks, generate_bursts
+from sar_simulator.io import BurstArray, RawDataReader, merge_burst_files
+from sar_simulator.orbit import Ephemeris, KeplerianElements, KeplerPropagator, calc_look_directions
+from sar_simulator.processing import RDAProcessor, process_bursts
+
+
+@pytest.fixture
+def scene(config):
+    """궤도력과 nadir 방향 30 μs 지연 위치의 타겟"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    ephemeris = Ephemeris.from_propagator(propagator, np.linspace(0.0, 1.0, 11))
+    position = ephemeris.evaluate(np.array([0.01]))[0][0]
+    nadir = -position / np.linalg.norm(position)
+    target_list = TargetList([Target(position=position + nadir * 30e-6 * 299792458.0 / 2.0)])
+    return ephemeris, target_list
+
+
+def _simulate(task):
+    """작업과 같은 조건의 순차 시뮬레이션"""
+    timestamps = task.ephemeris.pulse_times(task.num_pulses, task.config.prf, task.start_time)
+    positions, velocities = task.ephemeris.evaluate(timestamps)
+    beam_directions = None
+    if task.off_nadir_angle is not None:
+        beam_directions = calc_look_directions(positions, velocities, task.off_nadir_angle)
+    return SarEchoSimulator(task.config).simulate_multiple_pulses(
+        task.target_list, positions, velocities, beam_directions, task.range_compressed
+    )
+
+
+def test_plan_burst_tasks(config, scene):
+    """SAR 모드별 Burst 작업 계획 테스트"""
+    ephemeris, target_list = scene
+    
+    stripmap = plan_burst_tasks("stripmap", config, target_list, ephemeris, burst_pulses=100, num_bursts=3)
+    assert [task.group_name for task in stripmap] == ["SSG00", "SSG01", "SSG02"]
+    assert np.allclose([task.start_time for task in stripmap], [0.0, 0.02, 0.04])
+    assert all(task.off_nadir_angle is None and task.config is config for task in stripmap)
+    
+    scansar = plan_burst_tasks(
+        "SCANSAR", config, target_list, ephemeris, burst_pulses=50, num_bursts=2,
+        off_nadir_angles=[20.0, 25.0, 30.0], start_time=0.1
+    )
+    assert len(scansar) == 6
+    assert [task.off_nadir_angle for task in scansar] == [20.0, 25.0, 30.0] * 2
+    assert [task.config.beam_id for task in scansar] == ["Beam0000", "Beam0001", "Beam0002"] * 2
+    assert np.allclose([task.start_time for task in scansar], 0.1 + np.arange(6) * 0.01)
+    
+    with pytest.raises(ValueError):
+        plan_burst_tasks("SPOTLIGHT", config, target_list, ephemeris, burst_pulses=10)
+    with pytest.raises(ValueError):
+        plan_burst_tasks("SCANSAR", config, target_list, ephemeris, burst_pulses=10)
+    with pytest.raises(ValueError):
+        plan_burst_tasks("STRIPMAP", config, target_list, ephemeris, burst_pulses=10, off_nadir_angles=[1.0, 2.0])
+
+
+@pytest.mark.parametrize("merge_mode", ["virtual", "external", "copy"])
+def test_generate_bursts_parallel(config, scene, tmp_path, merge_mode):
+    """병렬 생성 후 통합한 Burst가 순차 시뮬레이션과 일치하는지 테스트"""
+    ephemeris, target_list = scene
+    tasks = plan_burst_tasks(
+        "SCANSAR", config, target_list, ephemeris, burst_pulses=8,
+        off_nadir_angles=[0.0, 0.1, 0.2], range_compressed=True
+    )
+    output_path = generate_bursts(tasks, tmp_path / "scansar.h5", max_workers=2, merge_mode=merge_mode)
+    parts_dir = tmp_path / "scansar_parts"
+    assert parts_dir.exists() == (merge_mode != "copy")
+    
+    with RawDataReader(output_path) as reader:
+        assert reader.group_names == ["SSG00", "SSG01", "SSG02"]
+        assert reader.attrs['Product Type'] == 'SAR_RAW_DATA'
+        for task in tasks:
+            assert reader.group_attributes(task.group_name)['Beam ID'] == task.config.beam_id
+            echo_data = np.asarray(reader.burst(task.group_name))
+            assert np.array_equal(echo_data, _simulate(task))
+            times = reader.state_vectors(task.group_name)["time"]
+            assert np.allclose(times, task.start_time + np.arange(8) / config.prf)
+        assert np.any(np.asarray(reader.burst("SSG00")) != 0)
+    
+    with h5py.File(output_path, 'r') as f:
+        link = f.get("SSG00", getlink=True)
+        assert isinstance(link, h5py.ExternalLink) == (merge_mode == "external")
+        assert f["SSG00/B000"].is_virtual == (merge_mode == "virtual")
+
+
+def test_generate_validation(config, scene, tmp_path):
+    """생성 입력 검증과 BAQ 저장 옵션 테스트"""
+    ephemeris, target_list = scene
+    task = BurstTask("SSG00", config, target_list, ephemeris, num_pulses=4, range_compressed=True)
+    with pytest.raises(ValueError):
+        generate_bursts([], tmp_path / "empty.h5")
+    with pytest.raises(ValueError):
+        generate_bursts([task, task], tmp_path / "duplicate.h5")
+    with pytest.raises(ValueError):
+        generate_bursts([task], tmp_path / "mode.h5", merge_mode="zip")
+    
+    output_path = generate_bursts([task], tmp_path / "baq.h5", max_workers=1, writer_options={"baq_bits": 4})
+    with RawDataReader(output_path) as reader:
+        assert reader.burst("SSG00").encoding == 'BAQ'
+    
+    # 그룹 이름이 겹치는 파일은 통합 불가
+    with pytest.raises(ValueError):
+        merge_burst_files([tmp_path / "baq_parts" / "SSG00.h5"] * 2, tmp_path / "merged.h5")
+
+
+def test_process_bursts_parallel(config, scene, tmp_path, monkeypatch):
+    """Burst 병렬 RDA 처리 결과와 순차 처리 비교"""
+    ephemeris, target_list = scene
+    tasks = plan_burst_tasks("STRIPMAP", config, target_list, ephemeris, burst_pulses=32, num_bursts=2)
+    output_path = generate_bursts(tasks, tmp_path / "stripmap.h5", max_workers=2)
+    
+    results = process_bursts(output_path, config, max_workers=2, dynamic_range=40.0)
+    assert list(results) == ["SSG00", "SSG01"]
+    
+    with RawDataReader(output_path) as reader:
+        for group_name, (image, range_extent, azimuth_extent) in results.items():
+            velocity = reader.state_vectors(group_name)["velocity"][16]
+            expected = RDAProcessor(config, velocity).process(np.asarray(reader.burst(group_name)), dynamic_range=40.0)
+            assert np.allclose(image, expected[0])
+            assert np.allclose(range_extent, expected[1])
+            assert np.allclose(azimuth_extent, expected[2])
+    
+    # 작업 프로세스는 Burst 전체를 complex64로 읽지 않고 블록 단위로 처리
+    def load_whole_burst(self, dtype=None, copy=None):
+        raise AssertionError("Burst 전체를 메모리로 읽음")
+    monkeypatch.setattr(BurstArray, "__array__", load_whole_burst)
+    serial = process_bursts(output_path, {"SSG01": config}, group_names=["SSG01"], max_workers=1, dynamic_range=40.0)
+    assert np.allclose(serial["SSG01"][0], results["SSG01"][0])
+    with pytest.raises(ValueError):
+        process_bursts(output_path, {"SSG01": config}, max_workers=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
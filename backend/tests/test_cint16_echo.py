@@ -0,0 +1,194 @@
+"""
+CInt16 Echo 테스트
+
+ADC 양자화 오차와 포화, 구간 복원, HDF5 CInt16 저장/읽기(일괄, 스트리밍),
+RDA 입력 처리, 시뮬레이터 adc_quantize 옵션과 API cint16 형식을 검증합니다.
+"""
+
+import base64
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from sar_simulator.common import SarSystemConfig, Target, TargetList, CInt16Echo, quantize_cint16
+from sar_simulator.common.cint16_echo import DEFAULT_CINT16_BLOCK_PULSES
+from sar_simulator.echo import SarEchoSimulator, echo_simulator
+from sar_simulator.io import RawDataReader, RawDataWriter
+from sar_simulator.processing import RDAProcessor
+
+
+@pytest.fixture
+def echo_signals():
+    """복소 가우시안 Echo"""
+    rng = np.random.default_rng(0)
+    return (rng.normal(size=(40, 500)) + 1j * rng.normal(size=(40, 500))).astype(np.complex64)
+
+
+def test_quantize_and_decode(echo_signals):
+    """양자화 오차, 포화, slicing 복원, 바이트열 변환 테스트"""
+    echo = quantize_cint16(echo_signals, adc_bits=12, block_pulses=16)
+    assert echo.shape == (40, 500) and echo.dtype == np.complex64 and len(echo) == 40
+    assert echo.data.dtype == np.int16 and echo.nbytes == echo_signals.nbytes // 2
+    
+    # 자동 full scale: 최대 절댓값이 최대 코드, 오차는 LSB/2 이내
+    assert np.abs(echo.data).max() == 2047
+    decoded = echo.to_complex64()
+    assert np.abs(decoded.real - echo_signals.real).max() <= echo.scale * (0.5 + 1e-3)
+    assert np.abs(decoded.imag - echo_signals.imag).max() <= echo.scale * (0.5 + 1e-3)
+    
+    # slicing은 해당 구간만 복원
+    assert np.array_equal(echo[5], decoded[5])
+    assert np.array_equal(echo[3:9, 100:200], decoded[3:9, 100:200])
+    assert np.array_equal(np.asarray(echo), decoded)
+    blocks = list(echo.iter_blocks(16))
+    assert [start for start, _ in blocks] == [0, 16, 32]
+    assert np.array_equal(np.concatenate([block for _, block in blocks]), decoded)
+    
+    # full scale을 넘는 값은 포화
+    saturated = quantize_cint16(echo_signals, adc_bits=8, full_scale=1.0)
+    assert np.isclose(saturated.scale, 1.0 / 127)
+    assert np.abs(saturated.data).max() == 127
+    
+    restored = CInt16Echo.frombuffer(echo.tobytes(), echo.shape, echo.scale, echo.adc_bits)
+    assert np.array_equal(restored.data, echo.data)
+    
+    with pytest.raises(ValueError):
+        quantize_cint16(echo_signals, adc_bits=17)
+    with pytest.raises(ValueError):
+        CInt16Echo.frombuffer(echo.tobytes(), (41, 500), echo.scale)
+    with pytest.raises(ValueError):
+        CInt16Echo(np.zeros((4, 5), dtype=np.int16), 1.0)
+
+
+def test_writer_reader_roundtrip(echo_signals, tmp_path, config_params):
+    """CInt16 일괄/스트리밍 저장과 BurstArray 복원 테스트"""
+    config = SarSystemConfig(**config_params, adc_bits=12)
+    echo = quantize_cint16(echo_signals, config.adc_bits)
+    filepath = tmp_path / "cint16.h5"
+    
+    with RawDataWriter(str(filepath), config, compression="gzip") as writer:
+        writer.write_burst("SSG00", echo)
+        writer.begin_burst("SSG01", num_samples=500, chunk_pulses=8, cint16_scale=echo.scale)
+        writer.append_pulses("SSG01", echo[:16])
+        writer.append_pulses("SSG01", CInt16Echo(echo.data[16:], echo.scale, echo.adc_bits))
+        writer.end_burst("SSG01")
+    
+    with RawDataReader(filepath) as reader:
+        for group_name in ["SSG00", "SSG01"]:
+            burst = reader.burst(group_name)
+            assert burst.encoding == 'CINT16' and burst.group['B000'].dtype == np.int16
+            assert burst.shape == (40, 500)
+            assert np.array_equal(np.asarray(burst), echo.to_complex64())
+            assert np.array_equal(burst[7:12, 30:90], echo[7:12, 30:90])
+    
+    # BAQ와 CInt16 스트리밍은 함께 사용할 수 없음
+    with RawDataWriter(str(tmp_path / "baq.h5"), config, baq_bits=4) as writer:
+        with pytest.raises(ValueError):
+            writer.begin_burst("SSG00", num_samples=500, cint16_scale=echo.scale)
+
+
+def test_rda_and_simulator(echo_signals, config):
+    """RDA CInt16 입력 처리와 시뮬레이터 adc_quantize 옵션 테스트"""
+    echo = quantize_cint16(echo_signals, 12)
+    processor = RDAProcessor(config, np.array([0.0, 7266.0, 0.0]))
+    assert np.array_equal(processor.pulse_compression(echo), processor.pulse_compression(echo.to_complex64()))
+    
+    full_swath = processor.process(echo, process_full_swath=True)
+    expected = processor.process(echo.to_complex64(), process_full_swath=True)
+    assert np.array_equal(full_swath[0], expected[0])
+    
+    simulator = SarEchoSimulator(config)
+    position = np.array([[6378137.0 + 517e3, 0.0, 0.0]] * 3)
+    velocity = np.array([[0.0, 7266.0, 0.0]] * 3)
+    target_list = TargetList([Target(position=np.array([6378137.0 + 517e3 - 30e-6 * 299792458.0 / 2.0, 0.0, 0.0]))])
+    complex_echo = simulator.simulate_multiple_pulses(target_list, position, velocity)
+    quantized = simulator.simulate_multiple_pulses(target_list, position, velocity, adc_quantize=True)
+    assert isinstance(quantized, CInt16Echo) and quantized.adc_bits == config.adc_bits
+    assert np.array_equal(quantized.data, quantize_cint16(complex_echo, config.adc_bits).data)
+
+
+def test_simulator_block_quantization(config, monkeypatch):
+    """고정 full scale 양자화는 전체 complex64 Echo 없이 펄스 블록 단위로 같은 코드를 만드는지 테스트"""
+    simulator = SarEchoSimulator(config)
+    num_pulses = DEFAULT_CINT16_BLOCK_PULSES + 10
+    position = np.array([[6378137.0 + 517e3, 0.0, 0.0]] * num_pulses)
+    velocity = np.array([[0.0, 7266.0, 0.0]] * num_pulses)
+    target_list = TargetList([Target(position=np.array([6378137.0 + 517e3 - 30e-6 * 299792458.0 / 2.0, 0.0, 0.0]))])
+    options = dict(range_compressed=True, add_noise=True, noise_seed=5, first_pulse=7)
+    
+    complex_echo = simulator.simulate_multiple_pulses(target_list, position, velocity, **options)
+    full_scale = 0.5 * float(np.max(np.abs(complex_echo.view(np.float32))))
+    saturated = simulator.simulate_multiple_pulses(target_list, position, velocity, adc_full_scale=full_scale, **options)
+    expected = quantize_cint16(saturated, config.adc_bits, full_scale)
+    
+    # 전체 Echo를 양자화하는 quantize_cint16 경로를 사용하지 않음
+    def fail(*args, **kwargs):
+        raise AssertionError("전체 complex64 Echo를 양자화했습니다.")
+    monkeypatch.setattr(echo_simulator, "quantize_cint16", fail)
+    quantized = simulator.simulate_multiple_pulses(
+        target_list, position, velocity, adc_quantize=True, adc_full_scale=full_scale, **options
+    )
+    assert quantized.scale == expected.scale
+    assert np.array_equal(quantized.data, expected.data)
+
+
+def test_api_cint16(tmp_path, config_params):
+    """Echo 시뮬레이션 cint16 응답과 SAR 이미지/Raw Data cint16 입력 테스트"""
+    client = TestClient(app)
+    response = client.post("/api/echo/simulate-multiple", json={
+        "config": config_params,
+        "targets": [{"position": [6378137.0 + 517e3 - 4496.9, 0.0, 0.0], "reflectivity": 1.0, "phase": 0.0}],
+        "satellite_states": [
+            {"position": [6378137.0 + 517e3, 0.0, 0.0], "velocity": [0.0, 7266.0, 0.0], "beam_direction": None}
+        ] * 4,
+        "adc_quantize": True
+    })
+    assert response.status_code == 200
+    result = response.json()
+    assert result["dtype"] == "cint16" and result["scale_factor"] > 0
+    echo_bytes = base64.b64decode(result["data"])
+    assert len(echo_bytes) == 4 * result["num_pulses"] * result["num_samples"]
+    
+    response = client.post("/api/sar-image/process", json={
+        "config": config_params,
+        "echo_data_base64": result["data"],
+        "shape": result["shape"],
+        "sample_format": "cint16",
+        "scale_factor": result["scale_factor"],
+        "satellite_velocity": [0.0, 7266.0, 0.0],
+        "process_full_swath": True
+    })
+    assert response.status_code == 200
+    
+    filepath = tmp_path / "api_cint16.h5"
+    response = client.post("/api/raw-data/save", json={
+        "config_request": config_params,
+        "echo_data_base64": result["data"],
+        "sample_format": "cint16",
+        "scale_factor": result["scale_factor"],
+        "satellite_states": [
+            {"position": [6378137.0 + 517e3, 0.0, 0.0], "velocity": [0.0, 7266.0, 0.0]}
+        ] * 4,
+        "filepath": str(filepath)
+    })
+    assert response.status_code == 200
+    with RawDataReader(filepath) as reader:
+        burst = reader.burst("SSG00")
+        assert burst.encoding == 'CINT16'
+        expected = CInt16Echo.frombuffer(echo_bytes, tuple(result["shape"]), result["scale_factor"])
+        assert np.array_equal(np.asarray(burst), expected.to_complex64())
+    
+    # cint16 형식에는 scale_factor 필요
+    response = client.post("/api/sar-image/process", json={
+        "config": config_params,
+        "echo_data_base64": result["data"],
+        "shape": result["shape"],
+        "sample_format": "cint16",
+        "satellite_velocity": [0.0, 7266.0, 0.0]
+    })
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,99 @@
+"""
+분포 클러터 생성기 테스트
+
+클러터 Echo 평균 전력을 같은 영역의 무작위 점 타겟 Echo와 비교합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common import TargetList
+from sar_simulator.common.coordinates import llh_to_ecef
+from sar_simulator.echo import SarEchoSimulator, ClutterGenerator
+from sar_simulator.echo.echo_generator import EchoGenerator
+
+
+@pytest.fixture
+def geometry():
+    """고도 3 km, 동쪽 45° 관측 (slant range 약 4.2 km, 샘플링 윈도우 내부)"""
+    lat, lon = np.deg2rad(37.0), np.deg2rad(127.0)
+    up = np.array([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)])
+    east = np.array([-np.sin(lon), np.cos(lon), 0.0])
+    north = np.cross(up, east)
+    
+    satellite_position = llh_to_ecef(37.0, 127.0, 3000.0)
+    satellite_velocity = north * 200.0
+    beam_direction = (east - up) / np.sqrt(2.0)
+    
+    # 빔 중심 주변 약 1 km x 1 km 영역
+    center_lon = 127.0 + np.rad2deg(3000.0 / (6378137.0 * np.cos(lat)))
+    upper_left = (37.0045, center_lon - 0.0056)
+    lower_right = (36.9955, center_lon + 0.0056)
+    return satellite_position, satellite_velocity, beam_direction, upper_left, lower_right
+
+
+def test_clutter_power_matches_point_targets(config, geometry):
+    """클러터 평균 전력이 무작위 점 타겟 Monte Carlo 결과와 일치하는지 테스트"""
+    satellite_position, satellite_velocity, beam_direction, upper_left, lower_right = geometry
+    num_pulses = 64
+    
+    generator = EchoGenerator(config)
+    clutter_generator = ClutterGenerator(config, 0.0, upper_left, lower_right, seed=0)
+    clutter = clutter_generator.generate(
+        np.tile(satellite_position, (num_pulses, 1)),
+        np.tile(satellite_velocity, (num_pulses, 1)),
+        np.tile(beam_direction, (num_pulses, 1)),
+        compressed_kernel=generator.compressed_kernel
+    )
+    assert clutter.shape == (num_pulses, config.num_samples)
+    
+    # 같은 영역에 σ = σ⁰ · A / N 인 점 타겟 N개
+    rng = np.random.default_rng(1)
+    num_targets = 20000
+    lat_span = np.deg2rad(upper_left[0] - lower_right[0]) * 6371e3
+    lon_span = np.deg2rad(lower_right[1] - upper_left[1]) * 6371e3 * np.cos(np.deg2rad(37.0))
+    area = lat_span * lon_span
+    
+    point_power = []
+    for _ in range(4):
+        positions = llh_to_ecef(
+            rng.uniform(lower_right[0], upper_left[0], num_targets),
+            rng.uniform(upper_left[1], lower_right[1], num_targets),
+            0.0
+        )
+        target_list = TargetList.from_columns(positions, reflectivity=area / num_targets, phase=rng.uniform(0, 360, num_targets))
+        echo = generator.generate_range_compressed(target_list, satellite_position, satellite_velocity, beam_direction)
+        point_power.append(np.mean(np.abs(echo) ** 2))
+    
+    ratio = np.mean(np.abs(clutter) ** 2) / np.mean(point_power)
+    assert 0.85 < ratio < 1.15
+
+
+def test_clutter_simulator_integration(config, geometry):
+    """SarEchoSimulator에 클러터가 더해지는지, 영역이 윈도우 밖이면 0인지 테스트"""
+    satellite_position, satellite_velocity, beam_direction, upper_left, lower_right = geometry
+    num_pulses = 8
+    positions = np.tile(satellite_position, (num_pulses, 1))
+    velocities = np.tile(satellite_velocity, (num_pulses, 1))
+    beams = np.tile(beam_direction, (num_pulses, 1))
+    
+    echo_sim = SarEchoSimulator(config)
+    clutter_generator = ClutterGenerator(config, -10.0, upper_left, lower_right, seed=0)
+    echo = echo_sim.simulate_multiple_pulses(
+        TargetList(), positions, velocities, beams, clutter_generator=clutter_generator
+    )
+    assert echo.shape == (num_pulses, config.num_samples)
+    assert np.all(np.isfinite(echo))
+    assert np.mean(np.abs(echo) ** 2) > 0.0
+    
+    # 관측 영역에서 멀리 떨어진 영역 (샘플링 윈도우 밖)
+    far_generator = ClutterGenerator(config, -10.0, (38.0, 128.0), (37.9, 128.1), seed=0)
+    far = far_generator.generate(positions, velocities, beams, compressed_kernel=echo_sim.echo_generator.compressed_kernel)
+    assert np.all(far == 0)
+    
+    with pytest.raises(ValueError):
+        clutter_generator.generate(positions, velocities, beams)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,180 @@
+"""
+Raw Data 압축 저장 테스트
+
+압축 필터 옵션, 자동 청크 크기, 압축 저장(일괄/스트리밍) 왕복,
+벤치마크 결과와 Raw Data 저장 API 압축 옵션을 검증합니다.
+"""
+
+import base64
+
+import h5py
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from sar_simulator.io import (
+    RawDataWriter,
+    available_codecs,
+    get_filter_options,
+    choose_chunk_shape,
+    benchmark_compression,
+)
+from sar_simulator.io.compression import _load_hdf5plugin
+
+
+def _sparse_echo(num_pulses, num_samples, seed=0):
+    """일부 구간에만 신호가 있는 Echo (점 타겟 장면과 유사)"""
+    rng = np.random.default_rng(seed)
+    echo_data = np.zeros((num_pulses, num_samples), dtype=np.complex64)
+    start = num_samples // 4
+    stop = start + num_samples // 8
+    echo_data[:, start:stop] = rng.normal(size=(num_pulses, stop - start)) + 1j * rng.normal(size=(num_pulses, stop - start))
+    return echo_data
+
+
+def test_filter_options():
+    """코덱별 필터 옵션과 입력 검증 테스트"""
+    assert get_filter_options(None) == {}
+    assert get_filter_options("none") == {}
+    assert get_filter_options("gzip") == {"compression": "gzip", "compression_opts": 4, "shuffle": True}
+    assert get_filter_options("gzip", 9)["compression_opts"] == 9
+    assert get_filter_options("lzf") == {"compression": "lzf", "shuffle": True}
+    assert available_codecs()[:3] == ["none", "gzip", "lzf"]
+    
+    with pytest.raises(ValueError):
+        get_filter_options("bzip2")
+    with pytest.raises(ValueError):
+        get_filter_options("lzf", 3)
+    with pytest.raises(ValueError):
+        get_filter_options("gzip", 10)
+    
+    if _load_hdf5plugin() is None:
+        assert "blosc-zstd" not in available_codecs()
+        with pytest.raises(ValueError, match="hdf5plugin"):
+            get_filter_options("blosc-zstd")
+    else:
+        assert "blosc-zstd" in available_codecs()
+        assert "compression" in get_filter_options("blosc-zstd")
+
+
+def test_chunk_shape():
+    """펄스/샘플 수에 따른 청크 크기 테스트"""
+    # 1 MiB / 8 bytes = 131072 샘플 → 17500 샘플 펄스는 청크당 7개
+    assert choose_chunk_shape(1000, 17500) == (7, 17500, 2)
+    assert choose_chunk_shape(None, 17500) == (7, 17500, 2)
+    
+    # 펄스 수보다 큰 청크는 만들지 않음
+    assert choose_chunk_shape(3, 1024) == (3, 1024, 2)
+    
+    # 한 펄스가 목표보다 크면 샘플 방향으로 균등 분할
+    chunks = choose_chunk_shape(10, 300000)
+    assert chunks[0] == 1 and chunks[1] * 8 <= 1 << 20
+    assert chunks[1] * 3 >= 300000
+    
+    with pytest.raises(ValueError):
+        choose_chunk_shape(10, 0)
+
+
+@pytest.mark.parametrize("codec", ["gzip", "lzf"])
+def test_compressed_round_trip(config, tmp_path, codec):
+    """압축 일괄/스트리밍 저장 왕복과 압축률 테스트"""
+    echo_data = _sparse_echo(64, 4096)
+    filepath = tmp_path / f"{codec}.h5"
+    
+    with RawDataWriter(str(filepath), config, compression=codec, chunk_bytes=256 * 1024) as writer:
+        writer.write_burst("S01", echo_data)
+        writer.begin_burst("S02", num_samples=4096)
+        for start in range(0, 64, 20):
+            writer.append_pulses("S02", echo_data[start:start + 20])
+        writer.end_burst("S02")
+    
+    with h5py.File(filepath, 'r') as f:
+        for group_name in ("S01", "S02"):
+            dataset = f[f"{group_name}/B000"]
+            assert dataset.compression == codec
+            assert dataset.shuffle
+            assert dataset.chunks == (8, 4096, 2)
+            stored = dataset[()]
+            assert np.array_equal(stored[..., 0] + 1j * stored[..., 1], echo_data)
+            assert dataset.id.get_storage_size() < dataset.nbytes / 2
+    
+    with pytest.raises(ValueError):
+        RawDataWriter(str(tmp_path / "invalid.h5"), config, compression="bzip2")
+
+
+def test_gzip_streaming_direct_chunks(config, tmp_path):
+    """gzip 스트리밍 직접 청크 기록: 남은 펄스와 샘플 방향 끝 청크 테스트"""
+    echo_data = _sparse_echo(21, 1000, seed=1)
+    filepath = tmp_path / "direct.h5"
+    
+    with RawDataWriter(str(filepath), config, compression="gzip", chunk_bytes=4096) as writer:
+        # 청크 (8, 1000, 2): 마지막 5펄스는 end_burst()에서 기록
+        writer.begin_burst("S01", num_samples=1000, chunk_pulses=8)
+        for start in range(0, 21, 3):
+            writer.append_pulses("S01", echo_data[start:start + 3])
+        writer.end_burst("S01")
+        
+        # 청크 (1, 500, 2)로 펄스마다 샘플 방향 분할, end_burst() 없이 close()에서 기록
+        writer.begin_burst("S02", num_samples=999)
+        writer.append_pulses("S02", echo_data[:, :999])
+        
+        # 한 청크 미만인 Burst
+        writer.begin_burst("S03", num_samples=1000, chunk_pulses=64)
+        writer.append_pulses("S03", echo_data)
+    
+    with h5py.File(filepath, 'r') as f:
+        assert f["S02/B000"].chunks == (1, 500, 2)
+        for group_name, expected in (("S01", echo_data), ("S02", echo_data[:, :999]), ("S03", echo_data)):
+            stored = f[f"{group_name}/B000"][()]
+            assert np.array_equal(stored[..., 0] + 1j * stored[..., 1], expected)
+
+
+def test_benchmark(tmp_path):
+    """압축 벤치마크 결과 테스트"""
+    echo_data = _sparse_echo(32, 2048)
+    results = benchmark_compression(echo_data, codecs=["none", "gzip", "lzf"], levels={"gzip": 1}, directory=str(tmp_path))
+    
+    assert [r["codec"] for r in results] == ["none", "gzip", "lzf"]
+    assert [r["level"] for r in results] == [None, 1, None]
+    assert list(tmp_path.iterdir()) == []
+    for result in results:
+        assert result["chunks"] == (32, 2048, 2)
+        assert result["write_seconds"] > 0.0
+        assert result["throughput_mb_s"] > 0.0
+    
+    assert np.isclose(results[0]["compression_ratio"], 1.0)
+    assert results[1]["compression_ratio"] > 2.0
+    assert results[2]["compression_ratio"] > 2.0
+
+
+def test_api_save_with_compression(config, tmp_path, config_params):
+    """Raw Data 저장 API 압축 옵션 테스트"""
+    echo_data = _sparse_echo(4, config.num_samples)
+    states = [{"position": [6895e3, 0.0, 0.0], "velocity": [0.0, 0.0, 7600.0]}] * 4
+    request = {
+        "config_request": config_params,
+        "echo_data_base64": base64.b64encode(echo_data.tobytes()).decode(),
+        "satellite_states": states,
+        "filepath": str(tmp_path / "api.h5"),
+        "group_name": "S01",
+        "compression": "gzip",
+        "compression_level": 6
+    }
+    client = TestClient(app)
+    
+    response = client.post("/api/raw-data/save", json=request)
+    assert response.status_code == 200
+    with h5py.File(tmp_path / "api.h5", 'r') as f:
+        dataset = f["S01/B000"]
+        assert dataset.compression == "gzip"
+        assert dataset.compression_opts == 6
+        stored = dataset[()]
+    assert np.array_equal(stored[..., 0] + 1j * stored[..., 1], echo_data)
+    
+    response = client.post("/api/raw-data/save", json={**request, "compression": "bzip2"})
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
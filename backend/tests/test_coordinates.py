@@ -0,0 +1,101 @@
+"""
+좌표 변환 테스트
+
+지리 좌표/ECEF 변환과 로컬 ENU/NED 좌표계 변환을 검증합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common.coordinates import (
+    WGS84_A,
+    WGS84_E2,
+    llh_to_ecef,
+    ecef_to_llh,
+    llh_to_ecef_array,
+    ecef_to_llh_array,
+    enu_rotation,
+    ned_rotation,
+    ecef_to_enu,
+    enu_to_ecef,
+    ecef_to_ned,
+    ned_to_ecef,
+)
+
+
+def _random_llh(num_points: int, seed: int = 0) -> np.ndarray:
+    """지표면부터 저궤도 고도까지의 임의 지리 좌표"""
+    rng = np.random.default_rng(seed)
+    lat = rng.uniform(-90.0, 90.0, num_points)
+    lon = rng.uniform(-180.0, 180.0, num_points)
+    h = rng.uniform(-500.0, 1000e3, num_points)
+    return np.stack([lat, lon, h], axis=-1)
+
+
+def test_llh_ecef_roundtrip():
+    """[N,3] 배열 왕복 변환 정확도 테스트"""
+    llh = _random_llh(10000)
+    ecef = llh_to_ecef_array(llh)
+    assert ecef.shape == (10000, 3)
+    
+    restored = ecef_to_llh_array(ecef)
+    assert restored.shape == (10000, 3)
+    assert np.max(np.abs(restored[:, 0] - llh[:, 0])) < 1e-9
+    assert np.max(np.abs(restored[:, 1] - llh[:, 1])) < 1e-9
+    assert np.max(np.abs(restored[:, 2] - llh[:, 2])) < 1e-4
+    
+    # 다시 ECEF로 변환했을 때 위치 오차 (서브 밀리미터)
+    assert np.max(np.linalg.norm(llh_to_ecef_array(restored) - ecef, axis=1)) < 1e-4
+
+
+def test_ecef_to_llh_scalar_and_special_points():
+    """스칼라 입력 및 극/적도 위치 테스트"""
+    lat, lon, h = ecef_to_llh(WGS84_A + 100.0, 0.0, 0.0)
+    assert np.isscalar(lat) and np.isscalar(h)
+    assert abs(lat) < 1e-12 and abs(lon) < 1e-12
+    assert abs(h - 100.0) < 1e-6
+    
+    polar_radius = WGS84_A * np.sqrt(1.0 - WGS84_E2)
+    lat, lon, h = ecef_to_llh(0.0, 0.0, -(polar_radius + 517e3))
+    assert abs(lat + 90.0) < 1e-9
+    assert abs(h - 517e3) < 1e-6
+    
+    # 임의 shape 배열 입력
+    llh = _random_llh(24).reshape(2, 3, 4, 3)
+    assert np.allclose(ecef_to_llh_array(llh_to_ecef_array(llh)), llh, rtol=0.0, atol=1e-4)
+
+
+def test_enu_ned_frames():
+    """ENU/NED 회전 행렬과 좌표 변환 일관성 테스트"""
+    lat, lon = 37.5, 127.0
+    reference = llh_to_ecef(lat, lon, 50.0)
+    
+    rotation = enu_rotation(lat, lon)
+    assert np.allclose(rotation @ rotation.T, np.eye(3), atol=1e-12)
+    assert np.isclose(np.linalg.det(rotation), 1.0)
+    
+    # 고도 방향 이동은 Up / -Down 성분만 가짐
+    above = llh_to_ecef(lat, lon, 1050.0)
+    assert np.allclose(ecef_to_enu(above, reference), [0.0, 0.0, 1000.0], atol=1e-6)
+    assert np.allclose(ecef_to_ned(above, reference), [0.0, 0.0, -1000.0], atol=1e-6)
+    
+    # 북쪽으로 이동한 점은 North 성분이 양수
+    north = ecef_to_enu(llh_to_ecef(lat + 0.01, lon, 50.0), reference)
+    assert north[1] > 1000.0 and abs(north[0]) < 1e-6
+    
+    # 배열 왕복 변환 및 ENU ↔ NED 관계
+    points = reference + np.random.default_rng(1).normal(scale=1e4, size=(100, 3))
+    enu = ecef_to_enu(points, reference)
+    ned = ecef_to_ned(points, reference)
+    assert np.allclose(enu_to_ecef(enu, reference), points, rtol=0.0, atol=1e-6)
+    assert np.allclose(ned_to_ecef(ned, reference), points, rtol=0.0, atol=1e-6)
+    assert np.allclose(ned, enu[:, [1, 0, 2]] * [1.0, 1.0, -1.0], atol=1e-9)
+    
+    # 여러 기준점에 대한 회전 행렬 배열
+    rotations = ned_rotation(np.array([0.0, 45.0]), np.array([10.0, 20.0]))
+    assert rotations.shape == (2, 3, 3)
+    assert np.allclose(rotations[1], ned_rotation(45.0, 20.0))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,205 @@
+"""
+궤도력 보간 테스트
+
+희소 상태 벡터의 3차 Hermite 보간 정확도, 오차 추정, 펄스 단위 상태 생성과
+Echo 시뮬레이션/Raw Data 저장 연동을 검증합니다.
+"""
+
+import base64
+
+import h5py
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routes.echo import MAX_ECHO_PULSES
+from sar_simulator.common import Target, TargetList
+from sar_simulator.echo import SarEchoSimulator
+from sar_simulator.io.raw_data_writer import RawDataWriter
+from sar_simulator.orbit import Ephemeris, KeplerianElements, KeplerPropagator
+
+
+@pytest.fixture
+def propagator():
+    """저궤도 Kepler 전파기"""
+    return KeplerPropagator(KeplerianElements(6900e3, 0.001, 97.4, 30.0, 40.0, 50.0))
+
+
+def test_interpolation_accuracy(propagator):
+    """10 s 간격 노드 보간의 위치/속도 정확도 테스트"""
+    ephemeris = Ephemeris.from_propagator(propagator, np.arange(0.0, 101.0, 10.0))
+    times = np.linspace(0.0, 100.0, 2001)
+    positions, velocities = ephemeris.evaluate(times)
+    expected_positions, expected_velocities = propagator.propagate(times)
+    
+    assert np.max(np.linalg.norm(positions - expected_positions, axis=1)) < 1e-2
+    assert np.max(np.linalg.norm(velocities - expected_velocities, axis=1)) < 1e-3
+    
+    # 노드에서는 정확히 일치
+    node_positions, node_velocities = ephemeris.evaluate(ephemeris.times)
+    assert np.allclose(node_positions, ephemeris.positions, rtol=0.0, atol=1e-6)
+    assert np.allclose(node_velocities, ephemeris.velocities, rtol=0.0, atol=1e-9)
+
+
+def test_error_estimate(propagator):
+    """오차 추정값이 실제 보간 오차와 같은 크기인지 테스트"""
+    times = np.linspace(0.0, 600.0, 20001)
+    expected_positions, expected_velocities = propagator.propagate(times)
+    
+    for spacing in (10.0, 30.0):
+        ephemeris = Ephemeris.from_propagator(propagator, np.arange(0.0, 601.0, spacing))
+        positions, velocities = ephemeris.evaluate(times)
+        position_error = np.max(np.linalg.norm(positions - expected_positions, axis=1))
+        velocity_error = np.max(np.linalg.norm(velocities - expected_velocities, axis=1))
+        
+        estimated_position, estimated_velocity = ephemeris.estimate_error()
+        assert 0.5 * position_error < estimated_position < 2.0 * position_error
+        assert 0.5 * velocity_error < estimated_velocity < 2.0 * velocity_error
+    
+    # 노드가 2개면 추정 불가
+    two_nodes = Ephemeris.from_propagator(propagator, np.array([0.0, 10.0]))
+    assert all(np.isnan(two_nodes.estimate_error()))
+
+
+def test_validation_and_range(propagator):
+    """입력 검증과 범위 밖 보간 오류 테스트"""
+    ephemeris = Ephemeris.from_propagator(propagator, np.array([0.0, 10.0, 20.0]))
+    assert len(ephemeris) == 3
+    assert ephemeris.start_time == 0.0 and ephemeris.end_time == 20.0
+    
+    with pytest.raises(ValueError):
+        ephemeris.evaluate(np.array([-1.0]))
+    with pytest.raises(ValueError):
+        ephemeris.propagate_pulses(200001, 5000.0)
+    with pytest.raises(ValueError):
+        Ephemeris([0.0, 0.0], ephemeris.positions[:2], ephemeris.velocities[:2])
+    with pytest.raises(ValueError):
+        Ephemeris([0.0], ephemeris.positions[:1], ephemeris.velocities[:1])
+
+
+def test_from_adx(propagator):
+    """ADX 배열에서 궤도력 생성 테스트"""
+    times = np.arange(0.0, 31.0, 10.0)
+    positions, velocities = propagator.propagate(times)
+    adx_data = np.zeros((len(times), 15))
+    adx_data[:, 0] = times
+    adx_data[:, 2:5] = positions
+    adx_data[:, 5:8] = velocities
+    
+    ephemeris = Ephemeris.from_adx(adx_data)
+    assert np.array_equal(ephemeris.times, times)
+    assert np.array_equal(ephemeris.positions, positions)
+    assert np.array_equal(ephemeris.velocities, velocities)
+
+
+def test_echo_simulation_from_ephemeris(propagator, config):
+    """궤도력에서 보간한 펄스 상태로 Echo 시뮬레이션"""
+    ephemeris = Ephemeris.from_propagator(propagator, np.array([0.0, 10.0, 20.0]))
+    positions, velocities = ephemeris.propagate_pulses(8, config.prf, start_time=5.0)
+    
+    expected, _ = propagator.propagate(5.0 + np.arange(8) / config.prf)
+    assert np.max(np.linalg.norm(positions - expected, axis=1)) < 1e-2
+    
+    # 위성 바로 아래 30 μs 지연 위치의 타겟
+    nadir = positions[4] / np.linalg.norm(positions[4])
+    target = Target(position=positions[4] - nadir * 30e-6 * 299792458.0 / 2.0)
+    echo_sim = SarEchoSimulator(config)
+    echo = echo_sim.simulate_pulses_from_ephemeris(
+        TargetList([target]), ephemeris, 8, start_time=5.0,
+        beam_directions=np.tile(-nadir, (8, 1))
+    )
+    reference = echo_sim.simulate_multiple_pulses(
+        TargetList([target]), positions, velocities,
+        beam_directions=np.tile(-nadir, (8, 1))
+    )
+    assert echo.shape[0] == 8
+    assert np.array_equal(echo, reference)
+
+
+def test_raw_data_writer_with_ephemeris(propagator, tmp_path, config):
+    """궤도력으로 ADX 시각/위치/속도를 채우는 Raw Data 저장 테스트"""
+    ephemeris = Ephemeris.from_propagator(propagator, np.array([0.0, 10.0, 20.0]))
+    echo_data = np.ones((16, config.num_samples), dtype=np.complex64)
+    
+    filepath = tmp_path / "ephemeris.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.write_burst("S01", echo_data, ephemeris=ephemeris)
+    
+    with h5py.File(filepath, 'r') as f:
+        adx_data = f["S01/B000_adx"][()]
+    
+    timestamps = np.arange(16) / config.prf
+    positions, velocities = ephemeris.evaluate(timestamps)
+    assert np.allclose(adx_data[:, 0], timestamps)
+    assert np.allclose(adx_data[:, 1], timestamps + config.swst)
+    assert np.array_equal(adx_data[:, 2:5], positions)
+    assert np.array_equal(adx_data[:, 5:8], velocities)
+
+
+def test_api_with_ephemeris(propagator, tmp_path, config, config_params):
+    """ephemeris 필드로 여러 펄스 Echo 시뮬레이션과 Raw Data 저장 API 테스트"""
+    node_times = np.array([0.0, 10.0, 20.0])
+    positions, velocities = propagator.propagate(node_times)
+    ephemeris = {
+        "times": node_times.tolist(),
+        "positions": positions.tolist(),
+        "velocities": velocities.tolist(),
+        "num_pulses": 4
+    }
+    client = TestClient(app)
+    
+    response = client.post("/api/echo/simulate-multiple", json={
+        "config": config_params,
+        "targets": [{"position": [6378137.0, 0.0, 0.0], "reflectivity": 1.0, "phase": 0.0}],
+        "ephemeris": ephemeris
+    })
+    assert response.status_code == 200
+    assert response.json()["num_pulses"] == 4
+    
+    # satellite_states와 동시 지정 불가
+    response = client.post("/api/echo/simulate-multiple", json={
+        "config": config_params,
+        "targets": [{"position": [6378137.0, 0.0, 0.0], "reflectivity": 1.0, "phase": 0.0}],
+        "satellite_states": [{"position": positions[0].tolist(), "velocity": velocities[0].tolist()}],
+        "ephemeris": ephemeris
+    })
+    assert response.status_code == 400
+    
+    # Raw Data 저장 (펄스 개수는 Echo 데이터 크기에서 계산)
+    echo_float32 = np.zeros((4, config.num_samples, 2), dtype=np.float32)
+    filepath = tmp_path / "api_ephemeris.h5"
+    response = client.post("/api/raw-data/save", json={
+        "filepath": str(filepath),
+        "group_name": "S01",
+        "echo_data_base64": base64.b64encode(echo_float32.tobytes()).decode(),
+        "config_request": config_params,
+        "ephemeris": {key: value for key, value in ephemeris.items() if key != "num_pulses"}
+    })
+    assert response.status_code == 200
+    assert response.json()["num_pulses"] == 4
+    
+    with h5py.File(filepath, 'r') as f:
+        adx_data = f["S01/B000_adx"][()]
+    assert np.allclose(adx_data[:, 2:5], propagator.propagate(np.arange(4) / config.prf)[0], rtol=0.0, atol=1e-2)
+    
+    # 펄스 개수 상한 (스키마 422, Echo 시뮬레이션 한도 400, Echo 데이터보다 많은 펄스 400)
+    request = {
+        "config": config_params,
+        "targets": [{"position": [6378137.0, 0.0, 0.0], "reflectivity": 1.0, "phase": 0.0}],
+        "ephemeris": dict(ephemeris, num_pulses=100000001)
+    }
+    assert client.post("/api/echo/simulate-multiple", json=request).status_code == 422
+    request["ephemeris"]["num_pulses"] = MAX_ECHO_PULSES + 1
+    assert client.post("/api/echo/simulate-multiple", json=request).status_code == 400
+    response = client.post("/api/raw-data/save", json={
+        "filepath": str(tmp_path / "too_many_pulses.h5"),
+        "echo_data_base64": base64.b64encode(echo_float32.tobytes()).decode(),
+        "config_request": config_params,
+        "ephemeris": dict(ephemeris, num_pulses=100000000)
+    })
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -19,6 +19,7 @@ import matplotlib.pyplot as plt
 
 from sar_simulator.common import SarSystemConfig, Target, TargetList
 from sar_simulator.echo import SarEchoSimulator
+from sar_simulator.orbit import KeplerianElements, KeplerPropagator
 from sar_simulator.common.constants import LIGHT_SPEED
 
 # 출력 디렉토리
@@ -67,9 +68,6 @@ def generate_satellite_trajectory(
     # v = sqrt(GM / R)
     v_orbit = np.sqrt(GM / R_orbit)
     
-    # 각속도
-    omega = v_orbit / R_orbit  # rad/s
-    
     # 초기 위치 설정
     if initial_position is None:
         # 적도 상공, X축 방향
@@ -80,39 +78,13 @@ def generate_satellite_trajectory(
         # Y축 방향 (동쪽)
         initial_velocity = np.array([0.0, v_orbit, 0.0], dtype=np.float64)
     
-    # 시간 간격 (PRF에 따라)
-    dt = 1.0 / config.prf  # s
-    
-    # 결과 배열 초기화
-    satellite_positions = np.zeros((num_pulses, 3), dtype=np.float64)
-    satellite_velocities = np.zeros((num_pulses, 3), dtype=np.float64)
-    
-    # 초기값 설정
-    satellite_positions[0] = initial_position
-    satellite_velocities[0] = initial_velocity
-    
-    # 각 pulse마다 위치 계산
-    for i in range(1, num_pulses):
-        # 경과 시간
-        t = i * dt
-        
-        # 각도 변화
-        dtheta = omega * t
-        
-        # 회전 행렬 (Z축 기준 회전, 적도 궤도 가정)
-        cos_theta = np.cos(dtheta)
-        sin_theta = np.sin(dtheta)
-        rotation_matrix = np.array([
-            [cos_theta, -sin_theta, 0],
-            [sin_theta,  cos_theta, 0],
-            [0,          0,         1]
-        ], dtype=np.float64)
-        
-        # 위치 업데이트
-        satellite_positions[i] = rotation_matrix @ initial_position
-        
-        # 속도 업데이트 (접선 방향)
-        satellite_velocities[i] = rotation_matrix @ initial_velocity
+    # 초기 상태를 관성 좌표계 궤도 요소로 보고 PRF 간격으로 전파
+    propagator = KeplerPropagator(
+        KeplerianElements.from_state_vector(initial_position, initial_velocity),
+        use_j2=False
+    )
+    times = np.arange(num_pulses) / config.prf
+    satellite_positions, satellite_velocities = propagator.propagate_eci(times)
     
     return satellite_positions, satellite_velocities
 
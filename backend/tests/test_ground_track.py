@@ -0,0 +1,182 @@
+"""
+지상 궤적 및 Swath Footprint 계산 테스트
+
+점 개수 추출, 빔 고각 방향/타원체 교차 기하, 지상 궤적/Swath API를 검증합니다.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.schemas.tle import TleCreateRequest
+from api.services.tle_service import create_tle
+from sar_simulator.common.coordinates import WGS84_A, llh_to_ecef
+from sar_simulator.common.satellite_orbit_service import calc_crossing_point_ellipsoid
+from sar_simulator.orbit import (
+    KeplerianElements,
+    KeplerPropagator,
+    decimate_indices,
+    calc_look_directions,
+    calculate_swath_footprint,
+)
+
+
+SSO_TLE = (
+    "1 43013U 17073A   24001.50000000  .00000012  00000+0  25000-4 0  9999\n"
+    "2 43013  97.4500  10.0000 0001000  90.0000 270.0000 15.21000000 12345"
+)
+
+
+def test_decimate_indices():
+    """균등 간격 추출 인덱스 테스트"""
+    assert np.array_equal(decimate_indices(5), np.arange(5))
+    assert np.array_equal(decimate_indices(5, 10), np.arange(5))
+    
+    indices = decimate_indices(1000001, 500)
+    assert len(indices) == 500
+    assert indices[0] == 0 and indices[-1] == 1000000
+    assert np.all(np.diff(indices) > 0)
+    
+    with pytest.raises(ValueError):
+        decimate_indices(10, 1)
+
+
+def test_swath_geometry_equator():
+    """적도 상공 북쪽 진행 위성의 오른쪽/왼쪽 Swath 기하 테스트"""
+    positions = np.array([[WGS84_A + 517e3, 0.0, 0.0]])
+    velocities = np.array([[0.0, 0.0, 7600.0]])
+    
+    right = calculate_swath_footprint(positions, velocities, 30.0, 4.0, look_side="right")
+    left = calculate_swath_footprint(positions, velocities, 30.0, 4.0, look_side="left")
+    
+    assert np.allclose(right["ground_track"][0], [0.0, 0.0, 0.0], atol=1e-9)
+    
+    # 북쪽 진행 시 오른쪽은 동쪽(경도 증가), near가 far보다 직하점에 가까움
+    assert 0.0 < right["near_edge"][0, 0] < right["far_edge"][0, 0]
+    assert left["far_edge"][0, 0] < left["near_edge"][0, 0] < 0.0
+    assert np.allclose(right["near_edge"][:, 1], 0.0, atol=1e-9)
+    assert np.allclose(right["near_edge"][:, 2], 0.0, atol=1e-6)
+    
+    # 위성에서 본 가장자리의 off-nadir 각도 = look_angle ∓ beamwidth/2
+    for edge, angle in (("near_edge", 28.0), ("far_edge", 32.0)):
+        lon, lat, h = right[edge][0]
+        line_of_sight = llh_to_ecef(lat, lon, h) - positions[0]
+        cos_angle = np.dot(line_of_sight / np.linalg.norm(line_of_sight), -positions[0] / np.linalg.norm(positions[0]))
+        assert np.isclose(np.rad2deg(np.arccos(cos_angle)), angle, atol=1e-6)
+    
+    assert right["swath_widths"][0] > 0.0
+    assert np.isclose(right["swath_widths"][0], left["swath_widths"][0])
+
+
+def test_matches_scalar_crossing_point():
+    """벡터화 결과와 점별 교차점 계산 결과 비교"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4, 30.0, 10.0))
+    positions, velocities = propagator.propagate(np.linspace(0.0, 5700.0, 200))
+    
+    footprint = calculate_swath_footprint(positions, velocities, 35.0, 3.0, max_points=50)
+    indices = footprint["indices"]
+    assert len(indices) == 50
+    
+    directions = calc_look_directions(positions[indices], velocities[indices], 33.5)
+    for i, index in enumerate(indices):
+        expected = calc_crossing_point_ellipsoid(positions[index], directions[i])
+        lon, lat, h = footprint["near_edge"][i]
+        assert np.linalg.norm(llh_to_ecef(lat, lon, h) - expected) < 1e-3
+
+
+def test_beyond_horizon_and_validation():
+    """지평선 너머 빔과 입력 검증 테스트"""
+    positions = np.array([[WGS84_A + 517e3, 0.0, 0.0]])
+    velocities = np.array([[0.0, 0.0, 7600.0]])
+    
+    # 517 km 고도의 지평선 off-nadir 각도는 약 68°
+    footprint = calculate_swath_footprint(positions, velocities, 68.0, 4.0)
+    assert footprint["near_valid"][0] and not footprint["far_valid"][0]
+    assert np.all(np.isnan(footprint["far_edge"][0]))
+    assert np.isnan(footprint["swath_widths"][0])
+    
+    with pytest.raises(ValueError):
+        calculate_swath_footprint(positions, velocities, 30.0, 4.0, look_side="up")
+    with pytest.raises(ValueError):
+        calculate_swath_footprint(positions, np.zeros((1, 3)), 30.0, 4.0)
+    with pytest.raises(ValueError):
+        calculate_swath_footprint(positions, velocities[:, :2], 30.0, 4.0)
+
+
+def test_swath_footprint_endpoint(db_session, config_params):
+    """위성 상태/TLE 궤적의 지상 궤적 및 Swath API 테스트"""
+    client = TestClient(app)
+    
+    # 펄스별 위성 상태
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    positions, velocities = propagator.propagate_pulses(20, config_params["prf"])
+    response = client.post("/api/satellite/swath-footprint", json={
+        "config": config_params,
+        "satellite_states": [
+            {"position": p, "velocity": v} for p, v in zip(positions.tolist(), velocities.tolist())
+        ],
+        "max_points": 5
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["num_points"] == 5
+    assert data["times"][0] == 0.0 and np.isclose(data["times"][-1], 19 / config_params["prf"])
+    assert all(point is not None for point in data["near_edge"] + data["far_edge"])
+    
+    # 저장된 TLE의 한 궤도 주기 (약 2,800만 펄스)를 500개 점으로 추출
+    tle = create_tle(db_session, TleCreateRequest(name="SSO", tle_data=SSO_TLE))
+    num_pulses = int(5700.0 * config_params["prf"])
+    response = client.post("/api/satellite/swath-footprint", json={
+        "config": config_params,
+        "tle_trajectory": {"tle_id": tle.id, "num_pulses": num_pulses},
+        "look_angle": 25.0,
+        "look_side": "left"
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["num_points"] == 500
+    assert np.isclose(data["times"][-1], (num_pulses - 1) / config_params["prf"])
+    latitudes = [point[1] for point in data["ground_track"]]
+    assert max(latitudes) > 80.0 and min(latitudes) < -80.0
+    
+    # 궤도력 100 s 구간 (50만 펄스)을 추출한 시각에서만 보간
+    node_times = np.arange(0.0, 101.0, 10.0)
+    node_positions, node_velocities = propagator.propagate(node_times)
+    num_pulses = int(100.0 * config_params["prf"])
+    response = client.post("/api/satellite/swath-footprint", json={
+        "config": config_params,
+        "ephemeris": {
+            "times": node_times.tolist(),
+            "positions": node_positions.tolist(),
+            "velocities": node_velocities.tolist(),
+            "start_time": 0.0,
+            "num_pulses": num_pulses
+        },
+        "max_points": 50
+    })
+    assert response.status_code == 200
+    data = response.json()
+    assert data["num_points"] == 50
+    assert data["times"][0] == 0.0 and np.isclose(data["times"][-1], (num_pulses - 1) / config_params["prf"])
+    
+    # 최대 출력 점 개수 상한
+    response = client.post("/api/satellite/swath-footprint", json={
+        "config": config_params,
+        "tle_trajectory": {"tle_id": tle.id, "num_pulses": num_pulses},
+        "max_points": 100001
+    })
+    assert response.status_code == 422
+    
+    # 궤적 지정 오류
+    response = client.post("/api/satellite/swath-footprint", json={"config": config_params})
+    assert response.status_code == 400
+    response = client.post("/api/satellite/swath-footprint", json={
+        "config": config_params,
+        "tle_trajectory": {"tle_id": "unknown-id", "num_pulses": 10}
+    })
+    assert response.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
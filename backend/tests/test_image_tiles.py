@@ -0,0 +1,204 @@
+"""
+SAR 이미지 타일 피라미드 테스트
+
+피라미드 level/타일 배치, 2×2 평균 축소와 투명 영역, 가늘고 긴 이미지의 저장 크기,
+경위도 격자 사각형, 피라미드 캐시 크기 제한과 타일 엔드포인트의 캐시 헤더를 검증합니다.
+"""
+
+import io
+import base64
+from collections import OrderedDict
+import numpy as np
+import pytest
+from PIL import Image
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routes import sar_image
+from sar_simulator.io import ImagePyramid, build_image_pyramid
+
+
+def _mean_power_db(image_db: np.ndarray) -> float:
+    """dB 영상의 선형 전력 평균 (단위: dB)"""
+    return float(10.0 * np.log10(np.mean(10.0 ** (image_db / 10.0))))
+
+
+def test_pyramid_levels():
+    """level 구성, 2×2 평균 축소, 투명 영역 테스트"""
+    rng = np.random.default_rng(0)
+    image_db = rng.uniform(-50.0, 0.0, size=(300, 1000)).astype(np.float32)
+    pyramid = build_image_pyramid(image_db, tile_size=256, min_value=-50.0, max_value=0.0)
+    
+    # 긴 변 1000 → 256 * 2^2 = 1024, level 0은 1×1 타일
+    assert isinstance(pyramid, ImagePyramid)
+    assert pyramid.num_levels == 3
+    assert (pyramid.tiles_x, pyramid.tiles_y) == (1, 1)
+    assert [pyramid.tile_counts(level) for level in range(3)] == [(1, 1), (2, 2), (4, 4)]
+    assert [pyramid.valid_shape(level) for level in range(3)] == [(75, 250), (150, 500), (300, 1000)]
+    
+    # level 영상은 이미지 영역을 덮는 타일까지만 저장
+    assert [level.shape for level in pyramid.levels] == [(256, 256), (256, 512), (512, 1024)]
+    assert pyramid.nbytes == 256 * 256 + 256 * 512 + 512 * 1024
+    
+    # 원본 level은 값 양자화 결과, 이미지 밖은 0
+    expected = np.round((image_db + 50.0) * 255.0 / 50.0).astype(np.uint8)
+    assert np.abs(pyramid.levels[2][:300, :1000].astype(int) - expected).max() <= 1
+    assert not pyramid.levels[2][300:].any() and not pyramid.levels[2][:, 1000:].any()
+    
+    # level 1 픽셀은 2×2 블록의 선형 전력 평균 (dB 평균보다 밝음)
+    block = _mean_power_db(image_db[:2, :2])
+    assert abs(int(pyramid.levels[1][0, 0]) - (block + 50.0) * 255.0 / 50.0) <= 0.5 + 1e-3
+    assert block >= image_db[:2, :2].mean()
+    
+    # 홀수 끝 행/열은 이미지 안쪽 원본 픽셀 수로 가중 평균 (level 0 마지막 열 = 원본 996-999열)
+    corner = _mean_power_db(image_db[296:300, 996:1000])
+    assert abs(int(pyramid.levels[0][74, 249]) - (corner + 50.0) * 255.0 / 50.0) <= 0.5 + 1e-3
+    
+    tile, mask = pyramid.get_tile(2, 3, 1)
+    assert tile.shape == (256, 256) and mask.shape == (256, 256)
+    assert np.array_equal(tile[:44, :232], pyramid.levels[2][256:300, 768:1000])
+    assert mask[:44, :232].all() and not mask[44:].any() and not mask[:, 232:].any()
+    
+    # 저장 영역 밖의 격자 타일은 투명
+    tile, mask = pyramid.get_tile(2, 3, 3)
+    assert not tile.any() and not mask.any()
+    
+    with pytest.raises(ValueError):
+        pyramid.get_tile(1, 2, 0)
+    with pytest.raises(ValueError):
+        pyramid.tile_counts(3)
+    with pytest.raises(ValueError):
+        build_image_pyramid(np.zeros(10))
+    with pytest.raises(ValueError):
+        build_image_pyramid(image_db, bounds=[10.0, 5.0, 9.0, 6.0])
+
+
+def test_pyramid_overview_brightness():
+    """낮은 해상도 level이 원본과 같은 평균 전력을 갖는지 테스트 (스펙클 영상)"""
+    rng = np.random.default_rng(4)
+    power = rng.exponential(size=(512, 512))
+    image_db = (10.0 * np.log10(power)).astype(np.float32)
+    pyramid = build_image_pyramid(image_db, tile_size=256, min_value=-30.0, max_value=10.0)
+    
+    # level 0 (2×2 축소)의 평균 전력은 원본 평균 전력 (0 dB)과 일치
+    overview_db = pyramid.levels[0][:256, :256] * 40.0 / 255.0 - 30.0
+    assert abs(_mean_power_db(overview_db)) < 0.2
+
+
+def test_tile_png_and_bounds(tmp_path):
+    """PNG 인코딩, 격자 경위도 사각형, 디렉토리 저장 테스트"""
+    image_db = np.linspace(-30.0, 0.0, 600 * 100, dtype=np.float32).reshape(600, 100)
+    pyramid = build_image_pyramid(image_db, bounds=[126.0, 36.0, 127.0, 37.5])
+    
+    # 긴 변 600 → 1024 격자 (level 0: 1×1 타일, 짧은 변도 같은 격자), 저장은 이미지 영역만
+    assert pyramid.levels[-1].shape == (768, 256)
+    assert (pyramid.tiles_x, pyramid.tiles_y) == (1, 1)
+    west, south, east, north = pyramid.tiling_bounds
+    assert np.allclose([west, north], [126.0, 37.5])
+    assert np.isclose(east, 126.0 + 1024 / 100)
+    assert np.isclose(south, 37.5 - 1.5 * 1024 / 600)
+    
+    png = Image.open(io.BytesIO(pyramid.tile_png(2, 0, 1)))
+    assert png.mode == 'LA' and png.size == (256, 256)
+    gray, alpha = np.asarray(png)[..., 0], np.asarray(png)[..., 1]
+    tile, mask = pyramid.get_tile(2, 0, 1)
+    assert np.array_equal(gray, tile)
+    assert np.array_equal(alpha > 0, mask)
+    
+    metadata = pyramid.metadata()
+    assert metadata["pyramid_id"] == pyramid.pyramid_id
+    assert metadata["bounds"] == [126.0, 36.0, 127.0, 37.5]
+    assert metadata["num_levels"] == 3
+    
+    pyramid.save(tmp_path / "tiles")
+    assert len(list((tmp_path / "tiles").rglob("*.png"))) == 1 + 4 + 16
+    assert (tmp_path / "tiles" / "2" / "0" / "3.png").exists()
+
+
+def test_elongated_image():
+    """가늘고 긴 이미지의 타일 격자와 저장 크기 테스트"""
+    image_db = np.zeros((256, 5000), dtype=np.float32)
+    pyramid = build_image_pyramid(image_db)
+    
+    # 격자는 5000 → 256 * 2^5 = 8192 정사각형이지만 저장은 이미지 영역 타일만
+    assert pyramid.num_levels == 6
+    assert pyramid.tile_counts(5) == (32, 32)
+    assert pyramid.levels[-1].shape == (256, 5120)
+    assert pyramid.nbytes < 3 * 256 * 5120
+    
+    tile, mask = pyramid.get_tile(5, 19, 0)
+    assert mask[:, :136].all() and not mask[:, 136:].any()
+    tile, mask = pyramid.get_tile(5, 31, 31)
+    assert not tile.any() and not mask.any()
+
+
+def test_pyramid_cache_bytes(monkeypatch):
+    """타일 피라미드 캐시 크기 제한 테스트"""
+    monkeypatch.setattr(sar_image, "_pyramids", OrderedDict())
+    monkeypatch.setattr(sar_image, "MAX_CACHED_PYRAMID_BYTES", 3 * 256 * 256)
+    extent = np.array([0.0, 1.0])
+    rng = np.random.default_rng(2)
+    
+    ids = [
+        sar_image._create_tiles(rng.uniform(-50.0, 0.0, size=(100, 100)), extent, extent)["pyramid_id"]
+        for _ in range(4)
+    ]
+    assert list(sar_image._pyramids) == ids[1:]
+    
+    # 한도보다 큰 피라미드도 가장 최근 것은 유지
+    monkeypatch.setattr(sar_image, "MAX_CACHED_PYRAMID_BYTES", 1)
+    large_id = sar_image._create_tiles(np.zeros((600, 600), dtype=np.float32), extent, extent)["pyramid_id"]
+    assert list(sar_image._pyramids) == [large_id]
+
+
+def test_tile_endpoint(config_params):
+    """SAR 이미지 처리 tiled 옵션과 타일 엔드포인트 캐시 헤더 테스트"""
+    client = TestClient(app)
+    rng = np.random.default_rng(1)
+    echo_signals = (rng.normal(size=(16, 1000)) + 1j * rng.normal(size=(16, 1000))).astype(np.complex64)
+    echo_data = np.stack([echo_signals.real, echo_signals.imag], axis=-1).astype(np.float32)
+    
+    response = client.post("/api/sar-image/process", json={
+        "config": config_params,
+        "echo_data_base64": base64.b64encode(echo_data.tobytes()).decode('utf-8'),
+        "shape": [16, 1000],
+        "satellite_velocity": [0.0, 7266.0, 0.0],
+        "tiled": True,
+        "image_bounds": [126.0, 36.0, 126.5, 36.2]
+    })
+    assert response.status_code == 200
+    # 타일로 제공하므로 전체 영상 데이터는 생략
+    assert response.json()["data"] is None
+    tiles = response.json()["tiles"]
+    assert tiles["bounds"] == [126.0, 36.0, 126.5, 36.2]
+    assert tiles["url_template"] == f"/api/sar-image/tiles/{tiles['pyramid_id']}/{{z}}/{{x}}/{{y}}.png"
+    
+    metadata = client.get(f"/api/sar-image/tiles/{tiles['pyramid_id']}/metadata").json()
+    assert metadata == tiles
+    
+    url = tiles["url_template"].format(z=tiles["num_levels"] - 1, x=0, y=0)
+    tile_response = client.get(url)
+    assert tile_response.status_code == 200
+    assert tile_response.headers["content-type"] == "image/png"
+    assert "immutable" in tile_response.headers["cache-control"]
+    assert Image.open(io.BytesIO(tile_response.content)).size == (tiles["tile_size"], tiles["tile_size"])
+    
+    etag = tile_response.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+    
+    assert client.get(tiles["url_template"].format(z=0, x=5, y=0)).status_code == 404
+    assert client.get("/api/sar-image/tiles/unknown/0/0/0.png").status_code == 404
+    
+    # tiled를 지정하지 않으면 타일 메타데이터 없음
+    response = client.post("/api/sar-image/process", json={
+        "config": config_params,
+        "echo_data_base64": base64.b64encode(echo_data.tobytes()).decode('utf-8'),
+        "shape": [16, 1000],
+        "satellite_velocity": [0.0, 7266.0, 0.0]
+    })
+    assert response.json()["tiles"] is None
+    assert len(base64.b64decode(response.json()["data"])) == 4 * np.prod(response.json()["shape"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,92 @@
+"""
+Kepler 궤도 전파기 테스트
+
+J2 영년 섭동, 지구 자전 반영 ECEF 변환, 펄스 단위 상태 벡터 생성을 검증합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common import SarSystemConfig, Target, TargetList
+from sar_simulator.common.constants import EARTH_GM, EARTH_ROTATION_RATE
+from sar_simulator.echo import SarEchoSimulator
+from sar_simulator.orbit import KeplerianElements, KeplerPropagator
+
+
+def test_state_vector_roundtrip():
+    """궤도 요소 ↔ 상태 벡터 변환 테스트"""
+    elements = KeplerianElements(7000e3, 0.05, 97.4, 30.0, 40.0, 50.0)
+    positions, velocities = KeplerPropagator(elements, use_j2=False).propagate_eci(np.array([0.0]))
+    restored = KeplerianElements.from_state_vector(positions[0], velocities[0])
+    
+    assert np.isclose(restored.semi_major_axis, 7000e3, rtol=0.0, atol=1e-6)
+    assert np.isclose(restored.eccentricity, 0.05, atol=1e-12)
+    for name in ("inclination", "raan", "arg_perigee", "mean_anomaly"):
+        assert np.isclose(getattr(restored, name), getattr(elements, name), atol=1e-9)
+
+
+def test_velocity_is_time_derivative():
+    """J2와 지구 자전을 포함한 속도가 위치의 시간 미분과 일치하는지 테스트"""
+    propagator = KeplerPropagator(KeplerianElements(7000e3, 0.05, 97.4, 30.0, 40.0, 50.0), gmst_at_epoch=10.0)
+    times = np.linspace(0.0, 6000.0, 60001)
+    
+    for propagate in (propagator.propagate_eci, propagator.propagate):
+        positions, velocities = propagate(times)
+        assert positions.shape == (60001, 3)
+        finite_difference = (positions[2:] - positions[:-2]) / (times[2:] - times[:-2])[:, None]
+        assert np.max(np.abs(finite_difference - velocities[1:-1])) < 1e-3
+
+
+def test_circular_orbit_and_j2_rates():
+    """원형 궤도 반경/주기와 태양동기 궤도 승교점 세차 테스트"""
+    elements = KeplerianElements.circular(517e3, 97.45)
+    propagator = KeplerPropagator(elements)
+    
+    positions, velocities = propagator.propagate_eci(np.linspace(0.0, 86400.0, 1000))
+    assert np.allclose(np.linalg.norm(positions, axis=1), elements.semi_major_axis, rtol=0.0, atol=1e-6)
+    
+    # 태양동기 궤도: 승교점이 하루 약 0.9856° 동쪽으로 이동
+    assert np.isclose(np.rad2deg(propagator.raan_rate) * 86400.0, 0.9856, atol=0.01)
+    
+    # J2가 없으면 주기는 2π·sqrt(a³/GM)
+    keplerian = KeplerPropagator(elements, use_j2=False)
+    assert np.isclose(keplerian.period, 2.0 * np.pi * np.sqrt(elements.semi_major_axis**3 / EARTH_GM))
+
+
+def test_geostationary_orbit_is_fixed_in_ecef():
+    """정지 궤도 위성은 ECEF에서 고정되어야 함"""
+    radius = (EARTH_GM / EARTH_ROTATION_RATE**2) ** (1.0 / 3.0)
+    propagator = KeplerPropagator(KeplerianElements(radius), gmst_at_epoch=0.0, use_j2=False)
+    
+    positions, velocities = propagator.propagate(np.linspace(0.0, 86400.0, 97))
+    assert np.max(np.abs(positions - [radius, 0.0, 0.0])) < 1e-3
+    assert np.max(np.abs(velocities)) < 1e-6
+
+
+def test_pulse_states_for_echo_simulation():
+    """PRF 간격 펄스 상태를 Echo 시뮬레이션에 바로 사용"""
+    config = SarSystemConfig(
+        fc=5.4e9, bw=150e6, taup=10e-6, fs=350e6, prf=5000,
+        swst=10e-6, swl=50e-6, orbit_height=517e3,
+        antenna_width=4.0, antenna_height=0.5
+    )
+    propagator = KeplerPropagator(KeplerianElements.circular(config.orbit_height, 97.4))
+    positions, velocities = propagator.propagate_pulses(8, config.prf)
+    
+    assert positions.shape == (8, 3) and velocities.shape == (8, 3)
+    expected, _ = propagator.propagate(np.arange(8) / config.prf)
+    assert np.array_equal(positions, expected)
+    
+    # 위성 바로 아래 30 μs 지연 위치의 타겟
+    nadir = positions[4] / np.linalg.norm(positions[4])
+    target = Target(position=positions[4] - nadir * 30e-6 * 299792458.0 / 2.0)
+    echo = SarEchoSimulator(config).simulate_multiple_pulses(
+        TargetList([target]), positions, velocities,
+        beam_directions=np.tile(-nadir, (8, 1))
+    )
+    assert echo.shape[0] == 8
+    assert np.all(np.max(np.abs(echo), axis=1) > 0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
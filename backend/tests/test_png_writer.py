@@ -0,0 +1,87 @@
+"""
+PNG 저장 테스트
+
+스트리밍 PNG 저장이 기존 저장 함수와 같은 정규화 결과를 내는지,
+영역 평균 리샘플링과 행 slicing 입력(BurstArray)을 검증합니다.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from sar_simulator.io import (
+    RawDataReader,
+    RawDataWriter,
+    save_echo_signals_as_grayscale_png,
+    save_echo_signals_as_grayscale_png_streaming,
+)
+
+
+def test_streaming_matches_full(tmp_path, random_echo):
+    """리샘플링 없는 스트리밍 저장이 기존 저장 결과와 일치하는지 테스트"""
+    echo_data = random_echo(130, 500)
+    save_echo_signals_as_grayscale_png(echo_data, tmp_path / "full.png")
+    save_echo_signals_as_grayscale_png_streaming(echo_data, tmp_path / "stream.png", block_rows=17)
+    
+    full = np.asarray(Image.open(tmp_path / "full.png"))
+    stream = Image.open(tmp_path / "stream.png")
+    assert stream.mode == 'L' and stream.size == (500, 130)
+    assert np.array_equal(np.asarray(stream), full)
+    
+    # 최대 진폭 지정과 0 입력
+    save_echo_signals_as_grayscale_png_streaming(echo_data, tmp_path / "max.png", max_amplitude=1.0)
+    expected = (np.abs(echo_data) / 1.0 * 255.0).clip(0, 255).astype(np.uint8)
+    assert np.array_equal(np.asarray(Image.open(tmp_path / "max.png")), expected)
+    
+    save_echo_signals_as_grayscale_png_streaming(np.zeros((5, 8), dtype=np.complex64), tmp_path / "zero.png")
+    assert not np.asarray(Image.open(tmp_path / "zero.png")).any()
+
+
+@pytest.mark.parametrize("resample_ratio", [0.25, 0.3, 1.5])
+def test_area_average_resampling(tmp_path, resample_ratio, random_echo):
+    """영역 평균 축소/최근접 확대 결과 테스트"""
+    echo_data = random_echo(120, 200, seed=1)
+    magnitude = np.abs(echo_data)
+    max_amplitude = float(magnitude.max())
+    save_echo_signals_as_grayscale_png_streaming(
+        echo_data, tmp_path / "resampled.png", resample_ratio=resample_ratio, block_rows=7
+    )
+    image = np.asarray(Image.open(tmp_path / "resampled.png")).astype(int)
+    
+    out_rows, out_cols = round(120 * resample_ratio), round(200 * resample_ratio)
+    assert image.shape == (out_rows, out_cols)
+    
+    expected = np.empty((out_rows, out_cols))
+    for i in range(out_rows):
+        r0 = i * 120 // out_rows
+        r1 = max((i + 1) * 120 // out_rows, r0 + 1)
+        for j in range(out_cols):
+            c0 = j * 200 // out_cols
+            c1 = max((j + 1) * 200 // out_cols, c0 + 1)
+            expected[i, j] = magnitude[r0:r1, c0:c1].mean()
+    expected = np.floor(expected / max_amplitude * 255.0)
+    assert np.abs(image - expected).max() <= 1
+
+
+def test_streaming_from_reader(tmp_path, config, random_echo):
+    """BurstArray 입력 스트리밍 저장과 입력 검증 테스트"""
+    echo_data = random_echo(64, 300, seed=2)
+    filepath = tmp_path / "raw.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.write_burst("S01", echo_data)
+    
+    with RawDataReader(filepath) as reader:
+        save_echo_signals_as_grayscale_png_streaming(reader.burst("S01"), tmp_path / "burst.png", block_rows=10)
+    save_echo_signals_as_grayscale_png_streaming(echo_data, tmp_path / "array.png")
+    assert np.array_equal(
+        np.asarray(Image.open(tmp_path / "burst.png")), np.asarray(Image.open(tmp_path / "array.png"))
+    )
+    
+    with pytest.raises(ValueError):
+        save_echo_signals_as_grayscale_png_streaming(echo_data, tmp_path / "bad.png", resample_ratio=0.0)
+    with pytest.raises(ValueError):
+        save_echo_signals_as_grayscale_png_streaming(echo_data, tmp_path / "bad.png", block_rows=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,91 @@
+"""
+Range 압축 Echo 생성 모드 테스트
+
+Chirp 합성 + Pulse Compression 결과와 압축 펄스 커널 직접 배치 결과를 비교합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common import Target, TargetList
+from sar_simulator.common.constants import LIGHT_SPEED
+from sar_simulator.echo import SarEchoSimulator
+from sar_simulator.echo.compressed_pulse_kernel import CompressedPulseKernel
+from sar_simulator.processing import RDAProcessor
+from sar_simulator.sensor import ChirpGenerator
+
+
+def test_kernel_matches_pulse_compression(config):
+    """정수 지연에서 커널이 Pulse Compression 결과와 일치하는지 테스트"""
+    kernel = CompressedPulseKernel(config, oversample=8, half_width=16)
+    chirp = ChirpGenerator().generate(config.bw, config.taup, config.fs)[0]
+    
+    idx0 = 1000
+    echo = np.zeros((1, config.num_samples), dtype=np.complex64)
+    echo[0, idx0:idx0 + len(chirp)] = chirp
+    compressed = RDAProcessor(config).pulse_compression(echo)[0]
+    
+    offsets = np.arange(-15, 16)
+    expected = compressed[idx0 + offsets]
+    actual = kernel.evaluate(offsets)
+    
+    peak = np.abs(expected).max()
+    assert np.max(np.abs(actual - expected)) / peak < 1e-3
+
+
+def test_range_compressed_echo_peak(config):
+    """Range 압축 모드의 피크 위치/크기가 기존 경로와 일치하는지 테스트"""
+    satellite_position = np.array([6378137.0 + 517000.0, 0.0, 0.0])
+    satellite_velocity = np.array([0.0, 7266.0, 0.0])
+    
+    target_R = 30e-6 * LIGHT_SPEED / 2.0
+    target_list = TargetList([
+        Target(position=satellite_position - np.array([target_R, 0.0, 0.0]), reflectivity=100.0)
+    ])
+    
+    echo_sim = SarEchoSimulator(config)
+    chirp = ChirpGenerator().generate(config.bw, config.taup, config.fs)[0]
+    echo = echo_sim.simulate_echo(
+        target_list, satellite_position, satellite_velocity, chirp_signal=chirp
+    )
+    reference = RDAProcessor(config).pulse_compression(echo[np.newaxis, :])[0, :config.num_samples]
+    
+    compressed = echo_sim.simulate_echo(
+        target_list, satellite_position, satellite_velocity, range_compressed=True
+    )
+    
+    assert compressed.shape == (config.num_samples,)
+    assert compressed.dtype == np.complex64
+    assert abs(int(np.argmax(np.abs(compressed))) - int(np.argmax(np.abs(reference)))) <= 1
+    assert np.max(np.abs(compressed)) == pytest.approx(np.max(np.abs(reference)), rel=0.1)
+
+
+def test_rda_with_range_compressed_input(config):
+    """Range 압축 Echo를 RDA에 바로 입력하는 테스트"""
+    num_pulses = 64
+    satellite_positions = np.tile(np.array([6378137.0 + 517000.0, 0.0, 0.0]), (num_pulses, 1))
+    satellite_positions[:, 1] = (np.arange(num_pulses) - num_pulses / 2) * 7266.0 / config.prf
+    satellite_velocities = np.tile(np.array([0.0, 7266.0, 0.0]), (num_pulses, 1))
+    
+    target_R = 30e-6 * LIGHT_SPEED / 2.0
+    target_list = TargetList([
+        Target(position=np.array([6378137.0 + 517000.0 - target_R, 0.0, 0.0]), reflectivity=100.0)
+    ])
+    
+    echo_sim = SarEchoSimulator(config)
+    compressed = echo_sim.simulate_multiple_pulses(
+        target_list, satellite_positions, satellite_velocities, range_compressed=True
+    )
+    
+    sar_image_db, range_extent, _ = RDAProcessor(config, satellite_velocities[0]).process(
+        compressed, range_compressed=True
+    )
+    
+    assert sar_image_db.shape[1] == 512
+    peak_range_idx = np.unravel_index(np.argmax(sar_image_db), sar_image_db.shape)[1]
+    peak_range = range_extent[0] + peak_range_idx * LIGHT_SPEED / config.fs / 2.0
+    assert peak_range == pytest.approx(target_R, abs=2.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
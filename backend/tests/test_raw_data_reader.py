@@ -0,0 +1,155 @@
+"""
+Raw Data Reader 테스트
+
+BurstArray 지연 slicing (contiguous memory-map, 청크/압축, BAQ),
+블록 단위 순차 읽기, ADX 구조화 배열과 입력 검증을 확인합니다.
+"""
+
+import h5py
+import numpy as np
+import pytest
+
+from sar_simulator.io import RawDataReader, RawDataWriter, baq_encode
+from sar_simulator.orbit import AttitudeProfile, KeplerianElements, KeplerPropagator
+from sar_simulator.processing import RDAProcessor
+
+
+# (펄스, 샘플) 인덱스 조합
+INDEX_KEYS = [
+    (slice(None), slice(None)),
+    (slice(3, 17), slice(100, 900)),
+    (slice(None, None, 3), slice(250, 20, -7)),
+    (5, slice(None)),
+    (-1, 333),
+    (slice(10, 40), -200),
+    (slice(30, 10), slice(None)),
+]
+
+
+def test_lazy_slicing(config, tmp_path, random_echo):
+    """저장 방식별 BurstArray slicing 결과를 numpy 배열과 비교"""
+    echo_data = random_echo(48, 1000)
+    filepath = tmp_path / "slicing.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.write_burst("PLAIN", echo_data)
+        writer.begin_burst("STREAM", num_samples=1000, chunk_pulses=8)
+        writer.append_pulses("STREAM", echo_data)
+        writer.end_burst("STREAM")
+    with RawDataWriter(str(tmp_path / "gzip.h5"), config, compression="gzip") as writer:
+        writer.write_burst("GZIP", echo_data)
+    
+    with RawDataReader(filepath) as reader:
+        assert reader.group_names == ["PLAIN", "STREAM"]
+        assert reader.attrs['Product Type'] == 'SAR_RAW_DATA'
+        assert reader.group_attributes("PLAIN")['PRF'] == config.prf
+        
+        plain = reader.burst("PLAIN")
+        assert plain.shape == (48, 1000) and len(plain) == 48 and plain.dtype == np.complex64
+        assert plain.is_memory_mapped
+        assert np.array_equal(plain.memmap(), echo_data)
+        
+        stream = reader.burst("STREAM")
+        assert not stream.is_memory_mapped
+        assert stream.chunk_pulses == 8
+        with pytest.raises(ValueError):
+            stream.memmap()
+        
+        for burst in (plain, stream):
+            for key in INDEX_KEYS:
+                assert np.array_equal(burst[key], echo_data[key]), key
+            assert np.array_equal(burst[7], echo_data[7])
+            assert np.array_equal(np.asarray(burst), echo_data)
+            with pytest.raises(IndexError):
+                burst[48]
+            with pytest.raises(IndexError):
+                burst[0, 0, 0]
+    
+    with RawDataReader(tmp_path / "gzip.h5") as reader:
+        compressed = reader.burst("GZIP")
+        for key in INDEX_KEYS:
+            assert np.array_equal(compressed[key], echo_data[key]), key
+
+
+def test_baq_partial_decode(config, tmp_path, random_echo):
+    """BAQ Burst의 샘플 구간 부분 복원 테스트"""
+    echo_data = random_echo(20, 1000, seed=1)
+    filepath = tmp_path / "baq.h5"
+    with RawDataWriter(str(filepath), config, baq_bits=3) as writer:
+        writer.write_burst("S01", echo_data)
+    with RawDataWriter(str(tmp_path / "baq_odd.h5"), config, baq_bits=3, baq_block_samples=5) as writer:
+        writer.write_burst("S01", echo_data)
+    
+    expected = baq_encode(echo_data, 3).decode()
+    expected_odd = baq_encode(echo_data, 3, block_samples=5).decode()
+    with RawDataReader(filepath) as reader, RawDataReader(tmp_path / "baq_odd.h5") as odd_reader:
+        burst = reader.burst("S01")
+        odd_burst = odd_reader.burst("S01")
+        assert burst.encoding == 'BAQ' and burst.shape == (20, 1000)
+        for key in INDEX_KEYS[:-1] + [(slice(2, 5), slice(127, 129)), (slice(None), slice(999, None))]:
+            assert np.array_equal(burst[key], expected[key]), key
+            assert np.array_equal(odd_burst[key], expected_odd[key]), key
+
+
+def test_iter_blocks(config, tmp_path, random_echo):
+    """블록 단위 순차 읽기와 블록별 Range 압축 테스트"""
+    echo_data = random_echo(50, config.num_samples, seed=2)
+    filepath = tmp_path / "blocks.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.write_burst("S01", echo_data)
+    
+    rda = RDAProcessor(config)
+    with RawDataReader(filepath) as reader:
+        burst = reader.burst("S01")
+        starts, blocks = zip(*burst.iter_blocks(block_pulses=16))
+        assert starts == (0, 16, 32, 48)
+        assert np.array_equal(np.concatenate(blocks), echo_data)
+        
+        compressed = np.concatenate([rda.pulse_compression(block) for _, block in burst.iter_blocks(16)])
+        assert np.allclose(compressed, rda.pulse_compression(echo_data))
+        
+        window = np.concatenate([block for _, block in burst.iter_blocks(samples=slice(100, 200))])
+        assert np.array_equal(window, echo_data[:, 100:200])
+        with pytest.raises(ValueError):
+            next(burst.iter_blocks(0))
+
+
+def test_state_vectors(config, tmp_path):
+    """ADX 상태 벡터 구조화 배열 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    positions, velocities = propagator.propagate_pulses(12, config.prf)
+    timestamps = np.arange(12) / config.prf
+    attitude = AttitudeProfile(roll_angle=-30.0, yaw_rate=0.1)
+    
+    filepath = tmp_path / "adx.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.write_burst("S01", np.zeros((12, 64), dtype=np.complex64), positions, velocities, timestamps,
+                           attitude=attitude)
+        writer.write_burst("S02", np.zeros((12, 64), dtype=np.complex64))
+    
+    with RawDataReader(filepath) as reader:
+        states = reader.state_vectors("S01")
+        assert states.shape == (12,)
+        assert np.array_equal(states["time"], timestamps)
+        assert np.allclose(states["window_start_time"], timestamps + config.swst)
+        assert np.array_equal(states["position"], positions)
+        assert np.array_equal(states["velocity"], velocities)
+        assert np.allclose(states["attitude_quaternion"], attitude.body_to_ecef_quaternions(timestamps, positions, velocities))
+        assert np.allclose(states["angular_velocity"], attitude.angular_velocities(timestamps))
+        assert np.array_equal(reader.state_vectors("S01", slice(4, 8))["position"], positions[4:8])
+        
+        with pytest.raises(ValueError):
+            reader.state_vectors("S02")
+        with pytest.raises(ValueError):
+            reader.burst("S03")
+    
+    with pytest.raises(ValueError):
+        RawDataReader(filepath).burst("S01")
+    
+    with h5py.File(tmp_path / "other.h5", 'w') as f:
+        f.attrs['Product Type'] = 'SAR_SCENE'
+    with pytest.raises(ValueError):
+        RawDataReader(tmp_path / "other.h5").open()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,110 @@
+"""
+Raw Data Writer 테스트
+
+Burst 일괄 저장과 청크/가변 크기 데이터셋 스트리밍 저장(append_pulses)의
+Echo/ADX 일치 여부와 입력 검증을 확인합니다.
+"""
+
+import h5py
+import numpy as np
+import pytest
+
+from sar_simulator.io.raw_data_writer import RawDataWriter
+from sar_simulator.orbit import AttitudeProfile, Ephemeris, KeplerianElements, KeplerPropagator
+
+
+def test_streaming_matches_write_burst(config, tmp_path, random_echo):
+    """블록 단위 스트리밍 저장 결과와 일괄 저장 결과 비교"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    ephemeris = Ephemeris.from_propagator(propagator, np.array([0.0, 10.0, 20.0]))
+    attitude = AttitudeProfile(roll_angle=-30.0, pitch_rate=0.01)
+    echo_data = random_echo(100, config.num_samples)
+    
+    batch_path = tmp_path / "batch.h5"
+    with RawDataWriter(str(batch_path), config) as writer:
+        writer.write_burst("S01", echo_data, ephemeris=ephemeris, attitude=attitude)
+    
+    stream_path = tmp_path / "stream.h5"
+    with RawDataWriter(str(stream_path), config) as writer:
+        writer.begin_burst("S01", chunk_pulses=16, ephemeris=ephemeris, attitude=attitude)
+        for start, stop in ((0, 7), (7, 40), (40, 41), (41, 100)):
+            total = writer.append_pulses("S01", echo_data[start:stop])
+            assert total == stop
+        assert writer.end_burst("S01") == 100
+    
+    with h5py.File(batch_path, 'r') as batch, h5py.File(stream_path, 'r') as stream:
+        dataset = stream["S01/B000"]
+        assert dataset.chunks == (16, config.num_samples, 2)
+        assert dataset.maxshape == (None, config.num_samples, 2)
+        assert dataset.attrs['Lines per Burst'] == 100
+        assert np.array_equal(dataset[()], batch["S01/B000"][()])
+        assert np.array_equal(stream["S01/B000_adx"][()], batch["S01/B000_adx"][()])
+        assert dict(stream["S01"].attrs) == dict(batch["S01"].attrs)
+    
+    # float32 [..., 2] 뷰 = (실수, 허수)
+    with h5py.File(stream_path, 'r') as f:
+        stored = f["S01/B000"][()]
+    assert np.array_equal(stored[..., 0], echo_data.real)
+    assert np.array_equal(stored[..., 1], echo_data.imag)
+
+
+def test_streaming_with_block_states(config, tmp_path, random_echo):
+    """블록별 위성 상태 지정과 ADX 없는 스트리밍 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    positions, velocities = propagator.propagate_pulses(30, config.prf)
+    timestamps = np.arange(30) / config.prf
+    echo_data = random_echo(30, 64, seed=1)
+    
+    filepath = tmp_path / "states.h5"
+    with RawDataWriter(str(filepath), config) as writer:
+        writer.begin_burst("S01", num_samples=64)
+        for start in range(0, 30, 12):
+            block = slice(start, start + 12)
+            writer.append_pulses("S01", echo_data[block], positions[block], velocities[block], timestamps[block])
+        writer.end_burst("S01")
+        
+        # 위성 상태 없이 Echo만 기록
+        writer.begin_burst("S02", num_samples=64)
+        writer.append_pulses("S02", echo_data[:10].astype(np.complex128))
+        writer.end_burst("S02")
+    
+    with h5py.File(filepath, 'r') as f:
+        adx_data = f["S01/B000_adx"][()]
+        assert np.array_equal(adx_data[:, 0], timestamps)
+        assert np.array_equal(adx_data[:, 2:5], positions)
+        assert np.array_equal(adx_data[:, 5:8], velocities)
+        assert "B000_adx" not in f["S02"]
+        assert f["S02/B000"].shape == (10, 64, 2)
+
+
+def test_streaming_validation(config, tmp_path):
+    """스트리밍 입력 검증 테스트"""
+    positions = np.tile([6895e3, 0.0, 0.0], (4, 1))
+    velocities = np.tile([0.0, 0.0, 7600.0], (4, 1))
+    
+    with RawDataWriter(str(tmp_path / "invalid.h5"), config) as writer:
+        with pytest.raises(ValueError):
+            writer.append_pulses("S01", np.zeros((4, 64), dtype=np.complex64))
+        
+        writer.begin_burst("S01", num_samples=64)
+        with pytest.raises(ValueError):
+            writer.begin_burst("S01", num_samples=64)
+        with pytest.raises(ValueError):
+            writer.append_pulses("S01", np.zeros((4, 32), dtype=np.complex64))
+        
+        # ADX는 첫 블록부터 모든 블록에 필요
+        writer.append_pulses("S01", np.zeros((4, 64), dtype=np.complex64))
+        with pytest.raises(ValueError):
+            writer.append_pulses("S01", np.zeros((4, 64), dtype=np.complex64), positions, velocities)
+        writer.end_burst("S01")
+        with pytest.raises(ValueError):
+            writer.begin_burst("S01", num_samples=64)
+        
+        writer.begin_burst("S02", num_samples=64)
+        writer.append_pulses("S02", np.zeros((4, 64), dtype=np.complex64), positions, velocities)
+        with pytest.raises(ValueError):
+            writer.append_pulses("S02", np.zeros((4, 64), dtype=np.complex64))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,126 @@
+"""
+위성 궤도 계산 서비스 테스트
+
+알려진 위성 상태(적도, 극, 역행 궤도)의 기준값과 궤적 단위 일괄 계산 결과를 비교하고,
+일괄 계산이 단일 상태 계산과 일치하는지 검증합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common.satellite_orbit_service import (
+    llh_to_ecef,
+    calc_beam_direction_to_target,
+    calc_crossing_point_ellipsoid,
+    calc_beam_direction_to_target_batch,
+    calc_crossing_point_ellipsoid_batch,
+    calc_heading_batch,
+    calculate_mission_direction,
+    calculate_mission_direction_batch,
+)
+
+
+MISSION_LOCATION = [128.1, 37.1]
+
+# 알려진 위성 상태와 미션 위치 [128.1, 37.1]에 대한 기준값
+# (위치, 속도, 빔 방향, Heading, 교차점 [경도, 위도, 고도])
+# 기존 단일 상태 구현(속도 정규화, 반복법 ecef_to_llh, 1초 후 위치 방위각)으로 계산한 값
+REFERENCE_STATES = [
+    # 적도 상공 동쪽 진행: 미션 위치가 지평선 너머이므로 빔은 위성 근처 지표와 교차
+    ([6895137.0, 0.0, 0.0], [0.0, 7266.0, 0.0],
+     [-0.875464433, 0.349570495, 0.333710197], 90.0, [1.8792927, 1.8051972, 0.0]),
+    # 북극 근처 북쪽 진행
+    ([10000.0, 6000.0, 6873700.0], [-6300.0, -3600.0, 12.0],
+     [-0.531067482, 0.674136525, -0.513329596], 1.218874, [127.5621051, 81.0799778, 0.0]),
+    # 남극 근처 남쪽 진행
+    ([-11000.0, -4000.0, -6873700.0], [6800.0, 2500.0, -12.0],
+     [-0.264309978, 0.338608586, 0.903041783], 180.202696, [130.5054604, -87.7421411, 0.0]),
+    # 태양동기(역행) 궤도 상승/하강 구간: 빔은 미션 위치에서 지표와 교차
+    ([-3282346.0, 4517762.0, 4032077.0], [3768.0, -2406.0, 5728.0],
+     [0.246151682, -0.898710598, -0.362944362], 347.053905, [128.1, 37.1, 0.0]),
+    ([-3496656.0, 4167152.0, 4223741.0], [-1550.0, 4390.0, -5579.0],
+     [0.637127534, -0.286337068, -0.715597365], 192.950712, [128.1, 37.1, 0.0]),
+]
+
+
+def _random_states(num_states: int, seed: int = 0):
+    """한반도 주변 상공의 임의 위성 상태"""
+    rng = np.random.default_rng(seed)
+    positions = llh_to_ecef(rng.uniform(30.0, 45.0, num_states), rng.uniform(120.0, 135.0, num_states), 517e3)
+    velocities = rng.normal(size=(num_states, 3)) * 7000.0
+    return positions, velocities
+
+
+def test_reference_states():
+    """적도/극/역행 궤도 상태의 빔 방향, Heading, 교차점 기준값 테스트"""
+    positions = np.array([state[0] for state in REFERENCE_STATES])
+    velocities = np.array([state[1] for state in REFERENCE_STATES])
+    batch = calculate_mission_direction_batch(positions, velocities, MISSION_LOCATION)
+    
+    for i, (_, _, beam_direction, heading, crossing_point) in enumerate(REFERENCE_STATES):
+        assert np.allclose(batch["beam_directions"][i], beam_direction, atol=1e-9)
+        assert np.isclose(batch["headings"][i], heading, atol=1e-6)
+        assert batch["crossing_valid"][i]
+        assert np.allclose(batch["crossing_points"][i, :2], crossing_point[:2], atol=1e-7)
+        assert np.isclose(batch["crossing_points"][i, 2], crossing_point[2], atol=1e-3)
+
+
+def test_batch_matches_single_state():
+    """일괄 계산과 단일 상태 계산 결과 비교"""
+    positions, velocities = _random_states(100)
+    velocities[0] = 0.0
+    
+    batch = calculate_mission_direction_batch(positions, velocities, MISSION_LOCATION)
+    assert batch["beam_directions"].shape == (100, 3)
+    assert batch["headings"].shape == (100,)
+    assert batch["crossing_points"].shape == (100, 3)
+    assert batch["headings"][0] == 0.0
+    assert np.all((batch["headings"] >= 0.0) & (batch["headings"] < 360.0))
+    
+    for i in range(100):
+        single = calculate_mission_direction(positions[i], velocities[i], MISSION_LOCATION)
+        assert np.allclose(batch["beam_directions"][i], single["beam_direction"])
+        assert np.isclose(batch["headings"][i], single["heading"])
+        assert batch["crossing_valid"][i]
+        assert np.allclose(batch["crossing_points"][i], single["crossing_point"], atol=1e-6)
+    
+    # 빔은 미션 위치를 지나므로 교차점은 미션 위치
+    assert np.allclose(batch["crossing_points"][:, :2], MISSION_LOCATION, atol=1e-6)
+    assert np.allclose(batch["crossing_points"][:, 2], 0.0, atol=1e-3)
+
+
+def test_crossing_point_batch_miss():
+    """지구를 향하지 않는 빔은 교차점이 없음"""
+    positions, _ = _random_states(4)
+    target = llh_to_ecef(37.1, 128.1, 0.0)
+    directions = calc_beam_direction_to_target_batch(positions, target)
+    directions[1] = -directions[1]
+    directions[3] = positions[3] / np.linalg.norm(positions[3])
+    
+    points, valid = calc_crossing_point_ellipsoid_batch(positions, directions)
+    assert valid.tolist() == [True, False, True, False]
+    assert np.all(np.isnan(points[~valid]))
+    
+    for i in range(4):
+        expected_direction = calc_beam_direction_to_target(positions[i], np.zeros(3), target)
+        if i in (0, 2):
+            assert np.allclose(directions[i], expected_direction)
+        single = calc_crossing_point_ellipsoid(positions[i], directions[i])
+        if valid[i]:
+            assert np.allclose(points[i], single, atol=1e-6)
+        else:
+            assert single is None
+
+
+def test_heading_batch_directions():
+    """적도 상공에서 동쪽/북쪽 진행 Heading 테스트"""
+    position = llh_to_ecef(0.0, 0.0, 517e3)
+    positions = np.array([position, position])
+    velocities = np.array([[0.0, 7266.0, 0.0], [0.0, 0.0, 7266.0]])
+    
+    headings = calc_heading_batch(positions, velocities)
+    assert np.allclose(headings, [90.0, 0.0], atol=1e-6)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,165 @@
+"""
+Scene 생성기 테스트
+
+반사도 래스터 → 점 타겟 변환 결과를 검증합니다.
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from sar_simulator.common import scene_builder
+from sar_simulator.common.scene_builder import (
+    build_scene_from_raster,
+    build_scene_from_raster_file,
+    build_scene_from_dem,
+)
+from sar_simulator.common.coordinates import llh_to_ecef, ecef_to_llh
+
+
+UPPER_LEFT = (37.1, 127.0)
+LOWER_RIGHT = (37.0, 127.1)
+
+
+def test_raster_pixel_centers():
+    """픽셀 중심 좌표가 llh_to_ecef 결과와 일치하는지 테스트"""
+    raster = np.random.rand(30, 40)
+    target_list = build_scene_from_raster(raster, UPPER_LEFT, LOWER_RIGHT, height=100.0, reflectivity_scale=2.0)
+    
+    lat = UPPER_LEFT[0] - (np.arange(30) + 0.5) * 0.1 / 30
+    lon = UPPER_LEFT[1] + (np.arange(40) + 0.5) * 0.1 / 40
+    lat_grid, lon_grid = np.meshgrid(lat, lon, indexing='ij')
+    expected = llh_to_ecef(lat_grid, lon_grid, 100.0).reshape(-1, 3)
+    
+    assert len(target_list) == 30 * 40
+    assert np.max(np.abs(target_list.positions - expected)) < 1e-6
+    assert np.allclose(target_list.reflectivity, raster.ravel() * 2.0)
+    assert np.all(target_list.phase == 0.0)
+
+
+def test_raster_separable_conversion(monkeypatch):
+    """지터가 없으면 픽셀 단위 변환 없이 행/열 단위 삼각함수만 계산하는지 테스트"""
+    converted = []
+    
+    def counting_llh_to_ecef(latitude, longitude, height):
+        converted.append(np.broadcast(latitude, longitude, height).size)
+        return llh_to_ecef(latitude, longitude, height)
+    
+    monkeypatch.setattr(scene_builder, "llh_to_ecef", counting_llh_to_ecef)
+    
+    # 스칼라 고도와 DEM 고도 모두 llh_to_ecef 결과와 일치
+    rows, cols = 300, 400
+    lat = UPPER_LEFT[0] + (np.arange(rows) + 0.5) * (LOWER_RIGHT[0] - UPPER_LEFT[0]) / rows
+    lon = UPPER_LEFT[1] + (np.arange(cols) + 0.5) * (LOWER_RIGHT[1] - UPPER_LEFT[1]) / cols
+    lat_grid, lon_grid = np.meshgrid(lat, lon, indexing='ij')
+    dem = np.random.default_rng(1).random((rows, cols)) * 1000.0
+    for height in (100.0, dem):
+        target_list = build_scene_from_raster(np.ones((rows, cols)), UPPER_LEFT, LOWER_RIGHT, height=height)
+        expected = llh_to_ecef(lat_grid, lon_grid, height).reshape(-1, 3)
+        assert np.max(np.abs(target_list.positions - expected)) < 1e-6
+    assert converted == []
+    
+    # 지터를 적용하면 픽셀마다 변환
+    build_scene_from_raster(np.ones((rows, cols)), UPPER_LEFT, LOWER_RIGHT, jitter=True, seed=0)
+    assert sum(converted) == rows * cols
+
+
+def test_raster_jitter_and_speckle():
+    """지터와 스펙클 위상 테스트"""
+    raster = np.ones((30, 40))
+    heights = np.full((30, 40), 50.0)
+    target_list = build_scene_from_raster(
+        raster, UPPER_LEFT, LOWER_RIGHT, height=heights,
+        jitter=True, speckle_phase=True, seed=0
+    )
+    
+    positions = target_list.positions
+    lat, lon, h = ecef_to_llh(positions[:, 0], positions[:, 1], positions[:, 2])
+    
+    # 지터는 픽셀 내부에 있어야 하고 고도는 유지되어야 함
+    pixel_lat = (UPPER_LEFT[0] - lat) / (0.1 / 30)
+    pixel_lon = (lon - UPPER_LEFT[1]) / (0.1 / 40)
+    assert np.array_equal(np.floor(pixel_lat).reshape(30, 40), np.repeat(np.arange(30)[:, None], 40, axis=1))
+    assert np.array_equal(np.floor(pixel_lon).reshape(30, 40), np.repeat(np.arange(40)[None, :], 30, axis=0))
+    assert np.max(np.abs(h - 50.0)) < 1e-3
+    
+    assert np.all((target_list.phase >= 0.0) & (target_list.phase < 360.0))
+    assert np.std(target_list.phase) > 50.0
+
+
+def test_raster_jitter_accuracy():
+    """0.1 deg 픽셀 지터 위치가 llh_to_ecef 결과와 일치하는지 테스트"""
+    upper_left, lower_right = (60.0, 10.0), (59.4, 10.6)
+    target_list = build_scene_from_raster(np.ones((6, 6)), upper_left, lower_right, jitter=True, seed=3)
+    
+    # 같은 seed로 지터 오프셋 재현 (위도, 경도 순서로 한 블록)
+    rng = np.random.default_rng(3)
+    d_lat = (rng.random((6, 6)) - 0.5) * -0.1
+    d_lon = (rng.random((6, 6)) - 0.5) * 0.1
+    lat = 60.0 - (np.arange(6)[:, None] + 0.5) * 0.1 + d_lat
+    lon = 10.0 + (np.arange(6)[None, :] + 0.5) * 0.1 + d_lon
+    expected = llh_to_ecef(lat, lon, 0.0).reshape(-1, 3)
+    assert np.max(np.linalg.norm(target_list.positions - expected, axis=1)) < 1e-6
+
+
+def test_raster_file_and_threshold(tmp_path):
+    """PNG/.npy 파일 입력 및 반사도 임계값 테스트"""
+    raster = np.zeros((16, 16), dtype=np.uint8)
+    raster[4:8, 4:8] = 200
+    
+    png_path = tmp_path / "scene.png"
+    Image.fromarray(raster, mode='L').save(png_path)
+    npy_path = tmp_path / "scene.npy"
+    np.save(npy_path, raster.astype(np.float32))
+    
+    for path in (png_path, npy_path):
+        target_list = build_scene_from_raster_file(path, UPPER_LEFT, LOWER_RIGHT, min_reflectivity=0.0)
+        assert len(target_list) == 16
+        assert np.all(target_list.reflectivity == 200.0)
+
+
+
+def _side_looking_satellite(incidence_deg: float) -> np.ndarray:
+    """DEM 중심을 서쪽에서 바라보는 위성 위치"""
+    lat, lon = 37.025, 127.03125
+    center = llh_to_ecef(lat, lon, 0.0)
+    lat_rad, lon_rad = np.deg2rad(lat), np.deg2rad(lon)
+    up = np.array([np.cos(lat_rad) * np.cos(lon_rad), np.cos(lat_rad) * np.sin(lon_rad), np.sin(lat_rad)])
+    east = np.array([-np.sin(lon_rad), np.cos(lon_rad), 0.0])
+    return center + up * 517e3 - east * 517e3 * np.tan(np.deg2rad(incidence_deg))
+
+
+def test_dem_shadow_and_layover():
+    """DEM 벽 뒤 음영과 앞쪽 겹침 영역 테스트"""
+    upper_left, lower_right = (37.05, 127.0), (37.0, 127.0625)
+    satellite_position = _side_looking_satellite(35.0)
+    
+    # 평지: 음영/겹침 없음
+    flat = build_scene_from_dem(np.zeros((50, 100)), upper_left, lower_right, satellite_position)
+    assert len(flat) == 50 * 100
+    assert not np.any(flat.get_attribute('shadow'))
+    assert not np.any(flat.get_attribute('layover'))
+    
+    # 50번 열에 높이 500 m 벽 (셀 폭 약 55 m)
+    dem = np.zeros((50, 100))
+    dem[:, 50] = 500.0
+    scene = build_scene_from_dem(dem, upper_left, lower_right, satellite_position, drop_shadow=False)
+    shadow = scene.get_attribute('shadow').reshape(50, 100)
+    layover = scene.get_attribute('layover').reshape(50, 100)
+    
+    # 음영 길이 = 500 * tan(35°) ≈ 350 m → 벽 뒤 6셀
+    assert np.array_equal(np.where(shadow[10])[0], np.arange(51, 57))
+    assert np.all(shadow.sum(axis=1) == 6)
+    
+    # 벽 꼭대기와 같은 경사 거리를 갖는 앞쪽 셀들은 겹침
+    assert layover[10, 50]
+    assert np.all(layover[10, 40:50])
+    assert not np.any(layover[10, 51:])
+    
+    # 기본 동작은 음영 셀 제거
+    dropped = build_scene_from_dem(dem, upper_left, lower_right, satellite_position)
+    assert len(dropped) == 50 * 100 - 50 * 6
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
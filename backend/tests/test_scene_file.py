@@ -0,0 +1,110 @@
+"""
+Scene 파일 테스트
+
+Scene 파일 저장/로드 및 빔 footprint 기반 부분 로드를 테스트합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common.target_model import TargetList
+from sar_simulator.common.scene_builder import build_scene_from_raster
+from sar_simulator.common.coordinates import llh_to_ecef
+from sar_simulator.io.scene_file import SceneFile, write_scene_file
+
+
+def _make_scene() -> TargetList:
+    """약 11 km x 9 km 영역의 200 x 200 타겟 Scene"""
+    raster = np.random.default_rng(0).random((200, 200))
+    target_list = build_scene_from_raster(raster, (37.1, 127.0), (37.0, 127.1))
+    target_list.set_attribute('class_id', np.arange(len(target_list)) % 7)
+    return target_list
+
+
+def test_scene_file_roundtrip(tmp_path):
+    """전체 로드 시 타겟과 헤더가 보존되는지 테스트"""
+    target_list = _make_scene()
+    path = write_scene_file(tmp_path / "scene.h5", target_list, tile_size=500.0)
+    
+    with SceneFile(path) as scene_file:
+        assert scene_file.num_targets == len(target_list)
+        assert scene_file.crs == "EPSG:4978"
+        lat_min, lon_min, lat_max, lon_max = scene_file.bounds
+        assert 37.0 < lat_min < lat_max < 37.1
+        assert 127.0 < lon_min < lon_max < 127.1
+        assert len(scene_file.tiles) > 100
+        
+        loaded = scene_file.load()
+        # memory-map view (읽기 전용, 복사 없음)
+        assert not loaded.to_array().flags['OWNDATA']
+        assert not loaded.to_array().flags['WRITEABLE']
+    
+    # 타일 순서로 재정렬되므로 정렬 후 비교
+    order_original = np.lexsort(target_list.positions.T)
+    order_loaded = np.lexsort(loaded.positions.T)
+    assert np.array_equal(target_list.to_array()[order_original], loaded.to_array()[order_loaded])
+    assert np.array_equal(
+        target_list.get_attribute('class_id')[order_original],
+        loaded.get_attribute('class_id')[order_loaded]
+    )
+
+
+def test_scene_file_beam_footprint(tmp_path):
+    """빔 footprint와 겹치는 타일만 로드되는지 테스트"""
+    target_list = _make_scene()
+    path = write_scene_file(tmp_path / "scene.h5", target_list, tile_size=500.0)
+    
+    # Scene 중앙 바로 위에서 좁은 빔으로 관측
+    center = llh_to_ecef(37.05, 127.05, 0.0)
+    satellite_position = llh_to_ecef(37.05, 127.05, 500e3)
+    beam_direction = center - satellite_position
+    half_angle = 2e3 / 500e3
+    
+    loaded = TargetList.from_scene_file(path, satellite_position, beam_direction, half_angle)
+    
+    # footprint(반경 약 2 km) 내 타겟은 모두 포함, 전체보다는 훨씬 적게 로드
+    distances = np.linalg.norm(target_list.positions - center, axis=1)
+    inside = np.sum(distances < 1.9e3)
+    assert inside <= len(loaded) < len(target_list) / 4
+    loaded_distances = np.linalg.norm(loaded.positions - center, axis=1)
+    assert np.sum(loaded_distances < 1.9e3) == inside
+    assert len(loaded.get_attribute('class_id')) == len(loaded)
+    
+    # 빔이 Scene 밖을 향하면 빈 리스트
+    far = llh_to_ecef(10.0, 10.0, 0.0)
+    empty = TargetList.from_scene_file(path, satellite_position, far - satellite_position, half_angle)
+    assert len(empty) == 0
+
+
+
+def test_scene_file_beam_footprint_trajectory(tmp_path):
+    """펄스를 추출해 검사해도 모든 펄스의 빔 footprint 타일을 포함하는지 테스트"""
+    target_list = _make_scene()
+    path = write_scene_file(tmp_path / "scene.h5", target_list, tile_size=500.0)
+    
+    # Scene을 남북으로 가로지르는 2,000 펄스 궤적에서 직하 방향 관측
+    num_pulses = 2000
+    latitudes = np.linspace(36.98, 37.12, num_pulses)
+    longitudes = np.full(num_pulses, 127.05)
+    satellite_positions = llh_to_ecef(latitudes, longitudes, np.full(num_pulses, 500e3))
+    ground = llh_to_ecef(latitudes, longitudes, np.zeros(num_pulses))
+    beam_directions = ground - satellite_positions
+    half_angle = 1e3 / 500e3
+    
+    with SceneFile(path) as scene_file:
+        selected = scene_file.select_tiles_in_beam(satellite_positions, beam_directions, half_angle)
+        
+        # 모든 펄스를 하나씩 검사한 결과
+        expected = np.zeros(len(scene_file.tiles), dtype=bool)
+        for pulse in range(num_pulses):
+            expected |= scene_file.select_tiles_in_beam(
+                satellite_positions[pulse], beam_directions[pulse], half_angle
+            )
+    
+    # 추출 간격만큼 넓혀 검사하므로 빠지는 타일 없이, 빔이 지나지 않는 타일은 제외
+    assert np.all(selected[expected])
+    assert np.sum(selected) < len(selected) / 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
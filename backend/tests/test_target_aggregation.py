@@ -0,0 +1,97 @@
+"""
+타겟 집계 테스트
+
+해상도 셀 단위 코히어런트 병합 결과를 검증합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common.constants import LIGHT_SPEED
+from sar_simulator.common.sar_system_config import SarSystemConfig
+from sar_simulator.common.target_model import TargetList
+from sar_simulator.common.target_aggregation import aggregate_targets
+from sar_simulator.echo.echo_generator import EchoGenerator
+
+
+def _make_config() -> SarSystemConfig:
+    """테스트용 SAR 시스템 설정"""
+    return SarSystemConfig(
+        fc=5.4e9, bw=150e6, fs=350e6, taup=10e-6, prf=5000,
+        swst=10e-6, swl=50e-6, orbit_height=517e3,
+        antenna_width=4.0, antenna_height=0.5
+    )
+
+
+SATELLITE_POSITION = np.array([6378137.0 + 517000.0, 0.0, 0.0])
+SATELLITE_VELOCITY = np.array([0.0, 7266.0, 0.0])
+
+
+def test_aggregation_cell_merge():
+    """같은 셀의 타겟이 하나로 병합되고 반사도가 코히어런트 합인지 테스트"""
+    config = _make_config()
+    
+    # 셀 A: 같은 위치의 두 타겟 (위상 0, 0 → 진폭 2배), 셀 B: 멀리 떨어진 단일 타겟
+    positions = np.array([
+        [6378137.0, 0.0, 0.0],
+        [6378137.0, 0.0, 0.0],
+        [6378137.0, 500.0, 0.0],
+    ])
+    target_list = TargetList.from_columns(positions, reflectivity=np.array([1.0, 1.0, 3.0]), phase=np.array([10.0, 10.0, 45.0]))
+    
+    aggregated, report = aggregate_targets(target_list, config, SATELLITE_POSITION, SATELLITE_VELOCITY)
+    
+    assert report.num_input_targets == 3
+    assert report.num_output_targets == 2
+    assert report.num_eliminated == 1
+    assert report.relative_error < 1e-12
+    
+    order = np.argsort(aggregated.positions[:, 1])
+    assert np.allclose(aggregated.positions[order], positions[1:])
+    assert np.allclose(aggregated.reflectivity[order], [4.0, 3.0])
+    assert np.allclose(aggregated.phase[order], [10.0, 45.0])
+    
+    # 반대 위상 타겟은 상쇄
+    cancel = TargetList.from_columns(positions[:2], reflectivity=1.0, phase=np.array([0.0, 180.0]))
+    aggregated, _ = aggregate_targets(cancel, config, SATELLITE_POSITION, SATELLITE_VELOCITY)
+    assert len(aggregated) == 1
+    assert aggregated.reflectivity[0] < 1e-12
+
+
+def test_aggregation_echo_and_accuracy_knob():
+    """집계 전후 Echo 비교 및 cell_fraction에 따른 오차 감소 테스트"""
+    config = _make_config()
+    generator = EchoGenerator(config)
+    
+    # 수신 윈도우 안(지연 30 us)의 0.2 m 정육면체 안에 무작위 위상의 타겟 200개
+    rng = np.random.default_rng(0)
+    center = SATELLITE_POSITION - np.array([30e-6 * LIGHT_SPEED / 2.0, 0.0, 0.0])
+    positions = center + rng.uniform(-0.1, 0.1, (200, 3))
+    target_list = TargetList.from_columns(positions, reflectivity=rng.uniform(50.0, 150.0, 200), phase=rng.uniform(0, 360, 200))
+    
+    aggregated, report = aggregate_targets(target_list, config, SATELLITE_POSITION, SATELLITE_VELOCITY)
+    assert report.num_output_targets < 10
+    
+    # 분수 지연을 정확히 반영하는 Range 압축 모드로 비교
+    echo_original = generator.generate_range_compressed(target_list, SATELLITE_POSITION, SATELLITE_VELOCITY)
+    echo_aggregated = generator.generate_range_compressed(aggregated, SATELLITE_POSITION, SATELLITE_VELOCITY)
+    error = (np.linalg.norm(echo_aggregated - echo_original) / np.linalg.norm(echo_original)) ** 2
+    assert error < 0.02
+    assert 0.5 * error < report.relative_error < 2.0 * error
+    
+    # 셀이 작을수록 제거되는 타겟 수와 오차가 줄어듦
+    errors = []
+    eliminated = []
+    for cell_fraction in (1.0, 0.5, 0.1):
+        _, report = aggregate_targets(target_list, config, SATELLITE_POSITION, SATELLITE_VELOCITY, cell_fraction)
+        errors.append(report.relative_error)
+        eliminated.append(report.num_eliminated)
+    assert errors[0] >= errors[1] >= errors[2]
+    assert eliminated[0] >= eliminated[1] >= eliminated[2]
+    
+    with pytest.raises(ValueError):
+        aggregate_targets(target_list, config, SATELLITE_POSITION, SATELLITE_VELOCITY, cell_fraction=0.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
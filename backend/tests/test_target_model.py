@@ -0,0 +1,67 @@
+"""
+TargetList 테스트
+
+컬럼 기반 TargetList의 view, 추가, 필터 동작을 테스트합니다.
+"""
+
+import numpy as np
+import pytest
+
+from sar_simulator.common import Target, TargetList
+
+
+def test_target_list_from_targets():
+    """Target 리스트로 생성 시 하위 호환 테스트"""
+    targets = [
+        Target(position=np.array([1.0, 2.0, 3.0]), reflectivity=2.0, phase=10.0),
+        Target(position=np.array([4.0, 5.0, 6.0])),
+    ]
+    target_list = TargetList(targets)
+    target_list.add_target(Target(position=np.array([7.0, 8.0, 9.0]), reflectivity=3.0))
+    
+    assert len(target_list) == 3
+    assert np.array_equal(target_list.to_array()[:, 3], [2.0, 1.0, 3.0])
+    assert np.array_equal(target_list[1].position, [4.0, 5.0, 6.0])
+    assert target_list[0].phase == 10.0
+    assert target_list[-1].reflectivity == 3.0
+    assert [t.reflectivity for t in target_list] == [2.0, 1.0, 3.0]
+
+
+def test_target_list_zero_copy():
+    """from_array / to_array가 복사 없이 동작하는지 테스트"""
+    array = np.random.rand(1000, 5)
+    target_list = TargetList.from_array(array)
+    
+    assert np.shares_memory(target_list.to_array(), array)
+    assert np.shares_memory(target_list.positions, array)
+    assert target_list.nbytes == 1000 * 40
+    
+    # Target view의 position 수정이 내부 배열에 반영되어야 함
+    target_list[5].position[0] = -1.0
+    assert array[5, 0] == -1.0
+
+
+def test_target_list_append_and_filter():
+    """배열 단위 추가 및 필터 테스트"""
+    target_list = TargetList()
+    for i in range(10):
+        positions = np.full((100, 3), float(i))
+        target_list.append(positions, reflectivity=np.arange(100.0), class_id=np.full(100, i))
+    
+    assert len(target_list) == 1000
+    assert target_list.positions.shape == (1000, 3)
+    assert np.array_equal(target_list.get_attribute("class_id")[::100], np.arange(10))
+    
+    selected = target_list.filter(target_list.reflectivity >= 50.0)
+    assert len(selected) == 500
+    assert np.all(selected.reflectivity >= 50.0)
+    assert len(selected.get_attribute("class_id")) == 500
+    
+    with pytest.raises(ValueError):
+        target_list.append(np.zeros((3, 2)))
+    with pytest.raises(KeyError):
+        target_list.get_attribute("unknown")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,144 @@
+"""
+수신기 열잡음 및 ADC 포화 테스트
+
+잡음 전력과 제자리 추가, 펄스별 난수 스트림의 재현성(스레드 수, 블록 크기, 펄스 오프셋),
+ADC 포화, 시뮬레이터/Burst 스케줄러/API 잡음 옵션을 검증합니다.
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from api.main import app
+from sar_simulator.common import TargetList
+from sar_simulator.common.constants import BOLZMAN_CONST
+from sar_simulator.echo import (
+    SarEchoSimulator, plan_burst_tasks, generate_bursts,
+    thermal_noise_power, add_thermal_noise, saturate_adc
+)
+from sar_simulator.io import RawDataReader
+from sar_simulator.orbit import Ephemeris, KeplerianElements, KeplerPropagator
+
+
+def test_add_thermal_noise(config):
+    """잡음 전력, 제자리 추가, 펄스 스트림 재현성 테스트"""
+    assert np.isclose(config.get_noise_power(), BOLZMAN_CONST * config.Tsys * config.bw)
+    assert np.isclose(thermal_noise_power(config, range_compressed=True), config.get_noise_power() * 3500)
+    
+    echo_signals = np.zeros((600, 1000), dtype=np.complex64)
+    buffer = echo_signals.ctypes.data
+    seed = add_thermal_noise(echo_signals, 2.0, seed=7, block_pulses=128)
+    assert seed == 7 and echo_signals.ctypes.data == buffer
+    assert np.isclose(np.mean(np.abs(echo_signals) ** 2), 2.0, rtol=0.01)
+    assert np.isclose(echo_signals.real.var(), echo_signals.imag.var(), rtol=0.02)
+    
+    # 스레드 수와 관계없이 같은 잡음, 기존 신호에 더해짐
+    threaded = np.ones((600, 1000), dtype=np.complex64)
+    add_thermal_noise(threaded, 2.0, seed=7, block_pulses=128, max_workers=3)
+    assert np.allclose(threaded - 1.0, echo_signals, atol=1e-6)
+    
+    # 펄스 인덱스로 스트림이 정해지므로 블록 크기나 분할 위치와 관계없이 일치
+    for block_pulses in (1, 100, 256, 1000):
+        repeated = np.zeros((600, 1000), dtype=np.complex64)
+        add_thermal_noise(repeated, 2.0, seed=7, block_pulses=block_pulses)
+        assert np.array_equal(repeated, echo_signals)
+    head, tail = np.zeros((300, 1000), dtype=np.complex64), np.zeros((300, 1000), dtype=np.complex64)
+    add_thermal_noise(head, 2.0, seed=7)
+    add_thermal_noise(tail, 2.0, seed=7, first_pulse=300)
+    assert np.array_equal(np.concatenate([head, tail]), echo_signals)
+    
+    other = np.zeros((600, 1000), dtype=np.complex64)
+    add_thermal_noise(other, 2.0, seed=8, block_pulses=128)
+    assert not np.array_equal(other, echo_signals)
+    
+    with pytest.raises(ValueError):
+        add_thermal_noise(np.zeros((4, 10), dtype=np.complex128), 1.0)
+    with pytest.raises(ValueError):
+        add_thermal_noise(echo_signals[:, ::2], 1.0)
+    with pytest.raises(ValueError):
+        add_thermal_noise(echo_signals, -1.0)
+
+
+def test_saturate_adc():
+    """I, Q 제자리 포화와 포화 성분 수 테스트"""
+    echo_signals = np.array([[0.5 + 2.0j, -3.0 - 0.1j], [1.0 + 1.0j, 0.0 - 1.5j]], dtype=np.complex64)
+    num_saturated = saturate_adc(echo_signals, 1.0, block_pulses=1)
+    assert num_saturated == 3
+    assert np.array_equal(echo_signals, np.array([[0.5 + 1.0j, -1.0 - 0.1j], [1.0 + 1.0j, 0.0 - 1.0j]], dtype=np.complex64))
+    with pytest.raises(ValueError):
+        saturate_adc(echo_signals, 0.0)
+
+
+def test_simulator_noise(config):
+    """시뮬레이터 잡음 재현성과 ADC 포화/양자화 단계 테스트"""
+    simulator = SarEchoSimulator(config)
+    positions = np.array([[6378137.0 + 517e3, 0.0, 0.0]] * 8)
+    velocities = np.array([[0.0, 7266.0, 0.0]] * 8)
+    targets = TargetList()
+    
+    noise = simulator.simulate_multiple_pulses(targets, positions, velocities, add_noise=True, noise_seed=3)
+    assert np.isclose(np.mean(np.abs(noise) ** 2), config.get_noise_power(), rtol=0.02)
+    repeated = simulator.simulate_multiple_pulses(targets, positions, velocities, add_noise=True, noise_seed=3)
+    assert np.array_equal(noise, repeated)
+    assert not np.any(simulator.simulate_multiple_pulses(targets, positions, velocities))
+    
+    # 포화 후 같은 full scale로 양자화
+    full_scale = float(np.sqrt(config.get_noise_power()))
+    quantized = simulator.simulate_multiple_pulses(
+        targets, positions, velocities, add_noise=True, noise_seed=3,
+        adc_quantize=True, adc_full_scale=full_scale
+    )
+    max_code = (1 << (config.adc_bits - 1)) - 1
+    assert np.isclose(quantized.scale, full_scale / max_code)
+    assert np.any(np.abs(quantized.data) == max_code)
+    clipped = np.clip(noise.view(np.float32), -full_scale, full_scale)
+    assert np.allclose(quantized.data.reshape(8, -1) * quantized.scale, clipped, atol=quantized.scale)
+
+
+def test_burst_noise_streams(config, tmp_path):
+    """Burst 작업별 잡음 스트림과 병렬 생성 재현성 테스트"""
+    propagator = KeplerPropagator(KeplerianElements.circular(517e3, 97.4))
+    ephemeris = Ephemeris.from_propagator(propagator, np.linspace(0.0, 1.0, 11))
+    tasks = plan_burst_tasks(
+        "STRIPMAP", config, TargetList(), ephemeris, burst_pulses=4, num_bursts=2,
+        range_compressed=True, add_noise=True
+    )
+    assert tasks[0].noise_seed is not None and tasks[0].noise_seed == tasks[1].noise_seed
+    assert [task.first_pulse for task in tasks] == [0, 4]
+    
+    serial = generate_bursts(tasks, tmp_path / "serial.h5", max_workers=1, merge_mode="copy")
+    parallel = generate_bursts(tasks, tmp_path / "parallel.h5", max_workers=2, merge_mode="copy")
+    with RawDataReader(serial) as serial_reader, RawDataReader(parallel) as parallel_reader:
+        first = np.asarray(serial_reader.burst("SSG00"))
+        assert np.array_equal(first, np.asarray(parallel_reader.burst("SSG00")))
+        assert np.array_equal(np.asarray(serial_reader.burst("SSG01")), np.asarray(parallel_reader.burst("SSG01")))
+        assert not np.array_equal(first, np.asarray(serial_reader.burst("SSG01")))
+        assert np.isclose(np.mean(np.abs(first) ** 2), thermal_noise_power(config, range_compressed=True), rtol=0.05)
+
+
+def test_api_noise(config_params):
+    """Echo 시뮬레이션 API 잡음 옵션 테스트"""
+    client = TestClient(app)
+    request = {
+        "config": config_params,
+        "satellite_states": [
+            {"position": [6378137.0 + 517e3, 0.0, 0.0], "velocity": [0.0, 7266.0, 0.0], "beam_direction": None}
+        ] * 2,
+        "add_noise": True,
+        "noise_seed": 11
+    }
+    first = client.post("/api/echo/simulate-multiple", json=request)
+    second = client.post("/api/echo/simulate-multiple", json=request)
+    assert first.status_code == 200
+    assert first.json()["data"] == second.json()["data"]
+    
+    request["add_noise"] = False
+    assert client.post("/api/echo/simulate-multiple", json=request).json()["data"] != first.json()["data"]
+    
+    request["add_noise"] = True
+    request["noise_seed"] = -1
+    assert client.post("/api/echo/simulate-multiple", json=request).status_code == 422
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
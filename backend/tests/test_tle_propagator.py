@@ -0,0 +1,169 @@
+"""
+TLE 궤도 전파 테스트
+
+SGP4 전파 결과, TLE 전파기 캐시, TLE 전파 API를 검증합니다.
+"""
+
+import numpy as np
+import pytest
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from fastapi.testclient import TestClient
+
+from api.main import app
+from api.routes.echo import MAX_ECHO_PULSES, MAX_ECHO_BYTES
+from api.schemas.tle import TleCreateRequest, TleUpdateRequest
+from api.services import tle_service
+from api.services.tle_service import create_tle, update_tle, get_tle_propagator
+from sar_simulator.orbit import TlePropagator
+
+
+ISS_TLE = (
+    "ISS (ZARYA)\n"
+    "1 25544U 98067A   24001.12345678  .00001234  00000+0  12345-4 0  9999\n"
+    "2 25544  51.6400 123.4567 0001234   0.0000   0.0000 15.12345678901234"
+)
+
+SSO_TLE = (
+    "1 43013U 17073A   24001.50000000  .00000012  00000+0  25000-4 0  9999\n"
+    "2 43013  97.4500  10.0000 0001000  90.0000 270.0000 15.21000000 12345"
+)
+
+
+def test_parse_and_epoch():
+    """TLE 파싱 및 기준 시각 테스트"""
+    propagator = TlePropagator(ISS_TLE)
+    assert propagator.name == "ISS (ZARYA)"
+    assert abs((propagator.epoch - datetime(2024, 1, 1, 2, 57, 46, 666000)).total_seconds()) < 1e-3
+    
+    assert TlePropagator(SSO_TLE).name is None
+    with pytest.raises(ValueError):
+        TlePropagator("1 25544U\n2 25544")
+
+
+def test_propagate_ecef():
+    """ECEF 상태 벡터 테스트 (속도 = 위치 미분, 고도/속력 범위)"""
+    propagator = TlePropagator(ISS_TLE)
+    times = np.arange(0.0, 600.0, 0.01)
+    positions, velocities = propagator.propagate(times)
+    assert positions.shape == (len(times), 3)
+    
+    finite_difference = (positions[2:] - positions[:-2]) / (times[2:] - times[:-2])[:, None]
+    assert np.max(np.abs(finite_difference - velocities[1:-1])) < 0.05
+    
+    radius = np.linalg.norm(positions, axis=1)
+    assert np.all((radius > 6.85e6) & (radius < 6.95e6))
+    
+    # 시작 시각을 지정하면 TLE 기준 시각에서 경과 시간만큼 이동한 것과 같아야 함
+    shifted, _ = propagator.propagate(times[:10], propagator.epoch + timedelta(seconds=60.0))
+    assert np.allclose(shifted, positions[6000:6010], rtol=0.0, atol=0.1)
+    
+    # 펄스 단위 상태 벡터
+    pulse_positions, _ = propagator.propagate_pulses(5, 100.0)
+    assert np.allclose(pulse_positions, positions[:5], rtol=0.0, atol=1e-6)
+
+
+def test_teme_to_ecef_matches_astropy():
+    """TEME → ECEF 변환을 astropy와 비교 (극운동 무시 오차 수준)"""
+    from astropy import units as u
+    from astropy.coordinates import TEME, ITRS, CartesianRepresentation, CartesianDifferential
+    from astropy.time import Time
+    
+    propagator = TlePropagator(SSO_TLE)
+    times = np.array([0.0, 1800.0])
+    positions_teme, velocities_teme = propagator.propagate_teme(times)
+    positions, velocities = propagator.propagate(times)
+    
+    for i, t in enumerate(times):
+        obstime = Time(propagator.epoch + timedelta(seconds=float(t)), scale='utc')
+        teme = TEME(
+            CartesianRepresentation(
+                positions_teme[i] * u.m,
+                differentials=CartesianDifferential(velocities_teme[i] * u.m / u.s)
+            ),
+            obstime=obstime
+        )
+        itrs = teme.transform_to(ITRS(obstime=obstime))
+        assert np.linalg.norm(itrs.cartesian.xyz.to(u.m).value - positions[i]) < 30.0
+        assert np.linalg.norm(itrs.velocity.d_xyz.to(u.m / u.s).value - velocities[i]) < 0.05
+
+
+def test_propagator_cache(db_session):
+    """파싱된 전파기 캐시 및 업데이트 시 무효화 테스트"""
+    tle = create_tle(db_session, TleCreateRequest(name="ISS", tle_data=ISS_TLE))
+    
+    first = get_tle_propagator(db_session, tle.id)
+    assert get_tle_propagator(db_session, tle.id) is first
+    
+    update_tle(db_session, tle.id, TleUpdateRequest(tle_data=SSO_TLE))
+    updated = get_tle_propagator(db_session, tle.id)
+    assert updated is not first
+    assert updated.satrec.satnum == 43013
+
+
+def test_propagator_cache_limit(db_session, monkeypatch):
+    """전파기 캐시 개수 제한 (가장 오래 사용하지 않은 전파기부터 제거) 테스트"""
+    monkeypatch.setattr(tle_service, "MAX_CACHED_PROPAGATORS", 2)
+    monkeypatch.setattr(tle_service, "_propagator_cache", OrderedDict())
+    tles = [create_tle(db_session, TleCreateRequest(name=f"SAT{i}", tle_data=SSO_TLE)) for i in range(3)]
+    
+    first = get_tle_propagator(db_session, tles[0].id)
+    get_tle_propagator(db_session, tles[1].id)
+    assert get_tle_propagator(db_session, tles[0].id) is first
+    get_tle_propagator(db_session, tles[2].id)
+    
+    assert list(tle_service._propagator_cache) == [tles[0].id, tles[2].id]
+
+
+def test_propagate_endpoint(db_session):
+    """TLE 궤도 전파 API 테스트"""
+    tle = create_tle(db_session, TleCreateRequest(name="ISS", tle_data=ISS_TLE))
+    client = TestClient(app)
+    
+    response = client.post(f"/api/tle/{tle.id}/propagate", json={"step": 10.0, "num_points": 7})
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["times"] == [0.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0]
+    expected, _ = TlePropagator(ISS_TLE).propagate(np.array(data["times"]))
+    assert np.allclose(data["positions"], expected, rtol=0.0, atol=1e-6)
+    assert len(data["velocities"]) == 7
+    
+    response = client.post("/api/tle/unknown-id/propagate", json={"step": 10.0, "num_points": 7})
+    assert response.status_code == 404
+    
+    response = client.post(f"/api/tle/{tle.id}/propagate", json={"step": 10.0, "num_points": 100001})
+    assert response.status_code == 422
+
+
+def test_echo_simulation_from_tle(db_session):
+    """TLE ID로 궤적을 지정한 여러 펄스 Echo 시뮬레이션 테스트"""
+    tle = create_tle(db_session, TleCreateRequest(name="ISS", tle_data=ISS_TLE))
+    client = TestClient(app)
+    
+    request = {
+        "config": {
+            "fc": 5.4e9, "bw": 150e6, "fs": 350e6, "taup": 10e-6, "prf": 5000,
+            "swst": 10e-6, "swl": 50e-6, "orbit_height": 517e3,
+            "antenna_width": 4.0, "antenna_height": 0.5
+        },
+        "targets": [{"position": [6378137.0, 0.0, 0.0], "reflectivity": 1.0, "phase": 0.0}],
+        "tle_trajectory": {"tle_id": tle.id, "num_pulses": 4}
+    }
+    response = client.post("/api/echo/simulate-multiple", json=request)
+    assert response.status_code == 200
+    assert response.json()["num_pulses"] == 4
+    
+    # 펄스 개수 상한
+    request["tle_trajectory"]["num_pulses"] = 100000001
+    assert client.post("/api/echo/simulate-multiple", json=request).status_code == 422
+    
+    # Echo 시뮬레이션 펄스 개수 한도 및 Echo 행렬 크기 한도 (전파 전에 400)
+    request["tle_trajectory"]["num_pulses"] = MAX_ECHO_PULSES + 1
+    assert client.post("/api/echo/simulate-multiple", json=request).status_code == 400
+    request["tle_trajectory"]["num_pulses"] = MAX_ECHO_BYTES // (8 * 17500) + 1
+    assert client.post("/api/echo/simulate-multiple", json=request).status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
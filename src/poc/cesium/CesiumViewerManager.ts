@@ -1,5 +1,5 @@
 import { ViewerInitializer } from './ViewerInitializer.js';
-import { ImageryManager } from './ImageryManager.js';
+import { ImageryManager, SarImageTiles } from './ImageryManager.js';
 import { BuildingManager } from './BuildingManager.js';
 import { CameraManager } from './CameraManager.js';
 
@@ -44,6 +44,16 @@ export class CesiumViewerManager {
     await this.imageryManager.setupImagery();
   }
 
+  /**
+   * SAR 이미지 타일 레이어 추가
+   */
+  addSarImageTiles(tiles: SarImageTiles, serverUrl: string): any {
+    if (!this.imageryManager) {
+      throw new Error('Viewer가 초기화되지 않았습니다.');
+    }
+    return this.imageryManager.addSarImageTiles(tiles, serverUrl);
+  }
+
   /**
    * 건물 레이어 추가
    */
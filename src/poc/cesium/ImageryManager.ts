@@ -1,11 +1,27 @@
+/**
+ * SAR 이미지 타일 피라미드 메타데이터 (백엔드 /api/sar-image/process 응답의 tiles)
+ */
+export interface SarImageTiles {
+  pyramid_id: string;
+  url_template: string;
+  tile_size: number;
+  num_levels: number;
+  tiles_x: number;
+  tiles_y: number;
+  bounds: number[] | null;
+  tiling_bounds: number[] | null;
+}
+
 /**
  * 이미지 레이어 관리
  */
 export class ImageryManager {
   private viewer: any;
+  private sarImageLayers: Map<string, any>;
 
   constructor(viewer: any) {
     this.viewer = viewer;
+    this.sarImageLayers = new Map();
   }
 
   /**
@@ -25,4 +41,60 @@ export class ImageryManager {
     );
     this.viewer.imageryLayers.add(satelliteLayer);
   }
+
+  /**
+   * SAR 이미지 타일 레이어 추가
+   * 
+   * 타일 격자 사각형(tiling_bounds)을 level 0 타일 개수로 나눈 GeographicTilingScheme을 사용하므로
+   * Cesium은 화면에 보이는 타일만 현재 해상도에 맞는 level로 요청합니다.
+   * 
+   * @param tiles 타일 피라미드 메타데이터
+   * @param serverUrl API 서버 주소 (예: http://localhost:8000)
+   * @returns 추가된 이미지 레이어
+   */
+  addSarImageTiles(tiles: SarImageTiles, serverUrl: string): any {
+    if (!this.viewer) {
+      throw new Error('Viewer가 초기화되지 않았습니다.');
+    }
+    if (!tiles.bounds || !tiles.tiling_bounds) {
+      throw new Error('SAR 이미지 경위도 범위(image_bounds)가 없습니다.');
+    }
+
+    this.removeSarImageTiles(tiles.pyramid_id);
+
+    const [west, south, east, north] = tiles.bounds;
+    const [gridWest, gridSouth, gridEast, gridNorth] = tiles.tiling_bounds;
+    const tilingScheme = new Cesium.GeographicTilingScheme({
+      rectangle: Cesium.Rectangle.fromDegrees(gridWest, gridSouth, gridEast, gridNorth),
+      numberOfLevelZeroTilesX: tiles.tiles_x,
+      numberOfLevelZeroTilesY: tiles.tiles_y
+    });
+
+    const provider = new Cesium.UrlTemplateImageryProvider({
+      url: `${serverUrl}${tiles.url_template}`,
+      tilingScheme,
+      rectangle: Cesium.Rectangle.fromDegrees(west, south, east, north),
+      tileWidth: tiles.tile_size,
+      tileHeight: tiles.tile_size,
+      minimumLevel: 0,
+      maximumLevel: tiles.num_levels - 1
+    });
+
+    const layer = this.viewer.imageryLayers.addImageryProvider(provider);
+    this.sarImageLayers.set(tiles.pyramid_id, layer);
+    return layer;
+  }
+
+  /**
+   * SAR 이미지 타일 레이어 제거
+   * 
+   * @param pyramidId 타일 피라미드 ID
+   */
+  removeSarImageTiles(pyramidId: string): void {
+    const layer = this.sarImageLayers.get(pyramidId);
+    if (layer) {
+      this.viewer.imageryLayers.remove(layer, true);
+      this.sarImageLayers.delete(pyramidId);
+    }
+  }
 }
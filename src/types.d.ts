@@ -194,6 +194,21 @@ declare namespace Cesium {
     constructor(options?: any);
   }
   
+  class UrlTemplateImageryProvider {
+    constructor(options?: any);
+  }
+  
+  class GeographicTilingScheme {
+    constructor(options?: any);
+  }
+  
+  namespace Rectangle {
+    function fromDegrees(west?: number, south?: number, east?: number, north?: number, result?: Rectangle): Rectangle;
+  }
+  class Rectangle {
+    constructor(west?: number, south?: number, east?: number, north?: number);
+  }
+  
   // Buildings 관련
   function createOsmBuildingsAsync(options?: any): Promise<any>;
   